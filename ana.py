@@ -1,8 +1,10 @@
 import uvicorn
 import asyncio
 import time
+import os
 
 from rvm_sistemi.dimdb import dimdb_istemcisi
+from rvm_sistemi.veri_tabani import veritabani_yoneticisi
 from rvm_sistemi.utils.logger import rvm_logger, log_system, log_dimdb, log_motor, log_sensor, log_oturum, log_error, setup_exception_handler
 from rvm_sistemi.makine.seri.port_yonetici import KartHaberlesmeServis
 from rvm_sistemi.makine.seri.sensor_karti import SensorKart
@@ -52,9 +54,12 @@ async def main():
     yonetici = KartHaberlesmeServis()
     motor_kontrol = None  # Motor kontrol referansı
 
-    # Elle port girildiyse buraya yaz
-    ELLE_SENSOR_PORT = "" # !!Arama istiyorsak tırnak içlerini boş bırak / ELLE_SENSOR_PORT = ""
-    ELLE_MOTOR_PORT = ""  # !!Arama istiyorsak tırnak içlerini boş bırak / ELLE_MOTOR_PORT = ""
+    # Barkod indeksi port arama sürerken arka planda kurulur (ilk şişede SQLite beklenmez)
+    veritabani_yoneticisi.barkod_indeksini_yenile(arkaplanda=True)
+
+    # Elle port girildiyse buraya yaz (veya RVM_SENSOR_PORT / RVM_MOTOR_PORT ile ver; sanal kartlar için)
+    ELLE_SENSOR_PORT = os.getenv("RVM_SENSOR_PORT", "") # !!Arama istiyorsak tırnak içlerini boş bırak / ELLE_SENSOR_PORT = ""
+    ELLE_MOTOR_PORT = os.getenv("RVM_MOTOR_PORT", "")  # !!Arama istiyorsak tırnak içlerini boş bırak / ELLE_MOTOR_PORT = ""
 
     if ELLE_SENSOR_PORT and ELLE_MOTOR_PORT:
         print("✅ Elle port tanımlandı, port arama atlandı.")
@@ -73,6 +78,7 @@ async def main():
         )
         print("🛈", mesaj)
         print("🛈 Bulunan portlar:", portlar)
+        print(f"⏱️ Port arama [{yonetici.son_tarama.get('tur')}]: {yonetici.son_tarama.get('toplam_sure')} s")
         log_system(f"Port arama sonucu: {mesaj}")
         log_system(f"Bulunan portlar: {portlar}")
 
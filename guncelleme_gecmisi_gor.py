@@ -12,6 +12,7 @@ from rvm_sistemi.veri_tabani import veritabani_yoneticisi
 ICONS = {
     "success": "✅",
     "failure": "❌",
+    "no_change": "➖",
     "warning": "⚠️"
 }
 
@@ -57,6 +58,7 @@ def main():
         print(f"  Toplam Güncelleme       : {istatistikler.get('toplam_guncelleme', 0)}")
         print(f"  Başarılı Güncelleme     : {istatistikler.get('basarili_guncelleme', 0)}")
         print(f"  Başarısız Güncelleme    : {istatistikler.get('basarisiz_guncelleme', 0)}")
+        print(f"  Değişiklik Yok          : {istatistikler.get('degisiklik_yok_guncelleme', 0)}")
         print(f"  Son Güncelleme Zamanı   : {format_timestamp(istatistikler.get('son_guncelleme_zamani'))}")
         print(f"  Mevcut Ürün Sayısı      : {istatistikler.get('mevcut_urun_sayisi', 0)}")
     else:
@@ -91,7 +93,7 @@ def main():
         print("-" * 80)
         for kayit in gecmis:
             status = kayit.get('status') or ""
-            icon = ICONS['success'] if status == 'success' else (ICONS['failure'] if status in ('failure', 'error') else '')
+            icon = ICONS.get(status, ICONS['failure'] if status == 'error' else '')
             icon_text = (icon + " ") if (use_icons and icon) else ""
             ts = format_timestamp(kayit.get('update_timestamp'))
             notes = (kayit.get('notes') or "")[:60]
@@ -123,6 +125,7 @@ def main():
         print(f"  Toplam Güncelleme       : {istatistikler.get('toplam_guncelleme', 0)}")
         print(f"  Başarılı Güncelleme     : {istatistikler.get('basarili_guncelleme', 0)}")
         print(f"  Başarısız Güncelleme    : {istatistikler.get('basarisiz_guncelleme', 0)}")
+        print(f"  Değişiklik Yok          : {istatistikler.get('degisiklik_yok_guncelleme', 0)}")
         print(f"  Son Güncelleme Zamanı   : {istatistikler.get('son_guncelleme_zamani', 'Yok')}")
         print(f"  Mevcut Ürün Sayısı      : {istatistikler.get('mevcut_urun_sayisi', 0)}")
     else:
@@ -152,7 +155,7 @@ def main():
         print(f"{'ID':<5} {'Tarih/Saat':<20} {'Ürün':<8} {'Kaynak':<10} {'Durum':<10} {'Notlar'}")
         print("-" * 80)
         for kayit in gecmis:
-            durum_icon = "✅" if kayit.get('status') == 'success' else "❌"
+            durum_icon = {"success": "✅", "no_change": "➖"}.get(kayit.get('status'), "❌")
             print(f"{kayit.get('id'):<5} "
                   f"{kayit.get('update_timestamp'):<20} "
                   f"{kayit.get('product_count'):<8} "
@@ -161,3 +161,26 @@ async def ac_motor_durum():
             "message": f"AC Motor durum hatası: {str(e)}",
             "data": None
         }
+
+@router.get("/hat-istatistikleri")
+async def ac_motor_hat_istatistikleri():
+    """Modbus hattı istek sınıfı başına (dur/komut/telemetri) gecikme histogramlarını döndürür"""
+    try:
+        kontrol = get_ac_motor_kontrol()
+        if not kontrol or not kontrol.client:
+            return {
+                "status": "error",
+                "message": "AC Motor kontrol bağlantısı yok",
+                "data": None
+            }
+        
+        return {
+            "status": "success",
+            "data": kontrol.client.hat_istatistikleri()
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Hat istatistikleri hatası: {str(e)}",
+            "data": None
+        }
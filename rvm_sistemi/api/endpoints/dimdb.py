@@ -3,7 +3,7 @@ DİM-DB API Endpoint'leri
 Oturum yönetimi ve paket işleme endpoint'leri
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, BackgroundTasks
 from fastapi.responses import JSONResponse
 
 from ..modeller.schemas import (
@@ -91,11 +91,9 @@ async def stop_operation(data: StopOperationRequest):
 
 
 @router.post("/updateProducts", response_model=SuccessResponse)
-async def update_products(data: UpdateProductsRequest):
-    """Ürün güncelleme endpoint'i"""
-    from fastapi import BackgroundTasks
-    background_tasks = BackgroundTasks()
-    background_tasks.add_task(dimdb_istemcisi.get_all_products_and_save)
+async def update_products(data: UpdateProductsRequest, background_tasks: BackgroundTasks):
+    """Ürün güncelleme endpoint'i - DİM-DB bildirdiği için koşullu kontrol yapılmadan indirilir"""
+    background_tasks.add_task(dimdb_istemcisi.get_all_products_and_save, zorla=True)
     return SuccessResponse()
 
 
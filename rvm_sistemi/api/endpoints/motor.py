@@ -188,8 +188,8 @@ async def motor_ping():
                 "saglikli": False
             }
         
-        # Ping işlemini başlat
-        motor.ping()
+        # Ping işlemini başlat (PONG beklenirken event loop bloklanmaz)
+        await asyncio.to_thread(motor.ping)
         
         # Sağlık durumunu al
         saglikli = motor.getir_saglik_durumu()
@@ -78,21 +78,23 @@ async def sensor_teach():
 
 @router.post("/agirlik-olc")
 async def agirlik_olc():
-    """Ağırlık ölçümü yapar - Yeni sistem: 'lo' komutu gönderir"""
+    """Ağırlık ölçümü yapar - 'lo' komutu gönderir ve ölçülen değeri döndürür"""
     try:
         sensor = get_sensor_kart()
         if not sensor:
             raise HTTPException(status_code=500, detail="Sensör kartı bağlantısı yok")
         
-        # Yeni sistem: 'lo' komutu gönder, ağırlık callback ile gelecek
-        result = sensor.agirlik_olc()
-        if result:
-            return {
-                "status": "success",
-                "message": "Ağırlık ölçüm komutu gönderildi, sonuç callback ile gelecek"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Ağırlık ölçüm komutu gönderilemedi")
+        # 'lo' komutunu gönder, "a:..." yanıtını bekle (yanıt callback'e de gider)
+        agirlik = await sensor.agirlik_oku_async()
+        if agirlik is None:
+            raise HTTPException(status_code=504, detail="Ağırlık ölçüm yanıtı gelmedi")
+        return {
+            "status": "success",
+            "message": "Ağırlık ölçüldü",
+            "agirlik": agirlik
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ağırlık ölçüm hatası: {str(e)}")
 
@@ -174,18 +176,23 @@ async def sds_sensorler():
 
 @router.post("/doluluk-orani")
 async def doluluk_orani():
-    """Doluluk oranlarını sorgular"""
+    """Doluluk oranlarını sorgular ve ölçülen değerleri döndürür"""
     try:
         sensor = get_sensor_kart()
         if not sensor:
             raise HTTPException(status_code=500, detail="Sensör kartı bağlantısı yok")
         
-        # Doluluk oranı komutunu gönder
-        result = sensor.doluluk_oranı()
-        if result:
-            return SuccessResponse(message="Doluluk oranı sorgulama komutu gönderildi, sonuç callback ile gelecek")
-        else:
-            raise HTTPException(status_code=500, detail="Doluluk oranı sorgulama komutu gönderilemedi")
+        # 'do' komutunu gönder, "do#c:..#p:..#m:.." yanıtını bekle
+        doluluk = await sensor.doluluk_oku_async()
+        if doluluk is None:
+            raise HTTPException(status_code=504, detail="Doluluk oranı yanıtı gelmedi")
+        return {
+            "status": "success",
+            "message": "Doluluk oranları ölçüldü",
+            "doluluk": doluluk
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Doluluk oranı sorgulama hatası: {str(e)}")
 
@@ -261,8 +268,8 @@ async def sensor_ping():
                 "saglikli": False
             }
         
-        # Ping işlemini başlat
-        sensor.ping()
+        # Ping işlemini başlat (PONG beklenirken event loop bloklanmaz)
+        await asyncio.to_thread(sensor.ping)
         
         # Sağlık durumunu al
         saglikli = sensor.getir_saglik_durumu()
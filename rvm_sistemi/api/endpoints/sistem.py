@@ -229,3 +229,68 @@ async def sistem_disk():
             "message": f"Disk bilgisi alma hatası: {str(e)}",
             "disk": None
         }
+
+@router.get("/lojik-gecikme")
+async def lojik_gecikme():
+    """Oturum lojiğinde olay türü başına sensörden işleme gecikmesini döndürür"""
+    try:
+        from ...makine.senaryolar import oturum_var
+        
+        return {
+            "status": "success",
+            "gecikmeler": oturum_var.olay_gecikme_ozeti(),
+            "bekleyen_olay": oturum_var.olay_kuyrugu.qsize()
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Lojik gecikme bilgisi alma hatası: {str(e)}",
+            "gecikmeler": None
+        }
+
+
+@router.get("/kart-kurtarma")
+async def kart_kurtarma():
+    """Kart başına kopma anından tekrar sağlıklı bağlantıya kadar geçen süreleri döndürür"""
+    try:
+        from ...makine.seri.system_state_manager import system_state
+        from ...makine import kart_referanslari
+
+        saglik_servisi = kart_referanslari.port_saglik_servisi_al()
+        izleyici = saglik_servisi.usb_izleyici if saglik_servisi else None
+
+        return {
+            "status": "success",
+            "kurtarma": system_state.get_recovery_stats(),
+            "hotplug_aktif": bool(izleyici and izleyici.aktif),
+            "hotplug_olay_sayisi": izleyici.olay_sayisi if izleyici else 0,
+            "ping_araligi": saglik_servisi.ping_araligi if saglik_servisi else None
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Kart kurtarma bilgisi alma hatası: {str(e)}",
+            "kurtarma": None
+        }
+
+
+@router.get("/seri-istatistikler")
+async def seri_istatistikler():
+    """Motor ve sensör kartlarının seri taşıyıcı metriklerini, hazırlık beklemelerinin kazancını ve durum kilidi metriklerini döndürür"""
+    try:
+        from ...makine.seri.hazirlik_bekleme import hazirlik_olcer
+        from ...makine.seri.system_state_manager import system_state
+
+        kartlar = {"motor": get_motor_kart(), "sensor": get_sensor_kart()}
+        return {
+            "status": "success",
+            "kartlar": {ad: kart.istatistikler() for ad, kart in kartlar.items() if kart},
+            "hazirlik_beklemeleri": hazirlik_olcer.ozet(),
+            "durum_kilitleri": system_state.get_lock_stats()
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Seri istatistik alma hatası: {str(e)}",
+            "kartlar": None
+        }
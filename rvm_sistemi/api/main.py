@@ -18,9 +18,19 @@ async def lifespan(app: FastAPI):
     # Uygulama başlatma
     print("RVM API Sunucusu başlatılıyor...")
     
+    # DİM-DB için kalıcı HTTP bağlantı havuzu
+    from ..dimdb import dimdb_istemcisi
+    await dimdb_istemcisi.istemci_baslat()
+    
+    # Paket sonuçları için kalıcı gönderim kuyruğu (önceki çalışmadan kalanlar da gönderilir)
+    from .servisler.dimdb_outbox_servis import dimdb_outbox_servis
+    await dimdb_outbox_servis.baslat()
+    
     yield
     
     print("\nRVM API Sunucusu kapatılıyor...")
+    await dimdb_outbox_servis.durdur()
+    await dimdb_istemcisi.istemci_kapat()
 
 
 # FastAPI uygulamasını oluştur
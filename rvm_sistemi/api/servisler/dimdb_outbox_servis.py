@@ -0,0 +1,243 @@
+"""
+DİM-DB Outbox Servisi
+Paket sonuçlarını kalıcı bir kuyruğa alır ve arka planda DİM-DB'ye iletir
+"""
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Dict, Any
+
+from ...dimdb import dimdb_istemcisi
+from ...veri_tabani import veritabani_yoneticisi
+from ...utils.logger import log_dimdb, log_error, log_system, log_warning
+from ...utils.terminal import ok, warn, status
+
+# 4xx cevapları kalıcı hatadır (tekrar denemek sonucu değiştirmez); bunlar hariç
+GECICI_4XX_KODLARI = frozenset({408, 425, 429})
+
+
+class DimdbOutboxServis:
+    """
+    Sensör/lojik thread'lerinden gelen DİM-DB isteklerini bekletmeden kuyruğa alır.
+
+    Üretici tarafı (ekle) kaydı bellekteki bir deque'ya ekleyip arka plan görevini uyandırır;
+    SQLite kilidini beklemez. Ana event loop üzerindeki kayıt görevi bu kayıtları hemen
+    'dimdb_outbox' tablosuna yazar, gönderim görevi tablodan sırayla okuyup gönderir ve
+    başarılı olanları siler. Böylece elektrik kesintisi veya çökme sonrası gönderilmemiş
+    sonuçlar yeniden başlatmada iletilir. Kalıcı hata (4xx) alan kayıtlar 'dimdb_outbox_hatali' tablosuna
+    taşınır, sıradaki kayıtları bloklamaz.
+    """
+
+    def __init__(self, parti_boyutu: int = 20, maks_deneme: int = 50, maks_bekleme: float = 60.0):
+        self.parti_boyutu = parti_boyutu
+        self.maks_deneme = maks_deneme
+        self.maks_bekleme = maks_bekleme
+        self.is_running = False
+        self._bellek = deque()  # ekle() ile gelen, henüz diske yazılmamış kayıtlar
+        self._kayit_lock = threading.Lock()  # Diske yazım sırası korunur
+        self._loop = None
+        self._kaydet_olayi = None
+        self._uyandir = None
+        self._bos = None
+        self._gorev = None
+        self._kayit_gorevi = None
+        self._kaydediliyor = False
+        self._ardisik_hata = 0
+        self.toplam_eklenen = 0
+        self.toplam_gonderilen = 0
+        self.toplam_basarisiz_deneme = 0
+        self.toplam_atilan = 0
+        self.toplam_kalici_hata = 0
+
+    def ekle(self, endpoint: str, payload: Dict[str, Any]) -> None:
+        """İsteği belleğe alır - herhangi bir thread'den çağrılabilir, disk yazımını ve gönderimi beklemez"""
+        self._bellek.append((endpoint, dimdb_istemcisi._payload_serilestir(payload)))
+        self.toplam_eklenen += 1
+
+        loop = self._loop
+        if loop is not None and self.is_running:
+            try:
+                loop.call_soon_threadsafe(self._kaydet_olayi.set)
+            except RuntimeError:
+                # Loop kapanmış - kayıt bellekte, durdur() diske yazar
+                pass
+
+    async def baslat(self) -> None:
+        """Outbox gönderim görevini çalışan event loop üzerinde başlatır"""
+        if self.is_running:
+            warn("DİM-DB", "Outbox servisi zaten çalışıyor")
+            log_warning("Outbox servisi zaten çalışıyor - başlatma atlandı")
+            return
+
+        await asyncio.to_thread(veritabani_yoneticisi.outbox_tablosu_olustur)
+        self._loop = asyncio.get_running_loop()
+        self._kaydet_olayi = asyncio.Event()
+        self._uyandir = asyncio.Event()
+        self._bos = asyncio.Event()
+        self.is_running = True
+        self._kaydet_olayi.set()  # Başlatmadan önce eklenenleri diske yaz
+        self._uyandir.set()  # Önceki çalışmadan kalan kayıtları hemen gönder
+        self._kayit_gorevi = asyncio.create_task(self._kayit_dongusu())
+        self._gorev = asyncio.create_task(self._gonderim_dongusu())
+
+        bekleyen = await asyncio.to_thread(veritabani_yoneticisi.outbox_sayisi)
+        ok("DİM-DB", f"Outbox servisi başlatıldı (Bekleyen: {bekleyen})")
+        log_system(f"DİM-DB outbox servisi başlatıldı - Diskte bekleyen kayıt: {bekleyen}")
+
+    async def durdur(self) -> None:
+        """Görevleri durdurur, bellekte kalan kayıtları son kez diske yazmayı dener"""
+        if not self.is_running:
+            return
+
+        self.is_running = False
+        for gorev in (self._gorev, self._kayit_gorevi):
+            if gorev:
+                gorev.cancel()
+                try:
+                    await gorev
+                except asyncio.CancelledError:
+                    pass
+        self._gorev = None
+        self._kayit_gorevi = None
+
+        try:
+            await asyncio.to_thread(self._bellektekileri_kaydet)
+        except sqlite3.Error as e:
+            log_error(f"Outbox: {len(self._bellek)} kayıt diske yazılamadı: {e}")
+        self._loop = None
+        status("DİM-DB", "Outbox servisi durduruldu", level="stop")
+        log_system(f"DİM-DB outbox servisi durduruldu - {self.durum_bilgisi()}")
+
+    async def bekleyenleri_gonder(self, zaman_asimi: float = 10.0) -> bool:
+        """Outbox boşalana kadar bekler (ör. transactionResult öncesi sıralama için)"""
+        if not self.is_running:
+            return False
+
+        self._bos.clear()
+        self._uyandir.set()
+        try:
+            await asyncio.wait_for(self._bos.wait(), zaman_asimi)
+            return True
+        except asyncio.TimeoutError:
+            log_warning(f"Outbox {zaman_asimi}s içinde boşaltılamadı")
+            return False
+
+    def _bellektekileri_kaydet(self) -> None:
+        """Bellekte bekleyen kayıtları ekleniş sırasıyla tek transaction ile SQLite'a yazar"""
+        with self._kayit_lock:
+            kayitlar = []
+            while self._bellek:
+                kayitlar.append(self._bellek.popleft())
+
+            if kayitlar:
+                try:
+                    veritabani_yoneticisi.outbox_ekle(kayitlar)
+                except sqlite3.Error:
+                    self._bellek.extendleft(reversed(kayitlar))
+                    raise
+
+    async def _kayit_dongusu(self) -> None:
+        """ekle() ile belleğe alınan kayıtları diske yazıp gönderim döngüsünü uyandırır"""
+        while self.is_running:
+            try:
+                await self._kaydet_olayi.wait()
+                self._kaydet_olayi.clear()
+                self._kaydediliyor = True
+                try:
+                    await asyncio.to_thread(self._bellektekileri_kaydet)
+                finally:
+                    self._kaydediliyor = False
+                self._uyandir.set()
+            except asyncio.CancelledError:
+                break
+            except sqlite3.Error as e:
+                log_error(f"Outbox: {len(self._bellek)} kayıt diske yazılamadı, tekrar denenecek: {e}")
+                self._kaydet_olayi.set()
+                await asyncio.sleep(1.0)
+
+    async def _gonderim_dongusu(self) -> None:
+        """Outbox'ı sırayla boşaltan arka plan döngüsü"""
+        while self.is_running:
+            try:
+                # Okumadan önce temizlenir; okuma sırasında yazılan kayıt uyandırmayı kaçırmaz
+                self._uyandir.clear()
+                kayitlar = await asyncio.to_thread(
+                    veritabani_yoneticisi.outbox_bekleyenleri_getir, self.parti_boyutu
+                )
+
+                if not kayitlar:
+                    # Bellekte, diske yazılmakta veya okuma sırasında yazılmış kayıt varsa boş değil
+                    if not self._bellek and not self._kaydediliyor and not self._uyandir.is_set():
+                        self._bos.set()
+                    await self._uyandir.wait()
+                    continue
+
+                self._bos.clear()
+                silinecekler = []
+                hata_olustu = False
+
+                for kayit in kayitlar:
+                    response = await dimdb_istemcisi._istek_gonder(kayit["endpoint"], kayit["payload"])
+                    if response is not None and response.status_code == 200:
+                        silinecekler.append(kayit["id"])
+                        self.toplam_gonderilen += 1
+                        continue
+
+                    self.toplam_basarisiz_deneme += 1
+                    hata = "Ağ hatası" if response is None else f"HTTP {response.status_code}"
+                    kalici = self._kalici_hata_mi(response)
+                    if kalici or kayit["attempts"] + 1 >= self.maks_deneme:
+                        neden = f"kalıcı hata ({hata})" if kalici else f"{self.maks_deneme} denemede gönderilemedi"
+                        log_error(f"Outbox kaydı {neden}, hatalı kayıtlara taşınıyor: #{kayit['id']} ({kayit['endpoint']})")
+                        await asyncio.to_thread(veritabani_yoneticisi.outbox_hataliya_tasi, kayit["id"], hata)
+                        if kalici:
+                            self.toplam_kalici_hata += 1
+                        else:
+                            self.toplam_atilan += 1
+                    else:
+                        await asyncio.to_thread(veritabani_yoneticisi.outbox_hata_kaydet, kayit["id"], hata)
+                        hata_olustu = True
+                        break  # Sıralamayı korumak için sonraki kayıtlara geçme
+
+                await asyncio.to_thread(veritabani_yoneticisi.outbox_sil, silinecekler)
+
+                if hata_olustu:
+                    self._ardisik_hata += 1
+                    bekleme = min(2 ** self._ardisik_hata, self.maks_bekleme)
+                    log_dimdb(f"Outbox gönderimi başarısız, {bekleme:.0f}s sonra tekrar denenecek")
+                    await asyncio.sleep(bekleme)
+                else:
+                    self._ardisik_hata = 0
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                log_error(f"Outbox gönderim döngüsü hatası: {e}")
+                await asyncio.sleep(1.0)
+
+    @staticmethod
+    def _kalici_hata_mi(response) -> bool:
+        """Tekrar denemenin sonucu değiştirmeyeceği cevaplar (4xx, zaman aşımı/limit hariç)"""
+        return response is not None and 400 <= response.status_code < 500 \
+            and response.status_code not in GECICI_4XX_KODLARI
+
+    def durum_bilgisi(self) -> Dict[str, Any]:
+        """Outbox istatistiklerini döndürür"""
+        return {
+            "calisiyor": self.is_running,
+            "toplam_eklenen": self.toplam_eklenen,
+            "toplam_gonderilen": self.toplam_gonderilen,
+            "toplam_basarisiz_deneme": self.toplam_basarisiz_deneme,
+            "toplam_atilan": self.toplam_atilan,
+            "toplam_kalici_hata": self.toplam_kalici_hata,
+            "bellekte_bekleyen": len(self._bellek),
+            "ardisik_hata": self._ardisik_hata,
+            "zaman": time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+
+
+# Global instance
+dimdb_outbox_servis = DimdbOutboxServis()
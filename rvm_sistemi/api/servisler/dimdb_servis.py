@@ -5,10 +5,10 @@ DİM-DB entegrasyonu ve bildirim işlemleri
 
 import uuid
 import time
-import asyncio
-from typing import Dict, Any
 
 from ...dimdb import dimdb_istemcisi
+from ...dimdb.dimdb_yoneticisi import paket_sonucu_olustur
+from .dimdb_outbox_servis import dimdb_outbox_servis
 from ...makine.senaryolar import oturum_var
 from ...utils.logger import log_dimdb, log_error, log_success, log_warning
 from ...utils.terminal import ok, warn, err, status
@@ -28,29 +28,10 @@ class DimdbServis:
             return
         
         try:
-            # UUID'yi al
-            paket_uuid = oturum_var.sistem.aktif_oturum["paket_uuid_map"].get(barcode, str(uuid.uuid4()))
-            
-            # Kabul edilen ürün sayılarını hesapla
-            pet_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 1)
-            cam_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 2)
-            alu_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 3)
-            
-            result_payload = {
-                "guid": str(uuid.uuid4()),
-                "uuid": paket_uuid,
-                "sessionId": oturum_var.sistem.aktif_oturum["sessionId"],
-                "barcode": barcode,
-                "measuredPackWeight": float(agirlik),
-                "measuredPackHeight": float(uzunluk),
-                "measuredPackWidth": float(genislik),
-                "binId": materyal_turu if kabul_edildi else -1,
-                "result": sebep_kodu,
-                "resultMessage": sebep_mesaji,
-                "acceptedPetCount": pet_sayisi,
-                "acceptedGlassCount": cam_sayisi,
-                "acceptedAluCount": alu_sayisi
-            }
+            result_payload = paket_sonucu_olustur(
+                barcode, agirlik, materyal_turu, uzunluk, genislik, 
+                kabul_edildi, sebep_kodu, sebep_mesaji
+            )
             
             await dimdb_istemcisi.send_accept_package_result(result_payload)
             ok("DİM-DB", f"Paket sonucu gönderildi: {barcode} - {'Kabul' if kabul_edildi else 'Red'}")
@@ -67,20 +48,18 @@ class DimdbServis:
     def send_package_result_sync(barcode: str, agirlik: float, materyal_turu: int, 
                                uzunluk: float, genislik: float, kabul_edildi: bool, 
                                sebep_kodu: int, sebep_mesaji: str) -> None:
-        """Thread-safe DİM-DB paket sonucu gönderimi"""
+        """Thread-safe DİM-DB paket sonucu gönderimi - outbox'a ekler, ağ isteğini beklemez"""
+        if not oturum_var.sistem.aktif_oturum["aktif"]:
+            warn("DİM-DB", "Aktif oturum yok, paket sonucu gönderilmedi")
+            log_warning("Aktif oturum yok, paket sonucu gönderilmedi")
+            return
+        
         try:
-            # Yeni event loop oluştur ve çalıştır
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(
-                    DimdbServis.send_package_result(
-                        barcode, agirlik, materyal_turu, uzunluk, genislik, 
-                        kabul_edildi, sebep_kodu, sebep_mesaji
-                    )
-                )
-            finally:
-                loop.close()
+            result_payload = paket_sonucu_olustur(
+                barcode, agirlik, materyal_turu, uzunluk, genislik, 
+                kabul_edildi, sebep_kodu, sebep_mesaji
+            )
+            dimdb_outbox_servis.ekle("acceptPackageResult", result_payload)
         except Exception as e:
             err("DİM-DB SYNC", f"Hata: {e}")
             log_error(f"DİM-DB SYNC Hata: {e}")
@@ -94,6 +73,9 @@ class DimdbServis:
             return
         
         try:
+            # Bekleyen paket sonuçları transaction result'tan önce gitmeli
+            await dimdb_outbox_servis.bekleyenleri_gonder()
+            
             # Kabul edilen ürünleri konteyner formatına dönüştür
             containers = {}
             for urun in oturum_var.sistem.onaylanan_urunler:
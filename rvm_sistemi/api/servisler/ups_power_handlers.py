@@ -111,6 +111,7 @@ async def handle_power_failure():
         
         # 8. GSI mesajı gelene kadar bekleme durumuna geç
         oturum_var.sistem.gsi_bekleme_durumu = True
+        oturum_var.olay_gonder("ups_kesintisi")
         wait("ELEKTRİK KESİNTİSİ", "GSI mesajı bekleniyor...")
         status("ELEKTRİK KESİNTİSİ", "Sistem UPS modunda - GSI gelene kadar bekliyor", level="info")
         log_system("UPS kesintisi: GSI mesajı bekleniyor")
@@ -160,6 +161,8 @@ async def handle_power_restored():
         oturum_var.sistem.uzunluk_goruntu_isleme = None
         oturum_var.sistem.agirlik_kuyruk.clear()
         oturum_var.sistem.uzunluk_motor_verisi = None
+        oturum_var.uzunluk_olcum_eventi.clear()
+        oturum_var.olay_gonder("ups_geri_geldi")
         ok("ELEKTRİK GERİ", "Sistem durumu sıfırlandı")
         
         wait("ELEKTRİK GERİ", "GSI mesajı bekleniyor - Yeni oturum için hazır")
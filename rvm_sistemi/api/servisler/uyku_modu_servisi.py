@@ -139,6 +139,7 @@ class UykuModuServisi:
         # Sistem durumu güncelleme
         if self.sistem_referans:
             self.sistem_referans.uyku_modu_aktif = True
+        self._modbus_uyku_ayarla(True)
         
         # Uyku modu istatistikleri
         log_system(f"Uyku modu #{self.uyku_modu_sayisi} başlatıldı")
@@ -179,6 +180,7 @@ class UykuModuServisi:
         # Sistem durumu güncelleme
         if self.sistem_referans:
             self.sistem_referans.uyku_modu_aktif = False
+        self._modbus_uyku_ayarla(False)
         
         # İstatistikleri logla
         log_system(f"Uyku modu #{self.uyku_modu_sayisi} sonlandırıldı")
@@ -192,6 +194,16 @@ class UykuModuServisi:
         ok("UYKU", f"Uyku modundan çıkıldı - {uyku_suresi.total_seconds():.0f}s tasarruf")
         log_success("Makine aktif moda başarıyla geçti")
     
+    def _modbus_uyku_ayarla(self, aktif: bool):
+        """GA500 izleme okumalarını uyku moduna göre yavaşlatır/normale döndürür"""
+        try:
+            from ...makine import kart_referanslari
+            kontrol = kart_referanslari.ac_motor_kontrol_al()
+            if kontrol and kontrol.client:
+                kontrol.client.uyku_modu_ayarla(aktif)
+        except Exception as e:
+            log_warning(f"Modbus uyku modu ayarlanamadı: {e}")
+    
     def uyku_durumu_al(self) -> dict:
         """Uyku modu durumunu al"""
         return {
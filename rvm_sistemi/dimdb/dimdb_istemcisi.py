@@ -4,6 +4,9 @@ import hashlib
 import time
 import json
 import uuid
+import asyncio
+import threading
+from contextlib import asynccontextmanager
 
 # Projenin diğer modüllerini doğru paket yolundan import et
 # Bu dosya 'dimdb' paketi içinde olduğu için, bir üst dizindeki 'veri_tabani' paketine
@@ -11,6 +14,7 @@ import uuid
 from ..veri_tabani import veritabani_yoneticisi
 from ..utils.logger import log_dimdb, log_error, log_success, log_warning, log_system
 from .config import config
+from .urun_akisi import UrunAkisCozucu
 
 # --- GÜVENLİK VE AYARLAR ---
 # Konfigürasyon değerleri artık config.py dosyasından alınıyor
@@ -25,47 +29,144 @@ print(f"RVM_ID: {RVM_ID}")
 print(f"BASE_URL: {BASE_URL}")
 print("="*40 + "\n")
 
-def _generate_signature_headers(payload_body_str):
+SECRET_KEY_BYTES = SECRET_KEY.encode('utf-8')
+
+# Endpoint bazlı zaman aşımları (saniye) - listede olmayanlar için varsayılan kullanılır
+VARSAYILAN_ZAMAN_ASIMI = 10.0
+ENDPOINT_ZAMAN_ASIMLARI = {
+    "heartbeat": 5.0,
+    "acceptPackageResult": 10.0,
+    "transactionResult": 15.0,
+    "alarm": 10.0,
+    "getAllProducts": 60.0,
+}
+
+# HTTP/2 sadece 'h2' paketi kuruluysa kullanılabilir
+try:
+    import h2  # noqa: F401
+    HTTP2_DESTEKLI = True
+except ImportError:
+    HTTP2_DESTEKLI = False
+
+# Katalog indirmesi: aynı anda tek indirme, süren indirme sırasında gelen zorunlu istek sıraya alınır
+_katalog_kilidi = threading.Lock()
+_katalog_indiriliyor = False
+_zorunlu_indirme_bekliyor = False
+
+# Uzun ömürlü, keep-alive destekli bağlantı havuzu (FastAPI lifespan içinde açılır)
+_havuz_istemcisi = None
+_havuz_loop = None
+
+
+def _yeni_istemci():
+    """Keep-alive ve (varsa) HTTP/2 destekli bir AsyncClient oluşturur."""
+    return httpx.AsyncClient(
+        http2=HTTP2_DESTEKLI,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=60.0),
+        timeout=VARSAYILAN_ZAMAN_ASIMI,
+    )
+
+
+async def istemci_baslat():
+    """Çalışan event loop üzerinde kalıcı HTTP istemcisini oluşturur."""
+    global _havuz_istemcisi, _havuz_loop
+    if _havuz_istemcisi is not None and not _havuz_istemcisi.is_closed:
+        return
+    _havuz_istemcisi = _yeni_istemci()
+    _havuz_loop = asyncio.get_running_loop()
+    log_dimdb(f"Kalıcı HTTP istemcisi başlatıldı (HTTP/2: {'Açık' if HTTP2_DESTEKLI else 'Kapalı'})")
+
+
+async def istemci_kapat():
+    """Kalıcı HTTP istemcisini ve açık bağlantıları kapatır."""
+    global _havuz_istemcisi, _havuz_loop
+    istemci = _havuz_istemcisi
+    _havuz_istemcisi = None
+    _havuz_loop = None
+    if istemci is not None and not istemci.is_closed:
+        await istemci.aclose()
+        log_dimdb("Kalıcı HTTP istemcisi kapatıldı")
+
+
+def _havuz_istemcisini_al():
+    """Havuz istemcisi bu event loop'ta oluşturulduysa onu döndürür, aksi halde None."""
+    if _havuz_istemcisi is None or _havuz_istemcisi.is_closed:
+        return None
+    try:
+        if asyncio.get_running_loop() is not _havuz_loop:
+            return None
+    except RuntimeError:
+        return None
+    return _havuz_istemcisi
+
+
+@asynccontextmanager
+async def _istemci():
+    """Havuz istemcisini, yoksa (başlangıç veya başka bir event loop) tek seferlik istemciyi verir."""
+    client = _havuz_istemcisini_al()
+    if client is not None:
+        yield client
+    else:
+        async with httpx.AsyncClient() as gecici_client:
+            yield gecici_client
+
+
+def _payload_serilestir(payload):
+    """Payload'ı bir kez JSON byte dizisine çevirir; imza ve gövde aynı byte'ları kullanır."""
+    return json.dumps(payload).encode('utf-8')
+
+
+def _generate_signature_headers(payload_body):
     """Verilen bir payload için imza ve timestamp header'larını oluşturur."""
     headers = {}
-    encoded_body = payload_body_str.encode('utf-8')
+    encoded_body = payload_body if isinstance(payload_body, bytes) else payload_body.encode('utf-8')
     current_timestamp = str(int(time.time()))
     headers['RVM-DBYS-Signature-Timestamp'] = current_timestamp
     
-    digest = hmac.new(SECRET_KEY.encode('utf-8'), encoded_body, hashlib.sha512)
+    digest = hmac.new(SECRET_KEY_BYTES, encoded_body, hashlib.sha512)
     digest.update(current_timestamp.encode('utf-8'))
     
     headers['RVM-DBYS-Signature'] = digest.hexdigest()
     headers['Content-Type'] = 'application/json'
     return headers
 
-async def _send_request(endpoint, payload, timeout=10.0):
-    """DİM-DB'ye güvenli bir POST isteği gönderen asenkron yardımcı fonksiyon."""
+async def _istek_gonder(endpoint, payload, timeout=None):
+    """
+    DİM-DB'ye imzalı POST isteği gönderir.
+    Cevabı döner; ağ hatasında None (cevap gelmedi, tekrar denenebilir).
+    """
     url = f"{BASE_URL}/{endpoint}"
-    payload_str = json.dumps(payload)
-    headers = _generate_signature_headers(payload_str)
+    payload_bytes = payload if isinstance(payload, bytes) else _payload_serilestir(payload)
+    headers = _generate_signature_headers(payload_bytes)
+    if timeout is None:
+        timeout = ENDPOINT_ZAMAN_ASIMLARI.get(endpoint, VARSAYILAN_ZAMAN_ASIMI)
     
     print(f"İstek gönderiliyor: {url}")
     log_dimdb(f"İstek gönderiliyor: {url}")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(url, content=payload_str, headers=headers, timeout=timeout)
-        
-        if response.status_code == 200:
-            print(f"✅ İstek ({endpoint}) başarıyla gönderildi. Kod: 200")
-            log_success(f"İstek ({endpoint}) başarıyla gönderildi. Kod: 200")
-            # getAllProducts json cevabı döner, diğerleri sadece başarı durumu
-            return response.json() if "getAllProducts" in endpoint else True
-        else:
-            print(f"İstek ({endpoint}) gönderilemedi. Hata: {response.status_code}, Cevap: {response.text}")
-            log_error(f"İstek ({endpoint}) gönderilemedi. Hata: {response.status_code}, Cevap: {response.text}")
-            return None if "getAllProducts" in endpoint else False
-            
+        async with _istemci() as client:
+            response = await client.post(url, content=payload_bytes, headers=headers, timeout=timeout)
     except httpx.RequestError as e:
         print(f"İstek ({endpoint}) gönderilirken ağ hatası oluştu: {e}")
         log_error(f"İstek ({endpoint}) gönderilirken ağ hatası oluştu: {e}")
-        return None if "getAllProducts" in endpoint else False
+        return None
+    
+    if response.status_code == 200:
+        print(f"✅ İstek ({endpoint}) başarıyla gönderildi. Kod: 200")
+        log_success(f"İstek ({endpoint}) başarıyla gönderildi. Kod: 200")
+    else:
+        print(f"İstek ({endpoint}) gönderilemedi. Hata: {response.status_code}, Cevap: {response.text}")
+        log_error(f"İstek ({endpoint}) gönderilemedi. Hata: {response.status_code}, Cevap: {response.text}")
+    return response
+
+async def _send_request(endpoint, payload, timeout=None):
+    """DİM-DB'ye güvenli bir POST isteği gönderen asenkron yardımcı fonksiyon."""
+    response = await _istek_gonder(endpoint, payload, timeout)
+    if response is not None and response.status_code == 200:
+        # getAllProducts json cevabı döner, diğerleri sadece başarı durumu
+        return response.json() if "getAllProducts" in endpoint else True
+    return None if "getAllProducts" in endpoint else False
 
 # --- DİM DB'YE GÖNDERİLECEK METOTLAR ---
 
@@ -110,21 +211,156 @@ async def send_alarm(alarm_code, alarm_message):
     }
     await _send_request("alarm", payload)
 
-async def get_all_products_and_save():
-    """DİM-DB'den ürün listesini alır ve yerel veritabanına kaydeder."""
-    
+def _katalog_indirmesini_baslat(zorla):
+    """Süren indirme yoksa başlatma hakkını alır; varsa zorunlu isteği sıraya koyar"""
+    global _katalog_indiriliyor, _zorunlu_indirme_bekliyor
+    with _katalog_kilidi:
+        if not _katalog_indiriliyor:
+            _katalog_indiriliyor = True
+            return True
+        if zorla:
+            _zorunlu_indirme_bekliyor = True
+        return False
+
+
+def _siradaki_zorunlu_indirme():
+    """Sırada zorunlu indirme varsa True; yoksa indirme hakkını bırakır"""
+    global _katalog_indiriliyor, _zorunlu_indirme_bekliyor
+    with _katalog_kilidi:
+        if _zorunlu_indirme_bekliyor:
+            _zorunlu_indirme_bekliyor = False
+            return True
+        _katalog_indiriliyor = False
+        return False
+
+
+def _katalog_indirmesini_birak():
+    global _katalog_indiriliyor, _zorunlu_indirme_bekliyor
+    with _katalog_kilidi:
+        _katalog_indiriliyor = False
+        _zorunlu_indirme_bekliyor = False
+
+
+async def get_all_products_and_save(zorla=False):
+    """
+    DİM-DB'den ürün listesini alır ve yerel veritabanına kaydeder.
+    Cevap akış halinde çözülür ve ürünler geldikçe partiler halinde gölge
+    tabloya yazılır; katalog bellekte bütün olarak tutulmaz. Cevap eksik veya
+    hatalıysa mevcut katalog olduğu gibi kalır.
+
+    Katalog değişmediyse veritabanına yazılmaz: saklı ETag/Last-Modified ile
+    koşullu istek atılır (304 = indirme yok). Sunucu 200 dönerse katalog tek
+    seferde gölge tabloya indirilir; özeti son uygulanan katalogla aynıysa
+    products'a dokunulmaz ve geçmişe 'no_change' yazılır.
+
+    Aynı anda tek indirme yapılır. Zorunlu istek (/updateProducts) süren bir
+    indirmeye denk gelirse o indirme bitince bir zorunlu indirme daha yapılır.
+
+    Args:
+        zorla (bool): Koşullu istek ve özet kontrolü yapılmaz (/updateProducts)
+
+    Returns:
+        str: "kaydedildi", "degismedi", "sirada" (süren indirmeden sonra yapılacak)
+             veya hata durumunda None
+    """
+    if not _katalog_indirmesini_baslat(zorla):
+        if zorla:
+            print("Ürün güncellemesi sürüyor, bitince zorunlu güncelleme yapılacak.")
+            log_dimdb("Ürün güncellemesi sürüyor, zorunlu güncelleme sıraya alındı")
+            return "sirada"
+        log_warning("Ürün güncellemesi zaten sürüyor, bu istek atlandı")
+        return None
+
+    try:
+        while True:
+            durum = await asyncio.to_thread(veritabani_yoneticisi.katalog_durumunu_getir)
+            sonuc = await _katalogu_indir(durum, zorla)
+            if not _siradaki_zorunlu_indirme():
+                return sonuc
+            zorla = True
+            log_dimdb("Sıradaki zorunlu ürün güncellemesi başlatılıyor")
+    except BaseException:
+        _katalog_indirmesini_birak()  # İptal (kapanış): sıradaki istek de bırakılır
+        raise
+
+
+async def _katalogu_indir(durum, zorla):
+    """
+    getAllProducts isteğini akış halinde işler.
+
+    Args:
+        durum: katalog_durumunu_getir() sonucu (son özet ve doğrulayıcılar)
+        zorla: Koşullu başlıklar gönderilmez, özet aynı olsa da katalog uygulanır
+
+    Returns:
+        str: "kaydedildi", "degismedi" veya None
+    """
+    endpoint = "getAllProducts"
     payload = {
         "guid": str(uuid.uuid4()),
         "rvm": RVM_ID,
         "timestamp": time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
     }
-    # Bu istek uzun sürebileceği için zaman aşımı süresini artırıyoruz.
-    response_data = await _send_request("getAllProducts", payload, timeout=60.0)
-    
-    if response_data and 'products' in response_data:
-        products = response_data['products']
-        print(f"Başarılı: {len(products)} adet ürün bilgisi alındı.")
-        veritabani_yoneticisi.urunleri_kaydet(products)
-    else:
-        print("Ürün listesi alınamadı veya gelen veri boş.")
+    url = f"{BASE_URL}/{endpoint}"
+    payload_bytes = _payload_serilestir(payload)
+    headers = _generate_signature_headers(payload_bytes)
+    if not zorla:
+        if durum.get("etag"):
+            headers["If-None-Match"] = durum["etag"]
+        if durum.get("last_modified"):
+            headers["If-Modified-Since"] = durum["last_modified"]
+    # Bu istek uzun sürebileceği için zaman aşımı ENDPOINT_ZAMAN_ASIMLARI'nda yüksek tutuluyor.
+    timeout = ENDPOINT_ZAMAN_ASIMLARI[endpoint]
+
+    print(f"İstek gönderiliyor: {url}")
+    log_dimdb(f"İstek gönderiliyor: {url}")
+
+    guncelleme = None
+    try:
+        async with _istemci() as client:
+            async with client.stream("POST", url, content=payload_bytes, headers=headers, timeout=timeout) as response:
+                if response.status_code == 304:
+                    print("✅ Ürün kataloğu değişmemiş (304), indirme atlandı.")
+                    log_success(f"İstek ({endpoint}): 304 Not Modified, katalog değişmemiş")
+                    await asyncio.to_thread(veritabani_yoneticisi.degisiklik_yok_kaydet, "304 Not Modified")
+                    return "degismedi"
+                if response.status_code != 200:
+                    await response.aread()
+                    print(f"İstek ({endpoint}) gönderilemedi. Hata: {response.status_code}, Cevap: {response.text}")
+                    log_error(f"İstek ({endpoint}) gönderilemedi. Hata: {response.status_code}, Cevap: {response.text}")
+                    print("Ürün listesi alınamadı veya gelen veri boş.")
+                    return None
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+                cozucu = UrunAkisCozucu()
+                guncelleme = await asyncio.to_thread(veritabani_yoneticisi.KatalogGuncellemesi, zorla)
+                async for parca in response.aiter_bytes():
+                    for urun in cozucu.besle(parca):
+                        if guncelleme.ekle(urun):
+                            await asyncio.to_thread(guncelleme.parti_yaz)
+                cozucu.bitir()
+
+        if not cozucu.products_bulundu:
+            await asyncio.to_thread(guncelleme.iptal, "Cevapta products alanı yok")
+            print("Ürün listesi alınamadı veya gelen veri boş.")
+            return None
+
+        print(f"Başarılı: {cozucu.urun_sayisi} adet ürün bilgisi alındı.")
+        log_success(f"İstek ({endpoint}) tamamlandı: {cozucu.urun_sayisi} ürün")
+
+        sonuc = await asyncio.to_thread(guncelleme.bitir, etag, last_modified)
+        return "degismedi" if sonuc["degisiklik_yok"] else "kaydedildi"
 
+    except (httpx.RequestError, ValueError, RuntimeError) as e:
+        # Ağ hatası, eksik/bozuk cevap veya zaten süren bir katalog güncellemesi
+        if guncelleme is not None:
+            await asyncio.to_thread(guncelleme.iptal, e)
+        print(f"İstek ({endpoint}) sırasında hata oluştu, mevcut katalog korunuyor: {e}")
+        log_error(f"İstek ({endpoint}) sırasında hata oluştu, mevcut katalog korunuyor: {e}")
+        return None
+    except BaseException as e:
+        if guncelleme is not None:
+            await asyncio.to_thread(guncelleme.iptal, e)
+        raise
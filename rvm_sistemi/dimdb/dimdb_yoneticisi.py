@@ -5,10 +5,35 @@ from ..makine.senaryolar import oturum_var
 from . import dimdb_istemcisi
 import uuid
 import time
-import asyncio
 
 # --- DİM-DB BİLDİRİM FONKSİYONLARI ---
 
+def paket_sonucu_olustur(barcode, agirlik, materyal_turu, uzunluk, genislik, kabul_edildi, sebep_kodu, sebep_mesaji):
+    """Anlık oturum durumundan acceptPackageResult payload'ını oluşturur"""
+    # UUID'yi al
+    paket_uuid = oturum_var.sistem.aktif_oturum["paket_uuid_map"].get(barcode, str(uuid.uuid4()))
+    
+    # Kabul edilen ürün sayılarını hesapla
+    pet_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 1)
+    cam_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 2)
+    alu_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 3)
+    
+    return {
+        "guid": str(uuid.uuid4()),
+        "uuid": paket_uuid,
+        "sessionId": oturum_var.sistem.aktif_oturum["sessionId"],
+        "barcode": barcode,
+        "measuredPackWeight": float(agirlik),
+        "measuredPackHeight": float(uzunluk),
+        "measuredPackWidth": float(genislik),
+        "binId": materyal_turu if kabul_edildi else -1,
+        "result": sebep_kodu,
+        "resultMessage": sebep_mesaji,
+        "acceptedPetCount": pet_sayisi,
+        "acceptedGlassCount": cam_sayisi,
+        "acceptedAluCount": alu_sayisi
+    }
+
 async def send_package_result(barcode, agirlik, materyal_turu, uzunluk, genislik, kabul_edildi, sebep_kodu, sebep_mesaji):
     """Her ürün doğrulaması sonrası DİM-DB'ye paket sonucunu gönderir"""
     if not oturum_var.sistem.aktif_oturum["aktif"]:
@@ -16,29 +41,7 @@ async def send_package_result(barcode, agirlik, materyal_turu, uzunluk, genislik
         return
     
     try:
-        # UUID'yi al
-        paket_uuid = oturum_var.sistem.aktif_oturum["paket_uuid_map"].get(barcode, str(uuid.uuid4()))
-        
-        # Kabul edilen ürün sayılarını hesapla
-        pet_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 1)
-        cam_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 2)
-        alu_sayisi = sum(1 for u in oturum_var.sistem.onaylanan_urunler if u.get('materyal_turu') == 3)
-        
-        result_payload = {
-            "guid": str(uuid.uuid4()),
-            "uuid": paket_uuid,
-            "sessionId": oturum_var.sistem.aktif_oturum["sessionId"],
-            "barcode": barcode,
-            "measuredPackWeight": float(agirlik),
-            "measuredPackHeight": float(uzunluk),
-            "measuredPackWidth": float(genislik),
-            "binId": materyal_turu if kabul_edildi else -1,
-            "result": sebep_kodu,
-            "resultMessage": sebep_mesaji,
-            "acceptedPetCount": pet_sayisi,
-            "acceptedGlassCount": cam_sayisi,
-            "acceptedAluCount": alu_sayisi
-        }
+        result_payload = paket_sonucu_olustur(barcode, agirlik, materyal_turu, uzunluk, genislik, kabul_edildi, sebep_kodu, sebep_mesaji)
         
         await dimdb_istemcisi.send_accept_package_result(result_payload)
         print(f"✅ [DİM-DB] Paket sonucu başarıyla gönderildi: {barcode} - {'Kabul' if kabul_edildi else 'Red'}")
@@ -49,15 +52,17 @@ async def send_package_result(barcode, agirlik, materyal_turu, uzunluk, genislik
         print(f"❌ [DİM-DB] Hata detayı: {traceback.format_exc()}")
 
 def send_package_result_sync(barcode, agirlik, materyal_turu, uzunluk, genislik, kabul_edildi, sebep_kodu, sebep_mesaji):
-    """Thread-safe DİM-DB paket sonucu gönderimi"""
+    """Thread-safe DİM-DB paket sonucu gönderimi - outbox'a ekler, ağ isteğini beklemez"""
+    if not oturum_var.sistem.aktif_oturum["aktif"]:
+        print("⚠️ [DİM-DB] Aktif oturum yok, paket sonucu gönderilmedi")
+        return
+    
     try:
-        # Yeni event loop oluştur ve çalıştır
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(send_package_result(barcode, agirlik, materyal_turu, uzunluk, genislik, kabul_edildi, sebep_kodu, sebep_mesaji))
-        finally:
-            loop.close()
+        from ..api.servisler.dimdb_outbox_servis import dimdb_outbox_servis
+        
+        result_payload = paket_sonucu_olustur(barcode, agirlik, materyal_turu, uzunluk, genislik, kabul_edildi, sebep_kodu, sebep_mesaji)
+        dimdb_outbox_servis.ekle("acceptPackageResult", result_payload)
+        print(f"📤 [DİM-DB] Paket sonucu outbox'a eklendi: {barcode} - {'Kabul' if kabul_edildi else 'Red'}")
     except Exception as e:
         print(f"❌ [DİM-DB SYNC] Hata: {e}")
 
@@ -75,6 +80,10 @@ async def send_transaction_result():
         return
     
     try:
+        # Bekleyen paket sonuçları transaction result'tan önce gitmeli
+        from ..api.servisler.dimdb_outbox_servis import dimdb_outbox_servis
+        await dimdb_outbox_servis.bekleyenleri_gonder()
+        
         # Kabul edilen ürünleri konteyner formatına dönüştür
         containers = {}
         for urun in oturum_var.sistem.onaylanan_urunler:
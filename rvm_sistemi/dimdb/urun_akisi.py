@@ -0,0 +1,159 @@
+"""
+urun_akisi.py - getAllProducts cevabının akış halinde çözülmesi
+Cevap gövdesi parça parça beslenir; "products" dizisindeki her ürün tamamlandığı
+anda dict olarak döndürülür. Bellekte aynı anda sadece son parça ve yarım
+kalmış tek ürün tutulur, katalog büyüklüğünden bağımsızdır.
+
+Beklenen biçim: {"products": [{...}, {...}], ...diğer alanlar}
+"""
+
+import codecs
+import json
+from typing import Iterator
+
+_BOSLUK = " \t\n\r"
+_SAYI_DEVAMI = frozenset("0123456789.eE+-")  # Sayının devam ettiğini gösteren karakterler
+_KIRPMA_ESIGI = 64 * 1024  # İşlenmiş metin bu boyutu geçince tampondan atılır
+
+
+class UrunAkisCozucu:
+    """
+    getAllProducts cevabı için artımlı JSON çözücü
+
+    Kullanım:
+        cozucu = UrunAkisCozucu()
+        async for parca in response.aiter_bytes():
+            for urun in cozucu.besle(parca):
+                ...
+        cozucu.bitir()  # Cevap eksik/bozuksa ValueError
+
+    Üst seviyedeki diğer alanlar diger_alanlar sözlüğünde toplanır.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._metin = ""
+        self._konum = 0
+        self._durum = "baslangic"  # baslangic, anahtar, deger, urunler, bitti
+        self._anahtar = None
+        self.products_bulundu = False
+        self.urun_sayisi = 0
+        self.diger_alanlar = {}
+
+    def besle(self, parca: bytes) -> Iterator[dict]:
+        """Yeni gelen baytları ekler ve tamamlanan ürünleri döndürür"""
+        self._metin += self._utf8.decode(parca)
+        yield from self._coz()
+        if self._konum > _KIRPMA_ESIGI:
+            self._metin = self._metin[self._konum:]
+            self._konum = 0
+
+    def bitir(self) -> None:
+        """Akış bitti; JSON tamamlanmadıysa ValueError"""
+        self._metin += self._utf8.decode(b"", final=True)
+        for _ in self._coz():
+            raise ValueError("getAllProducts cevabı beklenmedik şekilde bitti")
+        if self._durum != "bitti":
+            raise ValueError(f"getAllProducts cevabı eksik (durum: {self._durum}, {self.urun_sayisi} ürün)")
+
+    def _bosluk_atla(self) -> bool:
+        """Boşlukları atlar; işlenecek karakter kaldıysa True"""
+        metin, i = self._metin, self._konum
+        while i < len(metin) and metin[i] in _BOSLUK:
+            i += 1
+        self._konum = i
+        return i < len(metin)
+
+    def _deger_oku(self):
+        """Sıradaki JSON değerini okur; veri henüz tamamlanmadıysa (False, None)"""
+        try:
+            deger, son = self._decoder.raw_decode(self._metin, self._konum)
+        except json.JSONDecodeError:
+            return False, None  # Eksik veri: sonraki parçayı bekle (bitir() asıl hatayı verir)
+        # Sayı parça sınırında bölünmüş olabilir ("12" + "3", "12." + "5", "-1.5e" + "3"):
+        # raw_decode baştaki geçerli kısmı kabul eder, sayıdan sonra ayraç görülene kadar bekle
+        if isinstance(deger, (int, float)) and (son == len(self._metin) or self._metin[son] in _SAYI_DEVAMI):
+            return False, None
+        self._konum = son
+        return True, deger
+
+    def _karakter_bekle(self, beklenen: str) -> bool:
+        if not self._bosluk_atla():
+            return False
+        karakter = self._metin[self._konum]
+        if karakter not in beklenen:
+            raise ValueError(f"getAllProducts cevabında beklenmeyen karakter: {karakter!r} (beklenen: {beklenen})")
+        self._konum += 1
+        return True
+
+    def _coz(self) -> Iterator[dict]:
+        while True:
+            if self._durum == "baslangic":
+                if not self._karakter_bekle("{"):
+                    return
+                self._durum = "anahtar"
+
+            elif self._durum == "anahtar":
+                if not self._bosluk_atla():
+                    return
+                if self._metin[self._konum] in ",}":
+                    self._konum += 1
+                    if self._metin[self._konum - 1] == "}":
+                        self._durum = "bitti"
+                    continue
+                konum = self._konum
+                tamam, anahtar = self._deger_oku()
+                if not tamam:
+                    return
+                if not self._karakter_bekle(":"):
+                    self._konum = konum  # Anahtar ":" gelince yeniden okunur
+                    return
+                self._anahtar = anahtar
+                if anahtar == "products":
+                    if not self._karakter_bekle("["):
+                        self._durum = "products_ac"
+                        return
+                    self.products_bulundu = True
+                    self._durum = "urunler"
+                else:
+                    self._durum = "deger"
+
+            elif self._durum == "products_ac":
+                if not self._karakter_bekle("["):
+                    return
+                self.products_bulundu = True
+                self._durum = "urunler"
+
+            elif self._durum == "deger":
+                if not self._bosluk_atla():
+                    return
+                tamam, deger = self._deger_oku()
+                if not tamam:
+                    return
+                self.diger_alanlar[self._anahtar] = deger
+                self._durum = "anahtar"
+
+            elif self._durum == "urunler":
+                if not self._bosluk_atla():
+                    return
+                karakter = self._metin[self._konum]
+                if karakter == ",":
+                    self._konum += 1
+                    continue
+                if karakter == "]":
+                    self._konum += 1
+                    self._durum = "anahtar"
+                    continue
+                tamam, urun = self._deger_oku()
+                if not tamam:
+                    return
+                if not isinstance(urun, dict):
+                    raise ValueError(f"getAllProducts cevabında ürün nesne değil: {urun!r}")
+                self.urun_sayisi += 1
+                yield urun
+
+            else:  # bitti - sonrasında sadece boşluk olabilir
+                if self._bosluk_atla():
+                    raise ValueError("getAllProducts cevabının sonunda beklenmeyen veri")
+                return
@@ -125,7 +125,7 @@ class DurumMakinesi:
         
                 
     def modbus_mesaj(self, modbus_veri):
-        # Modbus verisini parse et
+        # GA500Telemetri kaydı parse edilmeden saklanır; eski string formatı hâlâ desteklenir
         parsed_data = modbus_parser.parse_modbus_string(modbus_veri)
         
         if parsed_data:
@@ -139,13 +139,11 @@ class DurumMakinesi:
             elif self.durum == "temizlik":
                 self._send_modbus_to_temizlik(motor_id, motor_data)
         
-        # Eski sistem için geriye dönük uyumluluk
+        # Eski sistem için geriye dönük uyumluluk (temizlik ekranı yukarıda güncellendi)
         if self.durum == "oturum_var":
             oturum_var.modbus_mesaj(modbus_veri)
         elif self.durum == "bakim":
             bakim.modbus_mesaj(modbus_veri)
-        elif self.durum == "temizlik":
-            temizlik.modbus_mesaj(modbus_veri)
     
     def _send_modbus_to_bakim(self, motor_id, motor_data):
         """Modbus verisini bakım ekranına gönderir"""
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Görüntü İşleme Ayarları
+Makine bazlı görüntü işleme ayarlarını proje ana dizinindeki
+goruntu_ayarlari.json dosyasından okur, eksik anahtarlar için varsayılanları kullanır.
+"""
+
+import os
+import json
+from typing import Dict, Any
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+GORUNTU_AYAR_DOSYA_YOLU = os.path.join(PROJECT_ROOT, "goruntu_ayarlari.json")
+
+# Varsayılan görüntü işleme ayarları
+VARSAYILAN_GORUNTU_AYARLARI = {
+    # Tahmin görüntüsü kayıt politikası: "kapali", "ornekleme", "dusuk_guven", "hata"
+    "kayit_politikasi": "kapali",
+    "kayit_orani_yuzde": 5.0,         # "ornekleme" politikasında kaydedilecek kare oranı
+    "dusuk_guven_esigi": 0.85,        # "dusuk_guven" politikasında bu değerin altı kaydedilir
+    "kayit_klasoru": "runs/detect/kayit",  # Proje ana dizinine göre
+    "kayit_kuyruk_boyutu": 8,         # Yazıcı thread kuyruğu (dolarsa kare atlanır)
+    "kayit_maks_boyut_mb": 500,       # Klasör boyut sınırı
+    "kayit_maks_yas_gun": 7,          # Bu günden eski dosyalar silinir
+    # YOLO çıkarım arka ucu: "pytorch", "onnx", "openvino"
+    "yolo_arka_uc": "pytorch",
+    "yolo_imgsz": 640,                # Çıkarım giriş boyutu (dışa aktarılan model de bu boyutta)
+    "yolo_intra_op_thread": 0,        # 0 = kütüphane varsayılanı
+    "yolo_inter_op_thread": 0,        # 0 = kütüphane varsayılanı
+    "yolo_isinma_sayisi": 3,          # Başlangıçta çalıştırılacak boş kare sayısı
+    # Kalibrasyon (mm/pixel) ve ilgi bölgesi - kamera konumu değişirse birlikte güncellenmeli
+    "x_olcek": 0.5510,
+    "y_olcek": 0.5110,
+    "roi": [0, 0, 0, 0],              # [x, y, genişlik, yükseklik] piksel; 0 boyut = tüm kare
+}
+
+
+def goruntu_ayarlarini_yukle() -> Dict[str, Any]:
+    """Görüntü ayarlarını dosyadan yükler, tanımlı olmayan anahtarlar için varsayılanı döner"""
+    ayarlar = dict(VARSAYILAN_GORUNTU_AYARLARI)
+    try:
+        if os.path.exists(GORUNTU_AYAR_DOSYA_YOLU):
+            with open(GORUNTU_AYAR_DOSYA_YOLU, 'r', encoding='utf-8') as f:
+                dosya_ayarlari = json.load(f)
+            for k in VARSAYILAN_GORUNTU_AYARLARI:
+                if k in dosya_ayarlari and dosya_ayarlari[k] is not None:
+                    ayarlar[k] = dosya_ayarlari[k]
+    except Exception as e:
+        print(f"❌ [GÖRÜNTÜ AYAR] Ayarlar yüklenemedi, varsayılanlar kullanılıyor: {e}")
+    return ayarlar
+
+
+def proje_yolu(yol: str) -> str:
+    """Göreli yolları proje ana dizinine göre mutlak yola çevirir"""
+    return yol if os.path.isabs(yol) else os.path.join(PROJECT_ROOT, yol)
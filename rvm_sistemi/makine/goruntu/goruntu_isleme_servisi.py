@@ -13,13 +13,15 @@ import os
 import threading
 import queue
 import uuid
-from typing import Union
-from ultralytics import YOLO
+from typing import Optional, Union
 from pyzbar import pyzbar
 
 # Bu import'ları kendi dosya yapınıza göre düzenleyin
 from .kamera_servisi import KameraServisi
 from .goruntu_sonuc_tipi import GoruntuSonuc, MalzemeTuru
+from .goruntu_ayarlari import goruntu_ayarlarini_yukle
+from .goruntu_kayitci import GoruntuKayitci
+from .yolo_islemci import modeli_yukle, roi_hesapla, roi_kirp
 # Türkçe isimlendirilmiş decorator import edildi.
 from .tekil_nesne_yapici import Tekil
 
@@ -37,11 +39,11 @@ class GoruntuIslemeServisi:
         
         # Özelliklere başlangıç değeri atayarak güvenliği artırıyoruz
         self.kamera = None
+        self.kayitci = None
         self.islem_thread = None
         self.islem_thread_aktif = False
 
-        # Sınıf içi kilit ve kuyruk yapıları (daha iyi kapsülleme)
-        self.kamera_lock = threading.Lock()
+        # Sınıf içi kuyruk yapıları (kamera kendi kare halkasını yönetir, ayrı kilit gerekmez)
         self.goruntu_queue = queue.Queue(maxsize=10)
         
         # Asenkron sonuçları güvenli bir şekilde almak için istek-cevap mekanizması
@@ -54,16 +56,32 @@ class GoruntuIslemeServisi:
             if not os.path.exists(model_yolu):
                 raise FileNotFoundError(f"YOLO model dosyası bulunamadı: {model_yolu}")
             
-            self.model = YOLO(model_yolu)
+            self.ayarlar = goruntu_ayarlarini_yukle()
+            self.imgsz = int(self.ayarlar["yolo_imgsz"])
+            self.roi = roi_hesapla(self.ayarlar["roi"])
+            self.model, self.arka_uc = modeli_yukle(
+                model_yolu,
+                arka_uc=self.ayarlar["yolo_arka_uc"],
+                imgsz=self.imgsz,
+                intra_op=int(self.ayarlar["yolo_intra_op_thread"]),
+                inter_op=int(self.ayarlar["yolo_inter_op_thread"]),
+                isinma_sayisi=int(self.ayarlar["yolo_isinma_sayisi"]),
+                kare_boyutu=(self.roi[2], self.roi[3]),  # Çıkarım kırpılmış karede yapılır
+            )
             self.cihaz = "cpu"
             
+            # Tahmin görüntüleri kritik yoldan ayrı, politikaya göre kaydedilir
+            self.kayitci = GoruntuKayitci(self.ayarlar)
+            
             # Kamerayı başlat
             self.kamera = KameraServisi()
             self.kamera.baslat()
             
-            # Kalibrasyon değerleri (mm/pixel)
-            self.x_olcek = 0.5510
-            self.y_olcek = 0.5110
+            # Kalibrasyon değerleri (mm/pixel) (ayar dosyasından), ilgi bölgesi yukarıda model ısınmasından önce okunur
+            self.x_olcek = float(self.ayarlar["x_olcek"])
+            self.y_olcek = float(self.ayarlar["y_olcek"])
+            print(f"✂️ [GÖRÜNTÜİŞ] YOLO ilgi bölgesi: x={self.roi[0]} y={self.roi[1]} "
+                  f"{self.roi[2]}x{self.roi[3]} px, imgsz={self.imgsz}")
             
             # Asenkron işleme için worker thread'i başlat
             self._asenkron_isleme_baslat()
@@ -83,15 +101,16 @@ class GoruntuIslemeServisi:
             self.servisi_kapat() # Hata durumunda kaynakları serbest bırak
             raise # Hatayı yukarı taşıyarak uygulamanın çökmesini sağla
 
-    def goruntu_yakala_ve_isle(self, islem_tipi: str = "yolo") -> Union[GoruntuSonuc, str, None]:
+    def goruntu_yakala_ve_isle(self, islem_tipi: str = "yolo",
+                               tetik_zamani: Optional[float] = None) -> Union[GoruntuSonuc, str, None]:
         """
         Görüntü yakalar ve belirtilen işleme tipine göre (YOLO veya QR) işler.
         YOLO işlemleri asenkron olarak arka planda yürütülür ve sonuç beklenir.
         QR işlemleri hızlı olduğu için senkron olarak yapılır.
+        tetik_zamani (time.monotonic) verilirse bu andan sonra alınmış kare kullanılır.
         """
         try:
-            with self.kamera_lock:
-                kare = self.kamera.fotograf_cek()
+            kare = self.kamera.fotograf_cek(tetik_zamani)
             
             if kare is None:
                 return self._hata_sonucu("kamera_hatasi")
@@ -202,15 +221,20 @@ class GoruntuIslemeServisi:
     def _yolo_isle(self, kare) -> GoruntuSonuc:
         """YOLO modelini kullanarak görüntüdeki nesneleri tespit eder."""
         try:
+            # Sadece konveyör bandı işlenir; kırpma kopyasız bir NumPy görünümüdür
+            roi_x, roi_y = self.roi[0], self.roi[1]
             sonuclar = self.model.predict(
-                source=kare, device=self.cihaz, save=True, conf=0.75,
+                source=roi_kirp(kare, self.roi), device=self.cihaz, imgsz=self.imgsz, save=False, conf=0.75,
                 iou=0.5, verbose=False, stream=False
             )
             
             tespit_edilen_nesneler = []
             if sonuclar and sonuclar[0].boxes:
                 for kutu in sonuclar[0].boxes:
+                    # Kutu ROI koordinatında gelir, tam kare koordinatına kaydırılır
                     x1, y1, x2, y2 = map(int, kutu.xyxy[0])
+                    x1, x2 = x1 + roi_x, x2 + roi_x
+                    y1, y2 = y1 + roi_y, y2 + roi_y
                     guven = float(kutu.conf[0])
                     sinif_id = int(kutu.cls[0])
                     etiket = self.model.names[sinif_id]
@@ -222,23 +246,45 @@ class GoruntuIslemeServisi:
                     tespit_edilen_nesneler.append({
                         "tur": malzeme_turu, "guven": guven,
                         "genislik_mm": genislik_mm, "yukseklik_mm": yukseklik_mm,
+                        "kutu": (x1, y1, x2, y2), "etiket": etiket,
                     })
             
             if not tespit_edilen_nesneler:
+                self._kayit_kontrol(kare, tespit_edilen_nesneler, "nesne_yok", 0.0)
                 return self._hata_sonucu("nesne_yok")
             
             en_iyi_nesne = max(tespit_edilen_nesneler, key=lambda x: x["guven"])
+            kayit_id = self._kayit_kontrol(kare, tespit_edilen_nesneler, "nesne_var", en_iyi_nesne["guven"])
             return GoruntuSonuc(
                 genislik_mm=round(en_iyi_nesne["genislik_mm"], 2),
                 yukseklik_mm=round(en_iyi_nesne["yukseklik_mm"], 2),
                 tur=en_iyi_nesne["tur"],
                 guven_skoru=round(en_iyi_nesne["guven"], 3),
-                mesaj="nesne_var"
+                mesaj="nesne_var",
+                kayit_id=kayit_id
             )
         except Exception as e:
             print(f"❌ [YOLO] YOLO işleme hatası: {e}")
+            self._kayit_kontrol(kare, [], "yolo_hatasi", 0.0)
             return self._hata_sonucu("yolo_hatasi")
 
+    def _kayit_kontrol(self, kare, tespitler, mesaj: str, guven: float) -> Optional[int]:
+        """
+        Kayıt politikası izin veriyorsa kareyi yazıcı thread'e devreder. Kaydedilmeyen
+        kare doğrulama sonucuna kadar bekletilir; dönen kimlik dogrulama_sonucu() içindir.
+        """
+        if not self.kayitci:
+            return None
+        if self.kayitci.kaydedilmeli_mi(mesaj, guven):
+            self.kayitci.kaydet(kare, tespitler, mesaj)
+            return None
+        return self.kayitci.dogrulama_bekle(kare, tespitler, mesaj, guven)
+
+    def dogrulama_sonucu(self, kayit_id: Optional[int], kabul_edildi: bool) -> None:
+        """Ürün doğrulamasının sonucunu kayıtçıya iletir (reddedilen ürünün karesi kaydedilebilir)"""
+        if self.kayitci:
+            self.kayitci.dogrulama_sonucu(kayit_id, kabul_edildi)
+
     def _hata_sonucu(self, hata_tipi: str) -> GoruntuSonuc:
         """Hata durumları için standart bir GoruntuSonuc nesnesi döndürür."""
         if hata_tipi != "nesne_yok":
@@ -262,6 +308,9 @@ class GoruntuIslemeServisi:
             if self.islem_thread and self.islem_thread.is_alive():
                 self.islem_thread.join(timeout=2.0)
         
+        if self.kayitci:
+            self.kayitci.durdur()
+        
         if self.kamera:
             self.kamera.durdur()
             
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Görüntü Kayıtçı
+YOLO tahmin görüntülerini kayıt politikasına göre seçer ve düşük öncelikli
+ayrı bir thread'de işaretleyip diske yazar. Klasör boyut ve yaş sınırı ile
+otomatik temizlenir.
+"""
+
+import os
+import time
+import queue
+import random
+import itertools
+import threading
+from typing import List, Dict, Optional
+
+import cv2
+
+from .goruntu_ayarlari import proje_yolu
+
+KAYIT_POLITIKALARI = ("kapali", "ornekleme", "dusuk_guven", "hata")
+TEMIZLIK_ARALIGI = 50  # Her N kayıtta bir klasör temizliği
+DOGRULAMA_BEKLEYEN_SINIRI = 8  # Doğrulama sonucu beklenen en fazla kare (konveyördeki ürün sayısı kadar)
+RED_KAYDI_POLITIKALARI = ("dusuk_guven", "hata")  # Doğrulamada reddedilen ürünün karesi de kaydedilir
+
+
+class GoruntuKayitci:
+    """Sınırlı kuyruklu, düşük öncelikli görüntü yazıcı"""
+
+    def __init__(self, ayarlar: Dict):
+        self.politika = ayarlar["kayit_politikasi"]
+        if self.politika not in KAYIT_POLITIKALARI:
+            print(f"⚠️ [KAYITÇI] Bilinmeyen kayıt politikası '{self.politika}', kayıt kapatıldı")
+            self.politika = "kapali"
+
+        self.oran = float(ayarlar["kayit_orani_yuzde"]) / 100.0
+        self.dusuk_guven_esigi = float(ayarlar["dusuk_guven_esigi"])
+        self.klasor = proje_yolu(ayarlar["kayit_klasoru"])
+        self.maks_boyut = int(ayarlar["kayit_maks_boyut_mb"]) * 1024 * 1024
+        self.maks_yas = float(ayarlar["kayit_maks_yas_gun"]) * 86400
+
+        self.kuyruk = queue.Queue(maxsize=int(ayarlar["kayit_kuyruk_boyutu"]))
+        self.thread = None
+        self.aktif = False
+        self.yazilan = 0
+        self.atlanan = 0
+        self._dogrulama_bekleyenler = {}  # kayit_id -> (kare, tespitler, mesaj, guven), eklenme sırasıyla
+        self._dogrulama_lock = threading.Lock()
+        self._kayit_sayaci = itertools.count(1)
+
+        if self.politika != "kapali":
+            os.makedirs(self.klasor, exist_ok=True)
+            self.aktif = True
+            self.thread = threading.Thread(target=self._yazici_worker, daemon=True, name="GoruntuKayitThread")
+            self.thread.start()
+
+    def kaydedilmeli_mi(self, mesaj: str, guven: float, reddedildi: bool = False) -> bool:
+        """
+        Sonuç mesajı, güven skoru ve doğrulama sonucuna göre karenin kaydedilip
+        kaydedilmeyeceğine karar verir (reddedildi: ürün doğrulamada reddedildi)
+        """
+        if self.politika == "kapali":
+            return False
+        if self.politika == "ornekleme":
+            return random.random() < self.oran
+        if self.politika == "dusuk_guven":
+            return reddedildi or mesaj != "nesne_var" or guven < self.dusuk_guven_esigi
+        if self.politika == "hata":
+            return reddedildi or mesaj not in ("nesne_var", "nesne_yok")
+        return False
+
+    def dogrulama_bekle(self, kare, tespitler: List[Dict], mesaj: str, guven: float) -> Optional[int]:
+        """
+        Tahmin anında kaydedilmeyen kareyi doğrulama sonucuna kadar tutar.
+        Sınır aşılırsa en eski bekleyen bırakılır.
+
+        Returns:
+            dogrulama_sonucu() ile verilecek kimlik; politika red kaydı yapmıyorsa None
+        """
+        if not self.aktif or kare is None or self.politika not in RED_KAYDI_POLITIKALARI:
+            return None
+        with self._dogrulama_lock:
+            kayit_id = next(self._kayit_sayaci)
+            self._dogrulama_bekleyenler[kayit_id] = (kare, tespitler, mesaj, guven)
+            while len(self._dogrulama_bekleyenler) > DOGRULAMA_BEKLEYEN_SINIRI:
+                del self._dogrulama_bekleyenler[next(iter(self._dogrulama_bekleyenler))]
+        return kayit_id
+
+    def dogrulama_sonucu(self, kayit_id: Optional[int], kabul_edildi: bool) -> None:
+        """Bekletilen karenin doğrulama sonucunu bildirir; reddedildiyse politika kaydı değerlendirir"""
+        if kayit_id is None:
+            return
+        with self._dogrulama_lock:
+            veri = self._dogrulama_bekleyenler.pop(kayit_id, None)
+        if veri is None:
+            return
+        kare, tespitler, mesaj, guven = veri
+        if self.kaydedilmeli_mi(mesaj, guven, reddedildi=not kabul_edildi):
+            self.kaydet(kare, tespitler, "dogrulama_red")
+
+    def kaydet(self, kare, tespitler: List[Dict], sebep: str) -> None:
+        """Kareyi yazma kuyruğuna ekler; kuyruk doluysa kareyi atlar (çağıranı bekletmez)"""
+        if not self.aktif or kare is None:
+            return
+        try:
+            # Kare kameradan çağırana ait kopya olarak gelir, tekrar kopyalanmaz
+            self.kuyruk.put_nowait((kare, tespitler, sebep, time.time()))
+        except queue.Full:
+            self.atlanan += 1
+
+    def _yazici_worker(self):
+        """Kuyruktaki kareleri işaretleyip diske yazan düşük öncelikli döngü"""
+        try:
+            # Linux'ta nice değeri thread bazlıdır
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+        except (AttributeError, OSError):
+            pass
+
+        while self.aktif:
+            try:
+                veri = self.kuyruk.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if veri is None:
+                break
+
+            kare, tespitler, sebep, zaman = veri
+            try:
+                for nesne in tespitler:
+                    x1, y1, x2, y2 = nesne["kutu"]
+                    cv2.rectangle(kare, (x1, y1), (x2, y2), (0, 255, 0), 2)
+                    cv2.putText(kare, f"{nesne['etiket']} {nesne['guven']:.2f}", (x1, max(y1 - 5, 10)),
+                                cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+
+                dosya_adi = time.strftime("%Y%m%d_%H%M%S", time.localtime(zaman))
+                dosya_adi += f"_{int((zaman % 1) * 1000):03d}_{sebep}.jpg"
+                cv2.imwrite(os.path.join(self.klasor, dosya_adi), kare)
+                self.yazilan += 1
+
+                if self.yazilan % TEMIZLIK_ARALIGI == 1:
+                    self._klasoru_temizle()
+            except Exception as e:
+                print(f"❌ [KAYITÇI] Görüntü yazma hatası: {e}")
+
+    def _klasoru_temizle(self):
+        """Yaş sınırını aşan dosyaları, ardından boyut sınırı aşılıyorsa en eskileri siler"""
+        try:
+            simdi = time.time()
+            dosyalar = []
+            for ad in os.listdir(self.klasor):
+                yol = os.path.join(self.klasor, ad)
+                if not os.path.isfile(yol):
+                    continue
+                bilgi = os.stat(yol)
+                if simdi - bilgi.st_mtime > self.maks_yas:
+                    os.remove(yol)
+                    continue
+                dosyalar.append((bilgi.st_mtime, bilgi.st_size, yol))
+
+            toplam = sum(boyut for _, boyut, _ in dosyalar)
+            for _, boyut, yol in sorted(dosyalar):
+                if toplam <= self.maks_boyut:
+                    break
+                os.remove(yol)
+                toplam -= boyut
+        except Exception as e:
+            print(f"⚠️ [KAYITÇI] Klasör temizleme hatası: {e}")
+
+    def durdur(self):
+        """Yazıcı thread'ini durdurur"""
+        if not self.aktif:
+            return
+        self.aktif = False
+        try:
+            self.kuyruk.put_nowait(None)
+        except queue.Full:
+            pass
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=2.0)
+
+    def istatistikler(self) -> Dict[str, Optional[object]]:
+        """Kayıt istatistiklerini döndürür"""
+        return {
+            "politika": self.politika,
+            "yazilan": self.yazilan,
+            "atlanan": self.atlanan,
+            "kuyrukta": self.kuyruk.qsize(),
+            "klasor": self.klasor,
+        }
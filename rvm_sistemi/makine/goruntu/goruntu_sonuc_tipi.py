@@ -37,6 +37,7 @@ class GoruntuSonuc:
     genislik_mm: float = 0.0
     yukseklik_mm: float = 0.0
     mesaj: str = ""
+    kayit_id: Optional[int] = None  # Doğrulama sonucuna kadar bekletilen karenin kimliği (GoruntuKayitci)
     
     def __str__(self) -> str:
         """İnsan okunabilir string representation"""
@@ -7,11 +7,40 @@ Ubuntu Server için Hikrobot MVS kamera kontrol servisi
 """
 
 import sys
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Tuple
 import numpy as np
 import cv2
 from ctypes import *
 from .MvCameraControl_class import *
 
+HALKA_BOYUTU = 4                 # Önceden ayrılmış ham kare tamponu sayısı
+YAKALAMA_ZAMAN_ASIMI_MS = 100    # Yakalama thread'inin SDK bekleme süresi
+KARE_MAKS_YAS = 0.5              # Bundan eski son kare "güncel" sayılmaz (saniye)
+
+# Donanım zaman damgası -> time.monotonic eşlemesi
+VARSAYILAN_TICK_FREKANSI = 1_000_000_000  # USB3 Vision: ns; GigE'de GevTimestampTickFrequency okunur
+SAAT_ESLEME_PENCERESI = 64       # Saat farkı bu kadar son kareden hesaplanır
+SAAT_ESLEME_MAKS_SAPMA = 0.1     # Penceredeki farklar bundan çok dağılırsa eşleme güvenilmez (saniye)
+
+
+@dataclass
+class KareBilgisi:
+    """Halkadaki tamamlanmış bir karenin meta verisi"""
+    indeks: int              # Halka tamponu indeksi
+    kare_no: int             # Kameranın kare numarası
+    cihaz_zamani: int        # Kamera donanım zaman damgası (tick)
+    cekim_zamani: float      # Donanım zaman damgasının time.monotonic karşılığı
+    alinma_zamani: float     # Karenin SDK'dan alındığı an (time.monotonic)
+    piksel_formati: int      # Ham verinin SDK piksel formatı
+    genislik: int
+    yukseklik: int
+    uzunluk: int             # Ham veri uzunluğu (bayt)
+
+
 class KameraServisi:
     """Hikrobot MVS kamera kontrol sınıfı"""
     
@@ -22,6 +51,20 @@ class KameraServisi:
         self.aktif_mi = False
         self.surekli_yakalama_aktif = False  # Sürekli yakalama durumu
         
+        # Yakalama thread'i ve önceden ayrılmış kare halkası
+        self.yakalama_thread = None
+        self.yakalama_thread_aktif = False
+        self._halka = []
+        self._okuyucu_sayisi = [0] * HALKA_BOYUTU
+        self._son_kare: Optional[KareBilgisi] = None
+        self._kare_kosulu = threading.Condition()
+        self._tick_frekansi = VARSAYILAN_TICK_FREKANSI
+        self._saat_farklari = deque(maxlen=SAAT_ESLEME_PENCERESI)
+        self._son_cihaz_zamani = None
+        self.yakalanan_kare = 0
+        self.atlanan_kare = 0
+        self.yakalama_hatasi = 0
+        
     def baslat(self):
         """Kamerayı başlat ve ayarla"""
         try:
@@ -75,10 +118,13 @@ class KameraServisi:
                 else:
                     print(f"⚠️ [KAMERA] Optimal paket boyutu alınamadı! ret[0x{optimal_paket_boyutu:x}]")
             
+            self._tick_frekansi = self._tick_frekansi_oku()
+            
             # Sürekli görüntü yakalamayı başlat (GSO sensörü için)
             self._surekli_yakalama_baslat()
             
             self.aktif_mi = True
+            self._yakalama_thread_baslat()
             print("✅ [KAMERA] Başarıyla başlatıldı ve sürekli yakalama aktif")
             
         except Exception as e:
@@ -109,54 +155,235 @@ class KameraServisi:
             print(f"❌ [KAMERA] Sürekli yakalama hatası: {e}")
             raise
     
-    def fotograf_cek(self):
+    def _yakalama_thread_baslat(self):
+        """Kareleri sürekli halkaya yazan yakalama thread'ini başlatır"""
+        if self.yakalama_thread_aktif:
+            return
+        self.yakalama_thread_aktif = True
+        self.yakalama_thread = threading.Thread(
+            target=self._yakalama_worker, daemon=True, name="KameraYakalamaThread"
+        )
+        self.yakalama_thread.start()
+
+    def _tick_frekansi_oku(self) -> int:
+        """Donanım zaman damgasının tick frekansı (GigE); okunamazsa ns kabul edilir"""
+        deger = MVCC_INTVALUE_EX()
+        ret = self.cam.MV_CC_GetIntValueEx("GevTimestampTickFrequency", deger)
+        if ret == 0 and deger.nCurValue > 0:
+            return int(deger.nCurValue)
+        return VARSAYILAN_TICK_FREKANSI
+
+    def _cekim_zamani(self, cihaz_zamani: int, alinma_zamani: float) -> float:
+        """
+        Donanım zaman damgasını time.monotonic saatine çevirir.
+        Alınma anı = çekim anı + aktarım gecikmesi olduğundan, son karelerdeki en küçük
+        (alınma - cihaz) farkı iki saat arasındaki farktır. Zaman damgası yoksa veya
+        eşleme tutarsızsa (yanlış tick frekansı) alınma anı kullanılır.
+        """
+        if not cihaz_zamani:
+            return alinma_zamani
+        if self._son_cihaz_zamani is not None and cihaz_zamani < self._son_cihaz_zamani:
+            self._saat_farklari.clear()  # Kamera saati sıfırlandı
+        self._son_cihaz_zamani = cihaz_zamani
+
+        cihaz_saniye = cihaz_zamani / self._tick_frekansi
+        self._saat_farklari.append(alinma_zamani - cihaz_saniye)
+        en_kucuk = min(self._saat_farklari)
+        if max(self._saat_farklari) - en_kucuk > SAAT_ESLEME_MAKS_SAPMA:
+            return alinma_zamani
+        return cihaz_saniye + en_kucuk
+
+    def _halka_hazirla(self, uzunluk):
+        """Ham kare halkadaki tamponlara sığmıyorsa (veya ilk karede) tamponları ayırır"""
+        if self._halka and self._halka[0].size >= uzunluk:
+            return
+        self._halka = [np.empty(uzunluk, dtype=np.uint8) for _ in range(HALKA_BOYUTU)]
+        self._son_kare = None
+
+    def _bos_slot_al(self):
+        """Son kare ve okunmakta olan tamponlar dışındaki ilk slotu döndürür"""
+        son = self._son_kare.indeks if self._son_kare else -1
+        for adim in range(1, HALKA_BOYUTU + 1):
+            indeks = (son + adim) % HALKA_BOYUTU
+            if indeks != son and self._okuyucu_sayisi[indeks] == 0:
+                return indeks
+        return None
+
+    def _yakalama_worker(self):
+        """
+        SDK'dan ham kareleri alıp tek kopyayla önceden ayrılmış halkaya yazar.
+        Renk dönüşümü burada yapılmaz (kare_al'da, sadece istenen kare için);
+        SDK tamponu kopya biter bitmez serbest bırakılır, kare başına bellek ayrılmaz.
+        """
+        cikis_karesi = MV_FRAME_OUT()
+        while self.yakalama_thread_aktif:
+            memset(byref(cikis_karesi), 0, sizeof(cikis_karesi))
+            ret = self.cam.MV_CC_GetImageBuffer(cikis_karesi, YAKALAMA_ZAMAN_ASIMI_MS)
+            if ret != 0 or not cikis_karesi.pBufAddr:
+                self.yakalama_hatasi += 1
+                continue
+
+            alinma_zamani = time.monotonic()
+            bilgi = cikis_karesi.stFrameInfo
+            uzunluk = bilgi.nFrameLen
+            indeks = None
+            try:
+                with self._kare_kosulu:
+                    self._halka_hazirla(uzunluk)
+                    indeks = self._bos_slot_al()
+
+                if indeks is not None:
+                    # SDK tamponu üzerinde kopyasız görünüm, ham veri halka slotuna kopyalanır
+                    buffer = (c_ubyte * uzunluk).from_address(addressof(cikis_karesi.pBufAddr.contents))
+                    np.copyto(self._halka[indeks][:uzunluk], np.frombuffer(buffer, dtype=np.uint8))
+            except Exception as e:
+                print(f"❌ [KAMERA] Kare kopyalama hatası: {e}")
+                indeks = None
+            finally:
+                self.cam.MV_CC_FreeImageBuffer(cikis_karesi)
+
+            if indeks is None:
+                self.atlanan_kare += 1
+                continue
+
+            cihaz_zamani = (bilgi.nDevTimeStampHigh << 32) | bilgi.nDevTimeStampLow
+            with self._kare_kosulu:
+                self._son_kare = KareBilgisi(
+                    indeks=indeks,
+                    kare_no=bilgi.nFrameNum,
+                    cihaz_zamani=cihaz_zamani,
+                    cekim_zamani=self._cekim_zamani(cihaz_zamani, alinma_zamani),
+                    alinma_zamani=alinma_zamani,
+                    piksel_formati=bilgi.enPixelType,
+                    genislik=bilgi.nWidth,
+                    yukseklik=bilgi.nHeight,
+                    uzunluk=uzunluk,
+                )
+                self.yakalanan_kare += 1
+                self._kare_kosulu.notify_all()
+
+    def kare_al(self, yeni_zaman: Optional[float] = None,
+                zaman_asimi: float = 1.0) -> Optional[Tuple[np.ndarray, KareBilgisi]]:
+        """
+        Halkadaki son tamamlanmış kareyi BGR'ye çevirip döndürür.
+        Tazelik kameranın donanım zaman damgasından (cekim_zamani) değerlendirilir.
+
+        Args:
+            yeni_zaman: Verilirse bu andan (time.monotonic) sonra çekilmiş kare beklenir,
+                        ör. sensör tetik zamanı. Verilmezse son kare KARE_MAKS_YAS'tan
+                        yeni olmalıdır.
+            zaman_asimi: Uygun kare için en fazla bekleme süresi (saniye)
+
+        Returns:
+            (BGR görüntü, KareBilgisi); zaman aşımında veya dönüştürülemezse None.
+            Görüntü çağırana aittir.
+        """
+        if not self.aktif_mi or not self.yakalama_thread_aktif:
+            raise Exception("Kamera aktif değil veya sürekli yakalama başlatılmamış.")
+
+        def _uygun():
+            kare = self._son_kare
+            if kare is None:
+                return False
+            if yeni_zaman is not None:
+                return kare.cekim_zamani > yeni_zaman
+            return time.monotonic() - kare.cekim_zamani <= KARE_MAKS_YAS
+
+        with self._kare_kosulu:
+            if not self._kare_kosulu.wait_for(_uygun, zaman_asimi):
+                return None
+            bilgi = self._son_kare
+            tampon = self._halka[bilgi.indeks]
+            self._okuyucu_sayisi[bilgi.indeks] += 1
+
+        # Dönüşüm kilit dışında yapılır; okunan slot bu sırada yakalama thread'ince yazılmaz
+        try:
+            goruntu = np.empty((bilgi.yukseklik, bilgi.genislik, 3), dtype=np.uint8)
+            if not self._bgr_ye_yaz(tampon[:bilgi.uzunluk], bilgi, goruntu):
+                return None
+            return goruntu, bilgi
+        except Exception as e:
+            print(f"❌ [KAMERA] Kare dönüştürme hatası: {e}")
+            return None
+        finally:
+            with self._kare_kosulu:
+                self._okuyucu_sayisi[bilgi.indeks] -= 1
+
+    def fotograf_cek(self, yeni_zaman: Optional[float] = None):
         """
         ULTRA HIZLI frame yakalama - GSO sensörü için maksimum optimize edilmiş
-        Kamera sürekli çalışır, sadece son frame'i alır
+        Kamera sürekli çalışır, yakalama thread'inin son tamamladığı kareyi döndürür
+        
+        Args:
+            yeni_zaman: Verilirse bu andan (time.monotonic) sonra alınmış kare beklenir
         
         Returns:
             np.ndarray: BGR formatında görüntü verisi
         """
-        if not self.aktif_mi or not self.cam or not self.surekli_yakalama_aktif:
-            raise Exception("Kamera aktif değil veya sürekli yakalama başlatılmamış.")
-        
         try:
-            # Frame buffer'ı hazırla
-            cikis_karesi = MV_FRAME_OUT()
-            memset(byref(cikis_karesi), 0, sizeof(cikis_karesi))
-            
-            # MV-CS040-10UC için minimal timeout (1ms - en hızlı güvenli değer)
-            # 540fps → 1.85ms frame interval, 1ms yeterli
-            ret = self.cam.MV_CC_GetImageBuffer(cikis_karesi, 1)
-            
-            if cikis_karesi.pBufAddr and ret == 0:
-                # Frame bilgilerini al
-                genislik = cikis_karesi.stFrameInfo.nWidth
-                yukseklik = cikis_karesi.stFrameInfo.nHeight
-                kare_uzunlugu = cikis_karesi.stFrameInfo.nFrameLen
-                
-                # Buffer'ı numpy array'e çevir - HIZLI
-                buffer = (c_ubyte * kare_uzunlugu).from_address(
-                    addressof(cikis_karesi.pBufAddr.contents))
-                buffer_np = np.frombuffer(buffer, dtype=np.uint8)
-                
-                # BGR formatına çevir - OPTIMIZED
-                bgr_goruntusu = self._bgr_ye_cevir_hizli(buffer_np, cikis_karesi.stFrameInfo)
-                
-                # Buffer'ı serbest bırak - ANINDA
-                self.cam.MV_CC_FreeImageBuffer(cikis_karesi)
-                
-                if bgr_goruntusu is not None:
-                    return bgr_goruntusu
-                else:
-                    raise Exception("Desteklenmeyen pixel formatı")
-                
-            else:
-                raise Exception(f"Frame alınamadı! ret[0x{ret:x}]")
+            sonuc = self.kare_al(yeni_zaman)
+            if sonuc is None:
+                raise Exception("Yeni kare alınamadı (zaman aşımı veya dönüşüm hatası)")
+            return sonuc[0]
                 
         except Exception as e:
             print(f"❌ [KAMERA] Frame yakalama hatası: {e}")
             return None
+
+    def istatistikler(self):
+        """Yakalama istatistiklerini döndürür"""
+        son = self._son_kare
+        return {
+            "yakalanan": self.yakalanan_kare,
+            "atlanan": self.atlanan_kare,
+            "yakalama_hatasi": self.yakalama_hatasi,
+            "son_kare_no": son.kare_no if son else None,
+            "son_kare_yasi_ms": round((time.monotonic() - son.cekim_zamani) * 1000, 1) if son else None,
+            "son_kare_aktarim_ms": round((son.alinma_zamani - son.cekim_zamani) * 1000, 1) if son else None,
+        }
+    
+    def _bgr_ye_yaz(self, buffer, kare_bilgisi, hedef) -> bool:
+        """
+        Ham kareyi BGR olarak hedef diziye yazar (ara bellek ayırmadan)
+        
+        Args:
+            buffer: Ham görüntü verisi
+            kare_bilgisi: KareBilgisi (piksel formatı ve boyutlar)
+            hedef: (yukseklik, genislik, 3) uint8 dizi
+        
+        Returns:
+            bool: Yazma başarılıysa True
+        """
+        pixel_formati = kare_bilgisi.piksel_formati
+        genislik = kare_bilgisi.genislik
+        yukseklik = kare_bilgisi.yukseklik
+        
+        bayer_donusumleri = {
+            0x01080009: cv2.COLOR_BAYER_BG2BGR,  # BayerRG8
+            0x0108000B: cv2.COLOR_BAYER_RG2BGR,  # BayerBG8
+            0x01080008: cv2.COLOR_BAYER_GB2BGR,  # BayerGR8
+            0x0108000A: cv2.COLOR_BAYER_GR2BGR,  # BayerGB8
+            0x01080001: cv2.COLOR_GRAY2BGR,      # Mono8
+        }
+        
+        if pixel_formati == 0x02180021 and len(buffer) >= genislik * yukseklik * 3:  # BGR8
+            np.copyto(hedef, buffer[:genislik * yukseklik * 3].reshape((yukseklik, genislik, 3)))
+            return True
+        if pixel_formati == 0x02180014 and len(buffer) >= genislik * yukseklik * 3:  # RGB8
+            cv2.cvtColor(buffer[:genislik * yukseklik * 3].reshape((yukseklik, genislik, 3)),
+                         cv2.COLOR_RGB2BGR, dst=hedef)
+            return True
+        if pixel_formati in bayer_donusumleri and len(buffer) >= genislik * yukseklik:
+            cv2.cvtColor(buffer[:genislik * yukseklik].reshape((yukseklik, genislik)),
+                         bayer_donusumleri[pixel_formati], dst=hedef)
+            return True
+        
+        # Beklenmeyen format - eski dönüştürücüye düş (bellek ayırır)
+        goruntu = self._bgr_ye_cevir_hizli(buffer, kare_bilgisi)
+        if goruntu is None or goruntu.shape != hedef.shape:
+            return False
+        np.copyto(hedef, goruntu)
+        return True
     
     def _bgr_ye_cevir_hizli(self, buffer, kare_bilgisi):
         """
@@ -165,14 +392,14 @@ class KameraServisi:
         
         Args:
             buffer: Ham görüntü verisi
-            kare_bilgisi: Frame bilgi yapısı
+            kare_bilgisi: KareBilgisi (piksel formatı ve boyutlar)
             
         Returns:
             np.ndarray: BGR formatında görüntü
         """
-        pixel_formati = kare_bilgisi.enPixelType
-        genislik = kare_bilgisi.nWidth
-        yukseklik = kare_bilgisi.nHeight
+        pixel_formati = kare_bilgisi.piksel_formati
+        genislik = kare_bilgisi.genislik
+        yukseklik = kare_bilgisi.yukseklik
         
         try:
             # MV-CS040-10UC Color kamera - en yaygın formatlar
@@ -285,6 +512,12 @@ class KameraServisi:
     def durdur(self):
         """Kamerayı kapat ve kaynakları temizle"""
         try:
+            # Önce yakalama thread'ini durdur (SDK tamponlarını kullanıyor)
+            if self.yakalama_thread_aktif:
+                self.yakalama_thread_aktif = False
+                if self.yakalama_thread and self.yakalama_thread.is_alive():
+                    self.yakalama_thread.join(timeout=1.0)
+            
             # Sürekli yakalamayı durdur
             if self.surekli_yakalama_aktif and self.cam:
                 self.cam.MV_CC_StopGrabbing()
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+YOLO İşlemci
+YOLO modelini seçilen çıkarım arka ucu (PyTorch, ONNX Runtime veya OpenVINO)
+ile yükler, thread sayılarını ayarlar ve ilk gerçek şişeden önce ısınma yapar.
+
+Dışa aktarılan modeller .pt dosyasının yanında, dosya özeti (hash) ve
+imgsz ile anahtarlanarak önbelleğe alınır; model değişince yeniden üretilir.
+
+Benchmark:
+    python -m rvm_sistemi.makine.goruntu.yolo_islemci --bench <kare_klasoru>
+    python -m rvm_sistemi.makine.goruntu.yolo_islemci --bench <kare_klasoru> --roi-ayar --imgsz 416
+"""
+
+import os
+import sys
+import time
+import glob
+import shutil
+import hashlib
+import argparse
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+ARKA_UCLAR = ("pytorch", "onnx", "openvino")
+KAMERA_GENISLIK = 720
+KAMERA_YUKSEKLIK = 540
+
+
+def roi_hesapla(roi: Optional[Sequence[int]], genislik: int = KAMERA_GENISLIK,
+               yukseklik: int = KAMERA_YUKSEKLIK) -> Tuple[int, int, int, int]:
+    """
+    ROI ayarını [x, y, genişlik, yükseklik] olarak kare sınırlarına kırpar.
+    Ayar yoksa veya boyutu 0 ise tüm kareyi döndürür.
+    """
+    if not roi or len(roi) != 4:
+        return 0, 0, genislik, yukseklik
+    x, y, w, h = (max(0, int(v)) for v in roi)
+    x, y = min(x, genislik - 1), min(y, yukseklik - 1)
+    w = genislik - x if w == 0 else min(w, genislik - x)
+    h = yukseklik - y if h == 0 else min(h, yukseklik - y)
+    return x, y, w, h
+
+
+def roi_kirp(kare, roi: Tuple[int, int, int, int]):
+    """Kareden ROI'yi kopyalamadan (NumPy görünümü olarak) keser"""
+    x, y, w, h = roi
+    return kare[y:y + h, x:x + w]
+
+
+def dosya_ozeti(yol: str) -> str:
+    """Model dosyasının kısa SHA-256 özetini döndürür"""
+    ozet = hashlib.sha256()
+    with open(yol, "rb") as f:
+        for parca in iter(lambda: f.read(1024 * 1024), b""):
+            ozet.update(parca)
+    return ozet.hexdigest()[:12]
+
+
+def threadleri_ayarla(intra_op: int, inter_op: int) -> None:
+    """PyTorch intra-op / inter-op thread sayılarını ayarlar (0 = varsayılan)"""
+    try:
+        import torch
+        if intra_op > 0:
+            torch.set_num_threads(intra_op)
+        if inter_op > 0:
+            # Paralel iş başladıktan sonra çağrılırsa RuntimeError verir
+            torch.set_num_interop_threads(inter_op)
+    except Exception as e:
+        print(f"⚠️ [YOLO] Thread ayarı uygulanamadı: {e}")
+
+
+def _onbellek_yolu(pt_yolu: str, arka_uc: str, imgsz: int) -> str:
+    """Dışa aktarılmış modelin önbellek yolunu döndürür"""
+    kok = os.path.splitext(pt_yolu)[0]
+    anahtar = f"{dosya_ozeti(pt_yolu)}_{imgsz}"
+    if arka_uc == "onnx":
+        return f"{kok}.{anahtar}.onnx"
+    # Ultralytics OpenVINO klasörünü '_openvino_model' sonekinden tanır
+    return f"{kok}.{anahtar}_openvino_model"
+
+
+def _disa_aktar(pt_yolu: str, arka_uc: str, imgsz: int) -> str:
+    """Modeli gerekirse dışa aktarır, önbellekteki yolu döndürür"""
+    from ultralytics import YOLO
+
+    hedef = _onbellek_yolu(pt_yolu, arka_uc, imgsz)
+    if os.path.exists(hedef):
+        return hedef
+
+    print(f"🔄 [YOLO] {arka_uc} modeli dışa aktarılıyor (tek seferlik): {hedef}")
+    cikti = YOLO(pt_yolu).export(format=arka_uc, imgsz=imgsz, dynamic=False, half=False)
+    shutil.move(str(cikti), hedef)
+    return hedef
+
+
+def _onnx_threadleri_uygula(model, onnx_yolu: str, intra_op: int, inter_op: int) -> None:
+    """ONNX Runtime oturumunu istenen thread sayılarıyla yeniden oluşturur"""
+    import onnxruntime as ort
+
+    secenekler = ort.SessionOptions()
+    if intra_op > 0:
+        secenekler.intra_op_num_threads = intra_op
+    if inter_op > 0:
+        secenekler.inter_op_num_threads = inter_op
+        secenekler.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+    model.predictor.model.session = ort.InferenceSession(
+        onnx_yolu, secenekler, providers=["CPUExecutionProvider"]
+    )
+
+
+def _openvino_threadleri_uygula(model, openvino_klasoru: str, intra_op: int) -> None:
+    """OpenVINO modelini istenen çıkarım thread sayısıyla yeniden derler"""
+    import openvino as ov
+
+    core = ov.Core()
+    xml_yolu = next(glob.iglob(os.path.join(openvino_klasoru, "*.xml")))
+    model.predictor.model.ov_compiled_model = core.compile_model(
+        core.read_model(xml_yolu), device_name="CPU",
+        config={"INFERENCE_NUM_THREADS": intra_op},
+    )
+
+
+def modeli_yukle(pt_yolu: str, arka_uc: str = "pytorch", imgsz: int = 640,
+                 intra_op: int = 0, inter_op: int = 0, isinma_sayisi: int = 3,
+                 kare_boyutu: Optional[Tuple[int, int]] = None):
+    """
+    YOLO modelini seçilen arka uçla yükler ve ısındırır.
+
+    Dışa aktarma veya yükleme başarısız olursa PyTorch arka ucuna düşer.
+
+    Returns:
+        tuple: (model, kullanilan_arka_uc)
+    """
+    from ultralytics import YOLO
+
+    threadleri_ayarla(intra_op, inter_op)
+
+    if arka_uc not in ARKA_UCLAR:
+        print(f"⚠️ [YOLO] Bilinmeyen arka uç '{arka_uc}', PyTorch kullanılıyor")
+        arka_uc = "pytorch"
+
+    model = None
+    model_yolu = pt_yolu
+    if arka_uc != "pytorch":
+        try:
+            model_yolu = _disa_aktar(pt_yolu, arka_uc, imgsz)
+            model = YOLO(model_yolu, task="detect")
+        except Exception as e:
+            print(f"⚠️ [YOLO] {arka_uc} arka ucu yüklenemedi, PyTorch kullanılıyor: {e}")
+            arka_uc = "pytorch"
+            model_yolu = pt_yolu
+
+    if model is None:
+        model = YOLO(pt_yolu)
+
+    modeli_isindir(model, imgsz, isinma_sayisi, kare_boyutu)
+
+    # Predictor ilk çağrıda oluşur; thread ayarları oturuma ondan sonra uygulanır
+    if intra_op > 0 or inter_op > 0:
+        try:
+            if arka_uc == "onnx":
+                _onnx_threadleri_uygula(model, model_yolu, intra_op, inter_op)
+            elif arka_uc == "openvino" and intra_op > 0:
+                _openvino_threadleri_uygula(model, model_yolu, intra_op)
+        except Exception as e:
+            print(f"⚠️ [YOLO] {arka_uc} thread ayarı uygulanamadı: {e}")
+
+    print(f"✅ [YOLO] Model hazır - Arka uç: {arka_uc}, imgsz: {imgsz}")
+    return model, arka_uc
+
+
+def modeli_isindir(model, imgsz: int, isinma_sayisi: int,
+                   kare_boyutu: Optional[Tuple[int, int]] = None) -> None:
+    """
+    Üretimdeki kare boyutunda boş karelerle tembel başlatmaları önceden tetikler.
+    kare_boyutu (genişlik, yükseklik) çıkarıma giren karedir (ROI varsa kırpılmış
+    kare); verilmezse tam kamera karesi kullanılır.
+    """
+    if isinma_sayisi <= 0:
+        return
+    genislik, yukseklik = kare_boyutu or (KAMERA_GENISLIK, KAMERA_YUKSEKLIK)
+    bos_kare = np.zeros((yukseklik, genislik, 3), dtype=np.uint8)
+    baslangic = time.time()
+    for _ in range(isinma_sayisi):
+        model.predict(source=bos_kare, device="cpu", imgsz=imgsz, save=False, verbose=False)
+    print(f"🔥 [YOLO] Isınma tamamlandı: {isinma_sayisi} kare, {(time.time() - baslangic) * 1000:.0f}ms")
+
+
+def tespitleri_al(model, kare, imgsz: int, conf: float = 0.75, iou: float = 0.5) -> List[Dict]:
+    """Tek kare için sınıf, güven ve kutu listesini döndürür"""
+    sonuclar = model.predict(source=kare, device="cpu", imgsz=imgsz, save=False,
+                             conf=conf, iou=iou, verbose=False)
+    tespitler = []
+    if sonuclar and sonuclar[0].boxes:
+        for kutu in sonuclar[0].boxes:
+            tespitler.append({
+                "sinif": int(kutu.cls[0]),
+                "guven": float(kutu.conf[0]),
+                "kutu": [float(v) for v in kutu.xyxy[0]],
+            })
+    return tespitler
+
+
+def _iou(a, b) -> float:
+    """İki xyxy kutunun kesişim/birleşim oranı"""
+    x1, y1 = max(a[0], b[0]), max(a[1], b[1])
+    x2, y2 = min(a[2], b[2]), min(a[3], b[3])
+    kesisim = max(0.0, x2 - x1) * max(0.0, y2 - y1)
+    birlesim = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - kesisim
+    return kesisim / birlesim if birlesim > 0 else 0.0
+
+
+def sonuclar_eslesiyor_mu(referans: List[Dict], aday: List[Dict], iou_esigi: float = 0.9) -> bool:
+    """En güvenli tespitlerin sınıfı ve kutusu PyTorch sonucu ile eşleşiyor mu"""
+    if not referans or not aday:
+        return not referans and not aday
+    r = max(referans, key=lambda t: t["guven"])
+    a = max(aday, key=lambda t: t["guven"])
+    return r["sinif"] == a["sinif"] and _iou(r["kutu"], a["kutu"]) >= iou_esigi
+
+
+def _yuzdelik(degerler: List[float], oran: float) -> float:
+    sirali = sorted(degerler)
+    return sirali[min(len(sirali) - 1, int(round(oran * (len(sirali) - 1))))]
+
+
+def benchmark(kare_klasoru: str, pt_yolu: str, arka_uclar: List[str], imgsz: int,
+              intra_op: int, inter_op: int, roi: Optional[Sequence[int]] = None) -> None:
+    """
+    Her arka uç için p50/p95/p99 çıkarım süresini ve PyTorch ile uyumu raporlar.
+
+    ROI verilirse referans, tüm karede 640 imgsz ile çalışan PyTorch'tur; diğer
+    ölçümler kırpılmış karede yapılır ve kutular ROI ofsetiyle geri kaydırılır.
+    """
+    import cv2
+
+    dosyalar = sorted(
+        yol for uzanti in ("*.jpg", "*.jpeg", "*.png", "*.bmp")
+        for yol in glob.glob(os.path.join(kare_klasoru, uzanti))
+    )
+    kareler = [cv2.imread(yol) for yol in dosyalar]
+    kareler = [k for k in kareler if k is not None]
+    if not kareler:
+        print(f"❌ [BENCH] Klasörde kare bulunamadı: {kare_klasoru}")
+        return
+
+    print(f"📂 [BENCH] {len(kareler)} kare, imgsz={imgsz}, intra={intra_op}, inter={inter_op}")
+    referans: Optional[List[List[Dict]]] = None
+    roi_kutusu = None
+
+    if roi is not None:
+        yukseklik, genislik = kareler[0].shape[:2]
+        roi_kutusu = roi_hesapla(roi, genislik, yukseklik)
+        print(f"✂️ [BENCH] ROI: {roi_kutusu} ({roi_kutusu[2] * roi_kutusu[3] / (genislik * yukseklik) * 100:.0f}% piksel)")
+        model, _ = modeli_yukle(pt_yolu, "pytorch", 640, intra_op, inter_op,
+                                kare_boyutu=(genislik, yukseklik))
+        sureler = []
+        referans = []
+        for kare in kareler:
+            baslangic = time.perf_counter()
+            referans.append(tespitleri_al(model, kare, 640))
+            sureler.append((time.perf_counter() - baslangic) * 1000)
+        print(f"📊 [BENCH] {'tam kare':9s} p50: {_yuzdelik(sureler, 0.50):7.1f}ms  "
+              f"p95: {_yuzdelik(sureler, 0.95):7.1f}ms  p99: {_yuzdelik(sureler, 0.99):7.1f}ms (referans)")
+
+    for arka_uc in arka_uclar:
+        kare_boyutu = roi_kutusu[2:] if roi_kutusu is not None else kareler[0].shape[1::-1]
+        model, kullanilan = modeli_yukle(pt_yolu, arka_uc, imgsz, intra_op, inter_op, kare_boyutu=kare_boyutu)
+        if kullanilan != arka_uc:
+            print(f"⚠️ [BENCH] {arka_uc} atlandı (yüklenemedi)")
+            continue
+
+        sureler, sonuclar = [], []
+        for kare in kareler:
+            if roi_kutusu is None:
+                baslangic = time.perf_counter()
+                sonuclar.append(tespitleri_al(model, kare, imgsz))
+                sureler.append((time.perf_counter() - baslangic) * 1000)
+                continue
+            x, y = roi_kutusu[0], roi_kutusu[1]
+            baslangic = time.perf_counter()
+            tespitler = tespitleri_al(model, roi_kirp(kare, roi_kutusu), imgsz)
+            sureler.append((time.perf_counter() - baslangic) * 1000)
+            for t in tespitler:
+                k = t["kutu"]
+                t["kutu"] = [k[0] + x, k[1] + y, k[2] + x, k[3] + y]
+            sonuclar.append(tespitler)
+
+        if referans is None and arka_uc == "pytorch":
+            referans = sonuclar
+        uyum = ""
+        if referans is not None and (arka_uc != "pytorch" or roi_kutusu is not None):
+            eslesen = sum(sonuclar_eslesiyor_mu(r, a) for r, a in zip(referans, sonuclar))
+            uyum = f" | PyTorch uyumu: {eslesen}/{len(kareler)}"
+
+        print(f"📊 [BENCH] {arka_uc:9s} p50: {_yuzdelik(sureler, 0.50):7.1f}ms  "
+              f"p95: {_yuzdelik(sureler, 0.95):7.1f}ms  p99: {_yuzdelik(sureler, 0.99):7.1f}ms{uyum}")
+
+
+def main(argv=None):
+    from .goruntu_ayarlari import goruntu_ayarlarini_yukle
+
+    ayarlar = goruntu_ayarlarini_yukle()
+    parser = argparse.ArgumentParser(description="YOLO arka uç benchmark aracı")
+    parser.add_argument("--bench", metavar="KLASOR", required=True, help="Örnek karelerin bulunduğu klasör")
+    parser.add_argument("--model", default=os.path.join(os.path.dirname(__file__), "kpl04.pt"))
+    parser.add_argument("--arka-uc", nargs="+", default=list(ARKA_UCLAR), choices=ARKA_UCLAR)
+    parser.add_argument("--imgsz", type=int, default=ayarlar["yolo_imgsz"])
+    parser.add_argument("--intra-op", type=int, default=ayarlar["yolo_intra_op_thread"])
+    parser.add_argument("--inter-op", type=int, default=ayarlar["yolo_inter_op_thread"])
+    parser.add_argument("--roi", type=int, nargs=4, metavar=("X", "Y", "W", "H"), default=None,
+                        help="Bu ROI ile kırpılmış kareyi tam kare ile karşılaştır")
+    parser.add_argument("--roi-ayar", action="store_true", help="Ayar dosyasındaki ROI'yi kullan")
+    args = parser.parse_args(argv)
+
+    roi = ayarlar["roi"] if args.roi_ayar else args.roi
+    # PyTorch her zaman referans olarak önce ölçülür
+    arka_uclar = ["pytorch"] + [a for a in args.arka_uc if a != "pytorch"]
+    benchmark(args.bench, args.model, arka_uclar, args.imgsz, args.intra_op, args.inter_op, roi)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,5 +4,6 @@ Ubuntu ortamında çalışan GA500 sürücü kontrol modülü
 """
 
 from .modbus_istemci import GA500ModbusClient
+from .telemetri import GA500Telemetri
 
-__all__ = ['GA500ModbusClient']
\ No newline at end of file
+__all__ = ['GA500ModbusClient', 'GA500Telemetri']
\ No newline at end of file
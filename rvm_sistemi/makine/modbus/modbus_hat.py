@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Modbus Hat Yöneticisi
+RS-485 hattının tek sahibi olan thread ve öncelikli istek kuyruğu.
+Durdurma/reset/çalıştırma komutları bekleyen telemetri okumalarının önüne geçer;
+zamanında hatta çıkamayan telemetri okumaları kuyrukta biriktirilmez, atlanır.
+"""
+
+import bisect
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+# Küçük değer = yüksek öncelik
+ONCELIKLER = {
+    "dur": 0,         # Motor durdurma - son tarih geçse bile gönderilir
+    "komut": 1,       # Çalıştırma, frekans, reset, arıza temizleme
+    "telemetri": 2,   # İzleme okumaları - son tarih geçerse atlanır
+}
+HISTOGRAM_SINIRLARI_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+
+class IstekAtlandi(Exception):
+    """Son tarihi geçtiği için hatta gönderilmeden atlanan istek"""
+
+
+class GecikmeHistogrami:
+    """Sabit kovalı gecikme histogramı ve son ölçümlerden yüzdelikler"""
+
+    def __init__(self, ornek_sayisi: int = 500):
+        self.kovalar = [0] * (len(HISTOGRAM_SINIRLARI_MS) + 1)
+        self.son_degerler = deque(maxlen=ornek_sayisi)
+        self.toplam = 0
+
+    def ekle(self, ms: float) -> None:
+        self.kovalar[bisect.bisect_left(HISTOGRAM_SINIRLARI_MS, ms)] += 1
+        self.son_degerler.append(ms)
+        self.toplam += 1
+
+    def ozet(self) -> Dict[str, Any]:
+        sirali = sorted(self.son_degerler)
+
+        def yuzdelik(oran):
+            return round(sirali[min(len(sirali) - 1, int(oran * len(sirali)))], 2) if sirali else None
+
+        etiketler = [f"<={s}ms" for s in HISTOGRAM_SINIRLARI_MS] + [f">{HISTOGRAM_SINIRLARI_MS[-1]}ms"]
+        return {
+            "adet": self.toplam,
+            "p50_ms": yuzdelik(0.50),
+            "p95_ms": yuzdelik(0.95),
+            "p99_ms": yuzdelik(0.99),
+            "maks_ms": round(sirali[-1], 2) if sirali else None,
+            "histogram": dict(zip(etiketler, self.kovalar)),
+        }
+
+
+class ModbusHatYoneticisi:
+    """Tüm Modbus işlemlerini tek thread'de öncelik sırasıyla çalıştırır"""
+
+    def __init__(self, isim: str = "ModbusHatThread"):
+        self.isim = isim
+        self._kuyruk = queue.PriorityQueue()
+        self._sira = itertools.count()
+        self._thread = None
+        self._aktif = False
+        self._baslat_lock = threading.Lock()
+
+        # İstek sınıfı başına: kuyrukta bekleme ve istek başına toplam süre
+        self.bekleme = {sinif: GecikmeHistogrami() for sinif in ONCELIKLER}
+        self.toplam_sure = {sinif: GecikmeHistogrami() for sinif in ONCELIKLER}
+        self.atlanan = {sinif: 0 for sinif in ONCELIKLER}
+        self.hatali = {sinif: 0 for sinif in ONCELIKLER}
+
+    def _baslat(self) -> None:
+        if self._aktif:
+            return
+        with self._baslat_lock:
+            if self._aktif:
+                return
+            self._aktif = True
+            self._thread = threading.Thread(target=self._hat_worker, daemon=True, name=self.isim)
+            self._thread.start()
+
+    def gonder(self, sinif: str, islem: Callable[[], Any], son_tarih_saniye: float) -> Future:
+        """
+        İsteği öncelik kuyruğuna ekler ve sonucu taşıyacak Future'ı döndürür.
+
+        Args:
+            sinif: "dur", "komut" veya "telemetri"
+            islem: Hat thread'inde çalıştırılacak pymodbus çağrısı
+            son_tarih_saniye: İsteğin bu süre içinde hatta çıkması gerekir
+        """
+        self._baslat()
+        future = Future()
+        eklenme = time.monotonic()
+        self._kuyruk.put((ONCELIKLER[sinif], next(self._sira), sinif, islem, eklenme,
+                          eklenme + son_tarih_saniye, future))
+        return future
+
+    def calistir(self, sinif: str, islem: Callable[[], Any], son_tarih_saniye: float) -> Any:
+        """İsteği gönderir ve sonucunu bekler (hat thread'inden çağrılırsa doğrudan çalıştırır)"""
+        if threading.current_thread() is self._thread:
+            return islem()
+        return self.gonder(sinif, islem, son_tarih_saniye).result()
+
+    def _hat_worker(self) -> None:
+        """Kuyruktaki en öncelikli isteği alıp hatta gönderen döngü"""
+        while self._aktif:
+            try:
+                _, _, sinif, islem, eklenme, son_tarih, future = self._kuyruk.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            if islem is None:
+                break
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            baslangic = time.monotonic()
+            if baslangic > son_tarih and sinif != "dur":
+                self.atlanan[sinif] += 1
+                future.set_exception(IstekAtlandi(
+                    f"{sinif} isteği {(baslangic - eklenme) * 1000:.0f}ms bekledi, atlandı"))
+                continue
+
+            self.bekleme[sinif].ekle((baslangic - eklenme) * 1000)
+            try:
+                future.set_result(islem())
+            except Exception as e:
+                self.hatali[sinif] += 1
+                future.set_exception(e)
+            self.toplam_sure[sinif].ekle((time.monotonic() - eklenme) * 1000)
+
+    def durdur(self) -> None:
+        """Hat thread'ini durdurur; bekleyen istekler atlanmış sayılır"""
+        if not self._aktif:
+            return
+        self._aktif = False
+        self._kuyruk.put((-1, next(self._sira), None, None, 0.0, 0.0, None))
+        if self._thread and self._thread.is_alive() and threading.current_thread() is not self._thread:
+            self._thread.join(timeout=2.0)
+
+        while True:
+            try:
+                _, _, sinif, islem, _, _, future = self._kuyruk.get_nowait()
+            except queue.Empty:
+                break
+            if future is not None and future.set_running_or_notify_cancel():
+                future.set_exception(IstekAtlandi("Modbus hattı kapatıldı"))
+
+    def istatistikler(self) -> Dict[str, Any]:
+        """İstek sınıfı başına gecikme histogramları ve sayaçlar"""
+        istatistik = {
+            sinif: {
+                "kuyrukta_bekleme": self.bekleme[sinif].ozet(),
+                "toplam_sure": self.toplam_sure[sinif].ozet(),
+                "atlanan": self.atlanan[sinif],
+                "hatali": self.hatali[sinif],
+            }
+            for sinif in ONCELIKLER
+        }
+        istatistik["kuyrukta"] = self._kuyruk.qsize()
+        return istatistik
@@ -16,6 +16,45 @@ except ImportError:
 
 from ...utils.terminal import section, status, ok, warn, err, step
 from ...dimdb.config import config
+from .telemetri import GA500Telemetri
+from .modbus_hat import ModbusHatYoneticisi, IstekAtlandi
+from ..seri.trafik_kaydi import modbus_istemcisini_izle
+
+# Son telemetri bu süreden yeniyse bus voltajı için tekrar okuma yapılmaz (saniye)
+TELEMETRI_TAZELIK_SURESI = 1.5
+
+# Okuma planlayıcı - GA500 MEMOBUS tek istekte en fazla 16 register okur
+MAKS_REGISTER_SAYISI = 16
+# 9600 baud'da bir ek işlem (istek + cevap + çerçeve boşlukları + sürücü cevap süresi)
+# yaklaşık 12 register'lık ek veriye denk; bundan küçük boşluklar tek istekte okunur
+MAKS_BIRLESTIRME_BOSLUGU = 12
+
+# Uyarlanabilir okuma aralıkları (saniye)
+HIZLI_OKUMA_ARALIGI = 0.1    # Motor çalışırken, arızada veya sıkışma şüphesinde
+YAVAS_OKUMA_ARALIGI = 2.0    # Motorlar dururken veya uyku modunda
+SICAKLIK_OKUMA_ARALIGI = 5.0 # Sıcaklık yavaş değişir, her döngüde okunmaz
+
+# Komutların hatta çıkması için son tarih (saniye); durdurma komutu her durumda gönderilir
+KOMUT_SON_TARIHI = 2.0
+
+
+def okuma_plani_olustur(adresler, maks_adet=MAKS_REGISTER_SAYISI, maks_bosluk=MAKS_BIRLESTIRME_BOSLUGU):
+    """
+    Register adreslerini mümkün olan en az sayıda ardışık okuma isteğine birleştirir.
+    
+    Returns:
+        list: [(baslangic_adresi, adet), ...]
+    """
+    plan = []
+    for adres in sorted(set(adresler)):
+        if plan:
+            baslangic, adet = plan[-1]
+            bosluk = adres - (baslangic + adet)
+            if bosluk <= maks_bosluk and adres - baslangic + 1 <= maks_adet:
+                plan[-1] = (baslangic, adres - baslangic + 1)
+                continue
+        plan.append((adres, 1))
+    return plan
 
 class GA500ModbusClient:
     """GA500 Modbus RTU Client - GUI kodundaki frekans mantığı ile"""
@@ -53,7 +92,9 @@ class GA500ModbusClient:
         
         self.client = None
         self.is_connected = False
-        self.lock = threading.Lock()
+        
+        # Seri hattın tek sahibi: komutlar telemetri okumalarının önüne geçer
+        self.hat = ModbusHatYoneticisi()
         
         if logger is None:
             logging.basicConfig(level=logging.INFO)
@@ -65,10 +106,10 @@ class GA500ModbusClient:
         self.reading_thread = None
         self.stop_reading = False
         
-        # Status data - makine tipine göre
-        self.status_data = {1: {}}  # Ezici motor (slave 1)
+        # Son telemetri kayıtları - makine tipine göre
+        self.telemetri = {1: None}  # Ezici motor (slave 1)
         if self.kirici_var_mi:  # True: KPL-04 (Kırıcılı), False: KPL-05 (Kırıcısız)
-            self.status_data[2] = {}  # Kırıcı motor (slave 2, sadece KPL-04)
+            self.telemetri[2] = None  # Kırıcı motor (slave 2, sadece KPL-04)
         
         # Modbus client'ları
         self.ezici_client = None  # Ezici motor client'ı
@@ -94,6 +135,18 @@ class GA500ModbusClient:
         self.CMD_REVERSE = 0x0002
         self.CMD_RESET = 0x0008
         
+        # Okuma planları: sıcaklık sadece tam okumada alınır
+        izleme_adresleri = [self.STATUS_REGISTER, self.DCBUS_REG] + [self.MON_BASE + i for i in range(5)]
+        self.hizli_okuma_plani = okuma_plani_olustur(izleme_adresleri)
+        self.tam_okuma_plani = okuma_plani_olustur(izleme_adresleri + [self.TEMP_REG])
+        self.son_sicaklik_okuma = {1: 0.0, 2: 0.0}
+        
+        # Uyarlanabilir okuma aralığı
+        self.uyku_modu = False
+        self.hizli_okuma_bitis = 0.0
+        self._okuma_uyandir = threading.Event()
+        self.okuma_islem_sayisi = 0
+        
     def connect(self):
         """Modbus bağlantısını başlat ve sürücüleri resetle - Port otomatik tespit"""
         
@@ -137,7 +190,9 @@ class GA500ModbusClient:
                 
                 if client.connect():
                     # Basit bir test ile bağlantıyı doğrula
-                    test_result = client.read_holding_registers(address=0x0020, count=1, unit=slave_id)
+                    test_result = self.hat.calistir(
+                        "komut", lambda: client.read_holding_registers(address=0x0020, count=1, unit=slave_id),
+                        KOMUT_SON_TARIHI)
                     if not test_result.isError():
                         # Başarılı portu kaydet
                         if slave_id == 1:
@@ -150,6 +205,7 @@ class GA500ModbusClient:
                             self.kirici_connected = True
                         
                         self.logger.info(f"✅ {drive_name} motor portu bulundu: {test_port}")
+                        modbus_istemcisini_izle(client, f"ga500_{slave_id}")  # RVM_TRAFIK_KAYDI açıksa
                         
                         # SÜRÜCÜYE RESET GÖNDER
                         self.reset(slave_id)
@@ -175,6 +231,9 @@ class GA500ModbusClient:
             # UPS kesintisi tespit edildi - hemen işlemleri başlat
             self._trigger_ups_power_failure()
             
+            # Hat thread'i kapanacak client'lara istek göndermesin; bekleyenler atlanır
+            self.hat.durdur()
+            
             # Mevcut bağlantıları kapat
             if self.ezici_client and self.ezici_connected:
                 self.ezici_client.close()
@@ -255,9 +314,13 @@ class GA500ModbusClient:
         try:
             # Sürekli okuma thread'ini durdur
             self.stop_reading = True
+            self._okuma_uyandir.set()
             if self.reading_thread and self.reading_thread.is_alive():
                 self.reading_thread.join(timeout=2)
             
+            # Hat thread'ini durdur
+            self.hat.durdur()
+            
             # Ezici motor bağlantısını kapat
             if self.ezici_client and self.ezici_connected:
                 self.ezici_client.close()
@@ -292,7 +355,9 @@ class GA500ModbusClient:
             # GUI kodundaki gibi: hz * 100 (0.01 Hz çözünürlük)
             freq_value = int(frequency * 100)
             
-            result = client.write_register(self.FREQUENCY_REGISTER, freq_value, unit=slave_id)
+            result = self.hat.calistir(
+                "komut", lambda: client.write_register(self.FREQUENCY_REGISTER, freq_value, unit=slave_id),
+                KOMUT_SON_TARIHI)
             if not result.isError():
                 self.logger.info(f"✅ Motor {slave_id}: Frekans ayarlandı ({frequency} Hz)")
                 return True
@@ -301,6 +366,10 @@ class GA500ModbusClient:
                 self._handle_connection_error()
                 return False
                 
+        except IstekAtlandi as e:
+            # Komut kuyrukta son tarihini kaçırdı - bağlantı hatası değil
+            self.logger.warning(f"⚠️ Motor {slave_id}: Frekans komutu atlandı ({e})")
+            return False
         except Exception as e:
             self.logger.error(f"❌ Frekans ayarlama hatası: {e}")
             self._handle_connection_error()
@@ -322,7 +391,9 @@ class GA500ModbusClient:
             
             self.logger.info(f"▶️ Motor {slave_id}: İleri çalıştırma")
             
-            result = client.write_register(self.CONTROL_REGISTER, self.CMD_FORWARD, unit=slave_id)
+            result = self.hat.calistir(
+                "komut", lambda: client.write_register(self.CONTROL_REGISTER, self.CMD_FORWARD, unit=slave_id),
+                KOMUT_SON_TARIHI)
             if not result.isError():
                 self.logger.info(f"✅ Motor {slave_id}: İleri çalıştırıldı")
                 return True
@@ -331,6 +402,10 @@ class GA500ModbusClient:
                 self._handle_connection_error()
                 return False
                 
+        except IstekAtlandi as e:
+            # Komut kuyrukta son tarihini kaçırdı - bağlantı hatası değil
+            self.logger.warning(f"⚠️ Motor {slave_id}: İleri çalıştırma komutu atlandı ({e})")
+            return False
         except Exception as e:
             self.logger.error(f"❌ İleri çalıştırma hatası: {e}")
             self._handle_connection_error()
@@ -352,7 +427,9 @@ class GA500ModbusClient:
             
             self.logger.info(f"⏹️ Motor {slave_id}: Durdurma")
             
-            result = client.write_register(self.CONTROL_REGISTER, self.CMD_STOP, unit=slave_id)
+            result = self.hat.calistir(
+                "dur", lambda: client.write_register(self.CONTROL_REGISTER, self.CMD_STOP, unit=slave_id),
+                KOMUT_SON_TARIHI)
             if not result.isError():
                 self.logger.info(f"✅ Motor {slave_id}: Durduruldu")
                 return True
@@ -361,6 +438,10 @@ class GA500ModbusClient:
                 self._handle_connection_error()
                 return False
                 
+        except IstekAtlandi as e:
+            # Komut kuyrukta son tarihini kaçırdı - bağlantı hatası değil
+            self.logger.warning(f"⚠️ Motor {slave_id}: Durdurma komutu atlandı ({e})")
+            return False
         except Exception as e:
             self.logger.error(f"❌ Durdurma hatası: {e}")
             self._handle_connection_error()
@@ -382,7 +463,9 @@ class GA500ModbusClient:
             
             self.logger.info(f"🔄 Motor {slave_id}: Reset atılıyor...")
             
-            result = client.write_register(self.CONTROL_REGISTER, self.CMD_RESET, unit=slave_id)
+            result = self.hat.calistir(
+                "komut", lambda: client.write_register(self.CONTROL_REGISTER, self.CMD_RESET, unit=slave_id),
+                KOMUT_SON_TARIHI)
             if not result.isError():
                 time.sleep(0.5)  # Reset sonrası bekleme
                 self.logger.info(f"✅ Motor {slave_id}: Reset tamamlandı")
@@ -392,6 +475,10 @@ class GA500ModbusClient:
                 self._handle_connection_error()
                 return False
                 
+        except IstekAtlandi as e:
+            # Komut kuyrukta son tarihini kaçırdı - bağlantı hatası değil
+            self.logger.warning(f"⚠️ Motor {slave_id}: Reset komutu atlandı ({e})")
+            return False
         except Exception as e:
             self.logger.error(f"❌ Reset hatası: {e}")
             self._handle_connection_error()
@@ -414,7 +501,9 @@ class GA500ModbusClient:
             self.logger.info(f"🔧 Motor {slave_id}: Arıza temizleniyor...")
             
             # Önce reset gönder
-            reset_result = client.write_register(self.CONTROL_REGISTER, self.CMD_RESET, unit=slave_id)
+            reset_result = self.hat.calistir(
+                "komut", lambda: client.write_register(self.CONTROL_REGISTER, self.CMD_RESET, unit=slave_id),
+                KOMUT_SON_TARIHI)
             if reset_result.isError():
                 self.logger.error(f"❌ Motor {slave_id}: Arıza reset hatası")
                 self._handle_connection_error()
@@ -423,7 +512,9 @@ class GA500ModbusClient:
             time.sleep(0.5)  # Reset sonrası bekleme
             
             # Arıza durumunu kontrol et
-            status_result = client.read_holding_registers(address=self.STATUS_REGISTER, count=1, unit=slave_id)
+            status_result = self.hat.calistir(
+                "komut", lambda: client.read_holding_registers(address=self.STATUS_REGISTER, count=1, unit=slave_id),
+                KOMUT_SON_TARIHI)
             if not status_result.isError():
                 status = status_result.registers[0]
                 fault_bit = status & 0x8  # Bit 3: Arıza durumu
@@ -439,102 +530,91 @@ class GA500ModbusClient:
                 self._handle_connection_error()
                 return False
                 
+        except IstekAtlandi as e:
+            # Komut kuyrukta son tarihini kaçırdı - bağlantı hatası değil
+            self.logger.warning(f"⚠️ Motor {slave_id}: Arıza temizleme komutu atlandı ({e})")
+            return False
         except Exception as e:
             self.logger.error(f"❌ Arıza temizleme hatası: {e}")
             self._handle_connection_error()
             return False
     
-    def read_status_registers(self, slave_id):
-        """Sürücü durum registerlerini oku - GUI kodundaki mantık"""
-        status_data = {}
-        
+    @property
+    def status_data(self):
+        """Eski iç içe sözlük formatında son durum verileri (geriye dönük uyumluluk)"""
+        return {sid: (t.durum_sozlugu() if t else {}) for sid, t in self.telemetri.items()}
+    
+    def read_telemetri(self, slave_id):
+        """Sürücü izleme registerlerini okuyup GA500Telemetri kaydı döndürür - GUI kodundaki mantık"""
         try:
             # Makine tipine göre kontrol
             if slave_id == 2 and not self.kirici_var_mi:
                 self.logger.error("❌ Bu makinede kırıcı motor yok! (KPL-05)")
-                return {}
+                return None
             
             # Doğru client'ı seç
             client = self.ezici_client if slave_id == 1 else self.kirici_client
             if not client:
                 self.logger.error(f"❌ Motor {slave_id} client'ı bulunamadı!")
-                return {}
-            
-            with self.lock:
-                # GUI kodundaki gibi register okuma
-                r1 = client.read_holding_registers(address=self.MON_BASE, count=5, unit=slave_id)
-                r2 = client.read_holding_registers(address=self.DCBUS_REG, count=1, unit=slave_id)
-                r3 = client.read_holding_registers(address=self.STATUS_REGISTER, count=1, unit=slave_id)
-                r4 = client.read_holding_registers(address=self.TEMP_REG, count=1, unit=slave_id)
-            
-            # Verileri parse et - ac_surucu_v1.py kodundaki doğru mantık
-            if r1 and r2 and r3 and r4 and not (r1.isError() or r2.isError() or r3.isError() or r4.isError()):
-                # ac_surucu_v1.py kodundaki doğru scaling
-                status_data['freq_reference'] = {
-                    'value': r1.registers[0] / 100.0,  # ÷100 (0.01 Hz çözünürlük)
-                    'raw': r1.registers[0],
-                    'unit': 'Hz',
-                    'description': 'Frekans Referansı'
-                }
-                status_data['output_freq'] = {
-                    'value': r1.registers[1] / 100.0,  # ÷100 (0.01 Hz çözünürlük)
-                    'raw': r1.registers[1],
-                    'unit': 'Hz',
-                    'description': 'Çıkış Frekansı'
-                }
-                status_data['output_voltage'] = {
-                    'value': r1.registers[2] / 10.0,   # ÷10 (0.1V çözünürlük)
-                    'raw': r1.registers[2],
-                    'unit': 'V',
-                    'description': 'Çıkış Voltajı'
-                }
-                status_data['output_current'] = {
-                    'value': r1.registers[3] / 10.0,   # ÷10 (0.1A çözünürlük)
-                    'raw': r1.registers[3],
-                    'unit': 'A',
-                    'description': 'Çıkış Akımı'
-                }
-                status_data['output_power'] = {
-                    'value': r1.registers[4] / 100.0,  # ÷100 (0.01 kW çözünürlük)
-                    'raw': r1.registers[4],
-                    'unit': 'kW',
-                    'description': 'Güç Çıkışı'
-                }
-                
-                # r2: dc_bus_voltage
-                status_data['dc_bus_voltage'] = {
-                    'value': r2.registers[0],
-                    'raw': r2.registers[0],
-                    'unit': 'V',
-                    'description': 'DC Bus Voltajı'
-                }
-                
-                # r3: drive_status
-                status_data['drive_status'] = {
-                    'value': r3.registers[0],
-                    'raw': r3.registers[0],
-                    'unit': '',
-                    'description': 'Sürücü Durumu'
-                }
-                
-                # r4: temperature
-                status_data['temperature'] = {
-                    'value': r4.registers[0],
-                    'raw': r4.registers[0],
-                    'unit': '°C',
-                    'description': 'Sıcaklık'
-                }
-            else:
-                self.logger.error(f"❌ Motor {slave_id}: Register okuma hatası")
-                # Register okuma hatası durumunda yeniden bağlantı dene
-                self._handle_connection_error()
-                
+                return None
+            
+            # Sıcaklık SICAKLIK_OKUMA_ARALIGI'nda bir okunur, arada önceki değer taşınır
+            onceki = self.telemetri.get(slave_id)
+            simdi = time.monotonic()
+            sicaklik_oku = onceki is None or simdi - self.son_sicaklik_okuma.get(slave_id, 0.0) >= SICAKLIK_OKUMA_ARALIGI
+            plan = self.tam_okuma_plani if sicaklik_oku else self.hizli_okuma_plani
+            
+            # Her pencere ayrı hat isteğidir; arada bekleyen komut önce gönderilir
+            degerler = {}
+            son_tarih = self.okuma_araligi()
+            for baslangic, adet in plan:
+                cevap = self.hat.calistir(
+                    "telemetri",
+                    lambda b=baslangic, a=adet: client.read_holding_registers(address=b, count=a, unit=slave_id),
+                    son_tarih)
+                self.okuma_islem_sayisi += 1
+                if not cevap or cevap.isError():
+                    degerler = None
+                    break
+                for i, deger in enumerate(cevap.registers):
+                    degerler[baslangic + i] = deger
+            
+            if degerler is not None:
+                if sicaklik_oku:
+                    self.son_sicaklik_okuma[slave_id] = simdi
+                    sicaklik = degerler[self.TEMP_REG]
+                else:
+                    sicaklik = onceki.temperature
+                # ac_surucu_v1.py kodundaki doğru scaling GA500Telemetri içinde
+                return GA500Telemetri.registerlerden(
+                    slave_id,
+                    [degerler[self.MON_BASE + i] for i in range(5)],
+                    degerler[self.DCBUS_REG],
+                    degerler[self.STATUS_REGISTER],
+                    sicaklik,
+                )
+            
+            self.logger.error(f"❌ Motor {slave_id}: Register okuma hatası")
+            # Register okuma hatası durumunda yeniden bağlantı dene
+            self._handle_connection_error()
+        
+        except IstekAtlandi:
+            # Hat komutlarla meşgul - hata değil, çağıran bu döngüyü atlar
+            raise
         except Exception as e:
             self.logger.error(f"❌ Status okuma hatası: {e}")
             # Exception durumunda da yeniden bağlantı dene
             self._handle_connection_error()
         
-        return status_data
+        return None
+    
+    def read_status_registers(self, slave_id):
+        """Sürücü durum registerlerini eski sözlük formatında oku (geriye dönük uyumluluk)"""
+        try:
+            telemetri = self.read_telemetri(slave_id)
+        except IstekAtlandi:
+            return {}
+        return telemetri.durum_sozlugu() if telemetri else {}
     
     def continuous_reading_worker(self):
         """Sürekli okuma worker thread'i"""
@@ -587,42 +667,12 @@ class GA500ModbusClient:
                 if self.stop_reading:
                     break
                 
-                # Ezici motor status'unu oku
-                ezici_status = self.read_status_registers(1)
-                if not ezici_status:
+                # Ezici her zaman, kırıcı sadece KPL-04'te okunur
+                if not self._telemetri_guncelle(1):
                     success = False
-                else:
-                    # Thread-safe veri güncelleme
-                    with self.lock:
-                        self.status_data[1] = ezici_status
-                    
-                    # Konsola yazdır ve callback'e gönder
-                    modbus_veri = self.print_status(1, ezici_status)
-                    if modbus_veri and self.callback:
-                        try:
-                            veri_str = "s1:" + ",".join([f"{k}:{v}" for k, v in modbus_veri.items()])
-                            self.callback(veri_str)
-                        except Exception as e:
-                            self.logger.error(f"❌ Ezici callback hatası: {e}")
-                
-                # Kırıcı motor okuma (sadece KPL-04)
-                if self.kirici_var_mi and self.kirici_connected:
-                    kirici_status = self.read_status_registers(2)
-                    if not kirici_status:
+                if self.kirici_var_mi and self.kirici_connected and not self.stop_reading:
+                    if not self._telemetri_guncelle(2):
                         success = False
-                    else:
-                        # Thread-safe veri güncelleme
-                        with self.lock:
-                            self.status_data[2] = kirici_status
-                        
-                        # Konsola yazdır ve callback'e gönder
-                        modbus_veri = self.print_status(2, kirici_status)
-                        if modbus_veri and self.callback:
-                            try:
-                                veri_str = "s2:" + ",".join([f"{k}:{v}" for k, v in modbus_veri.items()])
-                                self.callback(veri_str)
-                            except Exception as e:
-                                self.logger.error(f"❌ Kırıcı callback hatası: {e}")
 
                 if success:
                     consecutive_errors = 0  # Başarılı okuma, error sayacını sıfırla
@@ -639,8 +689,9 @@ class GA500ModbusClient:
                         if not self._handle_connection_error():
                             self.is_connected = False  # Bağlantı başarısız, ana döngü yeniden deneyecek
                 
-                # 0.5 saniye bekle
-                time.sleep(0.5)
+                # Motor durumuna göre hızlı/yavaş bekle; komut gelirse erken uyan
+                self._okuma_uyandir.wait(self.okuma_araligi())
+                self._okuma_uyandir.clear()
 
 
             except Exception as e:
@@ -655,67 +706,82 @@ class GA500ModbusClient:
                 
                 time.sleep(1)
     
-    def print_status(self, slave_id, status):
-        """Status verilerini formatla ve döndür"""
-        if not status:
-            return None
-            
-        freq_ref = status.get('freq_reference', {}).get('value', 0)
-        freq_out = status.get('output_freq', {}).get('value', 0)
-        voltage = status.get('output_voltage', {}).get('value', 0)
-        current = status.get('output_current', {}).get('value', 0)
-        power = status.get('output_power', {}).get('value', 0)
-        dc_voltage = status.get('dc_bus_voltage', {}).get('value', 0)
-        temperature = status.get('temperature', {}).get('value', 0)
-        drive_status = status.get('drive_status', {}).get('raw', 0)
-        
-        # Durum analizi - GUI kodundaki mantık
-        is_running = (drive_status & 0x0001) != 0
-        is_ready = (drive_status & 0x0004) != 0
-        has_fault = (drive_status & 0x0008) != 0
-        
-        # Yön bilgisi sadece motor çalışırken gösterilir
-        if is_running:
-            direction = "İLERİ" if (drive_status & 0x0002) else "GERİ"
-        else:
-            direction = "DURUYOR"
+    def _telemetri_guncelle(self, slave_id):
+        """Sürücü telemetrisini okur, saklar ve callback'e gönderir; okuma hatasında False döner"""
+        try:
+            telemetri = self.read_telemetri(slave_id)
+        except IstekAtlandi:
+            return True  # Hat komutlarla meşguldü, bu döngü atlanır
         
-        status_text = "ÇALIŞIYOR" if is_running else "DURUYOR"
-        ready_text = "EVET" if is_ready else "HAYIR"
-        fault_text = "VAR" if has_fault else "YOK"
+        if telemetri is None:
+            return False
         
-        # Callback için formatlanmış string döndür
-        modbus_data = {
-            'freq_ref': freq_ref,
-            'freq_out': freq_out,
-            'voltage': voltage,
-            'current': current,
-            'power': power,
-            'dc_voltage': dc_voltage,
-            'temperature': temperature,
-            'status': status_text,
-            'direction': direction,
-            'ready': ready_text,
-            'fault': fault_text
-        }
+        # Kayıt değişmez; referans ataması okuyucular için thread-safe
+        self.telemetri[slave_id] = telemetri
         
-        return modbus_data
+        # Kaydı doğrudan callback'e gönder (string'e çevirmeden)
+        if self.callback:
+            try:
+                self.callback(telemetri)
+            except Exception as e:
+                motor_adi = "Ezici" if slave_id == 1 else "Kırıcı"
+                self.logger.error(f"❌ {motor_adi} callback hatası: {e}")
+        return True
+    
+    def hat_istatistikleri(self):
+        """Modbus hattı istek sınıfı başına gecikme histogramları"""
+        istatistik = self.hat.istatistikler()
+        istatistik["okuma_islem_sayisi"] = self.okuma_islem_sayisi
+        istatistik["okuma_araligi_s"] = self.okuma_araligi()
+        return istatistik
+    
+    def okuma_araligi(self):
+        """Motor durumuna göre sonraki okumaya kadar beklenecek süre"""
+        if time.monotonic() < self.hizli_okuma_bitis:
+            return HIZLI_OKUMA_ARALIGI
+        if not self.uyku_modu:
+            for telemetri in self.telemetri.values():
+                if telemetri and (telemetri.calisiyor or telemetri.ariza):
+                    return HIZLI_OKUMA_ARALIGI
+        return YAVAS_OKUMA_ARALIGI
+    
+    def hizli_okuma_iste(self, sure=5.0):
+        """Motor komutu veya sıkışma şüphesinde belirtilen süre boyunca hızlı okumaya geçer"""
+        self.hizli_okuma_bitis = max(self.hizli_okuma_bitis, time.monotonic() + sure)
+        self._okuma_uyandir.set()
+    
+    def uyku_modu_ayarla(self, aktif):
+        """Uyku modunda okuma yavaş aralıkta kalır"""
+        self.uyku_modu = aktif
+        if not aktif:
+            self._okuma_uyandir.set()
     
     def get_bus_voltage(self, slave_id=1):
         """Bus voltage değerini döndürür - Voltage monitoring için"""
         try:
             if not self.is_connected:
                 return None
-                
-            # Status register'larını oku
-            status_data = self.read_status_registers(slave_id)
             
-            if status_data and 'dc_bus_voltage' in status_data:
-                voltage_data = status_data['dc_bus_voltage']
-                voltage_value = voltage_data.get('value', None)
-                return voltage_value
-            else:
+            # Sürekli okuma thread'inin son kaydı tazeyse bus'a tekrar gidilmez
+            telemetri = self.telemetri.get(slave_id)
+            if telemetri is not None and telemetri.yas <= TELEMETRI_TAZELIK_SURESI:
+                return telemetri.dc_voltage
+            
+            # Yavaş okuma aralığında sadece DC bus register'ı okunur
+            client = self.ezici_client if slave_id == 1 else self.kirici_client
+            if not client:
+                return None
+            try:
+                cevap = self.hat.calistir(
+                    "telemetri",
+                    lambda: client.read_holding_registers(address=self.DCBUS_REG, count=1, unit=slave_id),
+                    TELEMETRI_TAZELIK_SURESI)
+            except IstekAtlandi:
+                return None
+            self.okuma_islem_sayisi += 1
+            if not cevap or cevap.isError():
                 return None
+            return cevap.registers[0]
                 
         except Exception as e:
             self.logger.error(f"Bus voltage okuma hatası: {e}")
@@ -99,6 +99,11 @@ class MotorKontrol:
             return False
         return True
     
+    def _hizli_okuma_iste(self):
+        """Motor komutu sonrası Modbus izlemesini hızlı aralığa alır"""
+        if self.client:
+            self.client.hizli_okuma_iste()
+    
     def _check_sensor_kart(self):
         """Sensör kartı kontrolü (motor sürme için)"""
         if self.sensor_kart is None:
@@ -184,20 +189,18 @@ class MotorKontrol:
                     self.logger.warning("⚠️ Modbus bağlantısı yok - sıkışma izleme durduruluyor")
                     break
                 
-                # Motor durumunu oku
-                status = self.client.status_data.get(motor_id, {})
-                if not status:
+                # Son telemetri kaydını oku
+                telemetri = self.client.telemetri.get(motor_id)
+                if telemetri is None:
                     time.sleep(0.5)
                     continue
                 
                 # Akım değerini al
-                current_data = status.get('output_current', {})
-                current_value = current_data.get('value', 0.0)
+                current_value = telemetri.current
                 sikisma_durumu['son_akim'] = current_value
                 
                 # Motor çalışıyor mu kontrol et
-                drive_status = status.get('drive_status', {}).get('raw', 0)
-                is_running = (drive_status & 0x0001) != 0
+                is_running = telemetri.calisiyor
                 
                 if is_running and current_value > akim_limiti:
                     # Yüksek akım tespit edildi
@@ -205,6 +208,7 @@ class MotorKontrol:
                         # İlk defa yüksek akım
                         sikisma_durumu['aktif'] = True
                         sikisma_durumu['basla_zamani'] = time.time()
+                        self.client.hizli_okuma_iste()
                         self.logger.warning(f"⚠️ {motor_adi}: Yüksek akım tespit edildi ({current_value:.1f}A > {akim_limiti}A)")
                     else:
                         # Yüksek akım devam ediyor
@@ -398,6 +402,7 @@ class MotorKontrol:
         self.logger.info("▶️ Ezici İleri (Dijital)")
         try:
             self.sensor_kart.ezici_ileri()
+            self._hizli_okuma_iste()
             return True
         except Exception as e:
             self.logger.error(f"❌ Ezici ileri hatası: {e}")
@@ -411,6 +416,7 @@ class MotorKontrol:
         self.logger.info("◀️ Ezici Geri (Dijital)")
         try:
             self.sensor_kart.ezici_geri()
+            self._hizli_okuma_iste()
             return True
         except Exception as e:
             self.logger.error(f"❌ Ezici geri hatası: {e}")
@@ -510,6 +516,7 @@ class MotorKontrol:
         self.logger.info("▶️ Kırıcı İleri (Dijital)")
         try:
             self.sensor_kart.kirici_ileri()
+            self._hizli_okuma_iste()
             return True
         except Exception as e:
             self.logger.error(f"❌ Kırıcı ileri hatası: {e}")
@@ -527,6 +534,7 @@ class MotorKontrol:
         self.logger.info("◀️ Kırıcı Geri (Dijital)")
         try:
             self.sensor_kart.kirici_geri()
+            self._hizli_okuma_iste()
             return True
         except Exception as e:
             self.logger.error(f"❌ Kırıcı geri hatası: {e}")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GA500 Telemetri Kaydı
+Sürücüden okunan izleme değerlerini tipli ve hafif bir nesne olarak taşır.
+Callback zinciri (durum makinesi, bakım/temizlik ekranı, voltaj izleme,
+sıkışma koruması) aynı nesneyi okur; string formatı sadece eski tüketiciler
+için istendiğinde üretilir.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any
+
+# Sürücü durum register'ı (0x0020) bitleri
+DURUM_CALISIYOR = 0x0001
+DURUM_ILERI = 0x0002
+DURUM_HAZIR = 0x0004
+DURUM_ARIZA = 0x0008
+
+
+@dataclass(slots=True)
+class GA500Telemetri:
+    """Tek bir sürücünün tek okuma anındaki izleme değerleri"""
+    slave_id: int
+    freq_ref: float = 0.0       # Hz
+    freq_out: float = 0.0       # Hz
+    voltage: float = 0.0        # V
+    current: float = 0.0        # A
+    power: float = 0.0          # kW
+    dc_voltage: float = 0.0     # V
+    drive_status: int = 0       # Ham durum register'ı
+    temperature: float = 0.0    # °C
+    zaman: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def registerlerden(cls, slave_id: int, izleme, dc_bus: int, durum: int, sicaklik: int) -> "GA500Telemetri":
+        """MON_BASE'den okunan 5 register ve tekil register değerlerinden kayıt oluşturur"""
+        return cls(
+            slave_id=slave_id,
+            freq_ref=izleme[0] / 100.0,   # 0.01 Hz çözünürlük
+            freq_out=izleme[1] / 100.0,   # 0.01 Hz çözünürlük
+            voltage=izleme[2] / 10.0,     # 0.1 V çözünürlük
+            current=izleme[3] / 10.0,     # 0.1 A çözünürlük
+            power=izleme[4] / 100.0,      # 0.01 kW çözünürlük
+            dc_voltage=dc_bus,
+            drive_status=durum,
+            temperature=sicaklik,
+        )
+
+    # --- Durum bitleri ---
+
+    @property
+    def calisiyor(self) -> bool:
+        return (self.drive_status & DURUM_CALISIYOR) != 0
+
+    @property
+    def hazir(self) -> bool:
+        return (self.drive_status & DURUM_HAZIR) != 0
+
+    @property
+    def ariza(self) -> bool:
+        return (self.drive_status & DURUM_ARIZA) != 0
+
+    @property
+    def yon(self) -> str:
+        """Yön bilgisi sadece motor çalışırken anlamlıdır"""
+        if not self.calisiyor:
+            return "DURUYOR"
+        return "İLERİ" if (self.drive_status & DURUM_ILERI) else "GERİ"
+
+    @property
+    def yas(self) -> float:
+        """Okumadan bu yana geçen süre (saniye)"""
+        return time.monotonic() - self.zaman
+
+    # --- Eski formatlar ---
+
+    def sozluk(self) -> Dict[str, Any]:
+        """ModbusParser.parse_modbus_string çıktısıyla aynı anahtarlara sahip sözlük"""
+        return {
+            'freq_ref': self.freq_ref,
+            'freq_out': self.freq_out,
+            'voltage': self.voltage,
+            'current': self.current,
+            'power': self.power,
+            'dc_voltage': self.dc_voltage,
+            'temperature': self.temperature,
+            'status': "ÇALIŞIYOR" if self.calisiyor else "DURUYOR",
+            'direction': self.yon,
+            'ready': "EVET" if self.hazir else "HAYIR",
+            'fault': "VAR" if self.ariza else "YOK",
+        }
+
+    def durum_sozlugu(self) -> Dict[str, Dict[str, Any]]:
+        """GA500ModbusClient.status_data'nın eski iç içe sözlük formatı"""
+        def _alan(deger, raw, birim, aciklama):
+            return {'value': deger, 'raw': raw, 'unit': birim, 'description': aciklama}
+
+        return {
+            'freq_reference': _alan(self.freq_ref, round(self.freq_ref * 100), 'Hz', 'Frekans Referansı'),
+            'output_freq': _alan(self.freq_out, round(self.freq_out * 100), 'Hz', 'Çıkış Frekansı'),
+            'output_voltage': _alan(self.voltage, round(self.voltage * 10), 'V', 'Çıkış Voltajı'),
+            'output_current': _alan(self.current, round(self.current * 10), 'A', 'Çıkış Akımı'),
+            'output_power': _alan(self.power, round(self.power * 100), 'kW', 'Güç Çıkışı'),
+            'dc_bus_voltage': _alan(self.dc_voltage, self.dc_voltage, 'V', 'DC Bus Voltajı'),
+            'drive_status': _alan(self.drive_status, self.drive_status, '', 'Sürücü Durumu'),
+            'temperature': _alan(self.temperature, self.temperature, '°C', 'Sıcaklık'),
+        }
+
+    def ekran_formati(self) -> Dict[str, str]:
+        """Bakım/temizlik ekranı için formatlanmış değerler"""
+        return {
+            'set_freq': f"{self.freq_ref:.1f} Hz",
+            'out_freq': f"{self.freq_out:.1f} Hz",
+            'voltage': f"{self.voltage:.1f} V",
+            'current': f"{self.current:.1f} A",
+            'power': f"{self.power:.1f} W",
+            'bus_voltage': f"{self.dc_voltage:.1f} V",
+            'temperature': f"{self.temperature:.1f} °C",
+            'status': "ÇALIŞIYOR" if self.calisiyor else "DURUYOR",
+            'direction': self.yon,
+            'ready': "EVET" if self.hazir else "HAYIR",
+            'fault': "VAR" if self.ariza else "YOK",
+        }
+
+    def __str__(self) -> str:
+        """Eski callback string formatı: "s1:freq_ref:25.0,freq_out:24.8,..." """
+        return f"s{self.slave_id}:" + ",".join(f"{k}:{v}" for k, v in self.sozluk().items())
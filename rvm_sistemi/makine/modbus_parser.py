@@ -7,7 +7,9 @@ GA500 Modbus verilerini parse edip bakım ekranına gönderir
 
 import json
 import re
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Union
+
+from .modbus.telemetri import GA500Telemetri
 
 class ModbusParser:
     """Modbus verilerini parse eden sınıf"""
@@ -18,11 +20,25 @@ class ModbusParser:
             's2': {}   # Kırıcı motor (ID: 2)
         }
     
-    def parse_modbus_string(self, modbus_string: str) -> Optional[Dict[str, Any]]:
+    def telemetri_isle(self, telemetri: GA500Telemetri) -> Dict[str, Any]:
+        """Tipli telemetri kaydını parse etmeden saklar"""
+        motor_key = f's{telemetri.slave_id}'
+        self.parsed_data[motor_key] = telemetri
+        return {
+            'motor_id': telemetri.slave_id,
+            'motor_key': motor_key,
+            'data': telemetri
+        }
+    
+    def parse_modbus_string(self, modbus_string: Union[str, GA500Telemetri]) -> Optional[Dict[str, Any]]:
         """
         Modbus string'ini parse eder
         Format: "s1:freq_ref:25.0,freq_out:24.8,current:2.1,status:ÇALIŞIYOR"
+        GA500Telemetri kaydı gelirse parse edilmeden telemetri_isle'ye aktarılır.
         """
+        if isinstance(modbus_string, GA500Telemetri):
+            return self.telemetri_isle(modbus_string)
+        
         try:
             # Regex ile veriyi parse et
             pattern = r's(\d+):(.+)'
@@ -66,25 +82,32 @@ class ModbusParser:
             print(f"Modbus parse hatası: {e}")
             return None
     
+    @staticmethod
+    def _sozluk(veri) -> Dict[str, Any]:
+        """Telemetri kaydını eski sözlük formatına çevirir"""
+        return veri.sozluk() if isinstance(veri, GA500Telemetri) else veri
+    
     def get_motor_data(self, motor_id: int) -> Dict[str, Any]:
         """Belirli motor ID'si için veri döndürür"""
         motor_key = f's{motor_id}'
-        return self.parsed_data.get(motor_key, {})
+        return self._sozluk(self.parsed_data.get(motor_key, {}))
     
     def get_all_data(self) -> Dict[str, Any]:
         """Tüm motor verilerini döndürür"""
-        return self.parsed_data
+        return {k: self._sozluk(v) for k, v in self.parsed_data.items()}
     
     def get_crusher_data(self) -> Dict[str, Any]:
         """Ezici motor (s1) verilerini döndürür"""
-        return self.parsed_data.get('s1', {})
+        return self.get_motor_data(1)
     
     def get_breaker_data(self) -> Dict[str, Any]:
         """Kırıcı motor (s2) verilerini döndürür"""
-        return self.parsed_data.get('s2', {})
+        return self.get_motor_data(2)
     
-    def format_for_display(self, motor_data: Dict[str, Any]) -> Dict[str, str]:
+    def format_for_display(self, motor_data: Union[Dict[str, Any], GA500Telemetri]) -> Dict[str, str]:
         """Veriyi ekran gösterimi için formatlar"""
+        if isinstance(motor_data, GA500Telemetri):
+            return motor_data.ekran_formati()
         if not motor_data:
             return {}
         
@@ -1,4 +1,5 @@
 import time
+import queue
 from collections import deque
 from ...veri_tabani import veritabani_yoneticisi
 import threading
@@ -15,7 +16,7 @@ AGIRLIK_TOLERANSI = 200  # gram
 UZUNLUK_TOLERANSI = 100  # mm
 GENISLIK_TOLERANSI = 100  # mm
 UZUNLUK_DOGRULAMA_TOLERANSI = 200  # mm
-LOJIK_DONGU_BEKLEME = 0.005  # saniye
+LOJIK_BEKCI_ZAMANASIMI = 0.5  # saniye - olay gelmese de durum kontrolleri için üst sınır
 UZUNLUK_OLCUM_BEKLEME = 0.05  # saniye
 OTURUM_BASLANGIC_BEKLEME = 2  # saniye
 print("XXXXXXXXXXXXXXXXXX-----MEVLANA MOD AÇIK !!!!------XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX")
@@ -26,6 +27,32 @@ MATERYAL_ISIMLERI = {
     3: "ALÜMİNYUM"
 }
 
+# Lojik yöneticisini uyandıran mesajlar ve karşılık gelen durum bayrakları
+LOJIK_BAYRAKLARI = {
+    "gsi": "gsi_lojik",
+    "gso": "gso_lojik",
+    "yso": "yso_lojik",
+    "ysi": "ysi_lojik",
+    "kma": "konveyor_alarm",
+    "yma": "yonlendirici_alarm",
+    "sma": "seperator_alarm",
+    "kmk": "konveyor_konumda",
+    "ymk": "yonlendirici_konumda",
+    "smk": "seperator_konumda",
+    "kmh": "konveyor_hata",
+    "ymh": "yonlendirici_hata",
+    "smh": "seperator_hata",
+    "kmp": "konveyor_adim_problem",
+    "ykt": "yonlendirici_kalibrasyon",
+    "skt": "seperator_kalibrasyon",
+}
+
+@dataclass
+class LojikOlayi:
+    """Lojik yöneticisine gönderilen olay (kuyruğa eklenme zamanı ile)"""
+    tur: str
+    zaman: float = field(default_factory=time.monotonic)
+
 @dataclass
 class SistemDurumu:
     # Referanslar
@@ -113,6 +140,12 @@ class SistemDurumu:
 sistem = SistemDurumu()
 goruntu_isleme_servisi = GoruntuIslemeServisi()
 veri_lock = threading.Lock()
+olay_kuyrugu: "queue.Queue[LojikOlayi]" = queue.Queue()
+uzunluk_olcum_eventi = threading.Event()
+
+# Olay türü -> son gecikmeler (ms), sensörden aktüatöre gecikme ölçümü için
+olay_gecikmeleri: Dict[str, deque] = {}
+_bekleyen_olay_zamanlari: Dict[str, float] = {}
 
 # ==================== YARDIMCI FONKSİYONLAR ====================
 
@@ -137,6 +170,50 @@ def dimdb_bildirim_gonder(barcode: str, agirlik: float, materyal_turu: int,
     except Exception as e:
         log_error(f"DİM-DB bildirim hatası: {e}")
 
+# ==================== OLAY YÖNETİMİ ====================
+
+def olay_gonder(tur: str):
+    """
+    Lojik yöneticisini uyandırmak için olay kuyruğuna olay ekler.
+    Durumu mesaj_isle dışında değiştiren yollar (oturum sıfırlama,
+    UPS işleyicileri) da çağırmalıdır; aksi halde değişiklik bekçi zaman aşımında görülür.
+    """
+    olay_kuyrugu.put(LojikOlayi(tur))
+
+def _olaylari_topla(ilk_olay: LojikOlayi):
+    """Bekleyen tüm olayları kuyruktan alır, her tür için en eski zamanı saklar"""
+    olay = ilk_olay
+    while olay is not None:
+        _bekleyen_olay_zamanlari.setdefault(olay.tur, olay.zaman)
+        try:
+            olay = olay_kuyrugu.get_nowait()
+        except queue.Empty:
+            olay = None
+
+def _gecikme_kaydet(tur: str) -> Optional[float]:
+    """Olayın kuyruğa eklenmesinden işlenmesine kadar geçen süreyi kaydeder, olay zamanını döndürür"""
+    zaman = _bekleyen_olay_zamanlari.pop(tur, None)
+    if zaman is None:
+        return None
+    gecikme_ms = (time.monotonic() - zaman) * 1000
+    olay_gecikmeleri.setdefault(tur, deque(maxlen=100)).append(gecikme_ms)
+    return zaman
+
+def olay_gecikme_ozeti() -> Dict[str, Dict]:
+    """Olay türü başına gecikme özetini (ms) döndürür"""
+    ozet = {}
+    for tur, gecikmeler in list(olay_gecikmeleri.items()):
+        if not gecikmeler:
+            continue
+        degerler = list(gecikmeler)
+        ozet[tur] = {
+            "adet": len(degerler),
+            "ortalama_ms": round(sum(degerler) / len(degerler), 3),
+            "maks_ms": round(max(degerler), 3),
+            "son_ms": round(degerler[-1], 3),
+        }
+    return ozet
+
 # ==================== REFERANS YÖNETİMİ ====================
 
 def motor_referansini_ayarla(motor):
@@ -177,14 +254,15 @@ def barkod_verisi_al(barcode: str):
     print(f"    └─ UUID: {paket_uuid}")
     
     veri_senkronizasyonu(barkod=barcode)
+    olay_gonder("barkod")
     log_oturum_var(f"Yeni ürün - Barkod: {barcode}, UUID: {paket_uuid}")
 
 # ==================== GÖRÜNTÜ İŞLEME ====================
 
-def goruntu_isleme_tetikle():
-    """Görüntü işlemeyi tetikler"""
+def goruntu_isleme_tetikle(tetik_zamani: Optional[float] = None):
+    """Görüntü işlemeyi tetikler (tetik_zamani: sensör olayının time.monotonic zamanı)"""
     try:
-        goruntu_sonuc = goruntu_isleme_servisi.goruntu_yakala_ve_isle()
+        goruntu_sonuc = goruntu_isleme_servisi.goruntu_yakala_ve_isle(tetik_zamani=tetik_zamani)
         
         uzunluk_mm = float(goruntu_sonuc.genislik_mm)
         genislik_mm = float(goruntu_sonuc.yukseklik_mm)
@@ -202,7 +280,8 @@ def goruntu_isleme_tetikle():
         veri_senkronizasyonu(
             materyal_turu=materyal,
             uzunluk=uzunluk_mm,
-            genislik=genislik_mm
+            genislik=genislik_mm,
+            goruntu_kaydi=goruntu_sonuc.kayit_id
         )
         
         log_oturum_var(f"Görüntü işleme tamamlandı: {materyal}")
@@ -215,8 +294,9 @@ def goruntu_isleme_tetikle():
 
 # ==================== VERİ SENKRONİZASYONU ====================
 
-def veri_senkronizasyonu(barkod=None, agirlik=None, materyal_turu=None, uzunluk=None, genislik=None):
-    """Thread-safe veri senkronizasyonu"""
+def veri_senkronizasyonu(barkod=None, agirlik=None, materyal_turu=None, uzunluk=None, genislik=None,
+                         goruntu_kaydi=None):
+    """Thread-safe veri senkronizasyonu (goruntu_kaydi: doğrulama sonucunu bekleyen karenin kimliği)"""
     with veri_lock:
         # 1. YENİ ÜRÜN EKLEME
         if barkod is not None:
@@ -226,6 +306,7 @@ def veri_senkronizasyonu(barkod=None, agirlik=None, materyal_turu=None, uzunluk=
                 'materyal_turu': None,
                 'uzunluk': None,
                 'genislik': None,
+                'goruntu_kaydi': None,
                 'isleniyor': False
             })
             print(f"➕ [KUYRUK] Yeni ürün eklendi: {barkod} (Toplam: {len(sistem.veri_senkronizasyon_listesi)})")
@@ -269,6 +350,8 @@ def veri_senkronizasyonu(barkod=None, agirlik=None, materyal_turu=None, uzunluk=
             if genislik is not None:
                 target_urun['genislik'] = genislik
                 guncellenen.append(f"Genişlik: {genislik}mm")
+            if goruntu_kaydi is not None:
+                target_urun['goruntu_kaydi'] = goruntu_kaydi
             
             if guncellenen:
                 print(f"✏️  [VERİ GÜNCELLEME] Barkod {target_urun.get('barkod')} için:")
@@ -279,7 +362,7 @@ def veri_senkronizasyonu(barkod=None, agirlik=None, materyal_turu=None, uzunluk=
         for urun in sistem.veri_senkronizasyon_listesi:
             # Tüm veriler dolu mu?
             tum_veriler_dolu = all(deger is not None for anahtar, deger in urun.items() 
-                                  if anahtar != 'isleniyor')
+                                  if anahtar not in ('isleniyor', 'goruntu_kaydi'))
             
             if tum_veriler_dolu and not urun['isleniyor']:
                 print(f"\n✅ [VERİ TAMAM] Tüm veriler alındı:")
@@ -301,9 +384,10 @@ def veri_senkronizasyonu(barkod=None, agirlik=None, materyal_turu=None, uzunluk=
                     sistem.motor_ref.klape_metal()
                     print(f"🔧 [KLAPE] Metal konumu ayarlandı")
                 
-                # Doğrulama
-                dogrulama(urun['barkod'], urun['agirlik'], urun['materyal_turu'],
-                         urun['uzunluk'], urun['genislik'])
+                # Doğrulama - reddedilen ürünün karesi kayıt politikasına göre kaydedilir
+                kabul_edildi = dogrulama(urun['barkod'], urun['agirlik'], urun['materyal_turu'],
+                                         urun['uzunluk'], urun['genislik'])
+                goruntu_isleme_servisi.dogrulama_sonucu(urun['goruntu_kaydi'], kabul_edildi)
                 
                 # Kuyruktan çıkar
                 sistem.veri_senkronizasyon_listesi.remove(urun)
@@ -321,8 +405,8 @@ def veri_senkronizasyonu(barkod=None, agirlik=None, materyal_turu=None, uzunluk=
 # ==================== DOĞRULAMA ====================
 
 def dogrulama(barkod: str, agirlik: float, materyal_turu: int, 
-              uzunluk: float, genislik: float):
-    """Ürün doğrulama işlemi"""
+              uzunluk: float, genislik: float) -> bool:
+    """Ürün doğrulama işlemi - ürün kabul edildiyse True"""
     print(f"\n{'='*60}")
     print(f"🔍 [DOĞRULAMA BAŞLADI]")
     print(f"{'='*60}")
@@ -341,7 +425,7 @@ def dogrulama(barkod: str, agirlik: float, materyal_turu: int,
         sistem.iade_sebep = "Veritabanı hatası"
         dimdb_bildirim_gonder(barkod, agirlik, materyal_turu, uzunluk, genislik,
                              False, AcceptPackageResultCodes.DIGER, "Veritabanı hatası")
-        return
+        return False
     
     if not urun:
         sebep = f"Ürün veritabanında yok (Barkod: {barkod})"
@@ -351,7 +435,7 @@ def dogrulama(barkod: str, agirlik: float, materyal_turu: int,
         sistem.iade_sebep = sebep
         dimdb_bildirim_gonder(barkod, agirlik, materyal_turu, uzunluk, genislik,
                              False, AcceptPackageResultCodes.TANIMA_HATASI, "Tanıma Hatası")
-        return
+        return False
     
     # Parametreleri al
     min_agirlik = urun.get('packMinWeight')
@@ -387,7 +471,7 @@ def dogrulama(barkod: str, agirlik: float, materyal_turu: int,
         sistem.iade_sebep = sebep
         dimdb_bildirim_gonder(barkod, agirlik, materyal_turu, uzunluk, genislik,
                              False, AcceptPackageResultCodes.COK_AGIR, "Çok Ağır")
-        return
+        return False
     
     print(f"✅ [AĞIRLIK] Kontrol geçti: {agirlik}g")
     log_success(f"Ağırlık kontrolü geçti: {agirlik}g")
@@ -402,7 +486,7 @@ def dogrulama(barkod: str, agirlik: float, materyal_turu: int,
         dimdb_bildirim_gonder(barkod, agirlik, materyal_turu, uzunluk, genislik,
                              False, AcceptPackageResultCodes.GENIS_PROFIL_UYGUN_DEGIL, 
                              "Geniş profil uygun değil")
-        return
+        return False
     
     print(f"✅ [GENİŞLİK] Kontrol geçti: {genislik}mm")
     log_success(f"Genişlik kontrolü geçti: {genislik}mm")
@@ -417,7 +501,7 @@ def dogrulama(barkod: str, agirlik: float, materyal_turu: int,
         dimdb_bildirim_gonder(barkod, agirlik, materyal_turu, uzunluk, genislik,
                              False, AcceptPackageResultCodes.YUKSEKLIK_UYGUN_DEGIL, 
                              "Yükseklik uygun değil")
-        return
+        return False
     
     print(f"✅ [UZUNLUK] Kontrol geçti: {uzunluk}mm")
     log_success(f"Uzunluk kontrolü geçti: {uzunluk}mm")
@@ -431,7 +515,7 @@ def dogrulama(barkod: str, agirlik: float, materyal_turu: int,
         sistem.iade_sebep = sebep
         dimdb_bildirim_gonder(barkod, agirlik, materyal_turu, uzunluk, genislik,
                              False, AcceptPackageResultCodes.CESITLI_RED, "Çeşitli Red")
-        return
+        return False
     
     print(f"✅ [MATERYAL] Kontrol geçti: {MATERYAL_ISIMLERI.get(materyal_turu, 'BİLİNMEYEN')}")
     log_success(f"Materyal türü kontrolü geçti: {materyal_turu}")
@@ -455,6 +539,7 @@ def dogrulama(barkod: str, agirlik: float, materyal_turu: int,
     print(f"{'='*60}\n")
     
     log_success(f"Ürün kabul edildi: {barkod} (Kuyruk: {len(sistem.kabul_edilen_urunler)})")
+    return True
 
 # ==================== MANUEL KONTROLLER ====================
 
@@ -549,15 +634,14 @@ def yonlendirici_hareket():
     
     # Uzunluk verisini timeout ile bekle (maksimum 2 saniye)
     max_bekle = 2.0  # saniye
-    bekleme_araligi = 0.01  # 10ms
-    toplam_bekleme = 0
-    
-    while sistem.uzunluk_motor_verisi is None and toplam_bekleme < max_bekle:
-        time.sleep(bekleme_araligi)
-        toplam_bekleme += bekleme_araligi
+    bekleme_baslangic = time.monotonic()
+    if sistem.uzunluk_motor_verisi is None:
+        uzunluk_olcum_eventi.wait(max_bekle)
+    toplam_bekleme = time.monotonic() - bekleme_baslangic
     
     motor_uzunluk = sistem.uzunluk_motor_verisi
     sistem.uzunluk_motor_verisi = None  # Kullanıldı, temizle
+    uzunluk_olcum_eventi.clear()
     
     print(f"📏 [MOTOR UZUNLUK] Ölçüm alındı: {motor_uzunluk} mm (Bekleme: {toplam_bekleme*1000:.0f}ms)")
     
@@ -633,20 +717,36 @@ def yonlendirici_hareket():
 
 # ==================== LOJİK YÖNETİCİSİ ====================
 
+def _lojik_durum_ozeti():
+    """Geçişin sonundaki iade ve konveyör bloklarını etkileyen durum"""
+    return (sistem.iade_lojik, len(sistem.kabul_edilen_urunler), len(sistem.veri_senkronizasyon_listesi))
+
 def lojik_yoneticisi():
-    """Ana sistem lojik döngüsü"""
+    """Ana sistem lojik döngüsü - olay kuyruğu gelene kadar bloklanır"""
     print(f"\n{'#'*60}")
     print(f"🚀 LOJİK YÖNETİCİSİ BAŞLATILDI")
     print(f"{'#'*60}\n")
     log_system("Lojik yöneticisi başlatıldı")
     
+    tekrar_gec = False
     while sistem.sistem_calisma_durumu:
-        time.sleep(LOJIK_DONGU_BEKLEME)
+        # Olay gelene kadar bekle; dışarıdan değişen durumlar için bekçi zaman aşımı.
+        # Önceki geçiş durumu değiştirdiyse beklemeden yeni geçiş yapılır.
+        try:
+            _olaylari_topla(olay_kuyrugu.get(block=not tekrar_gec, timeout=LOJIK_BEKCI_ZAMANASIMI))
+        except queue.Empty:
+            pass
+        
+        if not sistem.sistem_calisma_durumu:
+            break
         
+        # Aynı anda gelen olaylar eskisi gibi sabit sırayla işlenir
+        gecis_oncesi = _lojik_durum_ozeti()
         try:
             # GSI - Giriş Sensörü İçeri
             if sistem.gsi_lojik:
                 sistem.gsi_lojik = False
+                _gecikme_kaydet("gsi")
                 
                 # UPS kesintisi sonrası GSI kontrolü
                 from ...api.servisler.ups_power_handlers import check_gsi_after_power_restore
@@ -669,6 +769,7 @@ def lojik_yoneticisi():
             # YSO - Yönlendirici Sensörü Oturum
             if sistem.yso_lojik:
                 sistem.yso_lojik = False
+                _gecikme_kaydet("yso")
                 print(f"\n🎯 [YSO] Yönlendirme noktası tetiklendi")
                 log_oturum_var("YSO: Yönlendirme başlatıldı")
                 sistem.motor_ref.konveyor_dur()
@@ -689,6 +790,7 @@ def lojik_yoneticisi():
             # YMK - Yönlendirici Motor Konumda
             if sistem.yonlendirici_konumda:
                 sistem.yonlendirici_konumda = False
+                _gecikme_kaydet("ymk")
                 sistem.yonlendirici_calisiyor = False
                 if sistem.agirlik_kuyruk:
                     cikartilan_agirlik = sistem.agirlik_kuyruk.popleft()
@@ -724,6 +826,7 @@ def lojik_yoneticisi():
             
             # Ağırlık işleme
             if sistem.agirlik is not None:
+                _gecikme_kaydet("agirlik")
                 if sistem.barkod_lojik and not sistem.iade_lojik:
                     # Konveyördeki toplam ağırlığı hesapla
                     toplam_konveyor_agirligi = sum(sistem.agirlik_kuyruk) if sistem.agirlik_kuyruk else 0
@@ -773,6 +876,7 @@ def lojik_yoneticisi():
             # Konveyör adım problemi
             if sistem.konveyor_adim_problem:
                 sistem.konveyor_adim_problem = False
+                _gecikme_kaydet("kmp")
                 print(f"⚠️ [KONVEYÖR PROBLEM] Adım problemi algılandı")
                 
                 if (not sistem.kabul_edilen_urunler and 
@@ -805,6 +909,7 @@ def lojik_yoneticisi():
             # GSO - Giriş Sensörü Oturum
             if sistem.gso_lojik:
                 sistem.gso_lojik = False
+                gso_zamani = _gecikme_kaydet("gso")
                 sistem.giris_sensor_durum = False
                 print(f"\n🚪 [GSO] Giriş sensörü çıkış tetiklendi")
                 
@@ -831,7 +936,7 @@ def lojik_yoneticisi():
                             log_oturum_var("GSO: Görüntü işleme başlatılıyor")
                             sistem.kabul_yonu = True
                             sistem.sensor_ref.loadcell_olc()
-                            goruntu_isleme_tetikle()
+                            goruntu_isleme_tetikle(gso_zamani)
                             sistem.gsi_gecis_lojik = False
                     else:
                         print(f"❌ [GSO] Barkod okunmadı - İade başlatılıyor")
@@ -842,6 +947,7 @@ def lojik_yoneticisi():
             # YSI - Yönlendirici Sensörü İçeri
             if sistem.ysi_lojik:
                 sistem.ysi_lojik = False
+                _gecikme_kaydet("ysi")
                 print(f"🎯 [YSI] Yönlendirici giriş sensörü tetiklendi")
                 log_oturum_var("YSI tetiklendi")
         
@@ -851,6 +957,12 @@ def lojik_yoneticisi():
             log_error(f"Lojik yöneticisi hatası: {e}")
             sistem.iade_lojik = True
             sistem.iade_sebep = f"Sistem hatası: {str(e)}"
+        
+        finally:
+            # Lojikte karşılığı olmayan (veya continue/hata ile işlenmeyen) olayların zamanlarını bırak
+            _bekleyen_olay_zamanlari.clear()
+            # İade/konveyör bloklarından sonra değişen durum (ör. GSO'da iade) bir sonraki olayı beklemesin
+            tekrar_gec = _lojik_durum_ozeti() != gecis_oncesi
     
     print(f"\n{'#'*60}")
     print(f"🛑 LOJİK YÖNETİCİSİ DURDURULDU")
@@ -907,6 +1019,7 @@ def mesaj_isle(mesaj: str):
         sistem_temizle()
         sistem.onaylanan_urunler.clear()
         sistem.uzunluk_motor_verisi = None
+        uzunluk_olcum_eventi.clear()  # Önceki oturumdan kalan ölçüm bir sonraki beklemeyi geçirmesin
         sistem.ezici_durum = True
         sistem.kirici_durum = True
         
@@ -917,6 +1030,7 @@ def mesaj_isle(mesaj: str):
         # Motorları başlat
         print(f"🔧 [MOTOR BAŞLATMA] Motorlar aktif ediliyor...")
         sistem.iade_lojik = True
+        olay_gonder("iade_durumu")
         sistem.sensor_ref.makine_oturum_var()
         sistem.motor_ref.motorlari_aktif_et()
         sistem.motor_ref.konveyor_geri()
@@ -929,6 +1043,7 @@ def mesaj_isle(mesaj: str):
         sistem.motor_ref.konveyor_dur()
         sistem.kabul_yonu = True
         sistem.iade_lojik = False
+        olay_gonder("iade_durumu")
         print(f"\n{'*'*60}")
         print(f"✅ OTURUM HAZIR - Ürün kabul edilebilir")
         print(f"{'*'*60}\n")
@@ -939,6 +1054,7 @@ def mesaj_isle(mesaj: str):
     if mesaj.startswith("a:"):
         try:
             sistem.agirlik = float(mesaj.split(":")[1].replace(",", "."))
+            olay_gonder("agirlik")
         except (ValueError, IndexError) as e:
             print(f"❌ [AĞIRLIK PARSE HATA] {e}")
             log_error(f"Ağırlık verisi hatası: {e}")
@@ -948,34 +1064,17 @@ def mesaj_isle(mesaj: str):
     if mesaj.startswith("m:"):
         try:
             sistem.uzunluk_motor_verisi = float(mesaj.split(":")[1].replace(",", "."))
+            uzunluk_olcum_eventi.set()
         except (ValueError, IndexError) as e:
             print(f"❌ [MOTOR UZUNLUK PARSE HATA] {e}")
             log_error(f"Motor uzunluk verisi hatası: {e}")
         return
     
-    # Sensör ve durum mesajları
-    mesaj_map = {
-        "gsi": lambda: setattr(sistem, 'gsi_lojik', True),
-        "gso": lambda: setattr(sistem, 'gso_lojik', True),
-        "yso": lambda: setattr(sistem, 'yso_lojik', True),
-        "ysi": lambda: setattr(sistem, 'ysi_lojik', True),
-        "kma": lambda: setattr(sistem, 'konveyor_alarm', True),
-        "yma": lambda: setattr(sistem, 'yonlendirici_alarm', True),
-        "sma": lambda: setattr(sistem, 'seperator_alarm', True),
-        "kmk": lambda: setattr(sistem, 'konveyor_konumda', True),
-        "ymk": lambda: setattr(sistem, 'yonlendirici_konumda', True),
-        "smk": lambda: setattr(sistem, 'seperator_konumda', True),
-        "kmh": lambda: setattr(sistem, 'konveyor_hata', True),
-        "ymh": lambda: setattr(sistem, 'yonlendirici_hata', True),
-        "smh": lambda: setattr(sistem, 'seperator_hata', True),
-        "kmp": lambda: setattr(sistem, 'konveyor_adim_problem', True),
-        "ykt": lambda: setattr(sistem, 'yonlendirici_kalibrasyon', True),
-        "skt": lambda: setattr(sistem, 'seperator_kalibrasyon', True),
-    }
-    
-    handler = mesaj_map.get(mesaj)
-    if handler:
-        handler()
+    # Sensör ve durum mesajları - bayrağı ayarla ve lojik yöneticisini uyandır
+    bayrak = LOJIK_BAYRAKLARI.get(mesaj)
+    if bayrak:
+        setattr(sistem, bayrak, True)
+        olay_gonder(mesaj)
 
 def modbus_mesaj(modbus_verisi):
     """Modbus verilerini işler"""
@@ -988,6 +1087,7 @@ def sistem_kapat():
     print(f"{'!'*60}\n")
     log_system("Sistem kapatılıyor...")
     sistem.sistem_calisma_durumu = False
+    olay_gonder("kapat")
     time.sleep(0.1)
     
     # Port sağlık servisini başlat
@@ -0,0 +1,77 @@
+"""
+Hazırlık Beklemeleri
+Sabit time.sleep() tahminleri yerine bir hazır olma koşulu beklenir (ilk pong,
+boot mesajı, thread başladı Event'i...). Eski bekleme süresi sadece üst sınır
+olarak kalır. Her aşama için koşulun ne kadar sürede sağlandığı ve üst sınıra
+göre kazanılan süre kaydedilir.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Iterable
+
+
+class HazirlikOlcer:
+    """Aşama başına bekleme sayısı, gerçek süre ve kazanılan süreyi tutar"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._asamalar: Dict[str, Dict] = {}
+
+    def kaydet(self, asama: str, ust_sinir: float, gecen: float, hazir: bool) -> None:
+        with self._lock:
+            kayit = self._asamalar.setdefault(asama, {
+                "adet": 0,
+                "zaman_asimi": 0,
+                "ust_sinir": ust_sinir,
+                "toplam_sure": 0.0,
+                "kazanilan_sure": 0.0,
+            })
+            kayit["adet"] += 1
+            kayit["ust_sinir"] = ust_sinir
+            kayit["toplam_sure"] += gecen
+            kayit["kazanilan_sure"] += max(ust_sinir - gecen, 0.0)
+            kayit["son_sure"] = gecen
+            if not hazir:
+                kayit["zaman_asimi"] += 1
+
+    def ozet(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {
+                asama: {
+                    "adet": k["adet"],
+                    "zaman_asimi": k["zaman_asimi"],
+                    "ust_sinir": k["ust_sinir"],
+                    "ortalama_sure": round(k["toplam_sure"] / k["adet"], 3),
+                    "son_sure": round(k["son_sure"], 3),
+                    "kazanilan_toplam": round(k["kazanilan_sure"], 2),
+                }
+                for asama, k in self._asamalar.items()
+            }
+
+
+def olcumlu_bekle(asama: str, ust_sinir: float, bekle: Callable[[float], bool]) -> bool:
+    """
+    bekle(ust_sinir) çağrısının süresini ölçer ve aşama kaydına ekler
+
+    Args:
+        asama: Kayıt adı (örn: "sensor.reconnect_boot")
+        ust_sinir: Eski sabit bekleme süresi, koşul sağlanmazsa en fazla bu kadar beklenir
+        bekle: Koşul sağlanınca True, süre dolunca False dönen bloklayan fonksiyon
+    """
+    baslangic = time.monotonic()
+    hazir = bool(bekle(ust_sinir))
+    hazirlik_olcer.kaydet(asama, ust_sinir, time.monotonic() - baslangic, hazir)
+    return hazir
+
+
+def olaylari_bekle(olaylar: Iterable[threading.Event], ust_sinir: float) -> bool:
+    """Tüm Event'ler set edilene kadar toplamda en fazla ust_sinir saniye bekler"""
+    son_tarih = time.monotonic() + ust_sinir
+    for olay in olaylar:
+        if not olay.wait(max(son_tarih - time.monotonic(), 0)):
+            return False
+    return True
+
+
+hazirlik_olcer = HazirlikOlcer()
@@ -0,0 +1,114 @@
+"""
+Port Keşif Önbelleği
+USB seri adaptörlerinin hangi karta bağlı olduğunu diskte saklar.
+Anahtar, list_ports meta verisinden gelen VID:PID ve USB seri numarası
+(yoksa fiziksel USB konumu / by-path) birleşimidir; /dev/ttyUSBx adı
+yeniden numaralanabildiği için anahtara dahil edilmez.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from rvm_sistemi.utils.logger import log_system, log_warning
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+ONBELLEK_DOSYA_YOLU = os.path.join(PROJECT_ROOT, "port_kesif_onbellegi.json")
+
+
+def port_anahtari(port_info) -> Optional[str]:
+    """
+    Portun kalıcı kimliği: "1a86:7523:<seri_no|usb_konumu>"
+    VID/PID veya kimlik bilgisi olmayan portlar önbelleğe alınmaz.
+    """
+    vid = getattr(port_info, "vid", None)
+    pid = getattr(port_info, "pid", None)
+    kimlik = getattr(port_info, "serial_number", None) or getattr(port_info, "location", None)
+    if vid is None or pid is None or not kimlik:
+        return None
+    return f"{vid:04x}:{pid:04x}:{kimlik}"
+
+
+class PortKesifOnbellegi:
+    """Port anahtarı -> kart tipi eşlemesini thread-safe tutar ve diske yazar"""
+
+    def __init__(self, dosya_yolu: str = ONBELLEK_DOSYA_YOLU):
+        self.dosya_yolu = dosya_yolu
+        self._lock = threading.Lock()
+        self._kayitlar: Dict[str, Dict] = self._yukle()
+
+    def _yukle(self) -> Dict[str, Dict]:
+        try:
+            if os.path.exists(self.dosya_yolu):
+                with open(self.dosya_yolu, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            log_warning(f"Port keşif önbelleği okunamadı, boş başlatılıyor: {e}")
+        return {}
+
+    def _kaydet(self) -> None:
+        """Önbelleği atomik olarak yazar (lock içinde çağrılır)"""
+        try:
+            gecici = self.dosya_yolu + ".tmp"
+            with open(gecici, 'w', encoding='utf-8') as f:
+                json.dump(self._kayitlar, f, indent=2, ensure_ascii=False)
+            os.replace(gecici, self.dosya_yolu)
+        except Exception as e:
+            log_warning(f"Port keşif önbelleği yazılamadı: {e}")
+
+    def kart_tipi(self, port_info) -> Optional[str]:
+        """Port daha önce bir karta eşlendiyse kart tipini döndürür"""
+        anahtar = port_anahtari(port_info)
+        if not anahtar:
+            return None
+        with self._lock:
+            kayit = self._kayitlar.get(anahtar)
+        return kayit["kart"] if kayit else None
+
+    def hatirla(self, port_info, kart: str) -> None:
+        """Doğrulanmış port -> kart eşlemesini kaydeder"""
+        anahtar = port_anahtari(port_info)
+        if not anahtar:
+            return
+        with self._lock:
+            # Aynı kart başka bir anahtarda kayıtlıysa (adaptör değişti) eskisini sil
+            for eski in [a for a, k in self._kayitlar.items() if k["kart"] == kart and a != anahtar]:
+                del self._kayitlar[eski]
+            onceki = self._kayitlar.get(anahtar)
+            self._kayitlar[anahtar] = {
+                "kart": kart,
+                "cihaz": port_info.device,
+                "son_dogrulama": time.strftime("%Y-%m-%d %H:%M:%S"),
+            }
+            if not onceki or onceki["kart"] != kart or onceki["cihaz"] != port_info.device:
+                log_system(f"Port keşif önbelleği güncellendi: {anahtar} -> {kart} ({port_info.device})")
+            self._kaydet()
+
+    def unut(self, port_info) -> None:
+        """Tam taramada kart bulunamayan portun kaydını siler"""
+        anahtar = port_anahtari(port_info)
+        with self._lock:
+            if anahtar and self._kayitlar.pop(anahtar, None) is not None:
+                log_system(f"Port keşif önbelleğinden silindi: {anahtar}")
+                self._kaydet()
+
+    def temizle(self) -> None:
+        with self._lock:
+            self._kayitlar = {}
+            self._kaydet()
+
+    def geri_yukle(self, kayitlar: Dict[str, Dict]) -> None:
+        """kayitlar() ile alınmış yedeği önbelleğe ve diske geri yazar"""
+        with self._lock:
+            self._kayitlar = dict(kayitlar)
+            self._kaydet()
+
+    def kayitlar(self) -> Dict[str, Dict]:
+        with self._lock:
+            return dict(self._kayitlar)
+
+
+# Tüm KartHaberlesmeServis örnekleri aynı önbelleği kullanır
+port_kesif_onbellegi = PortKesifOnbellegi()
@@ -9,7 +9,12 @@ from typing import Dict, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from serial.tools import list_ports
+
+from rvm_sistemi.makine.seri.hazirlik_bekleme import olcumlu_bekle
 from rvm_sistemi.makine.seri.port_yonetici import KartHaberlesmeServis
+from rvm_sistemi.makine.seri.port_onbellegi import port_kesif_onbellegi
+from rvm_sistemi.makine.seri.usb_olay_izleyici import UsbOlayIzleyici, PORT_ONEKLERI
 from rvm_sistemi.makine.seri.system_state_manager import system_state, SystemState, CardState
 from rvm_sistemi.utils.logger import (
     log_system, log_error, log_success, log_warning
@@ -41,9 +46,11 @@ class PortSaglikServisi:
     
     # Konfigürasyon sabitleri - daha sık kontrol
     PING_ARASI_SURE = 3  # Ping kontrolleri arası süre (saniye) - daha sık
+    PING_ARASI_SURE_OLAYLI = 10  # USB olay izleyici aktifken ping sadece yedek canlılık kontrolü
     MAX_PING_HATA = 5    # Maksimum başarısız ping sayısı - 5 ping başarısızlığında müdahale
     RESET_BEKLEME = 10   # Reset sonrası bekleme süresi
     MAX_RESET_DENEME = 3 # Maksimum reset deneme sayısı
+    USB_STABILIZASYON_UST_SINIR = 8  # USB reset sonrası portların geri gelmesi için en fazla bekleme
     
     def __init__(self, motor_karti, sensor_karti):
         """
@@ -69,6 +76,9 @@ class PortSaglikServisi:
         self._monitor_thread = None
         self._thread_lock = threading.Lock()
 
+        # USB hot-plug olayları - kopma/takılma ping beklenmeden yakalanır
+        self.usb_izleyici = UsbOlayIzleyici(self._usb_olayi)
+
         # Durum değişikliği takibi (görsel mesaj için)
         self._last_health_status = None  # "healthy", "warning", "critical"
 
@@ -79,6 +89,9 @@ class PortSaglikServisi:
     
     def servisi_baslat(self):
         """Sağlık izleme servisini başlat"""
+        # Olay izleyici oturum sırasında da çalışır (servisi_durdur onu durdurmaz)
+        self.usb_izleyici.baslat()
+
         with self._thread_lock:
             if self.running:
                 return
@@ -132,13 +145,93 @@ class PortSaglikServisi:
                 # Kartları kontrol et (her kart kendi reconnection durumunu kontrol eder)
                 self._kartlari_kontrol_et()
 
-                # Bekleme
-                time.sleep(self.PING_ARASI_SURE)
+                # Bekleme - reconnection'daki bir kart bitirirse beklemeden hemen kontrol et
+                bekleyenler = system_state.snapshot().reconnecting_cards
+                system_state.wait_until(lambda durum: bool(bekleyenler - durum.reconnecting_cards),
+                                        self.ping_araligi)
 
             except Exception as e:
                 log_error(f"Port sağlık izleme hatası: {e}")
                 time.sleep(1)
     
+    @property
+    def ping_araligi(self) -> float:
+        """Olay izleyici çalışıyorsa ping seyrekleşir, çalışmıyorsa eski sıklıkta devam eder"""
+        return self.PING_ARASI_SURE_OLAYLI if self.usb_izleyici.aktif else self.PING_ARASI_SURE
+
+    def _kartlar(self):
+        return {"motor": self.motor_karti, "sensor": self.sensor_karti}
+
+    def _usb_olayi(self, eylem: str, cihaz_yolu: str, olay_zamani: float):
+        """
+        USB olay izleyici callback'i
+
+        Args:
+            eylem: "add" veya "remove"
+            cihaz_yolu: Olayın geldiği port (örn: /dev/ttyUSB0)
+            olay_zamani: Olay zamanı (time.time())
+        """
+        if eylem == "remove":
+            self._port_cikarildi(cihaz_yolu, olay_zamani)
+        elif eylem == "add":
+            self._port_takildi(cihaz_yolu)
+
+    def _port_cikarildi(self, cihaz_yolu: str, olay_zamani: float):
+        """Çıkarılan port bir karta aitse sadece o kartın reconnection'ını başlatır"""
+        for kart_adi, kart in self._kartlar().items():
+            if kart.port_adi != cihaz_yolu:
+                continue
+
+            print(f"🔌 [PORT-SAĞLIK] {kart_adi.upper()} → USB çıkarıldı ({cihaz_yolu}) - reconnection başlatılıyor")
+            log_warning(f"{kart_adi.upper()} kartı USB çıkarıldı: {cihaz_yolu}")
+            system_state.mark_disconnected(kart_adi, olay_zamani, "hotplug")
+            self.kart_durumlari[kart_adi].durum = SaglikDurumu.UYARI
+
+            # Cihaz yokken USB reset anlamsız; dinleme thread'i de aynı anda fark ederse
+            # system_state tekrar eden reconnection'ı engeller
+            threading.Thread(
+                target=kart._handle_connection_error,
+                kwargs={"usb_reset": False},
+                daemon=True,
+                name=f"{kart_adi}_reconnect_from_hotplug"
+            ).start()
+            return
+
+    def _port_takildi(self, cihaz_yolu: str):
+        """Takılan portun kartını bulur ve o kartın reconnect worker'ını hemen uyandırır"""
+        kart_adi = self._takilan_portun_karti(cihaz_yolu)
+        if not kart_adi:
+            log_system(f"Takılan port bir karta eşlenemedi: {cihaz_yolu}")
+            return
+
+        kart = self._kartlar()[kart_adi]
+        if system_state.is_card_reconnecting(kart_adi):
+            print(f"🔌 [PORT-SAĞLIK] {kart_adi.upper()} → USB takıldı ({cihaz_yolu}) - reconnection hızlandırılıyor")
+            kart.yeniden_baglanmayi_hizlandir()
+        elif not kart.saglikli or not (kart.seri_nesnesi and kart.seri_nesnesi.is_open):
+            print(f"🔌 [PORT-SAĞLIK] {kart_adi.upper()} → USB takıldı ({cihaz_yolu}) - bağlantı başlatılıyor")
+            threading.Thread(
+                target=kart._handle_connection_error,
+                kwargs={"usb_reset": False},
+                daemon=True,
+                name=f"{kart_adi}_reconnect_from_hotplug"
+            ).start()
+
+    def _takilan_portun_karti(self, cihaz_yolu: str) -> Optional[str]:
+        """Önce port keşif önbelleğine bakar, bulamazsa bağlantısı kopuk tek kartı seçer"""
+        for port_info in list_ports.comports():
+            if port_info.device == cihaz_yolu:
+                kart_adi = port_kesif_onbellegi.kart_tipi(port_info)
+                if kart_adi in self._kartlar():
+                    return kart_adi
+                break
+
+        kopuk_kartlar = [
+            kart_adi for kart_adi, kart in self._kartlar().items()
+            if system_state.is_card_reconnecting(kart_adi) or not kart.saglikli
+        ]
+        return kopuk_kartlar[0] if len(kopuk_kartlar) == 1 else None
+
     def _kartlari_kontrol_et(self):
         """Tüm kartların sağlık kontrolü"""
         # Motor kartı kontrolü
@@ -239,7 +332,7 @@ class PortSaglikServisi:
             return
 
         # Durum güncelle (sadece reconnection başlatılmadıysa)
-        if gecen_sure > self.PING_ARASI_SURE * 2:
+        if gecen_sure > self.ping_araligi * 2:
             durum.durum = SaglikDurumu.UYARI
             print(f"⚠️  [PORT-SAĞLIK] {kart_adi.upper()} → UYARI! Son pong: {gecen_sure:.1f}s önce")
         else:
@@ -382,10 +475,12 @@ class PortSaglikServisi:
             
             if reset_success:
                 # Sistem durumu RECONNECTING oldu, şimdi portları yeniden bağla
-                print(f"⏳ [PORT-SAĞLIK] USB reset sonrası stabilizasyon bekleniyor (8 saniye)...")
+                print(f"⏳ [PORT-SAĞLIK] USB reset sonrası portlar bekleniyor (en fazla {self.USB_STABILIZASYON_UST_SINIR} saniye)...")
                 log_system("USB reset sonrası stabilizasyon bekleniyor...")
-                time.sleep(8)  # Embedded sistemlerin tamamen hazır olması için
-                print(f"✅ [PORT-SAĞLIK] Stabilizasyon tamamlandı")
+                # Kart portları yeniden listelenince devam; ESP32 boot'u port aramasındaki doğrulama bekler
+                hazir = olcumlu_bekle("usb_reset_stabilizasyon", self.USB_STABILIZASYON_UST_SINIR,
+                                      lambda ust_sinir: self._portlarin_gelmesini_bekle(len(kritik_kartlar), ust_sinir))
+                print(f"✅ [PORT-SAĞLIK] Stabilizasyon tamamlandı{'' if hazir else ' (süre doldu)'}")
                 
                 # Portları yeniden bağla
                 print(f"🔍 [PORT-SAĞLIK] Portlar yeniden aranıyor...")
@@ -440,6 +535,16 @@ class PortSaglikServisi:
         
         print(f"\n{'='*60}\n")
     
+    def _portlarin_gelmesini_bekle(self, adet: int, ust_sinir: float) -> bool:
+        """En az 'adet' USB seri port listelenene kadar bekler"""
+        son_tarih = time.monotonic() + ust_sinir
+        while time.monotonic() < son_tarih:
+            portlar = [p for p in list_ports.comports() if p.device.startswith(tuple(f"/dev/{o}" for o in PORT_ONEKLERI))]
+            if len(portlar) >= adet:
+                return True
+            time.sleep(0.2)
+        return False
+
     def _tum_portlari_kapat(self):
         """Tüm portları güvenli şekilde kapat"""
         try:
@@ -477,9 +582,8 @@ class PortSaglikServisi:
             # ÖNCE SENSOR KARTI
             if "sensor" in portlar:
                 print(f"  🔧 Sensor kartı: {portlar['sensor']}")
-                # Önce mevcut thread'leri temizle
+                # Önce mevcut thread'leri temizle (dinlemeyi_durdur thread'lerin bitmesini bekler)
                 self.sensor_karti.dinlemeyi_durdur()
-                time.sleep(0.5)
                 
                 # Port ata
                 self.sensor_karti.port_adi = portlar["sensor"]
@@ -489,11 +593,9 @@ class PortSaglikServisi:
                 if self.sensor_karti._try_connect_to_port():
                     print(f"  ✅ Sensor kartı bağlandı: {portlar['sensor']}")
                     
-                    # Sensor kartı için reset komutu gönder
-                    time.sleep(0.5)
+                    # Sensor kartı için reset komutu gönder (thread'ler dinlemeyi_baslat'ta hazır)
                     print(f"  🔄 Sensor kartı resetleniyor...")
-                    self.sensor_karti.reset()
-                    time.sleep(2)
+                    olcumlu_bekle("sensor.reset_sonrasi", 2.0, self.sensor_karti.reset_ve_hazir_bekle)
                     print(f"  ✅ Sensor kartı hazır")
                 else:
                     print(f"  ❌ Sensor portu açılamadı!")
@@ -503,17 +605,13 @@ class PortSaglikServisi:
                 # Sensor kartının hazır olmasını bekle
                 if "sensor" in portlar:
                     print(f"  ⏳ Sensor kartının hazır olması bekleniyor...")
-                    time.sleep(3)
+                    olcumlu_bekle("sensor.motor_oncesi", 3.0, self.sensor_karti.pong_bekle)
                     print(f"  ✅ Sensor kartı hazır, motor kartı başlatılıyor...")
                 
-                # Motor kartı için ek bekleme
-                print(f"  ⏳ Motor kartı boot süreci için ek bekleme...")
-                time.sleep(2)
-                
+                # Motor kartının boot'u portu_ac içindeki ready/b handshake ile beklenir
                 print(f"  🔧 Motor kartı: {portlar['motor']}")
-                # Önce mevcut thread'leri temizle
+                # Önce mevcut thread'leri temizle (dinlemeyi_durdur thread'lerin bitmesini bekler)
                 self.motor_karti.dinlemeyi_durdur()
-                time.sleep(0.5)
                 
                 # Port ata
                 self.motor_karti.port_adi = portlar["motor"]
@@ -523,29 +621,27 @@ class PortSaglikServisi:
                 if self.motor_karti._try_connect_to_port():
                     print(f"  ✅ Motor kartı bağlandı: {portlar['motor']}")
                     
-                    # Motor parametrelerini gönder
-                    time.sleep(1)
+                    # Motor parametrelerini gönder (kart pong verince)
+                    olcumlu_bekle("motor.parametre_oncesi", 1.0, self.motor_karti.pong_bekle)
                     print(f"  🔄 Motor parametreleri gönderiliyor...")
                     self.motor_karti.parametre_gonder()
-                    time.sleep(0.5)
                     
-                    # Motor kartını resetle
+                    # Motor kartını resetle (reset aynı sınıfta parametre_gonder'den sonra yazılır)
                     print(f"  🔄 Motor kartı resetleniyor...")
-                    self.motor_karti.reset()
-                    time.sleep(2)
+                    olcumlu_bekle("motor.reset_sonrasi", 2.0, self.motor_karti.reset_ve_hazir_bekle)
                     
                     # Motorları aktif et
                     print(f"  🔄 Motorlar aktif ediliyor...")
                     self.motor_karti.motorlari_aktif_et()
-                    time.sleep(1)
+                    # Aşağıdaki stabilizasyon ping'i telemetri sınıfında, aktif komutundan sonra gider
                     
                     print(f"  ✅ Motor kartı hazır")
                 else:
                     print(f"  ❌ Motor portu açılamadı!")
             
-            # Kartların stabilizasyonunu bekle
-            print(f"⏳ [PORT-SAĞLIK] Kartların stabilizasyonu için 5 saniye bekleniyor...")
-            time.sleep(5)
+            # Kartların stabilizasyonunu bekle - ikisi de pong verince biter (en fazla 5 saniye)
+            print(f"⏳ [PORT-SAĞLIK] Kartların stabilizasyonu bekleniyor (en fazla 5 saniye)...")
+            olcumlu_bekle("kartlar.stabilizasyon", 5.0, self._kartlar_pong_bekle)
             
             # Durumları sıfırla
             self._durumlari_sifirla()
@@ -556,6 +652,14 @@ class PortSaglikServisi:
             print(f"❌ [PORT-SAĞLIK] Kart yeniden başlatma hatası: {e}")
             log_error(f"Kart yeniden başlatma hatası: {e}")
     
+    def _kartlar_pong_bekle(self, ust_sinir: float) -> bool:
+        """Motor ve sensör kartlarının ikisi de pong verene kadar (toplam ust_sinir) bekler"""
+        son_tarih = time.monotonic() + ust_sinir
+        return all(
+            kart.pong_bekle(max(son_tarih - time.monotonic(), 0))
+            for kart in (self.sensor_karti, self.motor_karti)
+        )
+
     def _durumlari_sifirla(self):
         """Kart durumlarını sıfırla"""
         for durum in self.kart_durumlari.values():
@@ -16,6 +16,7 @@ from serial.tools import list_ports
 
 from rvm_sistemi.utils.logger import log_system, log_error, log_success, log_warning
 from rvm_sistemi.makine.seri.system_state_manager import system_state, SystemState
+from rvm_sistemi.makine.seri.port_onbellegi import port_kesif_onbellegi
 import subprocess
 import os
 import glob
@@ -33,6 +34,8 @@ class Constants:
     RETRY_DELAY = 1.0
     CONFIRMATION_TIMEOUT = 0.2
     THREAD_POOL_SIZE = 4
+    CACHED_VERIFY_TIMEOUT = 3.0  # Önbellekteki port için kimlik doğrulama süresi (port açılışındaki boot dahil)
+    PROBE_INTERVAL = 0.3         # Kimlik sorgusu tekrar aralığı
 
 
 class DeviceType(Enum):
@@ -269,6 +272,37 @@ class DeviceCommunicator:
         
         return None
     
+    @staticmethod
+    def probe_device(ser: serial.Serial, timeout: float = Constants.CACHED_VERIFY_TIMEOUT) -> Optional[DeviceType]:
+        """
+        Reset atmadan kimlik sorgusunu tekrarlar - çalışan kart hemen, port
+        açılışıyla yeniden başlayan kart boot biter bitmez cevap verir
+
+        Args:
+            ser: Seri port nesnesi
+            timeout: Toplam bekleme süresi
+
+        Returns:
+            Optional[DeviceType]: Cihaz tipi veya None
+        """
+        ser.timeout = Constants.PROBE_INTERVAL
+        ser.reset_input_buffer()
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
+            ser.write(Commands.IDENTIFY.value)
+            ser.flush()
+            # readline PROBE_INTERVAL içinde satır gelmezse boş döner
+            response = ser.readline().decode(errors='ignore').strip().lower()
+            while response and time.monotonic() < deadline:
+                if DeviceType.is_valid(response):
+                    ser.reset_input_buffer()
+                    return DeviceType.from_string(response)
+                # Boot mesajları ("ready" vb.) - sonraki satıra bak
+                response = ser.readline().decode(errors='ignore').strip().lower()
+
+        return None
+
     @staticmethod
     def confirm_connection(ser: serial.Serial) -> bool:
         """
@@ -318,6 +352,9 @@ class KartHaberlesmeServis:
         
         # ✅ Port arama için global lock (aynı anda sadece 1 thread arama yapabilir)
         self._scan_lock = threading.Lock()
+
+        # Son aramanın önbellek doğrulama / tam tarama süreleri (sıcak/soğuk başlangıç)
+        self.son_tarama: Dict = {}
         
         log_system(f"Kart Haberleşme Servisi başlatıldı - Sistem: {self.system}")
     
@@ -778,11 +815,37 @@ class KartHaberlesmeServis:
             
             log_system(f"{len(compatible_ports)} uyumlu port bulundu")
             
-            # Paralel port tarama
-            discovered_devices = self._parallel_port_scan(compatible_ports, cihaz_adi)
+            # Önce önbellekte kart tipi bilinen portları reset atmadan doğrula
+            dogrulama_baslangic = time.time()
+            discovered_devices, taranacak_portlar = self._verify_cached_ports(compatible_ports, cihaz_adi)
+            dogrulama_suresi = time.time() - dogrulama_baslangic
+            onbellekten = sorted(discovered_devices)
+
+            # Beklenen kartlar eksikse bilinmeyen/doğrulanamayan portları tam tarama ile paralel tara
+            beklenen_kartlar = {cihaz_adi} if cihaz_adi else set(kritik_kartlar or ("motor", "sensor"))
+            tarama_suresi = 0.0
+            if taranacak_portlar and not beklenen_kartlar.issubset(discovered_devices):
+                tarama_baslangic = time.time()
+                for kart, port in self._parallel_port_scan(taranacak_portlar, cihaz_adi).items():
+                    discovered_devices.setdefault(kart, port)
+                tarama_suresi = time.time() - tarama_baslangic
+            else:
+                taranacak_portlar = []
             
             # Sonuçları değerlendir
             elapsed_time = time.time() - start_time
+            tur = "sicak" if not taranacak_portlar else ("soguk" if not onbellekten else "karisik")
+            self.son_tarama = {
+                "tur": tur,
+                "onbellekten": onbellekten,
+                "taranan_port_sayisi": len(taranacak_portlar),
+                "dogrulama_suresi": round(dogrulama_suresi, 2),
+                "tarama_suresi": round(tarama_suresi, 2),
+                "toplam_sure": round(elapsed_time, 2),
+            }
+            log_system(f"⏱️ Kart arama [{tur}] - önbellek doğrulama: {dogrulama_suresi:.2f}s "
+                       f"({len(onbellekten)} kart), tam tarama: {tarama_suresi:.2f}s "
+                       f"({len(taranacak_portlar)} port), toplam: {elapsed_time:.2f}s")
             basarili, mesaj, bulunan_kartlar = self._evaluate_results(discovered_devices, cihaz_adi, elapsed_time)
             
             # Kritik kartları kontrol et
@@ -875,6 +938,85 @@ class KartHaberlesmeServis:
 
         return basarili, mesaj, bulunan_kartlar
     
+    def _verify_cached_ports(self, ports: List, target_device: Optional[str] = None) -> Tuple[Dict[str, str], List]:
+        """
+        Önbellekte kart tipi bilinen portları reset ve boot beklemesi olmadan paralel doğrula
+        
+        Args:
+            ports: Uyumlu port listesi
+            target_device: Hedef cihaz adı
+            
+        Returns:
+            Tuple[Dict[str, str], List]: Doğrulanan cihazlar ve tam taranması gereken portlar
+        """
+        bilinen = []
+        for port in ports:
+            kart = port_kesif_onbellegi.kart_tipi(port)
+            if kart and (not target_device or kart == target_device):
+                bilinen.append((port, kart))
+        
+        if not bilinen:
+            return {}, list(ports)
+        
+        discovered = {}
+        dogrulanan = set()
+        with ThreadPoolExecutor(max_workers=min(len(bilinen), Constants.THREAD_POOL_SIZE)) as executor:
+            future_to_port = {
+                executor.submit(self._verify_cached_port, port, kart): port
+                for port, kart in bilinen
+            }
+            for future in as_completed(future_to_port):
+                port = future_to_port[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    log_error(f"{port.device} önbellek doğrulama hatası: {e}")
+                    continue
+                if result:
+                    device_type, port_name = result
+                    discovered[device_type] = port_name
+                    dogrulanan.add(port.device)
+                    port_kesif_onbellegi.hatirla(port, device_type)
+        
+        return discovered, [p for p in ports if p.device not in dogrulanan]
+    
+    def _verify_cached_port(self, port_info, expected_device: str) -> Optional[Tuple[str, str]]:
+        """
+        Önbellekteki portu kimlik sorgusuyla doğrula (reset yok)
+        
+        Args:
+            port_info: Port bilgisi
+            expected_device: Önbellekteki kart tipi
+            
+        Returns:
+            Optional[Tuple[str, str]]: (cihaz_tipi, port_adı) veya None
+        """
+        port_device = port_info.device
+        
+        port_owner = system_state.get_port_owner(port_device)
+        if port_owner:
+            log_system(f"{port_device} port kullanımda [{port_owner}], doğrulama atlanıyor")
+            return None
+        
+        with self.connection.open_port(port_device) as ser:
+            if not ser:
+                return None
+            try:
+                device_type = self.communicator.probe_device(ser)
+                if not device_type:
+                    log_warning(f"{port_device} - önbellekteki {expected_device} kartı cevap vermedi, tam taranacak")
+                    return None
+                if device_type.value != expected_device:
+                    log_warning(f"{port_device} önbellekte {expected_device}, cevap veren: {device_type.value}")
+                
+                self.communicator.confirm_connection(ser)
+                log_success(f"{device_type.value.upper()} kartı {port_device} portunda doğrulandı (önbellek)")
+                return device_type.value, port_device
+            except (serial.SerialException, OSError) as e:
+                log_warning(f"{port_device} önbellek doğrulama iletişim hatası: {e}")
+        
+        return None
+    
     def _parallel_port_scan(self, ports: List, target_device: Optional[str] = None) -> Dict[str, str]:
         """
         Portları paralel olarak tara
@@ -980,9 +1122,12 @@ class KartHaberlesmeServis:
                     if self.communicator.confirm_connection(ser):
                         log_system(f"{device_name} bağlantısı onaylandı")
                     
+                    # Sonraki açılışlarda bu port hızlı doğrulansın
+                    port_kesif_onbellegi.hatirla(port_info, device_name)
                     return device_name, port_device
                 else:
                     log_warning(f"{port_device} - Tanımlanamayan cihaz")
+                    port_kesif_onbellegi.unut(port_info)
                     
             except (serial.SerialException, OSError) as e:
                 error_str = str(e).lower()
@@ -0,0 +1,362 @@
+"""
+Sanal Kartlar
+pty çiftleri üzerinden gerçek kart yerine geçen sahte firmware'ler ve kayıtlı
+trafiği (trafik_kaydi) aynı zamanlamayla ya da hızlandırılmış olarak yeniden
+oynatan oynatıcı. MotorKart / SensorKart pty'nin slave ucuna normal bir seri
+port gibi bağlanır; donanım olmadan yük ve zamanlama testleri yapılabilir.
+
+Sadece Linux/macOS (pty modülü).
+"""
+
+import os
+import pty
+import random
+import select
+import threading
+import time
+import tty
+from typing import Dict, List, Optional
+
+from rvm_sistemi.makine.seri.trafik_kaydi import RX, TX, kayitlari_oku
+from rvm_sistemi.utils.logger import log_system
+
+
+class SanalPort:
+    """Raw moda alınmış pty çifti; yol (slave) kart sınıflarına port olarak verilir"""
+
+    def __init__(self):
+        self.master, self.slave = pty.openpty()
+        tty.setraw(self.master)
+        tty.setraw(self.slave)
+        # Host portu açmadan tampon dolarsa yazan thread bloklanmasın; fazlası atılır
+        os.set_blocking(self.master, False)
+        self.yol = os.ttyname(self.slave)
+
+    def yaz(self, veri: bytes) -> None:
+        os.write(self.master, veri)  # Tampon doluysa BlockingIOError (OSError)
+
+    def oku(self, bekleme: float) -> Optional[bytes]:
+        """Veri gelene kadar en fazla bekleme saniye bekler; veri yoksa None"""
+        hazir, _, _ = select.select([self.master], [], [], bekleme)
+        if not hazir:
+            return None
+        return os.read(self.master, 4096)
+
+    def kapat(self) -> None:
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+class SahteKartFirmware:
+    """
+    Ortak sahte firmware: gelen satırları komut_isle'ye verir, ping/reset'i yanıtlar
+    Alt sınıflar komut_isle'yi ezerek karta özel yanıtları üretir
+    """
+
+    KART_ADI = "kart"
+
+    def __init__(self, yanit_gecikmesi: float = 0.0):
+        self.port = SanalPort()
+        self.yanit_gecikmesi = yanit_gecikmesi  # Komut başına firmware işlem süresi
+        self.running = False
+        self.alinan_komutlar: Dict[str, int] = {}
+        self._yazma_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def yol(self) -> str:
+        return self.port.yol
+
+    def baslat(self) -> "SahteKartFirmware":
+        self.running = True
+        self._thread = threading.Thread(target=self._calis, daemon=True, name=f"sahte_{self.KART_ADI}")
+        self._thread.start()
+        log_system(f"Sahte {self.KART_ADI} kartı başlatıldı: {self.yol}")
+        return self
+
+    def durdur(self) -> None:
+        self.running = False
+        if self._thread:
+            self._thread.join(timeout=1)
+        self.port.kapat()
+
+    def gonder(self, satir: str) -> None:
+        """Host'a bir satır gönderir (kartın kendiliğinden ürettiği olaylar için de)"""
+        with self._yazma_lock:
+            try:
+                self.port.yaz(satir.encode() + b"\n")
+            except OSError:
+                pass
+
+    def acilis(self) -> None:
+        """Port dinlenmeye başlamadan önce yapılacak boot adımları"""
+        pass
+
+    def komut_isle(self, komut: str) -> None:
+        if komut == "ping":
+            self.gonder("pong")
+        elif komut == "reset":
+            self.gonder("resetlendi")
+
+    def _calis(self):
+        self.acilis()
+        tampon = b""
+        while self.running:
+            try:
+                veri = self.port.oku(0.2)
+            except OSError:
+                break
+            if not veri:
+                continue
+            tampon += veri
+            while b"\n" in tampon:
+                satir, _, tampon = tampon.partition(b"\n")
+                komut = satir.decode(errors="ignore").strip()
+                if not komut:
+                    continue
+                self.alinan_komutlar[komut] = self.alinan_komutlar.get(komut, 0) + 1
+                if self.yanit_gecikmesi:
+                    time.sleep(self.yanit_gecikmesi)
+                self.komut_isle(komut)
+
+
+class SahteMotorFirmware(SahteKartFirmware):
+    """Motor kartı: ESP32 ready/b handshake, konum onayları, uzunluk ölçümü, giriş sensörü olayları"""
+
+    KART_ADI = "motor"
+    READY_ARALIGI = 0.2
+
+    KONUM_ONAYLARI = {
+        "ymp": "ymk", "ymc": "ymk", "ymd": "ymk",
+        "smm": "smk", "smp": "smk",
+        "kmd": "kmk",
+    }
+
+    def __init__(self, yanit_gecikmesi: float = 0.0, uzunluk: float = 220.0):
+        super().__init__(yanit_gecikmesi)
+        self.uzunluk = uzunluk
+
+    def acilis(self):
+        """Host port açıp 'b' gönderene kadar 'ready' yollar, ardından kalibrasyon mesajlarını gönderir"""
+        while self.running:
+            self.gonder("ready")
+            try:
+                veri = self.port.oku(self.READY_ARALIGI)
+            except OSError:
+                return
+            if veri and b"b\n" in veri:
+                for satir in ("yino", "kino", "yono", "Baslatiliyor"):
+                    self.gonder(satir)
+                return
+
+    def komut_isle(self, komut: str):
+        if komut in self.KONUM_ONAYLARI:
+            self.gonder(self.KONUM_ONAYLARI[komut])
+        elif komut == "ms":
+            self.gonder(f"m:{self.uzunluk:.1f}")
+        else:
+            super().komut_isle(komut)
+
+    def sise_gecir(self, gecis_suresi: float = 0.05) -> None:
+        """Giriş sensörünün önünden bir ürün geçirir (gsi -> gso)"""
+        self.gonder("gsi")
+        time.sleep(gecis_suresi)
+        self.gonder("gso")
+
+
+class SahteSensorFirmware(SahteKartFirmware):
+    """Sensör kartı: ağırlık (lo), doluluk (do), SDS sağlık satırları"""
+
+    KART_ADI = "sensor"
+
+    SDS_SENSORLERI = ("sdgo", "sdpu", "sdcu", "sdmu", "sdle")
+
+    def __init__(self, yanit_gecikmesi: float = 0.0, agirlik: float = 28.5, agirlik_sapma: float = 2.0):
+        super().__init__(yanit_gecikmesi)
+        self.agirlik = agirlik
+        self.agirlik_sapma = agirlik_sapma
+        self.doluluk = {"c": 40.0, "p": 55.0, "m": 20.0}
+
+    def komut_isle(self, komut: str):
+        if komut == "lo":
+            deger = self.agirlik + random.uniform(-self.agirlik_sapma, self.agirlik_sapma)
+            self.gonder(f"a:{deger:.2f}".replace(".", ","))
+        elif komut == "do":
+            self.gonder("do#" + "#".join(f"{k}:{v:.2f}" for k, v in self.doluluk.items()))
+        elif komut == "sds":
+            for sensor in self.SDS_SENSORLERI:
+                self.gonder(f"{sensor}#g:23.10*a:8.80*sd:Normal")
+        else:
+            super().komut_isle(komut)
+
+
+class TrafikOynatici:
+    """
+    Kayıttaki her kanal için bir SanalPort açar ve karttan gelen (RX) çerçeveleri
+    host'a tekrar yazar. Oynatma nedenseldir: kayıtta bir RX'ten önce host'un
+    gönderdiği TX satırları canlıda da gelmeden o RX yazılmaz; yazılma anı,
+    kayıttaki bir önceki olaydan geçen sürenin hiz'e bölünmüş halidir.
+    Böylece kart sınıfının port açma/handshake süresi ne olursa olsun sıra korunur.
+    Host'un gönderdikleri kayıttaki TX satırlarıyla karşılaştırılır.
+    """
+
+    ESLESME_PENCERESI = 16  # Fazladan/eksik ping gibi kaymalarda ileriye bakılacak satır
+    TX_BEKLEME_UST_SINIR = 2.0  # Host beklenen TX'i bu sürede göndermezse kanal serbest akışa geçer
+    ACILIS_TEKRAR_ARALIGI = 0.2  # İlk TX'ten önceki (boot) RX'ler host port açana kadar tekrarlanır
+
+    def __init__(self, kayit_dosyasi: str, hiz: float = 1.0, kanallar: Optional[List[str]] = None):
+        self.hiz = hiz
+        self.kayitlar = [
+            k for k in kayitlari_oku(kayit_dosyasi)
+            if kanallar is None or k.kanal in kanallar
+        ]
+        self.portlar: Dict[str, SanalPort] = {}
+        self._akislar: Dict[str, List] = {}
+        self._beklenen_tx: Dict[str, List[bytes]] = {}
+        for kayit in self.kayitlar:
+            if kayit.kanal not in self.portlar:
+                self.portlar[kayit.kanal] = SanalPort()
+                self._akislar[kayit.kanal] = []
+                self._beklenen_tx[kayit.kanal] = []
+            if kayit.yon == TX:
+                satirlar = [satir + b"\n" for satir in kayit.veri.split(b"\n") if satir]
+                self._beklenen_tx[kayit.kanal].extend(satirlar)
+            # (zaman, yön, veri, bu olaydan önce gelmesi gereken host TX satırı sayısı)
+            self._akislar[kayit.kanal].append(
+                (kayit.zaman, kayit.yon, kayit.veri, len(self._beklenen_tx[kayit.kanal]))
+            )
+
+        self._lock = threading.Lock()
+        self.eslesen = 0
+        self.eslesmeyen: List[Dict] = []
+        self.yazilan_rx = 0
+        self.tx_zaman_asimi = 0
+        self.running = False
+
+    def port_yollari(self) -> Dict[str, str]:
+        return {kanal: port.yol for kanal, port in self.portlar.items()}
+
+    def oynat(self) -> Dict:
+        """Tüm kanalları paralel oynatır, bitince (bloklar) karşılaştırma özetini döndürür"""
+        self.running = True
+        threadler = [
+            threading.Thread(target=self._kanali_oynat, args=(kanal,), daemon=True, name=f"oynat_{kanal}")
+            for kanal in self.portlar
+        ]
+        for thread in threadler:
+            thread.start()
+        for thread in threadler:
+            thread.join()
+        return self.ozet()
+
+    def durdur(self) -> None:
+        self.running = False
+        for port in self.portlar.values():
+            port.kapat()
+
+    def ozet(self) -> Dict:
+        return {
+            "kayit_sayisi": len(self.kayitlar),
+            "hiz": self.hiz,
+            "yazilan_rx": self.yazilan_rx,
+            "beklenen_tx": sum(len(v) for v in self._beklenen_tx.values()),
+            "eslesen_tx": self.eslesen,
+            "eslesmeyen_tx": len(self.eslesmeyen),
+            "tx_zaman_asimi": self.tx_zaman_asimi,
+            "ilk_eslesmeyenler": self.eslesmeyen[:10],
+        }
+
+    def _kanali_oynat(self, kanal: str) -> None:
+        port = self.portlar[kanal]
+        akis = self._akislar[kanal]
+        durum = {"tampon": b"", "gelen_tx": 0, "tx_sirasi": 0, "tx_zamanlari": [], "serbest": False}
+
+        # Boot mesajları (örn. motor 'ready'): host portu açıp ilk satırını gönderene kadar tekrarla
+        acilis = [veri for _, yon, veri, gerekli in akis if yon == RX and gerekli == 0]
+        if acilis and len(acilis) < len(akis):
+            while self.running and durum["gelen_tx"] == 0:
+                for veri in acilis:
+                    self._rx_yaz(port, veri, sayac=False)
+                self._host_tx_oku(kanal, durum, self.ACILIS_TEKRAR_ARALIGI)
+            akis = [olay for olay in akis if not (olay[1] == RX and olay[3] == 0)]
+
+        onceki_kayit_zamani = akis[0][0] if akis else 0.0
+        onceki_canli_zaman = time.monotonic()
+
+        for zaman, yon, veri, gerekli in akis:
+            if not self.running:
+                return
+            if yon == TX:
+                # Kayıttaki TX: canlıda geldiği an bir sonraki RX'in referansı olur.
+                # Host bir kez beklenen TX'i göndermezse kanal kayıt zamanlamasıyla serbest akar
+                son_tarih = time.monotonic() + self.TX_BEKLEME_UST_SINIR
+                while (self.running and not durum["serbest"] and durum["gelen_tx"] < gerekli
+                       and time.monotonic() < son_tarih):
+                    self._host_tx_oku(kanal, durum, 0.05)
+                if durum["gelen_tx"] < gerekli:
+                    if not durum["serbest"]:
+                        durum["serbest"] = True
+                        with self._lock:
+                            self.tx_zaman_asimi += 1
+                    onceki_canli_zaman += (zaman - onceki_kayit_zamani) / self.hiz
+                else:
+                    onceki_canli_zaman = durum["tx_zamanlari"][gerekli - 1]
+                onceki_kayit_zamani = zaman
+                continue
+
+            hedef = onceki_canli_zaman + (zaman - onceki_kayit_zamani) / self.hiz
+            while self.running and time.monotonic() < hedef:
+                self._host_tx_oku(kanal, durum, max(min(hedef - time.monotonic(), 0.05), 0))
+            self._rx_yaz(port, veri)
+            onceki_kayit_zamani = zaman
+            onceki_canli_zaman = time.monotonic()
+
+        self._host_tx_oku(kanal, durum, 0.2)  # Son yanıtlara fırsat ver
+
+    def _rx_yaz(self, port: SanalPort, veri: bytes, sayac: bool = True) -> None:
+        try:
+            port.yaz(veri)
+        except OSError:
+            return
+        if sayac:
+            with self._lock:
+                self.yazilan_rx += 1
+
+    def _host_tx_oku(self, kanal: str, durum: Dict, bekleme: float) -> None:
+        """Host'un porta yazdıklarını okur, satır satır beklenen TX ile karşılaştırır"""
+        try:
+            veri = self.portlar[kanal].oku(bekleme)
+        except (OSError, ValueError):
+            return
+        if not veri:
+            return
+        simdi = time.monotonic()
+        *satirlar, durum["tampon"] = (durum["tampon"] + veri).split(b"\n")
+        for satir in satirlar:
+            durum["gelen_tx"] += 1
+            durum["tx_zamanlari"].append(simdi)
+            self._tx_karsilastir(kanal, durum, satir + b"\n")
+
+    def _tx_karsilastir(self, kanal: str, durum: Dict, satir: bytes) -> None:
+        """
+        Sıradaki beklenen satırla karşılaştırır; zamanlamaya bağlı kaymalar
+        tüm kalan satırları bozmasın diye ESLESME_PENCERESI kadar ileriye bakılır
+        """
+        beklenen = self._beklenen_tx[kanal]
+        sira = durum["tx_sirasi"]
+        for i in range(sira, min(sira + self.ESLESME_PENCERESI, len(beklenen))):
+            if beklenen[i] == satir:
+                durum["tx_sirasi"] = i + 1
+                with self._lock:
+                    self.eslesen += 1
+                return
+        with self._lock:
+            self.eslesmeyen.append({
+                "kanal": kanal,
+                "sira": sira,
+                "beklenen": beklenen[sira].decode(errors="replace").strip() if sira < len(beklenen) else None,
+                "gelen": satir.decode(errors="replace").strip(),
+            })
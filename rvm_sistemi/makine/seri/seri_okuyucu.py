@@ -0,0 +1,125 @@
+"""
+seri_okuyucu.py - Kartlar için ortak, bloklamayan seri okuma motoru
+Port tanımlayıcısında poll ile bekler, gelen tüm baytları tek os.read ile alır,
+satırları yeniden kullanılan bir bytearray içinde '\\n' ile ayırır ve her tam
+mesajı alınma zamanıyla (time.monotonic) birlikte işleyiciye verir.
+"""
+
+import os
+import select
+import time
+from typing import Callable
+
+import serial
+
+OKUMA_BLOK_BOYUTU = 4096
+MAKS_CERCEVE_BOYUTU = 1024  # '\n' gelmeden bu boyutu aşan veri çöp kabul edilir
+POLL_HATA_BAYRAKLARI = select.POLLERR | select.POLLHUP | select.POLLNVAL
+
+
+class SeriPortKoptu(serial.SerialException):
+    """Port okunabilir görünüp veri döndürmediğinde veya poll hata bildirdiğinde"""
+
+
+class SeriCerceveOkuyucu:
+    """
+    Tek bir seri port için satır çerçeveleyici.
+    Kart sınıflarının dinleme thread'leri oku() metodunu döngü içinde çağırır;
+    bekleme süresi sadece running bayrağını kontrol etme aralığıdır, veri
+    geldiğinde poll hemen uyanır.
+    """
+
+    def __init__(self, isleyici: Callable[[str, float], None]):
+        self.isleyici = isleyici
+        self._tampon = bytearray()
+        self._poll = None
+        self._fd = None
+
+        # İstatistikler
+        self.okuma_sayisi = 0
+        self.mesaj_sayisi = 0
+        self.bayt_sayisi = 0
+        self.atilan_bayt = 0
+
+    def sifirla(self) -> None:
+        """Yarım kalmış çerçeveyi ve kayıtlı tanımlayıcıyı temizler (port değişiminde)"""
+        self._tampon.clear()
+        self._poll = None
+        self._fd = None
+
+    def _poll_hazirla(self, fd: int) -> None:
+        if fd != self._fd:
+            self._tampon.clear()
+            self._poll = select.poll()
+            self._poll.register(fd, select.POLLIN | POLL_HATA_BAYRAKLARI)
+            self._fd = fd
+
+    def oku(self, seri_nesnesi, bekleme_saniye: float = 0.5) -> int:
+        """
+        Veri gelene veya bekleme süresi dolana kadar bloklar, gelen tüm tam
+        mesajları işleyiciye verir.
+
+        Returns:
+            İşleyiciye verilen mesaj sayısı
+
+        Raises:
+            SeriPortKoptu: Port fiziksel olarak kopmuşsa
+            OSError / serial.SerialException: Diğer okuma hataları
+        """
+        fd = seri_nesnesi.fileno()
+        self._poll_hazirla(fd)
+
+        olaylar = self._poll.poll(int(bekleme_saniye * 1000))
+        if not olaylar:
+            return 0
+        alinma_zamani = time.monotonic()
+
+        _, bayraklar = olaylar[0]
+        if bayraklar & POLL_HATA_BAYRAKLARI and not bayraklar & select.POLLIN:
+            raise SeriPortKoptu(f"poll hata bildirdi (0x{bayraklar:x})")
+
+        veri = os.read(fd, OKUMA_BLOK_BOYUTU)
+        if not veri:
+            # pyserial ile aynı kabul: okunabilir ama boş = cihaz çıkarıldı
+            raise SeriPortKoptu("port okunabilir ama veri yok (cihaz çıkarılmış olabilir)")
+
+        self.okuma_sayisi += 1
+        self.bayt_sayisi += len(veri)
+        return self.besle(veri, alinma_zamani)
+
+    def besle(self, veri: bytes, alinma_zamani: float) -> int:
+        """Ham baytları tampona ekler ve tamamlanan satırları işleyiciye verir"""
+        tampon = self._tampon
+        tampon += veri
+
+        adet = 0
+        bas = 0
+        try:
+            while True:
+                son = tampon.find(b"\n", bas)
+                if son < 0:
+                    break
+                mesaj = tampon[bas:son].decode(errors='ignore').strip()
+                bas = son + 1
+                if mesaj:
+                    adet += 1
+                    self.isleyici(mesaj, alinma_zamani)
+        finally:
+            # İşleyici hata verse bile işlenen satırlar tekrar verilmez
+            if bas:
+                del tampon[:bas]
+            self.mesaj_sayisi += adet
+
+        if len(tampon) > MAKS_CERCEVE_BOYUTU:
+            self.atilan_bayt += len(tampon)
+            tampon.clear()
+        return adet
+
+    def istatistikler(self) -> dict:
+        return {
+            "okuma_sayisi": self.okuma_sayisi,
+            "mesaj_sayisi": self.mesaj_sayisi,
+            "bayt_sayisi": self.bayt_sayisi,
+            "atilan_bayt": self.atilan_bayt,
+            "bekleyen_bayt": len(self._tampon),
+        }
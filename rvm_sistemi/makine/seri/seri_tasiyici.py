@@ -0,0 +1,1144 @@
+"""
+seri_tasiyici.py - Motor ve sensör kartlarının ortak seri haberleşme motoru
+Port açma, ESP32 handshake, dinleme/yazma thread'leri, kuyruk taşma kontrolü,
+USB reset ve yeniden bağlanma tek yerde tutulur. Kart sınıfları yalnızca
+komut tablosunu, mesaj işleyicisini ve kart özel adımları (hook'lar) tanımlar;
+zamanlama düzeltmeleri iki karta birden uygulanır.
+"""
+
+import threading
+import queue
+import time
+import serial
+import subprocess
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
+
+from rvm_sistemi.makine.seri.hazirlik_bekleme import olcumlu_bekle, olaylari_bekle
+from rvm_sistemi.makine.seri.port_yonetici import KartHaberlesmeServis
+from rvm_sistemi.makine.seri.seri_okuyucu import SeriCerceveOkuyucu, SeriPortKoptu
+from rvm_sistemi.makine.seri.seri_yanit import YanitEslestirici, yanit_bekle, yanit_bekle_async
+from rvm_sistemi.makine.seri.seri_yazici import (
+    YAZMA_BIRLESTIRME_BAYT, TELEMETRI, KomutKuyrugu, komut_paketi_olustur, parametreli_komut
+)
+from rvm_sistemi.makine.seri.system_state_manager import system_state, CardState, SystemState
+from rvm_sistemi.makine.seri import trafik_kaydi
+from rvm_sistemi.utils.logger import (
+    log_error, log_success, log_warning,
+    log_system, log_exception
+)
+
+
+class SerialCardTransport:
+    """
+    ESP32 tabanlı kartlar için ortak seri taşıyıcı
+    Alt sınıflar KOMUTLAR / PARAMETRELI_KOMUTLAR tablolarını ve aşağıdaki
+    kart özel ayarları tanımlar, gerekirse hook metodlarını ezer
+    """
+
+    # Konfigürasyon sabitleri
+    MAX_RETRY = 10
+    RETRY_BASE_DELAY = 2
+    MAX_RETRY_DELAY = 30
+    PING_TIMEOUT = 0.3
+    QUEUE_MAX_SIZE = 100
+    MAX_CONSECUTIVE_ERRORS = 5
+    YAZMA_BIRLESTIRME_BAYT = YAZMA_BIRLESTIRME_BAYT  # Tek write() ile gönderilecek en fazla bayt
+
+    # Hazırlık beklemeleri - koşul sağlanınca hemen devam edilir, süreler sadece üst sınır
+    BOOT_BEKLEME_UST_SINIR = 5.0        # ESP32 boot/kalibrasyon -> ilk pong
+    RECONNECT_BOOT_UST_SINIR = 3.0      # Reconnect sonrası ilk pong
+    RECONNECT_DOGRULAMA_UST_SINIR = 4.8 # Reconnect doğrulaması (eski: 3 x 0.6 s ping + aralarda 1 s)
+    THREAD_BASLATMA_UST_SINIR = 0.7     # Listen/write thread'lerinin döngüye girmesi
+    HAZIRLIK_PING_ARALIGI = 0.3         # Hazırlık beklerken ping tekrar aralığı
+    RESET_ISARETLERI = frozenset({"resetlendi", "ready"})  # Firmware'in yeniden başladığını gösteren satırlar
+
+    # Kart özel ayarlar
+    KOMUTLAR = MappingProxyType({})
+    PARAMETRELI_KOMUTLAR = MappingProxyType({})  # Değer alan komutlar: ad -> "şablon{}\n"
+    KOMUT_ONCELIKLERI = MappingProxyType({"ping": TELEMETRI})  # Olmayan komutlar HAREKET sınıfında
+    KOMUT_GRUPLARI = MappingProxyType({"ping": "ping"})  # Aynı gruptan kuyrukta sadece son komut kalır
+    KOMUT_IPTALLERI = MappingProxyType({})  # Güvenlik komutu -> kuyruktan silinecek bekleyen komutlar
+    BOOT_HANDSHAKE = False          # Port açılınca ESP32 ready/b handshake yapılsın mı?
+    RECONNECT_USB_RESET = False     # Reconnect'te port aramasında USB reset zorlansın mı?
+    LOG_ETIKETI = "KART"            # Önemli mesaj loglarındaki kart etiketi
+    ONEMLI_MESAJLAR = ()            # Callback'e giderken loglanacak mesaj parçaları
+
+    def __init__(self, port_adi=None, callback=None, cihaz_adi="kart"):
+        """
+        Seri taşıyıcı başlatıcı
+
+        Args:
+            port_adi: Seri port adı (opsiyonel)
+            callback: Mesaj callback fonksiyonu
+            cihaz_adi: Cihaz adı
+        """
+        self.port_adi = port_adi
+        self.seri_nesnesi = None
+        self.callback = callback
+        self.cihaz_adi = cihaz_adi
+        self.port_yoneticisi = KartHaberlesmeServis()
+
+        # Reset bypass için ping zamanı takibi
+        self._last_ping_time = time.time()  # Başlangıç zamanı
+        self._first_connection = True  # İlk bağlantı takibi
+
+        # Thread yönetimi
+        self.running = False
+        self.listen_thread = None
+        self.write_thread = None
+        self.write_queue = KomutKuyrugu(self.QUEUE_MAX_SIZE, self.KOMUT_ONCELIKLERI, self.KOMUT_GRUPLARI,
+                                        self.KOMUT_IPTALLERI)
+        self.okuyucu = SeriCerceveOkuyucu(self._process_message)
+        self.yazma_sayisi = 0           # write() çağrısı
+        self.yazilan_komut_sayisi = 0   # Bu çağrılarla gönderilen komut
+        self.son_mesaj_zamani = None
+        self.yanitlar = YanitEslestirici()  # send_and_wait ile bekleyen istekler
+        self._yeniden_baglan_olayi = threading.Event()  # Hot-plug 'add' olayı reconnect beklemesini keser
+        self._dinleme_hazir = threading.Event()   # Listen thread döngüye girdi
+        self._yazma_hazir = threading.Event()     # Write thread döngüye girdi
+
+        # Sağlık durumu
+        self.saglikli = False
+
+        # Thread safety için lock'lar
+        self._port_lock = threading.RLock()
+
+        # Hata takibi
+        self._connection_attempts = 0
+        self._consecutive_errors = 0
+        self._last_error_time = 0
+        self.son_baglanti_suresi = None  # Son başarılı port arama + açma süresi (saniye)
+
+        # System state manager'a kaydol
+        system_state.set_card_state(self.cihaz_adi, CardState.DISCONNECTED, "Başlatıldı")
+
+        # İlk bağlantıyı başlat
+        self._ilk_baglanti()
+
+    # =============== KART ÖZEL HOOK'LAR ===============
+
+    def _baglanti_hazir(self):
+        """Bağlantı kurulup doğrulandıktan sonra karta gönderilecek ilk komutlar"""
+        pass
+
+    def istatistikler(self) -> dict:
+        """Okuma/yazma ve kuyruk metrikleri"""
+        return {
+            "port": self.port_adi,
+            "saglikli": self.saglikli,
+            "kuyruk": self.write_queue.qsize(),
+            "yazma_sayisi": self.yazma_sayisi,
+            "yazilan_komut_sayisi": self.yazilan_komut_sayisi,
+            "atilan_komut_sayisi": self.atilan_komut_sayisi,
+            "komut_kuyrugu": self.write_queue.istatistikler(),
+            "bekleyen_yanit": self.yanitlar.bekleyen_sayisi,
+            "son_baglanti_suresi": self.son_baglanti_suresi,
+            "okuyucu": self.okuyucu.istatistikler(),
+        }
+
+    # =============== BAĞLANTI ===============
+
+    def _ilk_baglanti(self):
+        """İlk bağlantı kurulumu - thread-safe"""
+        with self._port_lock:
+            log_system(f"{self.cihaz_adi} ilk bağlantı kuruluyor...")
+            
+            # Port verilmişse önce onu dene, olmazsa otomatik port bulma
+            bagli = bool(self.port_adi and self._try_connect_to_port()) or self._auto_find_port()
+
+        if bagli:
+            # Lock dışında: hazırlık beklemesinde listen thread pong'u işleyebilmeli
+            self._baglanti_hazir()
+            return True
+
+        # Bulunamazsa arka planda aramaya devam et
+        self._start_background_search()
+        return False
+
+    def _try_connect_to_port(self) -> bool:
+        """Belirtilen porta bağlanmayı dene"""
+        if self.portu_ac():
+            log_success(f"{self.cihaz_adi} porta bağlandı: {self.port_adi}")
+            system_state.set_card_state(self.cihaz_adi, CardState.CONNECTED, f"Port açıldı: {self.port_adi}")
+            self.dinlemeyi_baslat()
+            return True
+        else:
+            log_warning(f"{self.cihaz_adi} porta bağlanamadı: {self.port_adi}")
+            system_state.set_card_state(self.cihaz_adi, CardState.ERROR, f"Port açılamadı: {self.port_adi}")
+            return False
+
+    def _auto_find_port(self, force_usb_reset: bool = False) -> bool:
+        """
+        Otomatik port bulma
+
+        Args:
+            force_usb_reset: Port bulunamasa bile USB reset zorla (donanımsal sorunlu kartlar için)
+        """
+        try:
+            # Kart kritik olarak verilirse port bulunamasa bile USB reset yapılır
+            kritik_kartlar = [self.cihaz_adi] if force_usb_reset else None
+            arama_baslangic = time.monotonic()
+            basarili, mesaj, portlar = self.port_yoneticisi.baglan(
+                cihaz_adi=self.cihaz_adi,
+                kritik_kartlar=kritik_kartlar
+            )
+            
+            if basarili and self.cihaz_adi in portlar:
+                self.port_adi = portlar[self.cihaz_adi]
+                log_success(f"{self.cihaz_adi} port bulundu: {self.port_adi}")
+                
+                # Port bulundu, bağlantı kurmayı dene
+                if self._try_connect_to_port():
+                    self.son_baglanti_suresi = round(time.monotonic() - arama_baslangic, 2)
+                    log_success(f"{self.cihaz_adi} bağlantı kuruldu: {self.port_adi} ({self.son_baglanti_suresi}s)")
+                    # Thread durumunu kontrol et (dinlemeyi_baslat thread'lerin başlamasını bekledi)
+                    if self.thread_durumu_kontrol():
+                        log_system(f"{self.cihaz_adi} _auto_find_port - thread'ler başarıyla başlatıldı")
+                    else:
+                        log_warning(f"{self.cihaz_adi} _auto_find_port - thread'ler başlatılamadı")
+
+                    # ✅ RESET KALDIRILDI - İlk bağlantı gibi davran
+                    # İlk bağlantıda reset atmıyoruz ve her şey çalışıyor
+                    # Reconnection'da da reset atmaya gerek yok!
+
+                    return True
+                else:
+                    log_warning(f"{self.cihaz_adi} port bulundu ama bağlantı kurulamadı: {self.port_adi}")
+                    # Port bulundu ama bağlantı kurulamadı - port sağlık servisine bildir
+                    system_state.set_card_state(self.cihaz_adi, CardState.ERROR, f"Port bulundu ama bağlantı kurulamadı: {self.port_adi}")
+                    return False
+            else:
+                log_warning(f"{self.cihaz_adi} otomatik port bulunamadı: {mesaj}")
+                
+        except Exception as e:
+            log_error(f"{self.cihaz_adi} port arama hatası: {e}")
+            
+        return False
+
+    def _start_background_search(self):
+        """Arka planda port arama başlat - sonsuz döngü önlendi"""
+        def search_worker():
+            attempts = 0
+            base_delay = self.RETRY_BASE_DELAY
+            
+            while attempts < self.MAX_RETRY:
+                # Bağlantı varsa çık
+                with self._port_lock:
+                    if self.seri_nesnesi and self.seri_nesnesi.is_open:
+                        return
+                
+                attempts += 1
+                delay = min(base_delay * (2 ** (attempts - 1)), self.MAX_RETRY_DELAY)
+                
+                log_system(f"{self.cihaz_adi} port arama {attempts}/{self.MAX_RETRY}")
+                
+                if self._auto_find_port():
+                    self._baglanti_hazir()
+
+                    # ✅ RESET KALDIRILDI - İlk bağlantı gibi davran
+
+                    self._connection_attempts = 0
+                    # Thread durumunu kontrol et
+                    if self.thread_durumu_kontrol():
+                        log_system(f"{self.cihaz_adi} _start_background_search - thread'ler başarıyla başlatıldı")
+                    else:
+                        log_warning(f"{self.cihaz_adi} _start_background_search - thread'ler başlatılamadı")
+                    return
+                
+                time.sleep(delay)
+            
+            log_error(f"{self.cihaz_adi} maksimum arama denemesi aşıldı")
+        
+        thread = threading.Thread(target=search_worker, daemon=True, name=f"{self.cihaz_adi}_search")
+        thread.start()
+
+    # =============== ORTAK KOMUTLAR ===============
+
+    def reset(self):
+        log_system(f"{self.cihaz_adi} reset komutu gönderiliyor...")
+        # Write thread'in çalışıp çalışmadığını kontrol et
+        if not (self.write_thread and self.write_thread.is_alive()):
+            log_error(f"{self.cihaz_adi} write thread çalışmıyor - reset komutu gönderilemiyor")
+            return False
+        
+        self._safe_queue_put("reset", None)
+        log_system(f"{self.cihaz_adi} reset komutu queue'ya eklendi")
+        return True
+
+    def ping(self, bypass_reconnection_check=False):
+        """Ping - sadece mevcut bağlantıyı test et"""
+        # Reconnect devam ediyorsa ping atma
+        if not bypass_reconnection_check and system_state.is_card_reconnecting(self.cihaz_adi):
+            return False
+
+        if not self._is_port_ready():
+            return False
+
+        # Ping zamanını kaydet (reset bypass için)
+        self._last_ping_time = time.time()
+
+        # Sağlık durumunu False yap (gerçek yanıt gelene kadar)
+        self.saglikli = False
+
+        # Ping gönder ve PONG cevabını bekle (yanıt gelince hemen uyanır)
+        timeout = self.PING_TIMEOUT * 2  # 0.6 saniye
+        pong = self.send_and_wait("ping", expect=lambda m: m.lower() == "pong", timeout=timeout)
+        if yanit_bekle(pong, timeout) is not None:
+            self.saglikli = True
+            return True
+
+        # Timeout - PONG gelmedi (sadece hata durumunda log)
+        log_error(f"{self.cihaz_adi.upper()} ping timeout")
+        self.saglikli = False
+        return False
+
+    def send_and_wait(self, cmd, expect, timeout=1.0, data=None):
+        """
+        Komutu gönderir, beklenen yanıt satırıyla çözülen Future döndürür.
+
+        Args:
+            cmd: Komut sözlüğündeki komut adı
+            expect: Satırı alıp yanıt olup olmadığını söyleyen koşul
+            timeout: Bu süreden sonra gelen satırlarla eşleştirilmez
+            data: Parametreli komutların değeri
+        """
+        future = self.yanitlar.kaydet(expect, timeout)
+        if not self._is_port_ready():
+            self.yanitlar.hata_ver(future, ConnectionError(f"{self.cihaz_adi} port hazır değil"))
+            return future
+        self._safe_queue_put(cmd, data)
+        return future
+
+    async def send_and_wait_async(self, cmd, expect, timeout=1.0, data=None):
+        """send_and_wait'in async karşılığı - yanıt satırını, gelmezse None döndürür"""
+        return await yanit_bekle_async(self.send_and_wait(cmd, expect, timeout, data), timeout)
+
+    def pong_bekle(self, ust_sinir: float) -> bool:
+        """
+        Thread'ler çalışırken kart ilk pong'u verene kadar aralıklarla ping atar
+
+        Returns:
+            bool: ust_sinir dolmadan pong geldi mi?
+        """
+        son_tarih = time.monotonic() + ust_sinir
+        while True:
+            kalan = son_tarih - time.monotonic()
+            if kalan <= 0:
+                return False
+            deneme = time.monotonic()
+            sure = min(self.HAZIRLIK_PING_ARALIGI, kalan)
+            pong = self.send_and_wait("ping", expect=lambda m: m.lower() == "pong", timeout=sure)
+            if yanit_bekle(pong, sure) is not None:
+                self.saglikli = True
+                return True
+            # Port hazır değilse Future hemen döner; ping aralığını koru
+            gecen = time.monotonic() - deneme
+            if gecen < self.HAZIRLIK_PING_ARALIGI:
+                time.sleep(max(min(self.HAZIRLIK_PING_ARALIGI - gecen, son_tarih - time.monotonic()), 0))
+
+    def reset_ve_hazir_bekle(self, ust_sinir: float) -> bool:
+        """
+        Reset komutunu gönderir ve kart yeniden başlayıp ilk pong'u verene kadar bekler.
+        Önce yeniden başlama işareti beklenir (resetlendi/ready satırı veya bağlantının
+        kopması); reset öncesi firmware'in verdiği pong kartı hazır saymaz.
+
+        Returns:
+            bool: ust_sinir dolmadan kart yeniden başlayıp pong verdi mi?
+        """
+        son_tarih = time.monotonic() + ust_sinir
+        isaret = self.yanitlar.kaydet(lambda m: m.lower() in self.RESET_ISARETLERI, ust_sinir)
+        if not self.reset():
+            isaret.cancel()
+            return False
+        try:
+            isaret.result(timeout=ust_sinir)
+        except ConnectionError:
+            pass  # Kart reset ile USB'den düştü: yeniden başlıyor
+        except FutureTimeoutError:
+            isaret.cancel()
+            log_warning(f"{self.cihaz_adi} reset sonrası yeniden başlama işareti gelmedi")
+            return False
+        return self.pong_bekle(max(son_tarih - time.monotonic(), 0))
+
+    def _portta_pong_bekle(self, ust_sinir: float) -> bool:
+        """Dinleme thread'i başlamadan önce: ping yazıp pong'u doğrudan porttan okur"""
+        son_tarih = time.monotonic() + ust_sinir
+        sonraki_ping = 0.0
+        try:
+            while time.monotonic() < son_tarih:
+                if time.monotonic() >= sonraki_ping:
+                    self.seri_nesnesi.write(self.KOMUTLAR["ping"])
+                    self.seri_nesnesi.flush()
+                    self._trafik_kaydet(trafik_kaydi.TX, self.KOMUTLAR["ping"])
+                    sonraki_ping = time.monotonic() + self.HAZIRLIK_PING_ARALIGI
+
+                if self.seri_nesnesi.in_waiting > 0:
+                    satir = self.seri_nesnesi.readline().decode('utf-8', errors='ignore').strip()
+                    self._trafik_kaydet(trafik_kaydi.RX, satir.encode() + b"\n")
+                    if satir.lower() == "pong":
+                        return True
+                else:
+                    time.sleep(0.02)
+        except (serial.SerialException, OSError) as e:
+            log_warning(f"{self.cihaz_adi} hazırlık beklerken port hatası: {e}")
+        return False
+
+    def getir_saglik_durumu(self):
+        """Sağlık durumu"""
+        return self.saglikli
+
+    # =============== PORT VE THREAD YÖNETİMİ ===============
+
+    def portu_ac(self):
+        """Port açma - thread-safe"""
+        if not self.port_adi:
+            return False
+
+        try:
+            with self._port_lock:
+                # ✅ Eski port adını sakla - self.port_adi zaten yeni port olabilir!
+                old_port_path = None
+                if self.seri_nesnesi and self.seri_nesnesi.is_open:
+                    old_port_path = self.seri_nesnesi.port  # Gerçek eski port path
+
+                # Eski portu kapat ve release et
+                if old_port_path:
+                    system_state.release_port(old_port_path, self.cihaz_adi)
+                    log_system(f"{self.cihaz_adi} eski port release edildi: {old_port_path}")
+                    self.seri_nesnesi.close()
+                    self.seri_nesnesi = None
+                    time.sleep(0.5)
+                
+                # Yeni port aç
+                self.seri_nesnesi = serial.Serial(
+                    self.port_adi,
+                    baudrate=115200,
+                    timeout=1,
+                    write_timeout=1
+                )
+
+                log_success(f"{self.cihaz_adi} port açıldı: {self.port_adi}")
+
+                # Port sahipliğini claim et
+                if not system_state.claim_port(self.port_adi, self.cihaz_adi):
+                    log_error(f"{self.cihaz_adi} port sahipliği alınamadı: {self.port_adi}")
+                    self.seri_nesnesi.close()
+                    self.seri_nesnesi = None
+                    self.saglikli = False
+                    return False
+
+                # ✅ ESP32 BOOT HANDSHAKE - Yeni protokol: ready/b handshake
+                # ESP32 sürekli "ready" mesajı gönderir, Python 'b' ile yanıt verir
+                # GEÇICI: Eski firmware ile uyumluluk için handshake başarısızlığı tolere edilir
+                if self.BOOT_HANDSHAKE and not self._esp32_boot_handshake(timeout_seconds=15.0):
+                    log_warning(f"{self.cihaz_adi} ESP32 boot handshake başarısız - eski firmware olabilir")
+                    log_warning(f"{self.cihaz_adi} Yeni firmware yüklü değilse handshake çalışmaz")
+                    log_system(f"{self.cihaz_adi} Basit boot bekleme moduna geçiliyor...")
+                    # Eski firmware için: ilk pong gelene kadar (en fazla boot + kalibrasyon süresi)
+                    olcumlu_bekle(f"{self.cihaz_adi}.boot_fallback", self.BOOT_BEKLEME_UST_SINIR,
+                                  self._portta_pong_bekle)
+                    log_system(f"{self.cihaz_adi} Boot bekleme tamamlandı (fallback mode)")
+                    # Devam et, PONG ile doğrulanacak
+
+                self.saglikli = True
+                self._consecutive_errors = 0
+                return True
+                
+        except serial.SerialException as e:
+            log_error(f"{self.cihaz_adi} port hatası: {e}")
+            self.seri_nesnesi = None
+            self.saglikli = False
+            return False
+
+    def dinlemeyi_baslat(self):
+        """Thread başlatma - iyileştirilmiş - DEADLOCK FIX + ZOMBIE THREAD KONTROLÜ"""
+        # Port kontrolü ve running flag ayarları lock içinde
+        with self._port_lock:
+            # Port açık değilse thread başlatma
+            if not self.seri_nesnesi or not self.seri_nesnesi.is_open:
+                log_warning(f"{self.cihaz_adi} port açık değil - thread başlatılamıyor")
+                return
+            
+            # ✅ ZOMBIE THREAD KONTROLÜ
+            # Thread'ler "çalışıyor" görünüyorsa ama gerçekte is_alive() False ise temizle
+            threads_alive = (
+                (self.listen_thread and self.listen_thread.is_alive()) and
+                (self.write_thread and self.write_thread.is_alive())
+            )
+            
+            if self.running and not threads_alive:
+                # Zombie thread durumu - temizle
+                log_warning(f"{self.cihaz_adi} zombie thread tespit edildi - temizleniyor")
+                self.running = False
+                # Lock'u bırak, thread temizliği için
+            elif self.running and threads_alive:
+                # Thread'ler zaten çalışıyor (gerçekten alive)
+                log_warning(f"{self.cihaz_adi} thread'ler zaten çalışıyor")
+                return
+            elif not self.running and threads_alive:
+                # running=False ama thread'ler hala alive - durdur
+                log_warning(f"{self.cihaz_adi} orphan thread'ler bulundu - durduruluyor")
+                self.running = False
+            
+            # Eski thread'leri temizle
+            if self.running:
+                log_system(f"{self.cihaz_adi} eski thread'leri temizleniyor...")
+                self.running = False
+                # Lock'u bırak, thread'lerin durması için
+        
+        # Lock DIŞINDA thread temizliği - thread'ler durana kadar (en fazla 0.5s)
+        if not self.running:
+            self._cleanup_threads(bekleme=0.5)
+        
+        # Lock içinde running flag'i ayarla
+        with self._port_lock:
+            self.running = True
+        
+        # ✅ LOCK DIŞINDA thread'leri başlat (deadlock önleme)
+        self._threadleri_baslat()
+        log_system(f"{self.cihaz_adi} thread'leri başlatıldı")
+        
+        # Thread durumunu kontrol et ve logla
+        if self.thread_durumu_kontrol():
+            log_success(f"{self.cihaz_adi} thread'leri başarıyla başlatıldı")
+        else:
+            log_error(f"{self.cihaz_adi} thread'leri başlatılamadı - yeniden denenecek")
+            # Thread'leri tekrar başlat
+            self._cleanup_threads(bekleme=0.5)
+            self._threadleri_baslat()
+            log_system(f"{self.cihaz_adi} thread'leri tekrar başlatıldı")
+
+    def _threadleri_baslat(self):
+        """Listen/write thread'lerini başlatır ve ikisi de döngüye girene kadar bekler"""
+        self._dinleme_hazir.clear()
+        self._yazma_hazir.clear()
+        self.listen_thread = threading.Thread(
+            target=self._dinle,
+            daemon=True,
+            name=f"{self.cihaz_adi}_listen"
+        )
+        self.write_thread = threading.Thread(
+            target=self._yaz,
+            daemon=True,
+            name=f"{self.cihaz_adi}_write"
+        )
+        self.listen_thread.start()
+        self.write_thread.start()
+
+        olcumlu_bekle(
+            f"{self.cihaz_adi}.thread_baslatma", self.THREAD_BASLATMA_UST_SINIR,
+            lambda ust_sinir: olaylari_bekle((self._dinleme_hazir, self._yazma_hazir), ust_sinir)
+        )
+
+    def dinlemeyi_durdur(self):
+        """Thread durdurma - güvenli"""
+        with self._port_lock:
+            if not self.running:
+                return
+            
+            self.running = False
+            
+            self.yanitlar.tumunu_iptal_et(f"{self.cihaz_adi} dinleme durduruldu")
+
+            # Exit sinyali gönder
+            try:
+                self.write_queue.put_nowait(("exit", None))
+            except queue.Full:
+                pass
+            
+            # Thread'leri bekle - kendini join etmeyi önle
+            current_thread = threading.current_thread()
+            for thread in [self.listen_thread, self.write_thread]:
+                if thread and thread.is_alive() and thread != current_thread:
+                    thread.join(timeout=1)
+            
+            log_system(f"{self.cihaz_adi} thread'leri durduruldu")
+
+    # =============== INTERNAL İYİLEŞTİRMELER ===============
+
+    @property
+    def atilan_komut_sayisi(self) -> int:
+        """Kuyruk dolu olduğu için atılan komut"""
+        return self.write_queue.atilan_toplam
+
+    def _safe_queue_put(self, command, data=None):
+        """Queue'ya güvenli yazma - öncelik, birleştirme ve atma kararı kuyrukta verilir"""
+        sonuc = self.write_queue.ekle(command, data)
+        if sonuc == "atildi":
+            log_error(f"{self.cihaz_adi} komut gönderilemedi (kuyruk dolu): {command}")
+        elif sonuc == "eklendi:atildi":
+            log_warning(f"{self.cihaz_adi} queue dolu, düşük öncelikli eski komut atıldı")
+
+    def _cleanup_threads(self, bekleme=0.1):
+        """Thread temizliği - her thread için en fazla 'bekleme' saniye join"""
+        current_thread = threading.current_thread()
+        for thread in [self.listen_thread, self.write_thread]:
+            if thread and thread.is_alive() and thread != current_thread:
+                thread.join(timeout=bekleme)
+
+    def thread_durumu_kontrol(self):
+        """Thread durumunu kontrol et"""
+        with self._port_lock:
+            listen_ok = self.listen_thread and self.listen_thread.is_alive()
+            write_ok = self.write_thread and self.write_thread.is_alive()
+            
+            if listen_ok and write_ok:
+                log_system(f"{self.cihaz_adi} thread'leri çalışıyor - Listen: {listen_ok}, Write: {write_ok}")
+                return True
+            else:
+                log_warning(f"{self.cihaz_adi} thread durumu - Listen: {listen_ok}, Write: {write_ok}")
+                # Thread'lerin neden çalışmadığını kontrol et
+                if not listen_ok:
+                    log_error(f"{self.cihaz_adi} listen thread çalışmıyor")
+                if not write_ok:
+                    log_error(f"{self.cihaz_adi} write thread çalışmıyor")
+                return False
+
+    def _is_port_ready(self) -> bool:
+        """Port hazır mı?"""
+        with self._port_lock:
+            return (
+                self.seri_nesnesi is not None
+                and self.seri_nesnesi.is_open
+                and self.running
+            )
+
+    def _esp32_boot_handshake(self, timeout_seconds: float = 10.0) -> bool:
+        """
+        ESP32 ile boot handshake protokolü gerçekleştirir.
+
+        ESP32 setup() fonksiyonu sürekli "ready" mesajı gönderir.
+        Python bu mesajı alınca 'b' komutu gönderir.
+        ESP32 kalibrasyon başlatır ve "yino", "kino", "yono" mesajları gönderir.
+
+        Args:
+            timeout_seconds: Maksimum bekleme süresi
+
+        Returns:
+            True: Handshake başarılı
+            False: Timeout veya hata
+        """
+        start_time = time.time()
+        ready_alindi = False
+
+        log_system(f"{self.cihaz_adi} ESP32 boot handshake başlatılıyor...")
+
+        try:
+            # Önce buffer'ı temizle
+            self.seri_nesnesi.reset_input_buffer()
+            self.seri_nesnesi.reset_output_buffer()
+
+            while time.time() - start_time < timeout_seconds:
+                try:
+                    # ESP32'den "ready" mesajını bekle
+                    if self.seri_nesnesi.in_waiting > 0:
+                        line = self.seri_nesnesi.readline().decode('utf-8', errors='ignore').strip()
+                        self._trafik_kaydet(trafik_kaydi.RX, line.encode() + b"\n")
+
+                        if line == "ready":
+                            log_system(f"{self.cihaz_adi} ✅ ESP32 'ready' mesajı alındı")
+                            ready_alindi = True
+
+                            # 'b' komutu gönder
+                            self.seri_nesnesi.write(b'b\n')
+                            self.seri_nesnesi.flush()
+                            self._trafik_kaydet(trafik_kaydi.TX, b'b\n')
+                            log_system(f"{self.cihaz_adi} → 'b' komutu gönderildi")
+
+                            # ESP32'nin yanıtlarını bekle (yino, kino, yono, Baslatiliyor...)
+                            yanit_timeout = time.time() + 5.0
+                            beklenen_yanitlar = ["yino", "kino", "yono"]
+                            alinan_yanitlar = []
+
+                            while time.time() < yanit_timeout:
+                                if self.seri_nesnesi.in_waiting > 0:
+                                    yanit = self.seri_nesnesi.readline().decode('utf-8', errors='ignore').strip()
+                                    self._trafik_kaydet(trafik_kaydi.RX, yanit.encode() + b"\n")
+
+                                    if yanit:
+                                        log_system(f"{self.cihaz_adi} ← ESP32: {yanit}")
+
+                                    if yanit in beklenen_yanitlar:
+                                        alinan_yanitlar.append(yanit)
+
+                                    if "Baslatiliyor" in yanit or "baslatiliyor" in yanit.lower():
+                                        # Kalibrasyon başladı, başarılı sayılır
+                                        # Kalibrasyonun tamamlanması için ek süre bekle
+                                        log_system(f"{self.cihaz_adi} ESP32 kalibrasyon başladı, tamamlanması bekleniyor...")
+                                        # Kalibrasyon setup() içinde biter; ilk pong loop()'un çalıştığını gösterir
+                                        olcumlu_bekle(f"{self.cihaz_adi}.kalibrasyon", self.BOOT_BEKLEME_UST_SINIR,
+                                                      self._portta_pong_bekle)
+                                        log_success(f"{self.cihaz_adi} ESP32 boot handshake BAŞARILI")
+                                        return True
+
+                                time.sleep(0.01)
+
+                            # Yanıtlar geldi mi kontrol et (Baslatiliyor mesajı gelmese bile)
+                            if len(alinan_yanitlar) >= 2:
+                                # En azından 2 yanıt aldıysak kabul edilebilir
+                                log_system(f"{self.cihaz_adi} ESP32 kalibrasyon tamamlanması bekleniyor...")
+                                olcumlu_bekle(f"{self.cihaz_adi}.kalibrasyon", self.BOOT_BEKLEME_UST_SINIR,
+                                              self._portta_pong_bekle)
+                                log_success(f"{self.cihaz_adi} ESP32 boot handshake BAŞARILI (partial)")
+                                return True
+                            else:
+                                log_warning(f"{self.cihaz_adi} ESP32 yanıtları eksik: {alinan_yanitlar}")
+                                return False
+
+                    time.sleep(0.05)
+
+                except Exception as e:
+                    log_error(f"{self.cihaz_adi} Handshake okuma hatası: {e}")
+                    return False
+
+            # Timeout
+            if not ready_alindi:
+                log_error(f"{self.cihaz_adi} ESP32 boot handshake TIMEOUT - 'ready' mesajı alınamadı ({timeout_seconds}s)")
+            else:
+                log_error(f"{self.cihaz_adi} ESP32 boot handshake TIMEOUT - Yanıt alamama ({timeout_seconds}s)")
+
+            return False
+
+        except Exception as e:
+            log_error(f"{self.cihaz_adi} ESP32 boot handshake hatası: {e}")
+            return False
+
+    def _komut_kodla(self, command, data=None) -> bytes:
+        """Kuyruk komutunu karta gidecek baytlara çevirir (bilinmeyen komut için b"")"""
+        sablon = self.PARAMETRELI_KOMUTLAR.get(command)
+        if sablon is not None:
+            return parametreli_komut(sablon, data)
+        return self.KOMUTLAR.get(command, b"")
+
+    def _yaz(self):
+        """Yazma thread'i - kuyrukta bekleyen komutları tek write() ile gönderir"""
+        log_system(f"{self.cihaz_adi} write thread başlatıldı")
+        self._yazma_hazir.set()
+        bekleyen = None
+
+        while self.running:
+            try:
+                # Komut al (önceki pakete sığmayan komut önce gönderilir)
+                if bekleyen is None:
+                    try:
+                        bekleyen = self.write_queue.get(timeout=1)
+                    except queue.Empty:
+                        continue
+                command, data = bekleyen
+                bekleyen = None
+
+                if command == "exit":
+                    log_system(f"{self.cihaz_adi} write thread çıkıyor")
+                    break
+                
+                # Port kontrolü
+                if not self._is_port_ready():
+                    log_warning(f"{self.cihaz_adi} write thread - port hazır değil")
+                    time.sleep(0.1)
+                    continue
+                
+                # Hazır bekleyen komutları firmware tamponuna sığacak kadar birleştir
+                paket, adet, bekleyen, cikis = komut_paketi_olustur(
+                    self.write_queue, self._komut_kodla(command, data), self._komut_kodla,
+                    self.YAZMA_BIRLESTIRME_BAYT
+                )
+                if paket:
+                    self.seri_nesnesi.write(paket)
+                    self.seri_nesnesi.flush()
+                    self._trafik_kaydet(trafik_kaydi.TX, paket)
+                    self.yazma_sayisi += 1
+                    self.yazilan_komut_sayisi += adet
+
+                if cikis:
+                    log_system(f"{self.cihaz_adi} write thread çıkıyor")
+                    break
+                
+            except (serial.SerialException, OSError) as e:
+                log_error(f"{self.cihaz_adi} yazma hatası: {e}")
+                # I/O Error sonrası hemen portu kapat
+                with self._port_lock:
+                    if self.seri_nesnesi and self.seri_nesnesi.is_open:
+                        try:
+                            self.seri_nesnesi.close()
+                        except:
+                            pass
+                        self.seri_nesnesi = None
+                        self.saglikli = False
+                
+                # Reconnection'ı ayrı thread'de başlat (write thread'i durdurmadan)
+                threading.Thread(
+                    target=self._handle_connection_error,
+                    daemon=True,
+                    name=f"{self.cihaz_adi}_error_handler"
+                ).start()
+                
+                # Write thread'i durdurma, sadece port hatası için bekle
+                time.sleep(1)
+                continue
+            except Exception as e:
+                log_exception(f"{self.cihaz_adi} yazma thread hatası", exc_info=(type(e), e, e.__traceback__))
+        
+        log_system(f"{self.cihaz_adi} write thread bitti - running: {self.running}")
+
+    def _dinle(self):
+        """Dinleme thread'i - poll ile veri bekler, ortak çerçeveleyiciyle satırları ayırır"""
+        self._consecutive_errors = 0
+        self.okuyucu.sifirla()
+        self._dinleme_hazir.set()
+
+        while self.running:
+            try:
+                if not self._is_port_ready():
+                    time.sleep(0.5)
+                    continue
+
+                # Veri gelene kadar bloklar; 0.5s sadece running kontrolü için
+                if self.okuyucu.oku(self.seri_nesnesi, bekleme_saniye=0.5):
+                    self._consecutive_errors = 0  # Başarılı okuma
+
+            except SeriPortKoptu as e:
+                # Port fiziksel olarak kopmuş
+                log_error(f"{self.cihaz_adi} port erişim hatası: {e}")
+                self._handle_connection_error()
+                break
+
+            except (serial.SerialException, OSError, ValueError) as e:
+                # ValueError: port başka thread'de kapatıldı (fileno yok)
+                self._consecutive_errors += 1
+                log_error(f"{self.cihaz_adi} okuma hatası ({self._consecutive_errors}): {e}")
+
+                if self._consecutive_errors >= self.MAX_CONSECUTIVE_ERRORS:
+                    self._handle_connection_error()
+                    break
+
+                time.sleep(0.5)
+
+            except Exception as e:
+                log_exception(f"{self.cihaz_adi} dinleme hatası", exc_info=(type(e), e, e.__traceback__))
+                time.sleep(1)
+
+    def _process_message(self, message: str, alinma_zamani: Optional[float] = None):
+        """Mesaj işleme - Sadeleştirilmiş"""
+        if not message or not message.isprintable():
+            return  # Geçersiz mesajlar sessizce ignore et
+
+        self._trafik_kaydet(trafik_kaydi.RX, message.encode() + b"\n", alinma_zamani)
+
+        # Satırın porttan okunduğu an (time.monotonic)
+        self.son_mesaj_zamani = alinma_zamani if alinma_zamani is not None else time.monotonic()
+
+        # send_and_wait ile bekleyen istek varsa çöz (satır callback'e de gider)
+        self.yanitlar.mesaj_geldi(message)
+
+        message_lower = message.lower()
+
+        if message_lower == "pong":
+            # Başarılı ping - sessiz (noise azaltma)
+            self.saglikli = True
+        elif message_lower == "resetlendi":
+            log_warning(f"{self.cihaz_adi.upper()} kartı resetlendi")
+            
+            # İlk bağlantıda gelen reset mesajını bypass et
+            if self._first_connection:
+                log_system(f"{self.cihaz_adi} - İlk bağlantı reset mesajı, bypass ediliyor")
+                self._first_connection = False
+                self.saglikli = True
+                return
+            
+            # Seçici bypass: Sadece gömülü sistemin otomatik resetini bypass et
+            # Fiziksel bağlantı sorunlarında hala reset yap
+            current_time = time.time()
+            time_since_ping = current_time - self._last_ping_time
+            
+            # Daha uzun süre bekle (120 saniye) - kart boot süreci çok uzun olabilir
+            if time_since_ping < 120:  # Son 120 saniye içinde ping alındıysa
+                # Gömülü sistem reseti - bypass et
+                log_warning(f"{self.cihaz_adi} - Gömülü sistem reseti tespit edildi, bypass ediliyor (ping: {time_since_ping:.1f}s önce)")
+                self.saglikli = True  # Sağlıklı olarak işaretle
+            else:
+                # Ping alınmamışsa, fiziksel bağlantı sorunu
+                log_warning(f"{self.cihaz_adi} - Fiziksel bağlantı sorunu tespit edildi, reset yapılıyor (ping: {time_since_ping:.1f}s önce)")
+                self.saglikli = False
+                time.sleep(2)
+                self._handle_connection_error()
+        elif self.callback:
+            # Callback'e giden mesajları sadeleştir - sadece önemli olanları logla
+            if any(imp in message_lower for imp in self.ONEMLI_MESAJLAR):
+                log_system(f"{self.LOG_ETIKETI}: {message}")  # Sade format
+            try:
+                self.callback(message)
+            except Exception as e:
+                log_error(f"{self.cihaz_adi} callback hatası: {e}")
+        else:
+            # Callback yoksa ve tanınmayan mesaj - sessiz (noise azaltma)
+            pass
+
+    def _trafik_kaydet(self, yon: int, veri: bytes, zaman: Optional[float] = None):
+        """RVM_TRAFIK_KAYDI açıksa çerçeveyi trafik kaydına ekler"""
+        if trafik_kaydi.trafik_kaydedici:
+            trafik_kaydi.trafik_kaydedici.kaydet(self.cihaz_adi, yon, veri, zaman)
+
+    # =============== HATA YÖNETİMİ VE YENİDEN BAĞLANMA ===============
+
+    def _try_usb_reset(self, port_path: str) -> bool:
+        """
+        USB portunu fiziksel reset et
+        
+        Args:
+            port_path: Reset atılacak port yolu
+            
+        Returns:
+            bool: Reset başarılı mı?
+        """
+        try:
+            script_path = Path(__file__).parent / "usb_reset_helper.sh"
+            
+            if not script_path.exists():
+                log_warning(f"USB reset scripti bulunamadı: {script_path}")
+                return False
+            
+            log_system(f"USB reset deneniyor: {port_path}")
+            result = subprocess.run(
+                ['sudo', str(script_path), port_path],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            
+            if result.returncode == 0:
+                log_success(f"USB reset başarılı: {port_path}")
+                time.sleep(2)  # Driver yeniden yüklenmesini bekle
+                return True
+            else:
+                log_warning(f"USB reset başarısız: {result.stderr}")
+                return False
+                
+        except subprocess.TimeoutExpired:
+            log_error(f"USB reset timeout: {port_path}")
+            return False
+        except Exception as e:
+            log_error(f"USB reset hatası: {e}")
+            return False
+
+    def _handle_connection_error(self, usb_reset=True):
+        """
+        Bağlantı hatası yönetimi - System State Manager ile - İYİLEŞTİRİLMİŞ
+
+        Args:
+            usb_reset: Port için USB reset denensin mi? (cihaz çıkarıldıysa anlamsız)
+        """
+
+        # Bağlantı koptu: yanıt bekleyen istekler (reset işareti, ping) zaman aşımını beklemesin
+        self.yanitlar.tumunu_iptal_et(f"{self.cihaz_adi} bağlantısı koptu")
+
+        # ✅ ÖNCELİKLE reconnection durumu kontrol et - race condition önlemi
+        # Eğer başka bir thread zaten reconnection başlattıysa, bu thread sessizce çıkar
+        if not system_state.can_start_reconnection(self.cihaz_adi):
+            log_system(f"{self.cihaz_adi} reconnection başka bir thread tarafından yönetiliyor, bu thread sonlandırılıyor")
+            return
+
+        # ✅ USB reset devam ediyorsa bekle (diğer kartın reset'i bitsin)
+        if system_state.get_system_state() == SystemState.USB_RESETTING:
+            log_system(f"{self.cihaz_adi} USB reset devam ediyor, bekleniyor...")
+            # USB reset bitene kadar bekle (max 90 saniye) - durum değişince hemen uyanır
+            if not system_state.wait_until(lambda durum: durum.system_state != SystemState.USB_RESETTING, 90):
+                log_error(f"{self.cihaz_adi} USB reset timeout (90s), reconnection iptal ediliyor")
+                return
+
+            log_system(f"{self.cihaz_adi} USB reset bitti, reconnection başlatılıyor...")
+            time.sleep(1)  # Reset sonrası stabilizasyon
+
+        # ✅ Reconnection başlat (TEKRAR KONTROL ET - wait sırasında başka thread başlatmış olabilir)
+        if not system_state.start_reconnection(self.cihaz_adi, "I/O Error"):
+            log_system(f"{self.cihaz_adi} reconnection başlatılamadı (başka thread zaten başlattı)")
+            return
+        
+        try:
+            log_system(f"{self.cihaz_adi} bağlantı hatası yönetimi")
+            
+            # 1. Thread'leri tam olarak durdur
+            self.running = False  # Tüm thread'lere dur sinyali
+            
+            # 2. Thread'lerin bitmesini bekle (kendini join etmemeye dikkat)
+            current_thread = threading.current_thread()
+            
+            if hasattr(self, 'listen_thread') and self.listen_thread:
+                if self.listen_thread != current_thread and self.listen_thread.is_alive():
+                    log_system(f"{self.cihaz_adi} listen thread'i bekleniyor...")
+                    self.listen_thread.join(timeout=2.0)
+                    
+            if hasattr(self, 'write_thread') and self.write_thread:
+                if self.write_thread != current_thread and self.write_thread.is_alive():
+                    # Exit sinyali gönder
+                    try:
+                        self.write_queue.put_nowait(("exit", None))
+                    except queue.Full:
+                        pass
+                    log_system(f"{self.cihaz_adi} write thread'i bekleniyor...")
+                    self.write_thread.join(timeout=2.0)
+            
+            # 3. Portu güvenli kapat
+            with self._port_lock:
+                # ✅ CRITICAL FIX: Port release her durumda yapılmalı (is_open check olmadan)
+                # Çünkü I/O error sonrası serial object kapalı olabilir ama registry'de hala claimed
+                if self.port_adi:
+                    system_state.release_port(self.port_adi, self.cihaz_adi)
+
+                if self.seri_nesnesi:
+                    try:
+                        if self.seri_nesnesi.is_open:
+                            # ✅ Bekleyen okuma/yazmayı iptal et
+                            try:
+                                self.seri_nesnesi.cancel_read()
+                                self.seri_nesnesi.cancel_write()
+                            except AttributeError:
+                                pass  # cancel_read/write her zaman mevcut olmayabilir
+                            self.seri_nesnesi.close()
+                    except (OSError, serial.SerialException) as e:
+                        log_warning(f"{self.cihaz_adi} port kapatma hatası: {e}")
+                        pass
+                self.seri_nesnesi = None
+                self.saglikli = False
+
+            # 3.5. Queue'yu temizle - stale komutları önle
+            cleared_count = 0
+            try:
+                while not self.write_queue.empty():
+                    self.write_queue.get_nowait()
+                    cleared_count += 1
+            except queue.Empty:
+                pass
+
+            if cleared_count > 0:
+                log_system(f"{self.cihaz_adi} write queue temizlendi ({cleared_count} stale komut silindi)")
+
+            # 4. USB Reset dene (opsiyonel) - SADECE USB_RESETTING durumunda değilse
+            if usb_reset and self.port_adi and system_state.get_system_state() != SystemState.USB_RESETTING:
+                self._try_usb_reset(self.port_adi)
+            
+            # 5. Reconnection thread başlat (tek seferlik)
+            thread_name = f"{self.cihaz_adi}_reconnect"
+            reconnect_thread = threading.Thread(
+                target=self._reconnect_worker,
+                daemon=True,
+                name=thread_name
+            )
+            
+            # Thread'i system state manager'a kaydet
+            if system_state.register_thread(thread_name, reconnect_thread):
+                reconnect_thread.start()
+            else:
+                # Thread kaydedilemedi, reconnection'ı bitir
+                system_state.finish_reconnection(self.cihaz_adi, False)
+            
+        except Exception as e:
+            log_exception(f"{self.cihaz_adi} hata yönetimi başarısız", exc_info=(type(e), e, e.__traceback__))
+            system_state.finish_reconnection(self.cihaz_adi, False)
+
+    def yeniden_baglanmayi_hizlandir(self):
+        """Hot-plug 'add' olayında reconnect worker'ın deneme arası beklemesini keser"""
+        self._yeniden_baglan_olayi.set()
+
+    def _reconnect_worker(self):
+        """Yeniden bağlanma worker'ı - System State Manager ile - İYİLEŞTİRİLMİŞ"""
+        thread_name = f"{self.cihaz_adi}_reconnect"
+        attempts = 0
+        base_delay = self.RETRY_BASE_DELAY
+        self._yeniden_baglan_olayi.clear()
+        
+        try:
+            while attempts < self.MAX_RETRY:
+                # Sistem durumu kontrolü
+                if system_state.get_system_state() == SystemState.EMERGENCY:
+                    log_warning(f"{self.cihaz_adi} reconnection iptal edildi - Emergency mode")
+                    break
+                
+                attempts += 1
+                delay = min(base_delay * (2 ** (attempts - 1)), self.MAX_RETRY_DELAY)
+
+                log_system(f"{self.cihaz_adi} yeniden bağlanma {attempts}/{self.MAX_RETRY}")
+
+                # Donanımsal sorunlu kartlarda (motor) reconnect'te HEMEN USB reset zorlanır
+                # Çünkü şoktayken port bulunuyor ama ESP32 yanıt vermiyor
+                if self.RECONNECT_USB_RESET:
+                    log_system(f"{self.cihaz_adi} → USB reset ZORLANIYOR (kart donanımsal sorunu için)")
+
+                if self._auto_find_port(force_usb_reset=self.RECONNECT_USB_RESET):
+                    # ✅ Port bulundu, thread'ler başladı
+                    # ESP32 boot için yeterli bekleme (boot mesajları + firmware başlatma)
+                    log_system(f"{self.cihaz_adi} ESP32 boot ve firmware başlatması bekleniyor...")
+                    # ESP32 ilk pong'u verdiği an hazırdır (en fazla 3 saniye)
+                    olcumlu_bekle(f"{self.cihaz_adi}.reconnect_boot", self.RECONNECT_BOOT_UST_SINIR,
+                                  self.pong_bekle)
+
+                    # ✅ Ping/Pong ile kartı doğrula
+                    log_system(f"{self.cihaz_adi} reconnection doğrulaması - ping/pong testi...")
+                    # Sabit aralıklı 3 deneme yerine ilk pong'a kadar aralıklarla ping atılır
+                    kart_saglikli = olcumlu_bekle(f"{self.cihaz_adi}.reconnect_dogrulama",
+                                                  self.RECONNECT_DOGRULAMA_UST_SINIR, self.pong_bekle)
+                    if kart_saglikli:
+                        log_success(f"{self.cihaz_adi} doğrulama başarılı - PONG alındı")
+
+                    if not kart_saglikli:
+                        log_error(f"{self.cihaz_adi} doğrulama başarısız - ping/pong çalışmıyor")
+                        # ✅ Portu kapat ve release et, sonra tekrar dene
+                        log_system(f"{self.cihaz_adi} validation başarısız - port kapatılıyor ve release ediliyor")
+                        self.dinlemeyi_durdur()
+                        if self.seri_nesnesi and self.seri_nesnesi.is_open:
+                            self.seri_nesnesi.close()
+                        system_state.release_port(self.port_adi, self.cihaz_adi)
+                        continue  # Reconnection'ı tekrar dene
+
+                    # ✅ Kart sağlıklı, karta özel ilk komutları gönder
+                    self._baglanti_hazir()
+
+                    self._connection_attempts = 0
+                    log_success(f"{self.cihaz_adi} yeniden bağlandı ve doğrulandı")
+                    
+                    # Thread durumunu kontrol et ve logla
+                    if self.thread_durumu_kontrol():
+                        log_system(f"{self.cihaz_adi} reconnection tamamlandı - thread'ler çalışıyor")
+                    else:
+                        log_warning(f"{self.cihaz_adi} reconnection tamamlandı ama thread'ler çalışmıyor")
+                    
+                    # Başarılı reconnection
+                    system_state.finish_reconnection(self.cihaz_adi, True)
+                    return
+                
+                log_warning(f"{self.cihaz_adi} bağlanamadı, {delay}s bekliyor...")
+                # Cihaz tekrar takılırsa (hot-plug 'add') beklemeyi kes ve hemen dene
+                if self._yeniden_baglan_olayi.wait(delay):
+                    log_system(f"{self.cihaz_adi} USB cihazı takıldı - bekleme kesildi, hemen deneniyor")
+                self._yeniden_baglan_olayi.clear()
+            
+            log_error(f"{self.cihaz_adi} yeniden bağlanamadı ({self.MAX_RETRY} deneme)")
+
+            # ✅ Zombie port claim'i temizle - başarısız reconnection'dan sonra
+            if self.port_adi:
+                log_system(f"{self.cihaz_adi} reconnection başarısız - zombie port claim temizleniyor: {self.port_adi}")
+                system_state.release_port(self.port_adi, self.cihaz_adi)
+                self.port_adi = None
+
+            # Başarısız reconnection
+            system_state.finish_reconnection(self.cihaz_adi, False)
+
+        except Exception as e:
+            log_exception(f"{self.cihaz_adi} reconnection worker hatası", exc_info=(type(e), e, e.__traceback__))
+
+            # ✅ Exception durumunda da zombie port claim'i temizle
+            if self.port_adi:
+                log_system(f"{self.cihaz_adi} exception sonrası zombie port claim temizleniyor: {self.port_adi}")
+                try:
+                    system_state.release_port(self.port_adi, self.cihaz_adi)
+                    self.port_adi = None
+                except Exception:
+                    pass  # En azından finish_reconnection çağrılsın
+
+            system_state.finish_reconnection(self.cihaz_adi, False)
+        finally:
+            # Thread kaydını sil
+            system_state.unregister_thread(thread_name)
+            log_system(f"{self.cihaz_adi} reconnect worker sonlandı")
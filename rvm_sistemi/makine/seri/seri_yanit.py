@@ -0,0 +1,112 @@
+"""
+seri_yanit.py - Kart komutları için istek/yanıt eşleştirme
+Komut gönderilmeden önce beklenen yanıtı tanıyan bir koşul kaydedilir;
+dinleme thread'i gelen her satırı eşleştiriciye verir, koşulu sağlayan ilk
+satır bekleyen Future'ı çözer. Satır yine normal callback zincirine de gider.
+Kayıt, Future çözülmeden önce lock altında listeden alınır; böylece her Future'ı
+tek bir yol (eşleşme, zaman aşımı veya iptal) sonlandırır.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Tuple
+
+YanitKosulu = Callable[[str], bool]
+
+
+class YanitEslestirici:
+    """Bekleyen yanıt koşullarını tutar ve gelen satırlarla eşleştirir"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bekleyenler: List[Tuple[YanitKosulu, float, Future]] = []
+
+    def kaydet(self, kosul: YanitKosulu, zaman_asimi: float) -> Future:
+        """Koşulu kaydeder; eşleşen satır gelince Future satırın kendisiyle çözülür"""
+        future = Future()
+        son_tarih = time.monotonic() + zaman_asimi
+        with self._lock:
+            self._bekleyenler.append((kosul, son_tarih, future))
+        # İptal/zaman aşımı sonrası listede kalmasın
+        future.add_done_callback(self._kaldir)
+        return future
+
+    def _kaldir(self, future: Future) -> None:
+        with self._lock:
+            self._bekleyenler = [b for b in self._bekleyenler if b[2] is not future]
+
+    def mesaj_geldi(self, mesaj: str) -> bool:
+        """Satırı bekleyen koşullarla karşılaştırır, eşleşen varsa True döner"""
+        if not self._bekleyenler:
+            return False
+
+        simdi = time.monotonic()
+        eslesenler, suresi_dolanlar, kalanlar = [], [], []
+        with self._lock:
+            for kayit in self._bekleyenler:
+                kosul, son_tarih, future = kayit
+                if son_tarih < simdi:
+                    suresi_dolanlar.append(future)
+                    continue
+                try:
+                    eslesti = kosul(mesaj)
+                except Exception:
+                    eslesti = False
+                if eslesti:
+                    eslesenler.append(future)
+                else:
+                    kalanlar.append(kayit)
+            # Sonlandırılacaklar listeden lock altında alınır; tumunu_iptal_et aynı Future'a dokunmaz
+            self._bekleyenler = kalanlar
+
+        # Future callback'leri lock dışında çalışsın
+        for future in suresi_dolanlar:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(FutureTimeoutError("Yanıt zaman aşımı"))
+        for future in eslesenler:
+            if future.set_running_or_notify_cancel():
+                future.set_result(mesaj)
+        return bool(eslesenler)
+
+    def tumunu_iptal_et(self, sebep: str) -> None:
+        """Bağlantı koptuğunda bekleyen tüm istekleri hatayla sonlandırır"""
+        with self._lock:
+            bekleyenler = [future for _, _, future in self._bekleyenler]
+            self._bekleyenler = []
+        for future in bekleyenler:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(ConnectionError(sebep))
+
+    def hata_ver(self, future: Future, hata: Exception) -> None:
+        """Kaydı listeden alıp Future'ı hatayla sonlandırır; başka yol sonlandırdıysa bir şey yapmaz"""
+        with self._lock:
+            kalanlar = [b for b in self._bekleyenler if b[2] is not future]
+            if len(kalanlar) == len(self._bekleyenler):
+                return
+            self._bekleyenler = kalanlar
+        if future.set_running_or_notify_cancel():
+            future.set_exception(hata)
+
+    @property
+    def bekleyen_sayisi(self) -> int:
+        return len(self._bekleyenler)
+
+
+def yanit_bekle(future: Future, zaman_asimi: float):
+    """Future'ı zaman aşımıyla bekler; süre dolarsa kaydı iptal edip None döner"""
+    try:
+        return future.result(timeout=zaman_asimi)
+    except (FutureTimeoutError, ConnectionError):
+        future.cancel()
+        return None
+
+
+async def yanit_bekle_async(future: Future, zaman_asimi: float):
+    """yanit_bekle'nin event loop'u bloklamayan karşılığı"""
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), zaman_asimi)
+    except (asyncio.TimeoutError, FutureTimeoutError, ConnectionError):
+        future.cancel()
+        return None
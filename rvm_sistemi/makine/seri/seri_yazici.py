@@ -0,0 +1,224 @@
+"""
+seri_yazici.py - Kartlar için ortak komut kodlama ve yazma birleştirme yardımcıları
+Sabit komutlar kart sınıflarında bir kez kodlanır; parametreli komutlar
+(PWM, hız) küçük bir önbellekten gelir. Yazma thread'i kuyrukta bekleyen
+komutları firmware'in alabileceği boyuta kadar tek write() ile gönderir.
+
+Komut kuyruğu öncelik sınıflıdır (güvenlik > hareket > ayar > telemetri):
+durdurma komutu telemetri yığınının arkasında beklemez. Sınıf içinde sıra
+FIFO'dur; hareketlerin bağlı olduğu ayar komutları (tare, mod, parametre)
+bu yüzden hareket sınıfındadır. Aynı gruptaki komutlardan (örn. led_pwm
+değerleri, konveyör ileri/dur) kuyrukta sadece sonuncusu kalır; hareket
+sınıfında araya başka komut girdiyse birleştirilmez. Öne geçen güvenlik komutu
+kendi grubundaki ve iptal kümesindeki bekleyen komutları siler; durdurmadan sonra
+eski bir hareket gönderilmez. Kuyruk dolarsa en düşük öncelikli en eski komut atılır.
+"""
+
+import queue
+import time
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Mapping, Optional, Tuple
+
+# ESP32 Arduino UART RX tamponu varsayılanı 256 bayt; tek write() bu sınırı aşmaz
+YAZMA_BIRLESTIRME_BAYT = 256
+
+Komut = Tuple[str, object]
+
+# Öncelik sınıfları - küçük değer önce gönderilir
+GUVENLIK = 0    # Durdurma / iptal
+HAREKET = 1     # Motor, yönlendirici, ölçüm adımları ve bunların bağlı olduğu ayarlar (tabloda olmayanlar)
+AYAR = 2        # Hareketlerin beklemediği bağımsız ayarlar (PWM değerleri)
+TELEMETRI = 3   # ping ve durum sorguları
+ONCELIK_ADLARI = ("guvenlik", "hareket", "ayar", "telemetri")
+# Bu sınıflarda komutlar birbirine bağımlı: grup birleştirme sadece art arda gelenleri birleştirir
+SIRA_KORUNAN_SINIFLAR = frozenset({GUVENLIK, HAREKET})
+
+
+@lru_cache(maxsize=512)
+def parametreli_komut(sablon: str, deger) -> bytes:
+    """"l:{}\\n" gibi bir şablonu değerle kodlar (aynı değer tekrar kodlanmaz)"""
+    return sablon.format(deger if deger else 0).encode()
+
+
+def komut_paketi_olustur(
+    kuyruk: queue.Queue,
+    ilk_kod: bytes,
+    kodla: Callable[[str, object], bytes],
+    maks_bayt: int = YAZMA_BIRLESTIRME_BAYT,
+) -> Tuple[bytearray, int, Optional[Komut], bool]:
+    """
+    İlk komutun arkasına kuyrukta hazır bekleyen komutları ekler.
+
+    Returns:
+        (paket, komut_sayisi, sigmayan_komut, cikis_istendi)
+        sigmayan_komut bir sonraki pakete başlatılmalıdır.
+    """
+    paket = bytearray(ilk_kod)
+    adet = 1 if ilk_kod else 0
+    while len(paket) < maks_bayt:
+        try:
+            komut = kuyruk.get_nowait()
+        except queue.Empty:
+            break
+        if komut[0] == "exit":
+            return paket, adet, None, True
+        kod = kodla(*komut)
+        if not kod:
+            continue
+        if len(paket) + len(kod) > maks_bayt:
+            return paket, adet, komut, False
+        paket += kod
+        adet += 1
+    return paket, adet, None, False
+
+
+class KomutKuyrugu(queue.Queue):
+    """
+    Öncelik sınıflı, grup birleştirmeli ve atma politikalı yazma kuyruğu
+    queue.Queue arayüzü korunur (get/get_nowait/put_nowait/qsize/empty),
+    komutlar (komut, veri) olarak çıkar.
+
+    Args:
+        sinir: Kuyrukta bekleyebilecek en fazla komut (güvenlik komutları hariç)
+        oncelikler: komut adı -> öncelik sınıfı (olmayanlar HAREKET)
+        gruplar: komut adı -> grup anahtarı; aynı gruptan bekleyen komut yenisiyle değiştirilir
+                 (güvenlik/hareket sınıfında sadece arada başka komut yoksa)
+        iptaller: güvenlik komutu -> kuyruktan silinecek bekleyen komut adları (grubu dışında)
+    """
+
+    def __init__(self, sinir: int, oncelikler: Mapping[str, int], gruplar: Mapping[str, str],
+                 iptaller: Mapping[str, FrozenSet[str]] = MappingProxyType({})):
+        self.sinir = sinir
+        self.oncelikler = oncelikler
+        self.gruplar = gruplar
+        self.iptaller = iptaller
+        super().__init__()  # maxsize=0: put bloklamaz, sınır _ekle'de uygulanır
+
+    def _init(self, maxsize):
+        self._siniflar = tuple(deque() for _ in ONCELIK_ADLARI)
+        self._grup_kayitlari: Dict[str, list] = {}  # grup -> kuyruktaki kayıt
+        self.eklenen = 0
+        self.birlestirilen = 0
+        self.atilan = [0] * len(ONCELIK_ADLARI)
+        self.maks_derinlik = 0
+        self.en_uzun_bekleme = [0.0] * len(ONCELIK_ADLARI)
+
+    def _qsize(self):
+        return sum(len(sinif) for sinif in self._siniflar)
+
+    def _put(self, komut):
+        self._ekle(komut)
+
+    def _get(self):
+        for sinif_no, sinif in enumerate(self._siniflar):
+            if sinif:
+                kayit = sinif.popleft()
+                komut, veri, _, eklenme = kayit
+                grup = self.gruplar.get(komut)
+                if grup is not None and self._grup_kayitlari.get(grup) is kayit:
+                    del self._grup_kayitlari[grup]
+                bekleme = time.monotonic() - eklenme
+                if bekleme > self.en_uzun_bekleme[sinif_no]:
+                    self.en_uzun_bekleme[sinif_no] = bekleme
+                return komut, veri
+        raise IndexError("boş kuyruk")
+
+    def ekle(self, komut: str, veri=None) -> str:
+        """
+        Komutu kuyruğa ekler, bloklamaz
+
+        Returns:
+            "eklendi", "birlestirildi" veya "atildi" (yeni komut sığmadı)
+            Yer açmak için eski bir komut atıldıysa "eklendi:atildi"
+        """
+        with self.mutex:
+            sonuc = self._ekle((komut, veri))
+            self.not_empty.notify()
+            return sonuc
+
+    def _ekle(self, item) -> str:
+        komut, veri = item
+        sinif_no = GUVENLIK if komut == "exit" else self.oncelikler.get(komut, HAREKET)
+        grup = self.gruplar.get(komut)
+
+        sonuc = "eklendi"
+        if sinif_no == GUVENLIK:
+            # Öne geçen güvenlik komutu, arkasında kalacak aynı gruptaki ve iptal
+            # kümesindeki düşük sınıf komutları siler
+            iptal_kumesi = self.iptaller.get(komut, ())
+            for sinif in self._siniflar[GUVENLIK + 1:]:
+                silinecekler = [k for k in sinif
+                                if k[0] in iptal_kumesi or (grup is not None and self.gruplar.get(k[0]) == grup)]
+                for k in silinecekler:
+                    sinif.remove(k)
+                    k_grup = self.gruplar.get(k[0])
+                    if k_grup is not None and self._grup_kayitlari.get(k_grup) is k:
+                        del self._grup_kayitlari[k_grup]
+                if silinecekler:
+                    self.birlestirilen += len(silinecekler)
+                    sonuc = "birlestirildi"
+
+        # Aynı gruptan bekleyen komut varsa en son istek geçerli
+        if grup is not None:
+            # Bekleyen güvenlik komutu daha düşük sınıftan bir komutla ezilmez (farklı sınıf: ikisi de kalır)
+            eski = self._grup_kayitlari.get(grup)
+            if eski is not None and eski[2] == sinif_no:
+                if self._siniflar[sinif_no][-1] is eski:
+                    eski[0], eski[1] = komut, veri  # Zaten sınıfın sonunda
+                    self.birlestirilen += 1
+                    return "birlestirildi"
+                if sinif_no not in SIRA_KORUNAN_SINIFLAR:
+                    self._siniflar[sinif_no].remove(eski)  # Yenisi sınıfın sonuna eklenir
+                    self.birlestirilen += 1
+                    sonuc = "birlestirildi"
+                # Sıra korunan sınıfta araya komut girdiyse eskisi kalır, yenisi sona eklenir
+
+        if sonuc == "eklendi" and sinif_no != GUVENLIK and self._qsize() >= self.sinir:
+            # Yeni komuttan düşük veya eşit öncelikli en eski komutu at
+            for atilacak in range(len(self._siniflar) - 1, sinif_no - 1, -1):
+                if self._siniflar[atilacak]:
+                    atilan = self._siniflar[atilacak].popleft()
+                    atilan_grup = self.gruplar.get(atilan[0])
+                    if atilan_grup is not None and self._grup_kayitlari.get(atilan_grup) is atilan:
+                        del self._grup_kayitlari[atilan_grup]
+                    self.atilan[atilacak] += 1
+                    sonuc = "eklendi:atildi"
+                    break
+            else:
+                self.atilan[sinif_no] += 1
+                return "atildi"
+
+        kayit = [komut, veri, sinif_no, time.monotonic()]
+        self._siniflar[sinif_no].append(kayit)
+        if grup is not None:
+            self._grup_kayitlari[grup] = kayit
+        self.eklenen += 1
+        derinlik = self._qsize()
+        if derinlik > self.maks_derinlik:
+            self.maks_derinlik = derinlik
+        return sonuc
+
+    @property
+    def atilan_toplam(self) -> int:
+        return sum(self.atilan)
+
+    def istatistikler(self) -> dict:
+        """Kuyruk metrikleri - sınıf başına derinlik, atılan ve en uzun bekleme"""
+        with self.mutex:
+            return {
+                "derinlik": self._qsize(),
+                "maks_derinlik": self.maks_derinlik,
+                "eklenen": self.eklenen,
+                "birlestirilen": self.birlestirilen,
+                "atilan": self.atilan_toplam,
+                "siniflar": {
+                    ad: {
+                        "derinlik": len(self._siniflar[i]),
+                        "atilan": self.atilan[i],
+                        "en_uzun_bekleme_ms": round(self.en_uzun_bekleme[i] * 1000, 1),
+                    }
+                    for i, ad in enumerate(ONCELIK_ADLARI)
+                },
+            }
@@ -1,15 +1,24 @@
 """
 System State Manager - Temiz bayrak yapısı
 Tüm USB reset ve reconnection işlemlerini merkezi olarak yönetir
+
+Okuma tarafı kilitsizdir: her durum değişikliğinde değişmez bir DurumGoruntusu
+oluşturulur ve tek referans atamasıyla yayınlanır. get_* / is_* metodları bu
+görüntüden okur. Sürüm numarası her yayında artar; wait_for_change / wait_until
+ile durum değişikliği polling yapmadan beklenebilir.
 """
 
 import threading
 import time
+from collections import deque
 from enum import Enum
-from typing import Dict, Optional, Set
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Mapping, Optional, Set
 from dataclasses import dataclass
 from rvm_sistemi.utils.logger import log_system, log_warning, log_error, log_success
 
+RECOVERY_HISTORY_SIZE = 50  # Kart başına saklanan kurtarma süresi sayısı
+
 
 class SystemState(Enum):
     """Sistem durumları"""
@@ -39,6 +48,44 @@ class ResetOperation:
     initiated_by: str  # "port_health", "card_error", "manual"
 
 
+@dataclass(frozen=True)
+class DurumGoruntusu:
+    """Belirli bir sürümdeki sistem durumunun değişmez kopyası"""
+    version: int
+    system_state: SystemState
+    card_states: Mapping[str, CardState]
+    reconnecting_cards: FrozenSet[str]
+    owned_ports: Mapping[str, str]  # port -> card_name
+    active_reset: Optional[ResetOperation]
+    reset_in_progress: bool
+    reset_cooldown: bool
+
+
+class SayacliKilit:
+    """RLock sarmalayıcı - kaç kez alındığını sayar (kilit metrikleri için)"""
+
+    def __init__(self, ad: str):
+        self.ad = ad
+        self._kilit = threading.RLock()
+        self.alim_sayisi = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        alindi = self._kilit.acquire(blocking, timeout)
+        if alindi:
+            self.alim_sayisi += 1  # Kilit tutulurken artırılır
+        return alindi
+
+    def release(self) -> None:
+        self._kilit.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
 class SystemStateManager:
     """
     Merkezi sistem durumu yöneticisi
@@ -62,20 +109,25 @@ class SystemStateManager:
             
         # Sistem durumu
         self._system_state = SystemState.NORMAL
-        self._state_lock = threading.RLock()
+        self._state_lock = SayacliKilit("state")
         
         # Kart durumları
         self._card_states: Dict[str, CardState] = {}
-        self._card_lock = threading.RLock()
+        self._card_lock = SayacliKilit("card")
         
         # Reset operasyonları
         self._active_reset: Optional[ResetOperation] = None
-        self._reset_lock = threading.RLock()
+        self._reset_lock = SayacliKilit("reset")
         
         # Reconnection takibi
         self._reconnecting_cards: Set[str] = set()
         self._reconnection_start_times: Dict[str, float] = {}  # ✅ Reconnection timing
-        self._reconnect_lock = threading.RLock()
+        self._reconnect_lock = SayacliKilit("reconnect")
+
+        # Kopma -> kurtarma süresi ölçümü (kopma anı hot-plug olayından veya reconnection başlangıcından)
+        self._disconnect_times: Dict[str, tuple[float, str]] = {}  # card_name -> (timestamp, kaynak)
+        self._recovery_history: Dict[str, deque] = {}
+        self._last_recovery: Dict[str, Dict] = {}
         
         # Reset kontrolü - timeout yerine bayrak
         self._reset_in_progress = False
@@ -83,21 +135,109 @@ class SystemStateManager:
         
         # Thread takibi
         self._active_threads: Dict[str, threading.Thread] = {}
-        self._thread_lock = threading.RLock()
+        self._thread_lock = SayacliKilit("thread")
 
         # ✅ PORT SAHİPLİĞİ TAKİBİ - Temel mimari çözüm
         self._owned_ports: Dict[str, tuple[str, float]] = {}  # port -> (card_name, claim_timestamp)
-        self._port_lock = threading.RLock()
+        self._port_lock = SayacliKilit("port")
+
+        # Yayınlanan görüntü - okuyucular kilitsiz okur, yazıcılar _publish ile değiştirir
+        self._version_cond = threading.Condition(threading.Lock())
+        self._snapshot = self._build_snapshot(0)
+        self._publish_count = 0
+        self._lockfree_reads = 0  # Yaklaşık sayaç (thread'ler arası artış kaybolabilir)
+        self._stats_start = time.monotonic()
+        self._counted_locks = (
+            self._state_lock, self._card_lock, self._reset_lock,
+            self._reconnect_lock, self._thread_lock, self._port_lock,
+        )
 
         self._initialized = True
         log_system("System State Manager başlatıldı")
     
+    # ============ DURUM GÖRÜNTÜSÜ VE SÜRÜM ============
+
+    def _build_snapshot(self, version: int) -> DurumGoruntusu:
+        """Mevcut alanlardan yeni görüntü oluştur (kopyalar tek C çağrısıdır)"""
+        return DurumGoruntusu(
+            version=version,
+            system_state=self._system_state,
+            card_states=MappingProxyType(dict(self._card_states)),
+            reconnecting_cards=frozenset(self._reconnecting_cards),
+            owned_ports=MappingProxyType({port: owner for port, (owner, _) in self._owned_ports.copy().items()}),
+            active_reset=self._active_reset,
+            reset_in_progress=self._reset_in_progress,
+            reset_cooldown=self._reset_cooldown,
+        )
+
+    def _publish(self) -> None:
+        """Durum değişikliğinden sonra yeni görüntüyü yayınla ve bekleyenleri uyandır"""
+        with self._version_cond:
+            self._snapshot = self._build_snapshot(self._snapshot.version + 1)
+            self._publish_count += 1
+            self._version_cond.notify_all()
+
+    def snapshot(self) -> DurumGoruntusu:
+        """Son yayınlanan durum görüntüsü - kilit almaz"""
+        self._lockfree_reads += 1
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        """Her durum değişikliğinde artan sürüm numarası"""
+        return self._snapshot.version
+
+    def wait_for_change(self, since_version: int, timeout: Optional[float] = None) -> DurumGoruntusu:
+        """
+        Sürüm since_version'dan büyük olana kadar bekle
+
+        Returns:
+            DurumGoruntusu: Son görüntü (timeout dolduysa sürümü değişmemiş olabilir)
+        """
+        with self._version_cond:
+            self._version_cond.wait_for(lambda: self._snapshot.version > since_version, timeout)
+            return self._snapshot
+
+    def wait_until(self, predicate: Callable[[DurumGoruntusu], bool], timeout: Optional[float] = None) -> bool:
+        """
+        Koşul görüntü üzerinde sağlanana kadar bekle (polling yok, her yayında kontrol edilir)
+
+        Returns:
+            bool: Koşul sağlandı mı? (False: timeout)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        snapshot = self._snapshot
+        while not predicate(snapshot):
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            snapshot = self.wait_for_change(snapshot.version, remaining)
+        return True
+
+    def get_lock_stats(self) -> Dict:
+        """
+        Kilit alım metrikleri. onceki_kilit_alim_hizi, kilitsiz okumaların her
+        birinin eskisi gibi kilit alsaydı oluşacak hızdır (önce/sonra karşılaştırması)
+        """
+        elapsed = max(time.monotonic() - self._stats_start, 1e-9)
+        acquisitions = {lock.ad: lock.alim_sayisi for lock in self._counted_locks}
+        total = sum(acquisitions.values())
+        return {
+            "sure": round(elapsed, 1),
+            "surum": self._snapshot.version,
+            "yayin_sayisi": self._publish_count,
+            "kilit_alimlari": acquisitions,
+            "kilit_alim_hizi": round(total / elapsed, 1),
+            "kilitsiz_okuma": self._lockfree_reads,
+            "kilitsiz_okuma_hizi": round(self._lockfree_reads / elapsed, 1),
+            "onceki_kilit_alim_hizi": round((total + self._lockfree_reads) / elapsed, 1),
+        }
+
     # ============ SISTEM DURUMU YÖNETİMİ ============
     
     def get_system_state(self) -> SystemState:
         """Mevcut sistem durumunu al"""
-        with self._state_lock:
-            return self._system_state
+        return self.snapshot().system_state
     
     def set_system_state(self, new_state: SystemState, reason: str = "") -> bool:
         """
@@ -123,7 +263,8 @@ class SystemStateManager:
             # RECONNECTING durumuna geçişte zamanı kaydet
             if new_state == SystemState.RECONNECTING:
                 self._reconnecting_start_time = time.time()
-            
+
+            self._publish()
             log_system(f"Sistem durumu değişti: {old_state.value} -> {new_state.value} ({reason})")
             return True
     
@@ -153,19 +294,17 @@ class SystemStateManager:
     
     def is_system_busy(self) -> bool:
         """Sistem meşgul mu? (Reset veya reconnection devam ediyor)"""
-        with self._state_lock:
-            return self._system_state in [
-                SystemState.USB_RESETTING, 
-                SystemState.RECONNECTING, 
-                SystemState.POWER_RECOVERY
-            ]
+        return self.snapshot().system_state in (
+            SystemState.USB_RESETTING,
+            SystemState.RECONNECTING,
+            SystemState.POWER_RECOVERY
+        )
     
     # ============ KART DURUMU YÖNETİMİ ============
     
     def get_card_state(self, card_name: str) -> CardState:
         """Kart durumunu al"""
-        with self._card_lock:
-            return self._card_states.get(card_name, CardState.DISCONNECTED)
+        return self.snapshot().card_states.get(card_name, CardState.DISCONNECTED)
     
     def set_card_state(self, card_name: str, new_state: CardState, reason: str = "") -> bool:
         """
@@ -183,6 +322,8 @@ class SystemStateManager:
             old_state = self._card_states.get(card_name, CardState.DISCONNECTED)
             self._card_states[card_name] = new_state
             
+            if old_state != new_state or card_name not in self._snapshot.card_states:
+                self._publish()
             if old_state != new_state:
                 log_system(f"Kart durumu değişti [{card_name}]: {old_state.value} -> {new_state.value} ({reason})")
             
@@ -190,31 +331,22 @@ class SystemStateManager:
     
     def get_all_card_states(self) -> Dict[str, CardState]:
         """Tüm kart durumlarını al"""
-        with self._card_lock:
-            return self._card_states.copy()
+        return dict(self.snapshot().card_states)
     
     def are_critical_cards_connected(self, critical_cards: Set[str]) -> bool:
         """Kritik kartlar bağlı mı?"""
-        with self._card_lock:
-            for card in critical_cards:
-                if self._card_states.get(card, CardState.DISCONNECTED) != CardState.CONNECTED:
-                    return False
-            return True
+        card_states = self.snapshot().card_states
+        return all(
+            card_states.get(card, CardState.DISCONNECTED) == CardState.CONNECTED
+            for card in critical_cards
+        )
     
     # ============ RESET OPERASYON YÖNETİMİ ============
     
     def can_start_reset(self) -> bool:
-        """Reset başlatılabilir mi?"""
-        with self._reset_lock:
-            # Zaten reset devam ediyorsa hayır
-            if self._reset_in_progress:
-                return False
-            
-            # Cooldown durumundaysa hayır
-            if self._reset_cooldown:
-                return False
-            
-            return True
+        """Reset başlatılabilir mi? (zaten reset devam ediyorsa veya cooldown'daysa hayır)"""
+        snapshot = self.snapshot()
+        return not (snapshot.reset_in_progress or snapshot.reset_cooldown)
     
     def start_reset_operation(self, cards: Set[str], initiated_by: str) -> Optional[str]:
         """
@@ -231,6 +363,10 @@ class SystemStateManager:
             return None
         
         with self._reset_lock:
+            # Kilit alınana kadar başka thread başlatmış olabilir
+            if self._reset_in_progress or self._reset_cooldown:
+                return None
+
             # Reset bayrağını set et
             self._reset_in_progress = True
             
@@ -252,7 +388,8 @@ class SystemStateManager:
             # Kartları reconnecting durumuna al
             for card in cards:
                 self.set_card_state(card, CardState.RECONNECTING, "Reset başlatıldı")
-            
+
+            self._publish()
             log_system(f"Reset operasyonu başlatıldı: {operation_id} ({initiated_by})")
             return operation_id
     
@@ -283,6 +420,7 @@ class SystemStateManager:
             # Operasyonu temizle
             cards = self._active_reset.cards_involved.copy()
             self._active_reset = None
+            self._publish()
             
             # Sistem durumunu değiştir
             if success:
@@ -298,13 +436,13 @@ class SystemStateManager:
     
     def get_active_reset(self) -> Optional[ResetOperation]:
         """Aktif reset operasyonunu al"""
-        with self._reset_lock:
-            return self._active_reset
+        return self.snapshot().active_reset
     
     def set_reset_cooldown(self, enabled: bool) -> None:
         """Reset cooldown durumunu ayarla"""
         with self._reset_lock:
             self._reset_cooldown = enabled
+            self._publish()
             if enabled:
                 log_system("Reset cooldown aktif edildi")
             else:
@@ -312,23 +450,19 @@ class SystemStateManager:
     
     def is_reset_cooldown_active(self) -> bool:
         """Reset cooldown aktif mi?"""
-        with self._reset_lock:
-            return self._reset_cooldown
+        return self.snapshot().reset_cooldown
     
     # ============ RECONNECTION YÖNETİMİ ============
     
     def can_start_reconnection(self, card_name: str) -> bool:
         """Kart için reconnection başlatılabilir mi?"""
+        snapshot = self.snapshot()
         # Sistem meşgulse hayır (sadece USB_RESETTING durumunda)
-        if self._system_state == SystemState.USB_RESETTING:
+        if snapshot.system_state == SystemState.USB_RESETTING:
             return False
-        
-        with self._reconnect_lock:
-            # Zaten reconnecting'se hayır (ama I/O Error durumunda zorla başlat)
-            if card_name in self._reconnecting_cards:
-                return False
-            
-            return True
+
+        # Zaten reconnecting'se hayır
+        return card_name not in snapshot.reconnecting_cards
     
     def start_reconnection(self, card_name: str, reason: str = "") -> bool:
         """
@@ -345,9 +479,16 @@ class SystemStateManager:
             return False
         
         with self._reconnect_lock:
+            # Kilit alınana kadar başka thread başlatmış olabilir
+            if card_name in self._reconnecting_cards:
+                return False
+
             self._reconnecting_cards.add(card_name)
             self._reconnection_start_times[card_name] = time.time()  # ✅ Başlangıç zamanı kaydet
+            # Hot-plug olayı daha önce kopmayı bildirdiyse o an korunur
+            self._disconnect_times.setdefault(card_name, (time.time(), reason or "reconnection"))
             self.set_card_state(card_name, CardState.RECONNECTING, reason)
+            self._publish()
             
             log_system(f"Reconnection başlatıldı [{card_name}]: {reason}")
             return True
@@ -374,19 +515,66 @@ class SystemStateManager:
                 duration = time.time() - self._reconnection_start_times[card_name]
                 del self._reconnection_start_times[card_name]
                 log_system(f"Reconnection süresi [{card_name}]: {duration:.1f}s")
+
+            # Başarısız reconnection'da kopma anı korunur, sonraki başarılı denemeye kadar süre işler
+            if success and card_name in self._disconnect_times:
+                timestamp, source = self._disconnect_times.pop(card_name)
+                self._record_recovery(card_name, time.time() - timestamp, source)
             
             if success:
                 self.set_card_state(card_name, CardState.CONNECTED, "Reconnection başarılı")
             else:
                 self.set_card_state(card_name, CardState.ERROR, "Reconnection başarısız")
+            self._publish()
             
             log_system(f"Reconnection bitti [{card_name}]: {'başarılı' if success else 'başarısız'}")
             return True
     
+    def mark_disconnected(self, card_name: str, timestamp: Optional[float] = None, source: str = "") -> None:
+        """
+        Kartın koptuğu anı kaydet (kurtarma süresi ölçümü için)
+
+        Args:
+            card_name: Kart adı
+            timestamp: Kopma zamanı (time.time()), verilmezse şimdi
+            source: Kopmayı kim tespit etti (hotplug, ping, io_error...)
+        """
+        with self._reconnect_lock:
+            self._disconnect_times.setdefault(card_name, (timestamp or time.time(), source))
+
+    def _record_recovery(self, card_name: str, duration: float, source: str) -> None:
+        """Kopmadan tekrar sağlıklı bağlantıya kadar geçen süreyi kaydet (lock içinde çağrılır)"""
+        history = self._recovery_history.setdefault(card_name, deque(maxlen=RECOVERY_HISTORY_SIZE))
+        history.append(duration)
+        self._last_recovery[card_name] = {
+            "sure": round(duration, 2),
+            "kaynak": source,
+            "zaman": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        log_system(f"Kart kurtarma süresi [{card_name}]: {duration:.1f}s (kopma kaynağı: {source})")
+
+    def get_recovery_stats(self) -> Dict[str, Dict]:
+        """Kart başına kopma -> kurtarma süresi istatistikleri"""
+        with self._reconnect_lock:
+            stats = {}
+            for card_name, history in self._recovery_history.items():
+                sureler = sorted(history)
+                stats[card_name] = {
+                    "adet": len(sureler),
+                    "son": self._last_recovery.get(card_name),
+                    "ortalama": round(sum(sureler) / len(sureler), 2),
+                    "medyan": round(sureler[len(sureler) // 2], 2),
+                    "en_kisa": round(sureler[0], 2),
+                    "en_uzun": round(sureler[-1], 2),
+                }
+            for card_name, (timestamp, source) in self._disconnect_times.items():
+                stats.setdefault(card_name, {"adet": 0})["kopuk_sure"] = round(time.time() - timestamp, 2)
+                stats[card_name]["kopma_kaynagi"] = source
+            return stats
+
     def is_card_reconnecting(self, card_name: str) -> bool:
         """Kart reconnecting durumunda mı?"""
-        with self._reconnect_lock:
-            return card_name in self._reconnecting_cards
+        return card_name in self.snapshot().reconnecting_cards
     
     def get_reconnection_duration(self, card_name: str) -> float:
         """
@@ -407,13 +595,9 @@ class SystemStateManager:
     
     def is_reconnection_stuck(self) -> bool:
         """RECONNECTING durumu takıldı mı?"""
-        with self._state_lock:
-            if self._system_state != SystemState.RECONNECTING:
-                return False
-            
-            # Reconnecting kartlar var ama hiçbiri başarılı olmamışsa takılmış
-            with self._reconnect_lock:
-                return len(self._reconnecting_cards) > 0
+        snapshot = self.snapshot()
+        # Reconnecting kartlar var ama hiçbiri başarılı olmamışsa takılmış
+        return snapshot.system_state == SystemState.RECONNECTING and bool(snapshot.reconnecting_cards)
     
     # ============ THREAD YÖNETİMİ ============
     
@@ -479,7 +663,8 @@ class SystemStateManager:
             # Tüm kartları error durumuna al
             for card_name in self._card_states:
                 self._card_states[card_name] = CardState.ERROR
-            
+
+            self._publish()
             return True
     
     def reset_to_normal(self) -> bool:
@@ -495,23 +680,27 @@ class SystemStateManager:
             # Bayrakları temizle
             self._reset_in_progress = False
             self._reset_cooldown = False
+            self._publish()
             
             log_success("Sistem normal duruma döndürüldü")
             return True
     
     def get_status_summary(self) -> Dict:
-        """Sistem durumu özeti"""
-        with self._state_lock, self._card_lock, self._reset_lock, self._reconnect_lock:
-            return {
-                "system_state": self._system_state.value,
-                "card_states": {name: state.value for name, state in self._card_states.items()},
-                "active_reset": self._active_reset.operation_id if self._active_reset else None,
-                "reconnecting_cards": list(self._reconnecting_cards),
-                "active_threads": list(self.get_active_threads().keys()),
-                "reset_in_progress": self._reset_in_progress,
-                "reset_cooldown": self._reset_cooldown,
-                "system_busy": self.is_system_busy()
-            }
+        """Sistem durumu özeti (tek görüntüden - alanlar birbiriyle tutarlı)"""
+        snapshot = self.snapshot()
+        return {
+            "version": snapshot.version,
+            "system_state": snapshot.system_state.value,
+            "card_states": {name: state.value for name, state in snapshot.card_states.items()},
+            "active_reset": snapshot.active_reset.operation_id if snapshot.active_reset else None,
+            "reconnecting_cards": list(snapshot.reconnecting_cards),
+            "active_threads": list(self.get_active_threads().keys()),
+            "reset_in_progress": snapshot.reset_in_progress,
+            "reset_cooldown": snapshot.reset_cooldown,
+            "system_busy": snapshot.system_state in (
+                SystemState.USB_RESETTING, SystemState.RECONNECTING, SystemState.POWER_RECOVERY
+            )
+        }
 
     # ============ PORT SAHİPLİĞİ YÖNETİMİ ============
 
@@ -540,6 +729,7 @@ class SystemStateManager:
 
             # Port'u claim et
             self._owned_ports[port] = (card_name, time.time())
+            self._publish()
             log_system(f"✅ Port claim edildi [{card_name}]: {port}")
             return True
 
@@ -565,6 +755,7 @@ class SystemStateManager:
                 return False
 
             del self._owned_ports[port]
+            self._publish()
             log_system(f"✅ Port release edildi [{card_name}]: {port}")
             return True
 
@@ -578,10 +769,7 @@ class SystemStateManager:
         Returns:
             Optional[str]: Sahip kart adı veya None
         """
-        with self._port_lock:
-            if port in self._owned_ports:
-                return self._owned_ports[port][0]
-            return None
+        return self.snapshot().owned_ports.get(port)
 
     def is_port_owned(self, port: str) -> bool:
         """
@@ -593,8 +781,7 @@ class SystemStateManager:
         Returns:
             bool: Sahipli mi?
         """
-        with self._port_lock:
-            return port in self._owned_ports
+        return port in self.snapshot().owned_ports
 
     def get_owned_port(self, card_name: str) -> Optional[str]:
         """
@@ -606,11 +793,10 @@ class SystemStateManager:
         Returns:
             Optional[str]: Port path veya None
         """
-        with self._port_lock:
-            for port, (owner, _) in self._owned_ports.items():
-                if owner == card_name:
-                    return port
-            return None
+        for port, owner in self.snapshot().owned_ports.items():
+            if owner == card_name:
+                return port
+        return None
 
     def force_release_port(self, port: str, reason: str = "") -> bool:
         """
@@ -627,6 +813,7 @@ class SystemStateManager:
             if port in self._owned_ports:
                 owner, _ = self._owned_ports[port]
                 del self._owned_ports[port]
+                self._publish()
                 log_warning(f"⚠️ Port ZORLA release edildi [{owner}]: {port} ({reason})")
                 return True
             return False
@@ -638,8 +825,7 @@ class SystemStateManager:
         Returns:
             Dict[str, str]: {port: card_name}
         """
-        with self._port_lock:
-            return {port: owner for port, (owner, _) in self._owned_ports.items()}
+        return dict(self.snapshot().owned_ports)
 
 
 # Global instance
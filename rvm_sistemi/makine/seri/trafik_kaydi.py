@@ -0,0 +1,154 @@
+"""
+Seri Trafik Kaydı
+Kartlarla (ve GA500 Modbus hattıyla) yapılan haberleşmenin zaman damgalı,
+kompakt bir ikili log'a yazılması ve geri okunması.
+
+Dosya biçimi:
+    BASLIK (8 bayt) + kayıtlar
+    kayıt = <d zaman, B kanal, B yön, H uzunluk> + veri
+    zaman: kayıt başlangıcından itibaren saniye (monotonic)
+    yön:   RX (karttan gelen), TX (karta giden), KANAL (veri = kanal adı)
+
+Kayıt RVM_TRAFIK_KAYDI ortam değişkeni bir dosya yolu gösteriyorsa açılır;
+değişken yoksa trafik_kaydedici None'dır ve haberleşme yoluna maliyeti yoktur.
+"""
+
+import atexit
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterator, NamedTuple, Optional
+
+from rvm_sistemi.utils.logger import log_system, log_warning
+
+BASLIK = b"RVMTRF1\n"
+KAYIT_YAPISI = struct.Struct("<dBBH")
+MAKS_VERI = 0xFFFF
+
+RX = 0      # Karttan gelen
+TX = 1      # Karta giden
+KANAL = 2   # Kanal tanımı
+
+YON_ADLARI = {RX: "RX", TX: "TX"}
+
+
+class TrafikKaydi(NamedTuple):
+    zaman: float
+    kanal: str
+    yon: int
+    veri: bytes
+
+
+class TrafikKaydedici:
+    """Kanal başına RX/TX çerçevelerini thread-safe olarak ikili dosyaya yazar"""
+
+    FLUSH_ARALIGI = 1.0  # saniye
+
+    def __init__(self, dosya_yolu: str):
+        self.dosya_yolu = dosya_yolu
+        self._lock = threading.Lock()
+        self._dosya = open(dosya_yolu, "wb")
+        self._dosya.write(BASLIK)
+        self._kanallar: Dict[str, int] = {}
+        self._baslangic = time.monotonic()
+        self._son_flush = self._baslangic
+        self.kayit_sayisi = 0
+        log_system(f"Seri trafik kaydı başlatıldı: {dosya_yolu}")
+
+    def kaydet(self, kanal: str, yon: int, veri: bytes, zaman: Optional[float] = None) -> None:
+        """
+        Bir çerçeveyi kaydeder
+
+        Args:
+            kanal: Kart/hat adı (motor, sensor, ga500...)
+            yon: RX veya TX
+            veri: Çerçevenin ham baytları
+            zaman: time.monotonic() değeri, verilmezse şimdi
+        """
+        simdi = time.monotonic() if zaman is None else zaman
+        with self._lock:
+            if self._dosya is None:
+                return
+            kanal_no = self._kanallar.get(kanal)
+            if kanal_no is None:
+                kanal_no = self._kanallar[kanal] = len(self._kanallar)
+                ad = kanal.encode()
+                self._dosya.write(KAYIT_YAPISI.pack(0.0, kanal_no, KANAL, len(ad)) + ad)
+
+            for i in range(0, max(len(veri), 1), MAKS_VERI):
+                parca = veri[i:i + MAKS_VERI]
+                self._dosya.write(KAYIT_YAPISI.pack(simdi - self._baslangic, kanal_no, yon, len(parca)))
+                self._dosya.write(parca)
+            self.kayit_sayisi += 1
+
+            if simdi - self._son_flush >= self.FLUSH_ARALIGI:
+                self._dosya.flush()
+                self._son_flush = simdi
+
+    def kapat(self) -> None:
+        with self._lock:
+            if self._dosya is not None:
+                self._dosya.close()
+                self._dosya = None
+                log_system(f"Seri trafik kaydı kapatıldı: {self.dosya_yolu} ({self.kayit_sayisi} çerçeve)")
+
+
+def kayitlari_oku(dosya_yolu: str) -> Iterator[TrafikKaydi]:
+    """Kayıt dosyasındaki RX/TX çerçevelerini sırayla döndürür"""
+    kanallar: Dict[int, str] = {}
+    with open(dosya_yolu, "rb") as f:
+        if f.read(len(BASLIK)) != BASLIK:
+            raise ValueError(f"Geçersiz trafik kaydı dosyası: {dosya_yolu}")
+        while True:
+            baslik = f.read(KAYIT_YAPISI.size)
+            if len(baslik) < KAYIT_YAPISI.size:
+                return  # Dosya sonu (yarım kalmış son kayıt atlanır)
+            zaman, kanal_no, yon, uzunluk = KAYIT_YAPISI.unpack(baslik)
+            veri = f.read(uzunluk)
+            if len(veri) < uzunluk:
+                return
+            if yon == KANAL:
+                kanallar[kanal_no] = veri.decode()
+                continue
+            yield TrafikKaydi(zaman, kanallar.get(kanal_no, str(kanal_no)), yon, veri)
+
+
+def modbus_istemcisini_izle(client, kanal: str) -> None:
+    """
+    pymodbus seri istemcisinin gönderdiği/aldığı ADU'ları kaydeder
+    (send/recv sarılır). Kayıt kapalıysa hiçbir şey yapmaz.
+    """
+    if trafik_kaydedici is None:
+        return
+
+    for ad, yon in (("send", TX), ("recv", RX)):
+        orijinal = getattr(client, ad, None)
+        if orijinal is None:
+            continue
+
+        def sarici(*args, _orijinal=orijinal, _yon=yon, **kwargs):
+            sonuc = _orijinal(*args, **kwargs)
+            veri = args[0] if _yon == TX and args else sonuc
+            if isinstance(veri, (bytes, bytearray)) and veri:
+                trafik_kaydedici.kaydet(kanal, _yon, bytes(veri))
+            return sonuc
+
+        setattr(client, ad, sarici)
+
+
+def _kaydediciyi_olustur() -> Optional[TrafikKaydedici]:
+    dosya_yolu = os.getenv("RVM_TRAFIK_KAYDI")
+    if not dosya_yolu:
+        return None
+    try:
+        kaydedici = TrafikKaydedici(dosya_yolu)
+        atexit.register(kaydedici.kapat)
+        return kaydedici
+    except OSError as e:
+        log_warning(f"Seri trafik kaydı açılamadı ({dosya_yolu}): {e}")
+        return None
+
+
+# RVM_TRAFIK_KAYDI tanımlı değilse None
+trafik_kaydedici = _kaydediciyi_olustur()
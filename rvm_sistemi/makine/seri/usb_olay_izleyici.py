@@ -0,0 +1,125 @@
+"""
+USB Olay İzleyici
+Kernel'in uevent netlink soketini dinleyerek USB seri portların (ttyUSB/ttyACM)
+takılma ve çıkarılma olaylarını anında bildirir. Kopma, ping döngüsünün
+birkaç tur PONG alamamasını beklemeden olay geldiği an fark edilir.
+Harici bağımlılık (pyudev) gerektirmez; soket açılamazsa servis ping
+kontrolüyle çalışmaya devam eder.
+"""
+
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from rvm_sistemi.utils.logger import log_system, log_warning, log_error, log_success
+
+NETLINK_KOBJECT_UEVENT = 15
+UEVENT_GRUBU = 1  # Kernel olay grubu (udev'in yeniden yayınladığı grup 2)
+ALMA_BOYUTU = 16384
+PORT_ONEKLERI = ("ttyUSB", "ttyACM")
+
+# (eylem, cihaz_yolu, olay_zamani) -> eylem "add" / "remove", cihaz_yolu "/dev/ttyUSB0"
+UsbOlayCallback = Callable[[str, str, float], None]
+
+
+def uevent_ayikla(veri: bytes) -> Optional[Dict[str, str]]:
+    """
+    Kernel uevent paketini sözlüğe çevirir
+    Paket biçimi: "ACTION@DEVPATH\\0ACTION=add\\0SUBSYSTEM=tty\\0DEVNAME=ttyUSB0\\0..."
+    """
+    parcalar = veri.split(b"\0")
+    if not parcalar or b"@" not in parcalar[0]:
+        return None  # Kernel paketi değil
+
+    olay = {}
+    for parca in parcalar[1:]:
+        anahtar, ayirici, deger = parca.partition(b"=")
+        if ayirici:
+            olay[anahtar.decode(errors="ignore")] = deger.decode(errors="ignore")
+    return olay
+
+
+class UsbOlayIzleyici:
+    """USB seri port takılma/çıkarılma olaylarını ayrı bir thread'de dinler"""
+
+    def __init__(self, geri_cagir: UsbOlayCallback):
+        self.geri_cagir = geri_cagir
+        self.running = False
+        self._soket: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.olay_sayisi = 0
+        self.son_olay: Optional[Dict] = None
+
+    @property
+    def aktif(self) -> bool:
+        return self.running and self._thread is not None and self._thread.is_alive()
+
+    def baslat(self) -> bool:
+        """Netlink soketini açar ve dinleme thread'ini başlatır"""
+        with self._lock:
+            if self.aktif:
+                return True
+
+            try:
+                soket = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_KOBJECT_UEVENT)
+                soket.bind((0, UEVENT_GRUBU))  # pid 0: adresi kernel atar
+                soket.settimeout(1.0)  # Durdurma kontrolü için
+            except (OSError, AttributeError) as e:
+                log_warning(f"USB olay izleyici başlatılamadı, ping kontrolü kullanılacak: {e}")
+                return False
+
+            self._soket = soket
+            self.running = True
+            self._thread = threading.Thread(target=self._dinle, daemon=True, name="usb_olay_izleyici")
+            self._thread.start()
+            log_success("USB hot-plug olay izleyici başlatıldı")
+            return True
+
+    def durdur(self):
+        """Dinleme thread'ini durdurur ve soketi kapatır"""
+        with self._lock:
+            self.running = False
+            if self._thread and self._thread.is_alive():
+                self._thread.join(timeout=2)
+            if self._soket:
+                try:
+                    self._soket.close()
+                except OSError:
+                    pass
+                self._soket = None
+            log_system("USB olay izleyici durduruldu")
+
+    def _dinle(self):
+        """Olay döngüsü: sadece tty alt sistemindeki USB seri port olaylarını iletir"""
+        while self.running:
+            try:
+                veri = self._soket.recv(ALMA_BOYUTU)
+            except socket.timeout:
+                continue
+            except OSError as e:
+                if self.running:
+                    log_error(f"USB olay izleyici soket hatası: {e}")
+                    self.running = False
+                break
+
+            olay = uevent_ayikla(veri)
+            if not olay or olay.get("SUBSYSTEM") != "tty":
+                continue
+
+            eylem = olay.get("ACTION")
+            cihaz = olay.get("DEVNAME", "")
+            if eylem not in ("add", "remove") or not cihaz.startswith(PORT_ONEKLERI):
+                continue
+
+            olay_zamani = time.time()
+            cihaz_yolu = f"/dev/{cihaz}"
+            self.olay_sayisi += 1
+            self.son_olay = {"eylem": eylem, "cihaz": cihaz_yolu, "zaman": olay_zamani}
+            log_system(f"USB olayı: {eylem} {cihaz_yolu}")
+
+            try:
+                self.geri_cagir(eylem, cihaz_yolu, olay_zamani)
+            except Exception as e:
+                log_error(f"USB olay işleme hatası ({eylem} {cihaz_yolu}): {e}")
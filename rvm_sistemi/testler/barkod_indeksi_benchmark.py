@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Barkod İndeksi Benchmark Scripti
+Geçici bir veritabanına URUN_SAYISI ürün yazar ve barkodu_dogrula'yı önceki
+SQLite yolu (her çağrıda yeni bağlantı + SELECT) ile bellekteki barkod
+indeksi arasında karşılaştırır: saniyede sorgu ve p50/p99 gecikme.
+Ayrıca urunleri_kaydet sonrası indeksin arka planda yenilenme süresini ölçer.
+"""
+
+import os
+import random
+import tempfile
+import time
+
+from rvm_sistemi.veri_tabani import veritabani_yoneticisi as vt
+
+URUN_SAYISI = 50000
+SORGU_SAYISI = 20000
+BULUNMAYAN_ORANI = 0.1  # Katalogda olmayan barkod oranı
+
+
+def urunler_olustur(adet, baslangic=0):
+    return [{
+        "barcode": f"869{baslangic + i:010d}",
+        "material": 1 + i % 3,
+        "packMinWeight": 10.0, "packMaxWeight": 60.0,
+        "packMinWidth": 50.0, "packMaxWidth": 90.0,
+        "packMinHeight": 150.0, "packMaxHeight": 350.0,
+    } for i in range(adet)]
+
+
+def olc(etiket, dogrula, barkodlar):
+    sureler = []
+    bulunan = 0
+    baslangic = time.perf_counter()
+    for barkod in barkodlar:
+        t = time.perf_counter()
+        if dogrula(barkod):
+            bulunan += 1
+        sureler.append(time.perf_counter() - t)
+    toplam = time.perf_counter() - baslangic
+
+    sureler.sort()
+    print(f"\n📊 {etiket}")
+    print(f"  Sorgu/sn: {len(barkodlar) / toplam:,.0f}  (bulunan {bulunan}/{len(barkodlar)})")
+    print(f"  p50={sureler[len(sureler) // 2] * 1e6:.1f} µs  "
+          f"p99={sureler[int(len(sureler) * 0.99)] * 1e6:.1f} µs  "
+          f"maks={sureler[-1] * 1e6:.1f} µs")
+    return len(barkodlar) / toplam
+
+
+def main():
+    with tempfile.TemporaryDirectory() as klasor:
+        vt.DB_PATH = os.path.join(klasor, "benchmark.db")
+        vt.init_db()
+
+        print("=" * 60)
+        print(f"🗂️  BARKOD İNDEKSİ BENCHMARK ({URUN_SAYISI} ürün, {SORGU_SAYISI} sorgu)")
+        print("=" * 60)
+
+        vt.urunleri_kaydet(urunler_olustur(URUN_SAYISI))
+        vt.barkod_indeksini_yukle()  # urunleri_kaydet'in başlattığı arka plan kurulumunu bekler
+        t = time.perf_counter()
+        vt.barkod_indeksini_yukle()
+        print(f"  İndeks kurulumu: {(time.perf_counter() - t) * 1000:.1f} ms")
+
+        rastgele = random.Random(1)
+        barkodlar = [f"869{rastgele.randrange(int(URUN_SAYISI * (1 + BULUNMAYAN_ORANI))):010d}"
+                     for _ in range(SORGU_SAYISI)]
+
+        onceki = olc("SQLite sorgusu (önce)", vt._barkodu_veritabaninda_dogrula, barkodlar)
+        sonraki = olc("Bellek indeksi (sonra)", vt.barkodu_dogrula, barkodlar)
+        print(f"\n  Hız oranı: {sonraki / onceki:,.0f}x")
+
+        # Katalog güncellemesi: eski indeks yenisi yayınlanana kadar cevap vermeye devam eder
+        yeni_barkod = f"869{URUN_SAYISI * 2:010d}"
+        vt.urunleri_kaydet(urunler_olustur(URUN_SAYISI + 1, baslangic=URUN_SAYISI))
+        t = time.perf_counter()
+        while not vt.barkodu_dogrula(yeni_barkod):
+            time.sleep(0.001)
+        print(f"\n  Güncelleme sonrası yeni indeks yayını: {(time.perf_counter() - t) * 1000:.1f} ms")
+
+    print("\n" + "=" * 60)
+    print("✅ BENCHMARK TAMAMLANDI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+DİM-DB İstemci Benchmark Scripti
+Yerel bir stub sunucuya karşı tek seferlik istemci ile kalıcı
+bağlantı havuzunun istek başına gecikmesini karşılaştırır
+"""
+
+import asyncio
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from rvm_sistemi.dimdb import dimdb_istemcisi
+
+ISTEK_SAYISI = 200
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Her POST isteğine 200 dönen basit DİM-DB taklidi"""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        uzunluk = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(uzunluk)
+        govde = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(govde)))
+        self.end_headers()
+        self.wfile.write(govde)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def stub_sunucu_baslat():
+    """Stub sunucuyu rastgele bir portta arka planda başlatır"""
+    sunucu = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=sunucu.serve_forever, daemon=True).start()
+    return sunucu
+
+
+async def olc(etiket):
+    """ISTEK_SAYISI kadar heartbeat isteği atar ve gecikmeleri raporlar"""
+    payload = {"guid": "benchmark", "rvm": dimdb_istemcisi.RVM_ID, "state": 0}
+    sureler = []
+    for _ in range(ISTEK_SAYISI):
+        baslangic = time.perf_counter()
+        await dimdb_istemcisi._send_request("heartbeat", payload)
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+
+    sureler.sort()
+    print(f"\n📊 {etiket}")
+    print(f"  Ortalama: {statistics.mean(sureler):.2f} ms")
+    print(f"  p50: {sureler[len(sureler) // 2]:.2f} ms")
+    print(f"  p95: {sureler[int(len(sureler) * 0.95) - 1]:.2f} ms")
+    print(f"  p99: {sureler[int(len(sureler) * 0.99) - 1]:.2f} ms")
+
+
+async def main():
+    print("=" * 60)
+    print("🔄 DİM-DB İSTEMCİ BENCHMARK")
+    print("=" * 60)
+
+    sunucu = stub_sunucu_baslat()
+    dimdb_istemcisi.BASE_URL = f"http://127.0.0.1:{sunucu.server_address[1]}"
+
+    # Önce: her istekte yeni AsyncClient (havuz kapalı)
+    await dimdb_istemcisi.istemci_kapat()
+    await olc("Tek seferlik istemci (önce)")
+
+    # Sonra: kalıcı bağlantı havuzu
+    await dimdb_istemcisi.istemci_baslat()
+    await olc("Kalıcı bağlantı havuzu (sonra)")
+    await dimdb_istemcisi.istemci_kapat()
+
+    sunucu.shutdown()
+    print("\n" + "=" * 60)
+    print("✅ BENCHMARK TAMAMLANDI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
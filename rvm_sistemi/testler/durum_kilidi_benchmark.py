@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Durum Kilidi Benchmark Scripti
+SystemStateManager okumalarını, önceki kilitli okuma yolu (her okumada RLock)
+ile kilitsiz görüntü okuması arasında karşılaştırır. Okuyucu thread'ler
+yazma/dinleme thread'lerini, yazıcı thread port sağlık servisi ve reconnect
+worker'larını taklit eder. Ayrıca wait_for_change ile uyanma gecikmesini ölçer.
+"""
+
+import threading
+import time
+
+from rvm_sistemi.makine.seri.system_state_manager import system_state, CardState
+
+OKUYUCU_SAYISI = 4
+OLCUM_SURESI = 3.0  # saniye
+YAZMA_HIZI = 50  # saniyede durum değişikliği
+
+
+def kilitli_okuma(kilit, kart_durumlari, kart_adi):
+    """Önceki get_card_state: her okumada kilit alınır"""
+    with kilit:
+        return kart_durumlari.get(kart_adi, CardState.DISCONNECTED)
+
+
+def kilitsiz_okuma(kart_adi):
+    return system_state.get_card_state(kart_adi)
+
+
+def yazici(durdur):
+    """Kart durumunu ve port sahipliğini YAZMA_HIZI ile değiştirir"""
+    aralik = 1.0 / YAZMA_HIZI
+    baglandi = False
+    while not durdur.is_set():
+        baglandi = not baglandi
+        system_state.set_card_state("motor", CardState.CONNECTED if baglandi else CardState.RECONNECTING)
+        if baglandi:
+            system_state.claim_port("/dev/ttyBENCH0", "motor")
+        else:
+            system_state.release_port("/dev/ttyBENCH0", "motor")
+        durdur.wait(aralik)
+
+
+def olc(etiket, okuma):
+    """OKUYUCU_SAYISI thread ile OLCUM_SURESI boyunca okuma yapar, toplam okuma sayısını döndürür"""
+    durdur = threading.Event()
+    sayaclar = [0] * OKUYUCU_SAYISI
+
+    def okuyucu(i):
+        n = 0
+        while not durdur.is_set():
+            for _ in range(100):
+                okuma()
+            n += 100
+        sayaclar[i] = n
+
+    yazma = threading.Thread(target=yazici, args=(durdur,), daemon=True)
+    okuyucular = [threading.Thread(target=okuyucu, args=(i,), daemon=True) for i in range(OKUYUCU_SAYISI)]
+    yazma.start()
+    for t in okuyucular:
+        t.start()
+    time.sleep(OLCUM_SURESI)
+    durdur.set()
+    for t in okuyucular + [yazma]:
+        t.join()
+
+    toplam = sum(sayaclar)
+    print(f"  {etiket}: {toplam / OLCUM_SURESI:,.0f} okuma/s")
+    return toplam
+
+
+def uyanma_gecikmesi(adet=200):
+    """wait_for_change ile bekleyen thread'in durum değişikliğinden sonra uyanma süresi"""
+    gecikmeler = []
+    hazir = threading.Event()
+
+    def bekleyen():
+        for _ in range(adet):
+            surum = system_state.version
+            hazir.set()
+            system_state.wait_for_change(surum, 1.0)
+            gecikmeler.append(time.perf_counter() - yazma_zamani[0])
+
+    yazma_zamani = [0.0]
+    t = threading.Thread(target=bekleyen, daemon=True)
+    t.start()
+    for i in range(adet):
+        hazir.wait()
+        hazir.clear()
+        time.sleep(0.001)
+        yazma_zamani[0] = time.perf_counter()
+        system_state.set_card_state("sensor", CardState.CONNECTED if i % 2 else CardState.ERROR)
+    t.join()
+
+    gecikmeler.sort()
+    print(f"  wait_for_change uyanma: p50={gecikmeler[len(gecikmeler) // 2] * 1e6:.0f} µs  "
+          f"p95={gecikmeler[int(len(gecikmeler) * 0.95)] * 1e6:.0f} µs")
+
+
+def main():
+    print("=" * 60)
+    print(f"🔒 DURUM KİLİDİ BENCHMARK ({OKUYUCU_SAYISI} okuyucu, {YAZMA_HIZI} yazma/s)")
+    print("=" * 60)
+
+    eski_kilit = threading.RLock()
+    eski_durumlar = {"motor": CardState.CONNECTED}
+    onceki = olc("Kilitli okuma (önceki)", lambda: kilitli_okuma(eski_kilit, eski_durumlar, "motor"))
+    print(f"    kilit alımı: {onceki / OLCUM_SURESI:,.0f}/s (her okuma bir alım)")
+
+    baslangic = system_state.get_lock_stats()
+    sonraki = olc("Kilitsiz görüntü (yeni)", lambda: kilitsiz_okuma("motor"))
+    bitis = system_state.get_lock_stats()
+    alim = sum(bitis["kilit_alimlari"].values()) - sum(baslangic["kilit_alimlari"].values())
+    print(f"    kilit alımı: {alim / OLCUM_SURESI:,.0f}/s (sadece yazıcı)  yayın: "
+          f"{bitis['yayin_sayisi'] - baslangic['yayin_sayisi']}")
+    print(f"  Okuma hızı oranı: {sonraki / max(onceki, 1):.2f}x")
+
+    uyanma_gecikmesi()
+    print(f"\n📊 {system_state.get_lock_stats()}")
+
+
+if __name__ == "__main__":
+    main()
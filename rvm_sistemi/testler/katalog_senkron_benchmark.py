@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Katalog Senkron Benchmark Scripti
+urunleri_kaydet'in fark tabanlı yazımını önceki yöntemle (DELETE + ürün
+başına INSERT OR REPLACE) karşılaştırır. Her senaryoda yazma süresi ve aynı
+anda SQLite'tan barkod okuyan bir thread'in gördüğü en uzun bekleme ölçülür
+(fark hesabı transaction açılmadan yapıldığı için okuyucuyu bekletmez).
+"""
+
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from rvm_sistemi.veri_tabani import veritabani_yoneticisi as vt
+
+URUN_SAYISI = 50000
+DEGISEN_ORANI = 0.01
+EKLENEN_SILINEN_ORANI = 0.005
+
+
+def urunler_olustur(adet):
+    return [{
+        "barcode": f"869{i:010d}",
+        "material": 1 + i % 3,
+        "packMinWeight": 10.0, "packMaxWeight": 60.0,
+        "packMinWidth": 50.0, "packMaxWidth": 90.0,
+        "packMinHeight": 150.0, "packMaxHeight": 350.0,
+    } for i in range(adet)]
+
+
+def katalogu_degistir(urunler):
+    """DEGISEN_ORANI kadar ürünün ağırlığını değiştirir, bir kısmını siler ve yenilerini ekler"""
+    rastgele = random.Random(7)
+    yeni = [dict(u) for u in urunler]
+    for u in rastgele.sample(yeni, int(len(yeni) * DEGISEN_ORANI)):
+        u["packMaxWeight"] += 5
+    adet = int(len(yeni) * EKLENEN_SILINEN_ORANI)
+    del yeni[:adet]
+    for i in range(adet):
+        u = dict(yeni[0])
+        u["barcode"] = f"870{i:010d}"
+        yeni.append(u)
+    return yeni
+
+
+def onceki_urunleri_kaydet(products):
+    """Önceki yöntem: tüm ürünleri sil, ürün başına INSERT OR REPLACE"""
+    with sqlite3.connect(vt.DB_PATH) as conn:
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM products")
+        for product in products:
+            cursor.execute("""
+                INSERT OR REPLACE INTO products (barcode, material, packMinWeight, packMaxWeight, packMinWidth, packMaxWidth, packMinHeight, packMaxHeight)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, tuple(product.get(alan) for alan in ("barcode",) + vt.URUN_ALANLARI))
+        conn.commit()
+
+
+def okuyucu_ile_olc(yaz, products):
+    """Yazma sırasında barkod okuyan thread'in en uzun beklemesini ve yazma süresini döndürür"""
+    durdur = threading.Event()
+    en_uzun = [0.0]
+
+    def okuyucu():
+        while not durdur.is_set():
+            t = time.perf_counter()
+            vt._barkodu_veritabaninda_dogrula("8690000000001")
+            en_uzun[0] = max(en_uzun[0], time.perf_counter() - t)
+            time.sleep(0.001)
+
+    thread = threading.Thread(target=okuyucu, daemon=True)
+    thread.start()
+    time.sleep(0.05)
+    t = time.perf_counter()
+    yaz(products)
+    sure = time.perf_counter() - t
+    durdur.set()
+    thread.join()
+    return sure, en_uzun[0]
+
+
+def katalog_dogru_mu(products):
+    beklenen = {str(p["barcode"]): tuple(p.get(a) for a in vt.URUN_ALANLARI) for p in products}
+    with sqlite3.connect(vt.DB_PATH) as conn:
+        mevcut = {row[0]: tuple(row[1:]) for row in conn.execute(
+            f"SELECT barcode, {', '.join(vt.URUN_ALANLARI)} FROM products")}
+    return mevcut == beklenen
+
+
+def main():
+    ilk = urunler_olustur(URUN_SAYISI)
+    degismis = katalogu_degistir(ilk)
+    senaryolar = [("İlk yükleme", ilk, True), ("Değişiklik yok", ilk, False),
+                  (f"%{DEGISEN_ORANI * 100:g} değişen, %{EKLENEN_SILINEN_ORANI * 100:g} eklenen/silinen", degismis, False)]
+
+    print("=" * 60)
+    print(f"📦 KATALOG SENKRON BENCHMARK ({URUN_SAYISI} ürün)")
+    print("=" * 60)
+
+    for etiket, yaz in (("Önceki (DELETE + satır satır INSERT)", onceki_urunleri_kaydet),
+                        ("Fark tabanlı (sonra)", vt.urunleri_kaydet)):
+        with tempfile.TemporaryDirectory() as klasor:
+            vt.DB_PATH = os.path.join(klasor, "benchmark.db")
+            vt.init_db()
+            print(f"\n📊 {etiket}")
+            for senaryo, products, bos_tablo in senaryolar:
+                vt.barkod_indeksini_yukle()  # Önceki senaryonun arka plan indeks kurulumu ölçüme karışmasın
+                if bos_tablo:
+                    with sqlite3.connect(vt.DB_PATH) as conn:
+                        conn.execute("DELETE FROM products")
+                sure, bekleme = okuyucu_ile_olc(yaz, products)
+                print(f"  {senaryo:32s} yazma={sure * 1000:8.1f} ms  okuyucu maks bekleme={bekleme * 1000:7.1f} ms  "
+                      f"doğru={'✅' if katalog_dogru_mu(products) else '❌'}")
+
+    print("\n" + "=" * 60)
+    print("✅ BENCHMARK TAMAMLANDI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Port Tarama Süre Testi
+Kartlar bağlıyken soğuk (önbellek boş, tam reset + kimlik taraması) ve
+sıcak (önbellekteki portlar hızlı doğrulanır) kart aramasının sürelerini
+ayrı ayrı ölçer. Kart servisleri çalışırken değil, tek başına çalıştırılmalıdır.
+"""
+
+from rvm_sistemi.makine.seri.port_yonetici import KartHaberlesmeServis
+from rvm_sistemi.makine.seri.port_onbellegi import port_kesif_onbellegi
+
+KRITIK_KARTLAR = ["motor", "sensor"]
+
+
+def olc(etiket, yonetici):
+    """Bir kart araması yapar ve süre dökümünü yazdırır"""
+    basarili, mesaj, portlar = yonetici.baglan(try_usb_reset=False, kritik_kartlar=KRITIK_KARTLAR)
+    tarama = yonetici.son_tarama
+
+    print(f"\n📊 {etiket}")
+    print(f"  Sonuç: {mesaj} {portlar}")
+    print(f"  Tür: {tarama.get('tur')}")
+    print(f"  Önbellek doğrulama: {tarama.get('dogrulama_suresi')} s ({tarama.get('onbellekten')})")
+    print(f"  Tam tarama: {tarama.get('tarama_suresi')} s ({tarama.get('taranan_port_sayisi')} port)")
+    print(f"  Toplam: {tarama.get('toplam_sure')} s")
+    return basarili
+
+
+def main():
+    print("=" * 60)
+    print("🔄 PORT TARAMA SÜRE TESTİ")
+    print("=" * 60)
+
+    yonetici = KartHaberlesmeServis()
+    yedek = port_kesif_onbellegi.kayitlar()
+
+    try:
+        # Soğuk: önbellek boş
+        port_kesif_onbellegi.temizle()
+        if not olc("Soğuk başlangıç (önbellek boş)", yonetici):
+            print("\n❌ Kartlar bulunamadı, sıcak ölçüm atlandı")
+            return
+
+        # Sıcak: soğuk taramanın doldurduğu önbellek ile
+        olc("Sıcak başlangıç (önbellek dolu)", yonetici)
+    finally:
+        # Test, gerçek önbelleği silmiş olarak bırakmamalı
+        port_kesif_onbellegi.geri_yukle(yedek)
+        print(f"\n💾 Port önbelleği geri yüklendi ({len(yedek)} kayıt)")
+
+    print("\n" + "=" * 60)
+    print("✅ TEST TAMAMLANDI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
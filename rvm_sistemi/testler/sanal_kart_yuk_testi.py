@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Sanal Kart Yük Testi
+Motor ve sensör kartlarını pty üzerindeki sahte firmware'lerle taklit eder ve
+normal şişe hızının HIZ_CARPANI katında ürün geçirir.
+
+Kullanım:
+    python -m rvm_sistemi.testler.sanal_kart_yuk_testi          # Kart katmanı ölçümü
+    python -m rvm_sistemi.testler.sanal_kart_yuk_testi ana      # ana.py için sanal kartlar
+
+"ana" modunda yazdırılan RVM_SENSOR_PORT / RVM_MOTOR_PORT değerleriyle ana.py
+başka bir terminalde başlatılır; script Ctrl+C'ye kadar ürün geçirmeye devam eder.
+RVM_TRAFIK_KAYDI=dosya.trf verilirse oturum trafiği kaydedilir ve
+trafik_oynatma scriptiyle tekrar oynatılabilir.
+"""
+
+import statistics
+import sys
+import threading
+import time
+
+from rvm_sistemi.makine.seri.motor_karti import MotorKart
+from rvm_sistemi.makine.seri.sanal_kart import SahteMotorFirmware, SahteSensorFirmware
+from rvm_sistemi.makine.seri.sensor_karti import SensorKart
+from rvm_sistemi.makine.seri.seri_yanit import yanit_bekle
+
+NORMAL_SISE_HIZI = 1.0  # saniyede ürün
+HIZ_CARPANI = 10
+TEST_SURESI = 20  # saniye
+
+
+def sahte_kartlari_baslat():
+    motor = SahteMotorFirmware().baslat()
+    sensor = SahteSensorFirmware().baslat()
+    return motor, sensor
+
+
+def urun_gecir(sahte_motor, hiz, durdur, sayac):
+    """Saniyede hiz kadar ürünü giriş sensöründen geçirir"""
+    aralik = 1.0 / hiz
+    sonraki = time.monotonic()
+    while not durdur.is_set():
+        sahte_motor.sise_gecir(gecis_suresi=min(0.05, aralik / 2))
+        sayac.append(time.monotonic())
+        sonraki += aralik
+        durdur.wait(max(sonraki - time.monotonic(), 0))
+
+
+def yuzdelik(degerler, oran):
+    if not degerler:
+        return None
+    sirali = sorted(degerler)
+    return round(sirali[min(int(len(sirali) * oran), len(sirali) - 1)] * 1000, 2)
+
+
+def kart_testi():
+    """Kart katmanı: her gso için ağırlık ölçümü ve yönlendirici onayı beklenir"""
+    hiz = NORMAL_SISE_HIZI * HIZ_CARPANI
+    sahte_motor, sahte_sensor = sahte_kartlari_baslat()
+
+    gso_zamanlari = []
+    gso_olayi = threading.Event()
+
+    def motor_callback(mesaj):
+        if mesaj == "gso":
+            gso_zamanlari.append(time.monotonic())
+            gso_olayi.set()
+
+    motor = MotorKart(port_adi=sahte_motor.yol, callback=motor_callback)
+    sensor = SensorKart(port_adi=sahte_sensor.yol, callback=lambda mesaj: None)
+
+    durdur = threading.Event()
+    gonderilen = []
+    agirlik_sureleri = []
+    yonlendirici_sureleri = []
+    kayip = 0
+
+    uretici = threading.Thread(target=urun_gecir, args=(sahte_motor, hiz, durdur, gonderilen), daemon=True)
+    print(f"🍾 {hiz:.0f} ürün/sn ile {TEST_SURESI} sn yük testi ({HIZ_CARPANI}x)")
+    uretici.start()
+
+    bitis = time.monotonic() + TEST_SURESI
+    islenen = 0
+    while time.monotonic() < bitis:
+        if not gso_olayi.wait(0.5):
+            continue
+        gso_olayi.clear()
+        while islenen < len(gso_zamanlari):
+            islenen += 1
+
+            t = time.monotonic()
+            if sensor.agirlik_oku() is None:
+                kayip += 1
+            else:
+                agirlik_sureleri.append(time.monotonic() - t)
+
+            t = time.monotonic()
+            onay = yanit_bekle(motor.send_and_wait("yonlendirici_plastik", lambda m: m == "ymk", 0.5), 0.5)
+            if onay is None:
+                kayip += 1
+            else:
+                yonlendirici_sureleri.append(time.monotonic() - t)
+
+    durdur.set()
+    uretici.join()
+    time.sleep(0.3)
+
+    print("\n📊 SONUÇLAR")
+    print(f"  Geçirilen ürün: {len(gonderilen)}  Host'a ulaşan gso: {len(gso_zamanlari)}  İşlenen: {islenen}")
+    print(f"  Ağırlık turu   p50={yuzdelik(agirlik_sureleri, 0.5)} ms  p95={yuzdelik(agirlik_sureleri, 0.95)} ms")
+    print(f"  Yönlendirici   p50={yuzdelik(yonlendirici_sureleri, 0.5)} ms  p95={yuzdelik(yonlendirici_sureleri, 0.95)} ms")
+    if agirlik_sureleri:
+        print(f"  Ortalama ağırlık turu: {statistics.mean(agirlik_sureleri) * 1000:.2f} ms")
+    print(f"  Zaman aşımı: {kayip}")
+    print(f"  Motor: {motor.istatistikler()}")
+    print(f"  Sensör: {sensor.istatistikler()}")
+
+    motor.dinlemeyi_durdur()
+    sensor.dinlemeyi_durdur()
+    sahte_motor.durdur()
+    sahte_sensor.durdur()
+
+
+def ana_modu():
+    """ana.py'nin bağlanacağı sanal kartları açar ve Ctrl+C'ye kadar ürün geçirir"""
+    hiz = NORMAL_SISE_HIZI * HIZ_CARPANI
+    sahte_motor, sahte_sensor = sahte_kartlari_baslat()
+
+    print("=" * 60)
+    print("🔌 SANAL KARTLAR HAZIR - ana.py'yi şu ortam değişkenleriyle başlatın:")
+    print(f"  RVM_SENSOR_PORT={sahte_sensor.yol} RVM_MOTOR_PORT={sahte_motor.yol} python ana.py")
+    print("=" * 60)
+    input("ana.py oturumu başlatınca Enter'a basın (ürün geçişi başlar)...")
+
+    durdur = threading.Event()
+    gonderilen = []
+    uretici = threading.Thread(target=urun_gecir, args=(sahte_motor, hiz, durdur, gonderilen), daemon=True)
+    uretici.start()
+    print(f"🍾 {hiz:.0f} ürün/sn geçiriliyor, durdurmak için Ctrl+C")
+
+    try:
+        while True:
+            time.sleep(5)
+            print(f"  Geçirilen: {len(gonderilen)}  Motor komutları: {sahte_motor.alinan_komutlar}")
+            print(f"  Sensör komutları: {sahte_sensor.alinan_komutlar}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        durdur.set()
+        sahte_motor.durdur()
+        sahte_sensor.durdur()
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "ana":
+        ana_modu()
+    else:
+        kart_testi()
+
+
+if __name__ == "__main__":
+    main()
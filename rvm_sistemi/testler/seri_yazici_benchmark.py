@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Seri Yazıcı Benchmark Scripti
+Sahte bir kartı pty üzerinden taklit eder ve SensorKart yazma thread'inin
+saniyede gönderebildiği komut sayısını komut başına write() ile
+birleştirilmiş write() arasında karşılaştırır. Ayrıca telemetri/PWM yığını
+altında bir durdurma komutunun eski FIFO kuyrukta ve öncelikli KomutKuyrugu'nda
+kaç satırın arkasında gönderildiğini ölçer; öne geçen durdurmanın arkasında
+eski bir hareket kalmadığını motor kartı senaryolarıyla kontrol eder.
+"""
+
+import os
+import pty
+import queue
+import threading
+import time
+import tty
+
+import serial
+
+from rvm_sistemi.makine.seri.motor_karti import MotorKart
+from rvm_sistemi.makine.seri.sensor_karti import SensorKart
+from rvm_sistemi.makine.seri.seri_yazici import KomutKuyrugu
+
+KOMUT_SAYISI = 5000
+KOMUT_DONGUSU = [("led_pwm", 40), ("ezici_ileri", None), ("fan_pwm", 70), ("doluluk_oranı", None), ("ping", None)]
+YIGIN = [("doluluk_oranı", None), ("ping", None), ("sds_sensorler", None)] * 100 + \
+    [("led_pwm", i % 100) for i in range(100)]
+DURDURMA = b"ed\n"  # ezici_dur
+# Son komut durdurmadır; ondan önce eklenen hareketler durdurmadan sonra gönderilmemeli
+DURDURMA_SENARYOLARI = [
+    ["yonlendirici_plastik", "yonlendirici_dur"],
+    ["motorlari_aktif_et", "konveyor_ileri", "motorlari_iptal_et"],
+    ["konveyor_ileri", "ping", "yonlendirici_cam", "konveyor_geri", "parametre_gonder", "konveyor_dur"],
+    ["klape_plastik", "yonlendirici_plastik", "ping", "yonlendirici_dur"],
+]
+
+
+def sahte_kart_baslat(master_fd, beklenen, bitti):
+    """pty'nin kart tarafı: gelen satırları sayar, beklenen sayıya ulaşınca olayı işaretler"""
+    def dinle():
+        sayac = 0
+        while sayac < beklenen:
+            veri = os.read(master_fd, 4096)
+            sayac += veri.count(b"\n")
+        bitti.set()
+
+    threading.Thread(target=dinle, daemon=True).start()
+
+
+def kart_olustur(port_yolu, birlestirme_bayt):
+    """Port arama yapmadan sadece yazma thread'i için gerekli alanlarla kart oluşturur"""
+    kart = SensorKart.__new__(SensorKart)
+    kart.cihaz_adi = "sensor"
+    kart.running = True
+    kart.saglikli = True
+    kart.write_queue = queue.Queue()
+    kart._yazma_hazir = threading.Event()
+    kart._port_lock = threading.RLock()
+    kart.seri_nesnesi = serial.Serial(port_yolu, baudrate=115200, timeout=1, write_timeout=1)
+    kart.yazma_sayisi = 0
+    kart.yazilan_komut_sayisi = 0
+    kart.YAZMA_BIRLESTIRME_BAYT = birlestirme_bayt
+    return kart
+
+
+def olc(etiket, birlestirme_bayt):
+    """KOMUT_SAYISI komutu kuyruğa yazar ve sahte kartın hepsini alma süresini ölçer"""
+    master_fd, slave_fd = pty.openpty()
+    tty.setraw(master_fd)
+    kart = kart_olustur(os.ttyname(slave_fd), birlestirme_bayt)
+
+    bitti = threading.Event()
+    sahte_kart_baslat(master_fd, KOMUT_SAYISI, bitti)
+    yazici = threading.Thread(target=kart._yaz, daemon=True)
+    yazici.start()
+
+    baslangic = time.perf_counter()
+    for i in range(KOMUT_SAYISI):
+        kart.write_queue.put(KOMUT_DONGUSU[i % len(KOMUT_DONGUSU)])
+    bitti.wait(timeout=60)
+    sure = time.perf_counter() - baslangic
+
+    kart.write_queue.put(("exit", None))
+    yazici.join(timeout=2)
+    kart.seri_nesnesi.close()
+    os.close(master_fd)
+    os.close(slave_fd)
+
+    print(f"\n📊 {etiket}")
+    print(f"  Süre: {sure * 1000:.1f} ms")
+    print(f"  Komut/sn: {KOMUT_SAYISI / sure:,.0f}")
+    print(f"  write() çağrısı: {kart.yazma_sayisi} "
+          f"(çağrı başına {kart.yazilan_komut_sayisi / max(kart.yazma_sayisi, 1):.1f} komut)")
+
+
+def eski_kuyruga_ekle(kuyruk, komut):
+    """Önceki _safe_queue_put: kuyruk doluysa en eski komut atılır"""
+    if kuyruk.full():
+        kuyruk.get_nowait()
+    kuyruk.put_nowait(komut)
+
+
+def yigin_altinda_durdurma(etiket, kuyruk, ekle):
+    """Yazma thread'i başlamadan kuyruğu doldurur, durdurmayı ekler ve önündeki satırları sayar"""
+    master_fd, slave_fd = pty.openpty()
+    tty.setraw(master_fd)
+    kart = kart_olustur(os.ttyname(slave_fd), SensorKart.YAZMA_BIRLESTIRME_BAYT)
+    kart.write_queue = kuyruk
+
+    for komut in YIGIN:
+        ekle(komut)
+    ekle(("ezici_dur", None))
+    derinlik = kuyruk.qsize()
+
+    alinan = bytearray()
+    bitti = threading.Event()
+
+    def dinle():
+        while DURDURMA not in alinan:
+            alinan.extend(os.read(master_fd, 4096))
+        bitti.set()
+
+    threading.Thread(target=dinle, daemon=True).start()
+    baslangic = time.perf_counter()
+    yazici = threading.Thread(target=kart._yaz, daemon=True)
+    yazici.start()
+    bitti.wait(timeout=10)
+    sure = time.perf_counter() - baslangic
+
+    onundeki = alinan[:alinan.find(DURDURMA)].count(b"\n")
+    kart.write_queue.put_nowait(("exit", None))
+    yazici.join(timeout=2)
+    kart.seri_nesnesi.close()
+    os.close(master_fd)
+    os.close(slave_fd)
+
+    print(f"\n📊 {etiket}")
+    print(f"  Yığın: {len(YIGIN)} komut  Kuyruk derinliği: {derinlik}")
+    print(f"  Durdurmadan önce giden satır: {onundeki}  Süre: {sure * 1000:.2f} ms")
+    if isinstance(kuyruk, KomutKuyrugu):
+        print(f"  Kuyruk: {kuyruk.istatistikler()}")
+
+
+def durdurma_sonrasi_hareket():
+    """Motor kartı kuyruğunda durdurmanın arkasında kalan eski hareketleri sayar"""
+    print("\n📊 Durdurmadan sonra eski hareket - motor kartı kuyruğu")
+    hatali = 0
+    for senaryo in DURDURMA_SENARYOLARI:
+        kuyruk = KomutKuyrugu(MotorKart.QUEUE_MAX_SIZE, MotorKart.KOMUT_ONCELIKLERI,
+                              MotorKart.KOMUT_GRUPLARI, MotorKart.KOMUT_IPTALLERI)
+        for komut in senaryo:
+            kuyruk.ekle(komut)
+        giden = []
+        while not kuyruk.empty():
+            giden.append(kuyruk.get_nowait()[0])
+
+        durdurma = senaryo[-1]
+        grup = MotorKart.KOMUT_GRUPLARI.get(durdurma)
+        iptal_kumesi = MotorKart.KOMUT_IPTALLERI.get(durdurma, frozenset())
+        eski_hareketler = [k for k in giden[giden.index(durdurma) + 1:]
+                           if k in iptal_kumesi or (grup is not None and MotorKart.KOMUT_GRUPLARI.get(k) == grup)]
+        hatali += bool(eski_hareketler)
+        satirlar = [MotorKart.KOMUTLAR.get(k, k.encode()).decode().strip() for k in giden]
+        print(f"  {'❌' if eski_hareketler else '✅'} {' '.join(senaryo)} -> {' '.join(satirlar)}")
+    print(f"  Hatalı senaryo: {hatali}/{len(DURDURMA_SENARYOLARI)}")
+
+
+def main():
+    print("=" * 60)
+    print("🔄 SERİ YAZICI BENCHMARK")
+    print("=" * 60)
+
+    # Önce: her komut ayrı write() (birleştirme kapalı)
+    olc("Komut başına write() (önce)", 0)
+
+    # Sonra: kuyrukta bekleyenler tek write()
+    olc(f"Birleştirilmiş write() ≤{SensorKart.YAZMA_BIRLESTIRME_BAYT} bayt (sonra)",
+        SensorKart.YAZMA_BIRLESTIRME_BAYT)
+
+    # Yığın altında durdurma: FIFO + en eskiyi at (önce) / öncelikli kuyruk (sonra)
+    fifo = queue.Queue(maxsize=SensorKart.QUEUE_MAX_SIZE)
+    yigin_altinda_durdurma("Durdurma - FIFO kuyruk (önce)", fifo, lambda k: eski_kuyruga_ekle(fifo, k))
+    oncelikli = KomutKuyrugu(SensorKart.QUEUE_MAX_SIZE, SensorKart.KOMUT_ONCELIKLERI, SensorKart.KOMUT_GRUPLARI)
+    yigin_altinda_durdurma("Durdurma - öncelikli kuyruk (sonra)", oncelikli, lambda k: oncelikli.ekle(*k))
+    durdurma_sonrasi_hareket()
+
+    print("\n" + "=" * 60)
+    print("✅ BENCHMARK TAMAMLANDI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
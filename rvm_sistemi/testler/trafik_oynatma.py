@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Trafik Oynatma Scripti
+RVM_TRAFIK_KAYDI ile kaydedilmiş bir oturumu pty üzerindeki sanal kartlardan
+kaydedildiği zamanlamayla (veya HIZ katı hızlandırılmış) tekrar oynatır.
+
+Kullanım:
+    python -m rvm_sistemi.testler.trafik_oynatma oturum.trf [hiz] [kart]
+
+"kart" verilirse MotorKart / SensorKart bu script içinde sanal portlara
+bağlanır ve kayıttaki mesajların host'a ulaşıp ulaşmadığı ölçülür; verilmezse
+portlar yazdırılır ve ana.py (RVM_SENSOR_PORT / RVM_MOTOR_PORT) beklenir.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+
+from rvm_sistemi.makine.seri.motor_karti import MotorKart
+from rvm_sistemi.makine.seri.sanal_kart import TrafikOynatici
+from rvm_sistemi.makine.seri.sensor_karti import SensorKart
+from rvm_sistemi.makine.seri.trafik_kaydi import RX, kayitlari_oku
+
+KART_KANALLARI = ["motor", "sensor"]
+
+
+def kayit_ozeti(dosya):
+    sayac = Counter((k.kanal, k.yon) for k in kayitlari_oku(dosya))
+    print(f"📄 {dosya}")
+    for (kanal, yon), adet in sorted(sayac.items()):
+        print(f"  {kanal:10s} {'RX' if yon == RX else 'TX'}: {adet}")
+
+
+def kartlarla_oynat(oynatici):
+    """Kartları sanal portlara bağlar, kaydı oynatır ve callback'e ulaşan mesajları sayar"""
+    gelen = Counter()
+    sonuc = {}
+    # Kart __init__'i portu açıp handshake yaparken oynatma arka planda sürmeli
+    oynatma = threading.Thread(target=lambda: sonuc.update(oynatici.oynat()), daemon=True)
+    oynatma.start()
+
+    yollar = oynatici.port_yollari()
+    kartlar = []
+    if "motor" in yollar:
+        kartlar.append(MotorKart(port_adi=yollar["motor"], callback=lambda m: gelen.update(["motor"])))
+    if "sensor" in yollar:
+        kartlar.append(SensorKart(port_adi=yollar["sensor"], callback=lambda m: gelen.update(["sensor"])))
+
+    oynatma.join()
+    time.sleep(0.5)
+    for kart in kartlar:
+        kart.dinlemeyi_durdur()
+    print(f"  Callback'e ulaşan mesajlar: {dict(gelen)}")
+    return sonuc
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        return
+
+    dosya = sys.argv[1]
+    hiz = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    kart_modu = len(sys.argv) > 3 and sys.argv[3] == "kart"
+
+    kayit_ozeti(dosya)
+    oynatici = TrafikOynatici(dosya, hiz=hiz, kanallar=KART_KANALLARI)
+    yollar = oynatici.port_yollari()
+
+    print("=" * 60)
+    print(f"▶️  OYNATMA ({hiz}x)")
+    print("=" * 60)
+
+    baslangic = time.monotonic()
+    if kart_modu:
+        sonuc = kartlarla_oynat(oynatici)
+    else:
+        print("ana.py'yi şu ortam değişkenleriyle başlatın:")
+        print(f"  RVM_SENSOR_PORT={yollar.get('sensor', '')} RVM_MOTOR_PORT={yollar.get('motor', '')} python ana.py")
+        input("Portlar açılınca Enter'a basın...")
+        sonuc = oynatici.oynat()
+
+    oynatici.durdur()
+    print(f"  Süre: {time.monotonic() - baslangic:.2f} s")
+    for anahtar, deger in sonuc.items():
+        print(f"  {anahtar}: {deger}")
+
+
+if __name__ == "__main__":
+    main()
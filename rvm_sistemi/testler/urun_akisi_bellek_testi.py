@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Ürün Akışı Bellek Testi
+Sentetik bir getAllProducts cevabını iki yolla veritabanına yazar ve en yüksek
+RSS artışını karşılaştırır:
+    önce:  gövdenin tamamı bellekte, json.loads + ürün listesi ile urunleri_kaydet
+    sonra: gövde 64 KiB parçalarla UrunAkisCozucu'ya beslenir, ürünler
+           KatalogGuncellemesi ile partiler halinde gölge tabloya yazılır
+Her ölçüm ayrı bir süreçte yapılır (RSS tepe değeri süreç başınadır).
+Akış yolunda katalogla birlikte kalan küçük artış SQLite'ın mmap ile eşlediği
+veritabanı dosyası sayfalarıdır (baglanti.MMAP_BOYUTU, geri alınabilir bellek).
+
+Kullanım:
+    python -m rvm_sistemi.testler.urun_akisi_bellek_testi [ürün sayısı ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+PARCA_BOYUTU = 64 * 1024
+SONUC_ONEKI = "SONUC "  # Alt süreç çıktısında sonuç satırı (modül çıktılarından ayırmak için)
+VARSAYILAN_BOYUTLAR = [50000, 200000]
+
+
+def urun(i):
+    return {
+        "barcode": f"869{i:010d}",
+        "material": 1 + i % 3,
+        "packMinWeight": 10.0 + i % 7, "packMaxWeight": 60.0,
+        "packMinWidth": 50.0, "packMaxWidth": 90.0,
+        "packMinHeight": 150.0, "packMaxHeight": 350.0,
+        "productName": f"Ürün {i}",
+    }
+
+
+def cevap_parcalari(adet):
+    """Cevap gövdesini ağdan geliyormuş gibi PARCA_BOYUTU'luk parçalarla üretir"""
+    tampon = bytearray(b'{"status": "ok", "products": [')
+    for i in range(adet):
+        if i:
+            tampon += b","
+        tampon += json.dumps(urun(i), ensure_ascii=False).encode()
+        while len(tampon) >= PARCA_BOYUTU:
+            yield bytes(tampon[:PARCA_BOYUTU])
+            del tampon[:PARCA_BOYUTU]
+    tampon += b'], "count": %d}' % adet
+    yield bytes(tampon)
+
+
+def rss_kib(alan):
+    with open("/proc/self/status") as f:
+        for satir in f:
+            if satir.startswith(alan + ":"):
+                return int(satir.split()[1])
+    return 0
+
+
+def olc(mod, adet, db_yolu):
+    """Alt süreç: tek bir modu çalıştırır ve sonucu JSON satırı olarak yazar"""
+    from rvm_sistemi.dimdb.urun_akisi import UrunAkisCozucu
+    from rvm_sistemi.veri_tabani import veritabani_yoneticisi as vt
+
+    vt.DB_PATH = db_yolu
+    vt.init_db()
+    vt.barkod_indeksini_yenile = lambda arkaplanda=False: None  # Sadece alım yolu ölçülsün
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")  # VmHWM'i sıfırla
+    except OSError:
+        pass
+    baslangic_rss = rss_kib("VmRSS")
+    t = time.perf_counter()
+
+    if mod == "onceki":
+        govde = b"".join(cevap_parcalari(adet))  # response.content
+        products = json.loads(govde)["products"]  # response.json()
+        vt.urunleri_kaydet(products)
+    else:
+        cozucu = UrunAkisCozucu()
+        guncelleme = vt.KatalogGuncellemesi()
+        for parca in cevap_parcalari(adet):
+            for product in cozucu.besle(parca):
+                if guncelleme.ekle(product):
+                    guncelleme.parti_yaz()
+        cozucu.bitir()
+        guncelleme.bitir()
+
+    sure = time.perf_counter() - t
+    print(SONUC_ONEKI + json.dumps({"tepe_mib": (rss_kib("VmHWM") - baslangic_rss) / 1024, "sure": sure,
+                      "urun": vt.urun_sayisini_getir()}))
+
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "olc":
+        olc(sys.argv[2], int(sys.argv[3]), sys.argv[4])
+        return
+
+    boyutlar = [int(a) for a in sys.argv[1:]] or VARSAYILAN_BOYUTLAR
+    print("=" * 60)
+    print("🧠 ÜRÜN AKIŞI BELLEK TESTİ")
+    print("=" * 60)
+    for adet in boyutlar:
+        print(f"\n📊 {adet} ürün (~{sum(len(p) for p in cevap_parcalari(adet)) / 1024 / 1024:.1f} MiB JSON)")
+        for mod, etiket in (("onceki", "Tüm gövde + json.loads (önce)"), ("akis", "Akış + partiler (sonra)")):
+            with tempfile.TemporaryDirectory() as klasor:
+                cikti = subprocess.run(
+                    [sys.executable, "-m", "rvm_sistemi.testler.urun_akisi_bellek_testi", "olc", mod, str(adet),
+                     os.path.join(klasor, "bellek.db")],
+                    capture_output=True, text=True, check=True,
+                ).stdout
+            sonuc = json.loads(next(satir for satir in cikti.splitlines()
+                                    if satir.startswith(SONUC_ONEKI))[len(SONUC_ONEKI):])
+            print(f"  {etiket:32s} tepe RSS artışı={sonuc['tepe_mib']:7.1f} MiB  "
+                  f"süre={sonuc['sure']:.2f} s  kaydedilen={sonuc['urun']}")
+
+    print("\n" + "=" * 60)
+    print("✅ TEST TAMAMLANDI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
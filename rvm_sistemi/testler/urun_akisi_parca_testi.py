@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Ürün Akışı Parça Sınırı Testi
+Örnek getAllProducts cevaplarını UrunAkisCozucu'ya 1 bayttan gövde boyuna kadar
+her parça boyutuyla besler; çözülen ürünler ve üst seviye alanlar json.loads
+sonucuyla birebir aynı olmalıdır. Sayılar ("12." + "5", "-1.5e" + "3"), kaçış
+dizileri ve çok baytlı UTF-8 karakterler parça sınırında bölünmüş olur.
+
+Kullanım:
+    python -m rvm_sistemi.testler.urun_akisi_parca_testi
+"""
+
+import json
+import sys
+
+from rvm_sistemi.dimdb.urun_akisi import UrunAkisCozucu
+
+ORNEKLER = [
+    '{"a":1,"x":-12.5e3}',
+    '{"products":[]}',
+    '{"count": 10, "products": [{"barcode": "8690000000017", "material": 1, "packMinWeight": 12.5, '
+    '"packMaxWeight": 1e2, "packMinWidth": -0.25E-1, "productName": "Şişe \\"Ç\\" \\u00fc"}, '
+    '{"barcode": "8690000000024", "material": 3, "packMaxHeight": 350, "ok": true, "x": null}], '
+    '"version": 12.0, "note": "ğüşiöç", "total": -7}',
+    ' { "products" : [ { "barcode" : "1" , "packMinWeight" : 0.5 } ] , "son" : 1E+3 } \n',
+]
+
+
+def parcalarla_coz(govde, boyut):
+    cozucu = UrunAkisCozucu()
+    urunler = []
+    for i in range(0, len(govde), boyut):
+        urunler.extend(cozucu.besle(govde[i:i + boyut]))
+    cozucu.bitir()
+    return urunler, cozucu.diger_alanlar
+
+
+def main():
+    hatalar = 0
+    denemeler = 0
+    for metin in ORNEKLER:
+        beklenen = json.loads(metin)
+        beklenen_urunler = beklenen.pop("products", [])
+        govde = metin.encode("utf-8")
+        for boyut in range(1, len(govde) + 1):
+            denemeler += 1
+            try:
+                sonuc = parcalarla_coz(govde, boyut)
+            except ValueError as e:
+                sonuc = e
+            if sonuc != (beklenen_urunler, beklenen):
+                hatalar += 1
+                print(f"❌ {boyut} baytlık parçalar: {sonuc!r}\n   gövde: {metin[:60]}")
+
+    if hatalar:
+        print(f"❌ {hatalar}/{denemeler} parçalama hatalı")
+        sys.exit(1)
+    print(f"✅ {len(ORNEKLER)} örnek, {denemeler} parçalama: tümü json.loads ile aynı")
+
+
+if __name__ == "__main__":
+    main()
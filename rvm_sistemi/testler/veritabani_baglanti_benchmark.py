@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Veritabanı Bağlantı Benchmark Scripti
+Tüm katalog yeniden yazılırken (her satır tek transaction'da güncellenir) eşzamanlı okuyucuların
+barkod sorgusu hızını ve en uzun beklemesini karşılaştırır:
+    önce:  her çağrıda sqlite3.connect, rollback journal
+    sonra: baglanti katmanı (thread başına bağlantı, WAL, synchronous=NORMAL, mmap)
+Ayrıca yazma olmadan tek thread sorgu hızını ölçer.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+from rvm_sistemi.veri_tabani import baglanti
+from rvm_sistemi.veri_tabani import veritabani_yoneticisi as vt
+
+URUN_SAYISI = 50000
+OKUYUCU_SAYISI = 4
+BOSTA_SORGU = 20000
+GUNCELLEME_SQL = "UPDATE products SET packMaxWeight = ?, content_hash = ? WHERE barcode = ?"
+
+
+def urunler_olustur(adet, agirlik):
+    return [{
+        "barcode": f"869{i:010d}",
+        "material": 1 + i % 3,
+        "packMinWeight": 10.0, "packMaxWeight": agirlik,
+        "packMinWidth": 50.0, "packMaxWidth": 90.0,
+        "packMinHeight": 150.0, "packMaxHeight": 350.0,
+    } for i in range(adet)]
+
+
+def onceki_okuma(barkod):
+    """Önceki yol: her sorguda yeni bağlantı"""
+    with sqlite3.connect(vt.DB_PATH) as conn:
+        conn.row_factory = sqlite3.Row
+        row = conn.execute("SELECT * FROM products WHERE barcode = ?", (barkod,)).fetchone()
+        return dict(row) if row else None
+
+
+def onceki_yazma(agirlik):
+    """Önceki yol: tek bağlantı, rollback journal, tüm satırlar güncellenir"""
+    with sqlite3.connect(vt.DB_PATH) as conn:
+        conn.executemany(GUNCELLEME_SQL, [(agirlik, i, f"869{i:010d}") for i in range(URUN_SAYISI)])
+        conn.commit()
+
+
+def katman_yazma(agirlik):
+    """Aynı güncelleme bağlantı katmanının yazma transaction'ı ile"""
+    with baglanti.yazma(vt.DB_PATH) as conn:
+        conn.executemany(GUNCELLEME_SQL, [(agirlik, i, f"869{i:010d}") for i in range(URUN_SAYISI)])
+
+
+def okuyucular_ile_olc(okuma, yazma):
+    """Yazma süresince okuyucu thread'lerin sorgu sayısını ve en uzun beklemesini ölçer"""
+    durdur = threading.Event()
+    sayaclar = [0] * OKUYUCU_SAYISI
+    en_uzun = [0.0] * OKUYUCU_SAYISI
+
+    def okuyucu(no):
+        i = no
+        while not durdur.is_set():
+            t = time.perf_counter()
+            okuma(f"869{i % URUN_SAYISI:010d}")
+            en_uzun[no] = max(en_uzun[no], time.perf_counter() - t)
+            sayaclar[no] += 1
+            i += 7919
+
+    threadler = [threading.Thread(target=okuyucu, args=(no,), daemon=True) for no in range(OKUYUCU_SAYISI)]
+    for thread in threadler:
+        thread.start()
+    time.sleep(0.1)
+    onceki_sayi = sum(sayaclar)
+    t = time.perf_counter()
+    yazma()
+    sure = time.perf_counter() - t
+    yazma_sirasinda = sum(sayaclar) - onceki_sayi
+    durdur.set()
+    for thread in threadler:
+        thread.join()
+    return sure, yazma_sirasinda / sure, max(en_uzun)
+
+
+def bosta_olc(okuma):
+    t = time.perf_counter()
+    for i in range(BOSTA_SORGU):
+        okuma(f"869{(i * 7919) % URUN_SAYISI:010d}")
+    return BOSTA_SORGU / (time.perf_counter() - t)
+
+
+def main():
+    print("=" * 60)
+    print(f"🗄️  VERİTABANI BAĞLANTI BENCHMARK ({URUN_SAYISI} ürün, {OKUYUCU_SAYISI} okuyucu)")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as klasor:
+        # Önce: rollback journal, çağrı başına bağlantı
+        vt.DB_PATH = os.path.join(klasor, "onceki.db")
+        with sqlite3.connect(vt.DB_PATH) as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+        vt.init_db()
+        vt.urunleri_kaydet(urunler_olustur(URUN_SAYISI, 60.0))
+        vt.barkod_indeksini_yukle()
+        baglanti.thread_baglantilarini_kapat()
+        with sqlite3.connect(vt.DB_PATH) as conn:
+            conn.execute("PRAGMA journal_mode=DELETE")
+
+        bosta_once = bosta_olc(onceki_okuma)
+        sure, hiz, bekleme = okuyucular_ile_olc(onceki_okuma, lambda: onceki_yazma(65.0))
+        print("\n📊 Önce (sqlite3.connect / rollback journal)")
+        print(f"  Boşta sorgu/sn (tek thread): {bosta_once:,.0f}")
+        print(f"  Katalog yazımı: {sure * 1000:.0f} ms  yazma sırasında sorgu/sn: {hiz:,.0f}  "
+              f"en uzun bekleme: {bekleme * 1000:.1f} ms")
+
+        # Sonra: bağlantı katmanı
+        vt.DB_PATH = os.path.join(klasor, "sonra.db")
+        vt.init_db()
+        vt.urunleri_kaydet(urunler_olustur(URUN_SAYISI, 60.0))
+        vt.barkod_indeksini_yukle()
+
+        bosta_sonra = bosta_olc(vt._barkodu_veritabaninda_dogrula)
+        sure, hiz, bekleme = okuyucular_ile_olc(
+            vt._barkodu_veritabaninda_dogrula, lambda: katman_yazma(65.0))
+        print("\n📊 Sonra (baglanti katmanı / WAL)")
+        print(f"  Boşta sorgu/sn (tek thread): {bosta_sonra:,.0f}")
+        print(f"  Katalog yazımı: {sure * 1000:.0f} ms  yazma sırasında sorgu/sn: {hiz:,.0f}  "
+              f"en uzun bekleme: {bekleme * 1000:.1f} ms")
+        print(f"  Katman sayaçları: {baglanti.istatistikler()}")
+
+    print("\n" + "=" * 60)
+    print("✅ BENCHMARK TAMAMLANDI")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
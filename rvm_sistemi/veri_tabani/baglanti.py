@@ -0,0 +1,112 @@
+"""
+baglanti.py - SQLite bağlantı katmanı
+Her thread veritabanı dosyası başına tek bir bağlantı tutar; dosya açma,
+şema okuma ve PRAGMA kurulumu her çağrıda değil, bağlantı başına bir kez yapılır.
+
+Bağlantı ayarları:
+    journal_mode=WAL      okuyucular katalog yazımı sırasında bloklanmaz
+    synchronous=NORMAL    WAL'de güvenli, her commit'te fsync yok
+    mmap_size             okumalar sayfa önbelleği yerine mmap'ten
+    busy_timeout          eşzamanlı yazıcılar hata yerine bekler
+Hazırlanmış ifadeler sqlite3'ün ifade önbelleğinde (SQL metni başına) tutulur.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+MMAP_BOYUTU = 64 * 1024 * 1024      # bayt
+MESGUL_ZAMAN_ASIMI_MS = 5000
+IFADE_ONBELLEGI = 256               # bağlantı başına hazırlanmış ifade
+
+_yerel = threading.local()
+_sayac_kilidi = threading.Lock()
+_sayaclar = {"acilan_baglanti": 0, "okuma": 0, "yazma": 0, "geri_alinan": 0}
+
+
+def _say(anahtar: str) -> None:
+    with _sayac_kilidi:
+        _sayaclar[anahtar] += 1
+
+
+def _baglanti_ac(yol: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(yol, timeout=MESGUL_ZAMAN_ASIMI_MS / 1000, cached_statements=IFADE_ONBELLEGI)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA mmap_size={MMAP_BOYUTU}")
+    conn.execute(f"PRAGMA busy_timeout={MESGUL_ZAMAN_ASIMI_MS}")
+    _say("acilan_baglanti")
+    return conn
+
+
+def baglanti(yol: str) -> sqlite3.Connection:
+    """Bu thread'in yol için açık bağlantısını döndürür, yoksa açar"""
+    baglantilar = getattr(_yerel, "baglantilar", None)
+    if baglantilar is None:
+        baglantilar = _yerel.baglantilar = {}
+    conn = baglantilar.get(yol)
+    if conn is None:
+        conn = baglantilar[yol] = _baglanti_ac(yol)
+    return conn
+
+
+@contextmanager
+def okuma(yol: str) -> Iterator[sqlite3.Connection]:
+    """Okuma bağlantısı - WAL sayesinde devam eden yazma beklenmez"""
+    _say("okuma")
+    yield baglanti(yol)
+
+
+@contextmanager
+def yazma(yol: str) -> Iterator[sqlite3.Connection]:
+    """
+    Yazma transaction'ı: BEGIN IMMEDIATE ile yazma kilidi baştan alınır,
+    blok hatasız biterse commit, hata olursa rollback yapılıp hata yükseltilir.
+    """
+    conn = baglanti(yol)
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        _say("geri_alinan")
+        raise
+    conn.commit()
+    _say("yazma")
+
+
+def sorgula(yol: str, sql: str, parametreler=(), sozluk: bool = False) -> List:
+    """SELECT sonucunun tüm satırları; sozluk=True ise satırlar dict"""
+    with okuma(yol) as conn:
+        cursor = conn.cursor()
+        if sozluk:
+            cursor.row_factory = sqlite3.Row
+            return [dict(row) for row in cursor.execute(sql, parametreler)]
+        return cursor.execute(sql, parametreler).fetchall()
+
+
+def sorgula_tek(yol: str, sql: str, parametreler=(), sozluk: bool = False) -> Optional[object]:
+    """SELECT sonucunun ilk satırı veya None"""
+    with okuma(yol) as conn:
+        cursor = conn.cursor()
+        if sozluk:
+            cursor.row_factory = sqlite3.Row
+        row = cursor.execute(sql, parametreler).fetchone()
+        cursor.close()  # Açık ifade WAL okuma görüntüsünü tutmasın
+        if row is None:
+            return None
+        return dict(row) if sozluk else row
+
+
+def thread_baglantilarini_kapat() -> None:
+    """Çağıran thread'in açık bağlantılarını kapatır (thread sonlanırken de kendiliğinden kapanır)"""
+    baglantilar = getattr(_yerel, "baglantilar", None) or {}
+    for conn in baglantilar.values():
+        conn.close()
+    baglantilar.clear()
+
+
+def istatistikler() -> dict:
+    with _sayac_kilidi:
+        return dict(_sayaclar)
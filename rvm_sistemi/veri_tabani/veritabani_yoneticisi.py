@@ -1,6 +1,13 @@
+import marshal
+import operator
 import sqlite3
 import os
+import threading
+import zlib
 from datetime import datetime, timedelta
+from typing import Dict, NamedTuple, Optional
+
+from rvm_sistemi.veri_tabani import baglanti
 
 # Veritabanı dosyasının yolunu projenin ana dizini olarak ayarla
 # Bu, betiğin nereden çalıştırıldığına bakılmaksızın dosyanın her zaman aynı yerde olmasını sağlar.
@@ -18,7 +25,7 @@ def init_db():
     """
     try:
         print(f"Veritabanı kontrol ediliyor/oluşturuluyor: {DB_PATH}")
-        with sqlite3.connect(DB_PATH) as conn:
+        with baglanti.yazma(DB_PATH) as conn:
             cursor = conn.cursor()
             
             # Products tablosu
@@ -32,9 +39,11 @@ def init_db():
                     packMinWidth REAL,
                     packMaxWidth REAL,
                     packMinHeight REAL,
-                    packMaxHeight REAL
+                    packMaxHeight REAL,
+                    content_hash INTEGER
                 )
             """)
+            _products_semasini_guncelle(cursor)
             
             # Ürün güncelleme geçmişi tablosu
             cursor.execute("""
@@ -48,107 +57,423 @@ def init_db():
                 )
             """)
             
-            conn.commit()
-            print("✅ Veritabanı tabloları hazır")
+            # DİM-DB gönderim kuyruğu (outbox) tablosu
+            _outbox_tablosu_olustur(cursor)
+            
+            # Son uygulanan katalog sürümü (koşullu indirme için)
+            _katalog_durumu_tablosu_olustur(cursor)
+            
+        print("✅ Veritabanı tabloları hazır")
     except sqlite3.Error as e:
         print(f"Veritabanı hatası (init_db): {e}")
         raise
 
-def urunleri_kaydet(products):
+URUN_ALANLARI = ('material', 'packMinWeight', 'packMaxWeight', 'packMinWidth',
+                 'packMaxWidth', 'packMinHeight', 'packMaxHeight')
+_urun_alanlarini_al = operator.itemgetter(*URUN_ALANLARI)
+
+def _products_semasini_guncelle(cursor):
+    """Eski veritabanlarında products tablosuna content_hash sütununu ekler."""
+    sutunlar = {row[1] for row in cursor.execute("PRAGMA table_info(products)")}
+    if 'content_hash' not in sutunlar:
+        cursor.execute("ALTER TABLE products ADD COLUMN content_hash INTEGER")
+
+def _urun_ozeti(degerler):
     """
-    DİM-DB'den gelen ürün listesini veritabanına kaydeder.
-    Kayıt işleminden önce mevcut tüm ürünleri siler.
+    Ürün alanlarının süreçler arası kararlı 63 bit özeti (crc32 + adler32).
+    Python sürümü marshal biçimini değiştirirse sadece bir kez tüm satırlar yeniden yazılır.
     """
-    update_timestamp = turkiye_saati().strftime('%Y-%m-%d %H:%M:%S')
-    product_count = len(products)
-    
+    veri = marshal.dumps(degerler)
+    return (zlib.crc32(veri) << 31) ^ zlib.adler32(veri)
+
+def _urunu_hazirla(product):
+    """Ürünü (barkod, alan değerleri, özet) olarak döndürür; barkodsuz ürün için None."""
+    barkod = product.get('barcode')
+    if barkod is None:
+        return None
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cursor = conn.cursor()
-            
-            # 1. Adım: Eski ürün sayısını al
-            cursor.execute("SELECT COUNT(*) FROM products")
-            eski_urun_sayisi = cursor.fetchone()[0]
-            
-            # 2. Adım: Eski verileri temizle
-            print(f"📦 Eski ürün verileri temizleniyor... (Mevcut: {eski_urun_sayisi})")
-            cursor.execute("DELETE FROM products")
-            
-            # 3. Adım: Duplicate kontrol et
-            barkod_listesi = [p.get('barcode') for p in products]
-            unique_barkodlar = set(barkod_listesi)
-            duplicate_sayisi = len(barkod_listesi) - len(unique_barkodlar)
+        degerler = _urun_alanlarini_al(product)
+    except KeyError:  # Eksik alan NULL yazılır
+        degerler = tuple(product.get(alan) for alan in URUN_ALANLARI)
+    return str(barkod), degerler, _urun_ozeti(degerler)
+
+class KatalogOzeti:
+    """
+    Ürün sırasından bağımsız katalog özeti: ürün özetlerinin 64 bit toplamı
+    ve ürün sayısı. Aynı katalog her indirmede aynı değeri verir.
+    """
 
-            if duplicate_sayisi > 0:
-                print(f"⚠️  API'den {duplicate_sayisi} adet duplicate barkod geldi (otomatik düzeltiliyor)")
+    def __init__(self):
+        self._toplam = 0
+        self.urun_sayisi = 0
 
-            # 4. Adım: Yeni ürün listesini ekle (duplicate barkodları otomatik değiştir)
-            print(f"📥 {len(unique_barkodlar)} adet benzersiz ürün veritabanına kaydediliyor...")
-            for product in products:
+    def ekle(self, barkod, ozet):
+        self._toplam = (self._toplam + _urun_ozeti((barkod, ozet))) & 0xFFFFFFFFFFFFFFFF
+        self.urun_sayisi += 1
+
+    @property
+    def deger(self):
+        return f"{self._toplam:016x}-{self.urun_sayisi}"
+
+class KatalogGuncellemesi:
+    """
+    Ürün kataloğunu products_yeni gölge tablosuna sabit boyutlu partilerle
+    yazar; bitir() gölge tabloyu content_hash ile products'a karşı fark alıp
+    tek transaction'da uygular. Katalog bellekte bütün olarak tutulmaz, ürünler
+    geldikçe eklenebilir (akış halinde gelen DİM-DB cevabı).
+
+    Kullanım:
+        guncelleme = KatalogGuncellemesi()
+        for product in urunler:
+            if guncelleme.ekle(product):
+                guncelleme.parti_yaz()
+        guncelleme.bitir()   # hata olursa guncelleme.iptal(hata)
+
+    Katalog özeti son uygulanan katalogla aynıysa (zorla=False) products'a
+    dokunulmaz, geçmişe sadece 'no_change' kaydı düşülür.
+    """
+
+    PARTI_BOYUTU = 1000
+    _calisiyor = threading.Lock()  # Aynı anda tek katalog güncellemesi (gölge tablo ortak)
+
+    def __init__(self, zorla=False):
+        if not KatalogGuncellemesi._calisiyor.acquire(blocking=False):
+            raise RuntimeError("Katalog güncellemesi zaten sürüyor")
+        self.update_timestamp = turkiye_saati().strftime('%Y-%m-%d %H:%M:%S')
+        self.alinan = 0
+        self.barkodsuz = 0
+        self._parti = []
+        self._bitti = False
+        self.zorla = zorla
+        self.katalog_ozeti = KatalogOzeti()
+        try:
+            with baglanti.yazma(DB_PATH) as conn:
+                cursor = conn.cursor()
+                _products_semasini_guncelle(cursor)
+                _katalog_durumu_tablosu_olustur(cursor)
                 cursor.execute("""
-                    INSERT OR REPLACE INTO products (barcode, material, packMinWeight, packMaxWeight, packMinWidth, packMaxWidth, packMinHeight, packMaxHeight)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    product.get('barcode'),
-                    product.get('material'),
-                    product.get('packMinWeight'),
-                    product.get('packMaxWeight'),
-                    product.get('packMinWidth'),
-                    product.get('packMaxWidth'),
-                    product.get('packMinHeight'),
-                    product.get('packMaxHeight')
-                ))
-            
-            # 5. Adım: Güncelleme geçmişini kaydet
-            cursor.execute("""
-                INSERT INTO update_history (update_timestamp, product_count, source, status, notes)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                update_timestamp,
-                product_count,
-                'DIM-DB',
-                'success',
-                f'Eski ürün: {eski_urun_sayisi}, Yeni ürün: {product_count}'
-            ))
-            
-            conn.commit()
-            print(f"✅ Ürünler başarıyla veritabanına kaydedildi.")
-            print(f"📊 Güncelleme Kaydı: {update_timestamp} - {product_count} ürün")
-            
-    except sqlite3.Error as e:
-        # Hata durumunda da kaydet
+                    CREATE TABLE IF NOT EXISTS products_yeni (
+                        barcode TEXT PRIMARY KEY,
+                        material INTEGER,
+                        packMinWeight REAL,
+                        packMaxWeight REAL,
+                        packMinWidth REAL,
+                        packMaxWidth REAL,
+                        packMinHeight REAL,
+                        packMaxHeight REAL,
+                        content_hash INTEGER
+                    )
+                """)
+                cursor.execute("DELETE FROM products_yeni")  # Yarım kalmış önceki güncelleme
+        except BaseException:
+            self._kilidi_birak()
+            raise
+
+    def ekle(self, product):
+        """
+        Ürünü bekleyen partiye ekler (aynı barkodda son gelen geçerli).
+
+        Returns:
+            bool: Parti doldu, parti_yaz() çağrılmalı
+        """
+        self.alinan += 1
+        hazir = _urunu_hazirla(product)
+        if hazir is None:
+            self.barkodsuz += 1
+            return False
+        barkod, degerler, ozet = hazir
+        self.katalog_ozeti.ekle(barkod, ozet)
+        self._parti.append((barkod, *degerler, ozet))
+        return len(self._parti) >= self.PARTI_BOYUTU
+
+    def parti_yaz(self):
+        """Bekleyen partiyi gölge tabloya kısa bir transaction ile yazar"""
+        if not self._parti:
+            return
+        parti, self._parti = self._parti, []
+        with baglanti.yazma(DB_PATH) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO products_yeni (barcode, material, packMinWeight, packMaxWeight, packMinWidth, packMaxWidth, packMinHeight, packMaxHeight, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, parti)
+
+    def bitir(self, etag=None, last_modified=None):
+        """
+        Gölge tabloyu products'a uygular: sadece eklenen, değişen ve silinen
+        ürünler yazılır. Okuyucular (WAL) commit'e kadar eski kataloğu görür.
+
+        Args:
+            etag, last_modified: DİM-DB cevabının doğrulayıcıları (bir sonraki koşullu istek için)
+
+        Returns:
+            dict: eski, yeni, eklenen, guncellenen, silinen ürün sayıları ve degisiklik_yok
+        """
         try:
-            with sqlite3.connect(DB_PATH) as conn:
+            ozet = self.katalog_ozeti.deger
+            if not self.zorla and ozet == katalog_durumunu_getir().get('content_hash'):
+                self._parti = []
+                with baglanti.yazma(DB_PATH) as conn:
+                    conn.execute("DELETE FROM products_yeni")
+                    urun_sayisi = _degisiklik_yok_yaz(conn, self.update_timestamp,
+                                                      f'Katalog özeti aynı ({self.alinan} ürün)', etag, last_modified)
+                print(f"✅ Ürün kataloğu değişmemiş ({self.alinan} ürün), veritabanı yazımı atlandı.")
+                return {"eski": urun_sayisi, "yeni": urun_sayisi, "eklenen": 0, "guncellenen": 0,
+                        "silinen": 0, "degisiklik_yok": True}
+
+            self.parti_yaz()
+            with baglanti.yazma(DB_PATH) as conn:
                 cursor = conn.cursor()
+                eski_urun_sayisi = cursor.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+                yeni_urun_sayisi = cursor.execute("SELECT COUNT(*) FROM products_yeni").fetchone()[0]
+
+                duplicate_sayisi = self.alinan - self.barkodsuz - yeni_urun_sayisi
+                if duplicate_sayisi > 0:
+                    print(f"⚠️  API'den {duplicate_sayisi} adet duplicate barkod geldi (otomatik düzeltiliyor)")
+                if self.barkodsuz > 0:
+                    print(f"⚠️  API'den {self.barkodsuz} adet barkodsuz ürün geldi (atlandı)")
+
+                # 1. Adım: Farkı say
+                eklenen = cursor.execute("""
+                    SELECT COUNT(*) FROM products_yeni y
+                    WHERE NOT EXISTS (SELECT 1 FROM products p WHERE p.barcode = y.barcode)
+                """).fetchone()[0]
+                guncellenen = cursor.execute("""
+                    SELECT COUNT(*) FROM products_yeni y JOIN products p ON p.barcode = y.barcode
+                    WHERE p.content_hash IS NOT y.content_hash
+                """).fetchone()[0]
+
+                # 2. Adım: Farkı uygula
+                cursor.execute("DELETE FROM products WHERE barcode NOT IN (SELECT barcode FROM products_yeni)")
+                silinen = cursor.rowcount
                 cursor.execute("""
+                    INSERT INTO products (barcode, material, packMinWeight, packMaxWeight, packMinWidth, packMaxWidth, packMinHeight, packMaxHeight, content_hash)
+                    SELECT barcode, material, packMinWeight, packMaxWeight, packMinWidth, packMaxWidth, packMinHeight, packMaxHeight, content_hash
+                    FROM products_yeni WHERE true
+                    ON CONFLICT(barcode) DO UPDATE SET
+                        material = excluded.material, packMinWeight = excluded.packMinWeight,
+                        packMaxWeight = excluded.packMaxWeight, packMinWidth = excluded.packMinWidth,
+                        packMaxWidth = excluded.packMaxWidth, packMinHeight = excluded.packMinHeight,
+                        packMaxHeight = excluded.packMaxHeight, content_hash = excluded.content_hash
+                    WHERE products.content_hash IS NOT excluded.content_hash
+                """)
+                cursor.execute("DELETE FROM products_yeni")
+
+                print(f"📦 Katalog farkı: +{eklenen} eklendi, ~{guncellenen} güncellendi, "
+                      f"-{silinen} silindi (Önceki: {eski_urun_sayisi})")
+
+                # 3. Adım: Güncelleme geçmişini kaydet
+                cursor.execute("""
+                    INSERT INTO update_history (update_timestamp, product_count, source, status, notes)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (
+                    self.update_timestamp,
+                    self.alinan,
+                    'DIM-DB',
+                    'success',
+                    f'Eski ürün: {eski_urun_sayisi}, Yeni ürün: {self.alinan}, '
+                    f'Eklenen: {eklenen}, Güncellenen: {guncellenen}, Silinen: {silinen}'
+                ))
+                _katalog_durumunu_yaz(cursor, ozet, yeni_urun_sayisi, etag, last_modified)
+        finally:
+            self._kilidi_birak()
+
+        print(f"✅ Ürünler başarıyla veritabanına kaydedildi.")
+        print(f"📊 Güncelleme Kaydı: {self.update_timestamp} - {self.alinan} ürün")
+
+        # Doğrulama eski indeksten devam eder, yenisi hazır olunca değiştirilir
+        if eklenen or guncellenen or silinen:
+            barkod_indeksini_yenile(arkaplanda=True)
+        return {
+            "eski": eski_urun_sayisi,
+            "yeni": yeni_urun_sayisi,
+            "eklenen": eklenen,
+            "guncellenen": guncellenen,
+            "silinen": silinen,
+            "degisiklik_yok": False,
+        }
+
+    def iptal(self, hata):
+        """Güncellemeyi products'a dokunmadan bırakır ve hatayı geçmişe yazar"""
+        self._parti = []
+        try:
+            with baglanti.yazma(DB_PATH) as conn:
+                conn.execute("DELETE FROM products_yeni")
+                conn.execute("""
                     INSERT INTO update_history (update_timestamp, product_count, source, status, notes)
                     VALUES (?, ?, ?, ?, ?)
                 """, (
-                    update_timestamp,
+                    self.update_timestamp,
                     0,
                     'DIM-DB',
                     'error',
-                    f'Hata: {str(e)}'
+                    f'Hata: {str(hata)}'
                 ))
-                conn.commit()
         except:
             pass
-        
+        finally:
+            self._kilidi_birak()
+
+    def _kilidi_birak(self):
+        if not self._bitti:
+            self._bitti = True
+            KatalogGuncellemesi._calisiyor.release()
+
+# --- KATALOG SÜRÜMÜ ---
+
+def _katalog_durumu_tablosu_olustur(cursor):
+    """Son uygulanan katalogun özetini ve DİM-DB doğrulayıcılarını tutan tek satırlık tablo."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS catalog_state (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            content_hash TEXT,
+            product_count INTEGER,
+            etag TEXT,
+            last_modified TEXT,
+            updated_at TEXT
+        )
+    """)
+
+def _katalog_durumunu_yaz(cursor, content_hash, product_count, etag, last_modified):
+    cursor.execute("""
+        INSERT OR REPLACE INTO catalog_state (id, content_hash, product_count, etag, last_modified, updated_at)
+        VALUES (1, ?, ?, ?, ?, ?)
+    """, (content_hash, product_count, etag, last_modified, turkiye_saati().strftime('%Y-%m-%d %H:%M:%S')))
+
+def _degisiklik_yok_yaz(conn, update_timestamp, notes, etag=None, last_modified=None):
+    """'no_change' geçmiş kaydı ekler, yeni doğrulayıcı geldiyse saklar; mevcut ürün sayısını döner."""
+    _katalog_durumu_tablosu_olustur(conn)
+    row = conn.execute("SELECT product_count FROM catalog_state WHERE id = 1").fetchone()
+    urun_sayisi = row[0] if row else conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+    conn.execute("""
+        INSERT INTO update_history (update_timestamp, product_count, source, status, notes)
+        VALUES (?, ?, ?, ?, ?)
+    """, (update_timestamp, urun_sayisi, 'DIM-DB', 'no_change', notes))
+    if etag or last_modified:
+        conn.execute("UPDATE catalog_state SET etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) WHERE id = 1",
+                     (etag, last_modified))
+    return urun_sayisi
+
+def katalog_durumunu_getir():
+    """
+    Son uygulanan katalogun durumunu döner.
+
+    Returns:
+        dict: content_hash, product_count, etag, last_modified, updated_at (kayıt yoksa boş)
+    """
+    try:
+        return baglanti.sorgula_tek(DB_PATH, "SELECT * FROM catalog_state WHERE id = 1", sozluk=True) or {}
+    except sqlite3.Error:
+        return {}  # Tablo henüz yok: ilk katalog
+
+def degisiklik_yok_kaydet(notes, etag=None, last_modified=None):
+    """Katalog değişmediğinde ürünlere dokunmadan geçmişe 'no_change' kaydı düşer."""
+    update_timestamp = turkiye_saati().strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        with baglanti.yazma(DB_PATH) as conn:
+            _degisiklik_yok_yaz(conn, update_timestamp, notes, etag, last_modified)
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (degisiklik_yok_kaydet): {e}")
+
+def urunleri_kaydet(products):
+    """
+    DİM-DB'den gelen ürün listesini veritabanına kaydeder.
+    Liste KatalogGuncellemesi ile gölge tabloya yazılır, sadece fark uygulanır.
+    """
+    guncelleme = KatalogGuncellemesi()
+    try:
+        for product in products:
+            if guncelleme.ekle(product):
+                guncelleme.parti_yaz()
+        return guncelleme.bitir()
+    except sqlite3.Error as e:
+        # Hata durumunda da kaydet
+        guncelleme.iptal(e)
         print(f"❌ Veritabanı hatası (urunleri_kaydet): {e}")
         raise
+    except BaseException as e:
+        guncelleme.iptal(e)
+        raise
+
+# --- BARKOD İNDEKSİ ---
+# Ürün kataloğu bellekte barkod -> UrunKaydi sözlüğü olarak tutulur. Doğrulama
+# her şişede SQLite'a gitmez; indeks urunleri_kaydet sonrası arka planda yeniden
+# kurulur ve tek referans atamasıyla değiştirilir (okuyucular kilit almaz).
+
+class UrunKaydi(NamedTuple):
+    """products tablosunun bir satırı (alan sırası SELECT * ile aynı)"""
+    id: int
+    barcode: str
+    material: int
+    packMinWeight: Optional[float]
+    packMaxWeight: Optional[float]
+    packMinWidth: Optional[float]
+    packMaxWidth: Optional[float]
+    packMinHeight: Optional[float]
+    packMaxHeight: Optional[float]
+
+_barkod_indeksi: Optional[Dict[str, UrunKaydi]] = None
+_indeks_kilidi = threading.Lock()  # Sadece indeks kurulumlarını sıraya koyar
+
+def barkod_indeksini_yukle():
+    """
+    products tablosunu okuyup yeni bir barkod indeksi kurar ve yayınlar.
+
+    Returns:
+        int: İndeksteki ürün sayısı
+    """
+    with _indeks_kilidi:
+        with baglanti.okuma(DB_PATH) as conn:
+            cursor = conn.execute("""
+                SELECT id, barcode, material, packMinWeight, packMaxWeight,
+                       packMinWidth, packMaxWidth, packMinHeight, packMaxHeight
+                FROM products
+            """)
+            yeni_indeks = {row[1]: UrunKaydi._make(row) for row in cursor}
+
+        global _barkod_indeksi
+        _barkod_indeksi = yeni_indeks
+        return len(yeni_indeks)
+
+def barkod_indeksini_yenile(arkaplanda=False):
+    """
+    Barkod indeksini yeniden kurar. arkaplanda=True ise daemon thread'de
+    çalışır; o sürede doğrulama mevcut indeksle devam eder.
+    """
+    def _yenile():
+        try:
+            urun_sayisi = barkod_indeksini_yukle()
+            print(f"🗂️  Barkod indeksi hazır: {urun_sayisi} ürün")
+        except sqlite3.Error as e:
+            print(f"Veritabanı hatası (barkod_indeksini_yenile): {e}")
+
+    if arkaplanda:
+        threading.Thread(target=_yenile, name="barkod_indeksi", daemon=True).start()
+    else:
+        _yenile()
 
 def barkodu_dogrula(barcode):
     """
     Verilen barkodun veritabanında olup olmadığını kontrol eder.
     Varsa ürün bilgilerini, yoksa None döner.
+    Bellekteki barkod indeksinden okunur; indeks henüz kurulmadıysa ilk
+    çağrıda kurulur, kurulamazsa doğrudan SQLite'a bakılır.
     """
+    indeks = _barkod_indeksi
+    if indeks is None:
+        try:
+            barkod_indeksini_yukle()
+            indeks = _barkod_indeksi
+        except sqlite3.Error as e:
+            print(f"Veritabanı hatası (barkod indeksi): {e}")
+            return _barkodu_veritabaninda_dogrula(barcode)
+
+    kayit = indeks.get(barcode if barcode is None or isinstance(barcode, str) else str(barcode))
+    return kayit._asdict() if kayit else None
+
+def _barkodu_veritabaninda_dogrula(barcode):
+    """İndeks kullanılamadığında barkodu doğrudan products tablosunda arar."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.row_factory = sqlite3.Row  # Sonuçları sözlük gibi almayı sağlar
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM products WHERE barcode = ?", (barcode,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        return baglanti.sorgula_tek(DB_PATH, "SELECT * FROM products WHERE barcode = ?", (barcode,), sozluk=True)
     except sqlite3.Error as e:
         print(f"Veritabanı hatası (barkodu_dogrula): {e}")
         return None
@@ -156,11 +481,7 @@ def barkodu_dogrula(barcode):
 def urun_sayisini_getir():
     """Veritabanındaki toplam ürün sayısını döner."""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM products")
-            count = cursor.fetchone()[0]
-            return count
+        return baglanti.sorgula_tek(DB_PATH, "SELECT COUNT(*) FROM products")[0]
     except sqlite3.Error as e:
         print(f"Veritabanı hatası (urun_sayisini_getir): {e}")
         return 0
@@ -176,16 +497,11 @@ def guncelleme_gecmisini_getir(limit=10):
         list: Güncelleme kayıtları listesi
     """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM update_history 
-                ORDER BY id DESC 
-                LIMIT ?
-            """, (limit,))
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+        return baglanti.sorgula(DB_PATH, """
+            SELECT * FROM update_history 
+            ORDER BY id DESC 
+            LIMIT ?
+        """, (limit,), sozluk=True)
     except sqlite3.Error as e:
         print(f"Veritabanı hatası (guncelleme_gecmisini_getir): {e}")
         return []
@@ -198,17 +514,12 @@ def son_guncelleme_bilgisi():
         dict: Son güncelleme bilgisi veya None
     """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM update_history 
-                WHERE status = 'success'
-                ORDER BY id DESC 
-                LIMIT 1
-            """)
-            row = cursor.fetchone()
-            return dict(row) if row else None
+        return baglanti.sorgula_tek(DB_PATH, """
+            SELECT * FROM update_history 
+            WHERE status = 'success'
+            ORDER BY id DESC 
+            LIMIT 1
+        """, sozluk=True)
     except sqlite3.Error as e:
         print(f"Veritabanı hatası (son_guncelleme_bilgisi): {e}")
         return None
@@ -221,7 +532,7 @@ def guncelleme_istatistikleri():
         dict: İstatistik bilgileri
     """
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with baglanti.okuma(DB_PATH) as conn:
             cursor = conn.cursor()
             
             # Toplam güncelleme sayısı
@@ -236,6 +547,10 @@ def guncelleme_istatistikleri():
             cursor.execute("SELECT COUNT(*) FROM update_history WHERE status = 'error'")
             basarisiz_guncelleme = cursor.fetchone()[0]
             
+            # Katalog değişmediği için yazılmayan güncelleme sayısı
+            cursor.execute("SELECT COUNT(*) FROM update_history WHERE status = 'no_change'")
+            degisiklik_yok_guncelleme = cursor.fetchone()[0]
+            
             # Son güncelleme zamanı
             cursor.execute("SELECT update_timestamp FROM update_history ORDER BY id DESC LIMIT 1")
             son_guncelleme = cursor.fetchone()
@@ -245,6 +560,7 @@ def guncelleme_istatistikleri():
                 "toplam_guncelleme": toplam_guncelleme,
                 "basarili_guncelleme": basarili_guncelleme,
                 "basarisiz_guncelleme": basarisiz_guncelleme,
+                "degisiklik_yok_guncelleme": degisiklik_yok_guncelleme,
                 "son_guncelleme_zamani": son_guncelleme_zamani,
                 "mevcut_urun_sayisi": urun_sayisini_getir()
             }
@@ -252,3 +568,121 @@ def guncelleme_istatistikleri():
         print(f"Veritabanı hatası (guncelleme_istatistikleri): {e}")
         return {}
 
+# --- DİM-DB OUTBOX ---
+
+def _outbox_tablosu_olustur(cursor):
+    """DİM-DB'ye gönderilmeyi bekleyen istekler için 'dimdb_outbox' tablosunu oluşturur."""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dimdb_outbox (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            endpoint TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            created_at TEXT NOT NULL,
+            attempts INTEGER DEFAULT 0,
+            last_error TEXT
+        )
+    """)
+    # Kalıcı hata alan (4xx) veya deneme sınırını aşan kayıtlar incelenmek üzere buraya taşınır
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dimdb_outbox_hatali (
+            id INTEGER PRIMARY KEY,
+            endpoint TEXT NOT NULL,
+            payload BLOB NOT NULL,
+            created_at TEXT NOT NULL,
+            attempts INTEGER DEFAULT 0,
+            last_error TEXT,
+            failed_at TEXT NOT NULL
+        )
+    """)
+
+def outbox_tablosu_olustur():
+    """Outbox tablosunun var olduğundan emin olur."""
+    try:
+        with baglanti.yazma(DB_PATH) as conn:
+            _outbox_tablosu_olustur(conn.cursor())
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (outbox_tablosu_olustur): {e}")
+        raise
+
+def outbox_ekle(kayitlar):
+    """
+    Outbox'a tek transaction içinde kayıt ekler.
+    
+    Args:
+        kayitlar (list): (endpoint, payload_bytes) ikilileri
+        
+    Returns:
+        list: Eklenen kayıtların id'leri
+    """
+    created_at = turkiye_saati().strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        with baglanti.yazma(DB_PATH) as conn:
+            cursor = conn.cursor()
+            idler = []
+            for endpoint, payload in kayitlar:
+                cursor.execute(
+                    "INSERT INTO dimdb_outbox (endpoint, payload, created_at) VALUES (?, ?, ?)",
+                    (endpoint, payload, created_at)
+                )
+                idler.append(cursor.lastrowid)
+        return idler
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (outbox_ekle): {e}")
+        raise
+
+def outbox_bekleyenleri_getir(limit=20):
+    """En eski bekleyen outbox kayıtlarını sırayla döner."""
+    try:
+        return baglanti.sorgula(DB_PATH, """
+            SELECT id, endpoint, payload, attempts FROM dimdb_outbox
+            ORDER BY id ASC
+            LIMIT ?
+        """, (limit,), sozluk=True)
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (outbox_bekleyenleri_getir): {e}")
+        return []
+
+def outbox_sil(idler):
+    """Başarıyla gönderilen outbox kayıtlarını siler."""
+    if not idler:
+        return
+    try:
+        with baglanti.yazma(DB_PATH) as conn:
+            conn.executemany("DELETE FROM dimdb_outbox WHERE id = ?", [(i,) for i in idler])
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (outbox_sil): {e}")
+
+def outbox_hata_kaydet(kayit_id, hata):
+    """Başarısız gönderim denemesini kaydeder."""
+    try:
+        with baglanti.yazma(DB_PATH) as conn:
+            conn.execute(
+                "UPDATE dimdb_outbox SET attempts = attempts + 1, last_error = ? WHERE id = ?",
+                (hata, kayit_id)
+            )
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (outbox_hata_kaydet): {e}")
+
+def outbox_hataliya_tasi(kayit_id, hata):
+    """Gönderilemeyecek outbox kaydını 'dimdb_outbox_hatali' tablosuna taşır, kuyruk sıradakine geçer."""
+    failed_at = turkiye_saati().strftime('%Y-%m-%d %H:%M:%S')
+    try:
+        with baglanti.yazma(DB_PATH) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO dimdb_outbox_hatali
+                    (id, endpoint, payload, created_at, attempts, last_error, failed_at)
+                SELECT id, endpoint, payload, created_at, attempts + 1, ?, ?
+                FROM dimdb_outbox WHERE id = ?
+            """, (hata, failed_at, kayit_id))
+            conn.execute("DELETE FROM dimdb_outbox WHERE id = ?", (kayit_id,))
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (outbox_hataliya_tasi): {e}")
+        raise
+
+def outbox_sayisi():
+    """Outbox'ta bekleyen kayıt sayısını döner."""
+    try:
+        return baglanti.sorgula_tek(DB_PATH, "SELECT COUNT(*) FROM dimdb_outbox")[0]
+    except sqlite3.Error as e:
+        print(f"Veritabanı hatası (outbox_sayisi): {e}")
+        return 0
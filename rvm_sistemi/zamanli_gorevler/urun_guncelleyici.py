@@ -22,6 +22,7 @@ class UrunGuncelleyici:
         self.ilk_guncelleme_yap = ilk_guncelleme_yap
         self.calistiriliyor = False
         self._gorev = None
+        self.son_sonuc = None  # "kaydedildi", "degismedi", "sirada" veya None (hata)
         
     async def baslat(self):
         """Ürün güncelleme zamanlayıcısını başlatır"""
@@ -56,17 +57,20 @@ class UrunGuncelleyici:
                 log_system("Periyodik ürün güncelleme zamanı geldi...")
                 await self._urun_guncelle()
     
-    async def _urun_guncelle(self):
-        """Ürün listesini günceller"""
+    async def _urun_guncelle(self, zorla=False):
+        """
+        Ürün listesini günceller. Periyodik güncellemede katalog değişmediyse
+        indirme/yazma atlanır; zorla=True her durumda yeniden indirir.
+        """
         try:
             # UTC saatini kullan
             utc_time = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
             # Ürün güncellemesi başlatılıyor - sadece log dosyasına yazılır
             log_system(f"Ürün güncellemesi başlatılıyor... ({utc_time})")
-            await dimdb_istemcisi.get_all_products_and_save()
+            self.son_sonuc = await dimdb_istemcisi.get_all_products_and_save(zorla=zorla)
             utc_time_end = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
             # Ürün güncellemesi tamamlandı - sadece log dosyasına yazılır
-            log_success(f"Ürün güncellemesi tamamlandı ({utc_time_end})")
+            log_success(f"Ürün güncellemesi tamamlandı: {self.son_sonuc} ({utc_time_end})")
         except Exception as e:
             # Ürün güncelleme hatası - sadece log dosyasına yazılır
             import traceback
@@ -90,7 +94,7 @@ class UrunGuncelleyici:
         """Manuel ürün güncellemesi başlatır"""
         # Manuel güncelleme başlatılıyor - sadece log dosyasına yazılır
         log_system("Manuel ürün güncellemesi başlatılıyor...")
-        asyncio.create_task(self._urun_guncelle())
+        asyncio.create_task(self._urun_guncelle(zorla=True))
     
     def durum_bilgisi(self):
         """Mevcut durum bilgisini döndürür"""
@@ -98,6 +102,7 @@ class UrunGuncelleyici:
             "calistiriliyor": self.calistiriliyor,
             "guncelleme_sikligi_dakika": self.guncelleme_sikligi_dakika,
             "ilk_guncelleme_yap": self.ilk_guncelleme_yap,
+            "son_sonuc": self.son_sonuc,
             "sonraki_guncelleme": f"{self.guncelleme_sikligi_dakika} dakika sonra" if self.calistiriliyor else None,
             "mevcut_utc_saat": time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
             "mevcut_yerel_saat": time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())